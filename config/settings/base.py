@@ -713,6 +713,18 @@ TASKFLOW_LOCK_RETRY_COUNT = env.int('TASKFLOW_LOCK_RETRY_COUNT', 2)
 TASKFLOW_LOCK_RETRY_INTERVAL = env.int('TASKFLOW_LOCK_RETRY_INTERVAL', 3)
 # Interval in seconds for zone progress counters (0 for update on every file)
 TASKFLOW_ZONE_PROGRESS_INTERVAL = env.int('TASKFLOW_ZONE_PROGRESS_INTERVAL', 10)
+# Worker thread count for reading checksum files in zone validation
+TASKFLOW_VALIDATE_WORKERS = env.int('TASKFLOW_VALIDATE_WORKERS', 4)
+# Worker thread count for calculating checksums in zone validation
+TASKFLOW_CHECKSUM_WORKERS = env.int('TASKFLOW_CHECKSUM_WORKERS', 1)
+# Worker thread count for running independent flow tasks concurrently
+TASKFLOW_PARALLEL_WORKERS = env.int('TASKFLOW_PARALLEL_WORKERS', 1)
+# Queue async flows per project instead of failing if the project is locked
+TASKFLOW_QUEUE_ENABLED = env.bool('TASKFLOW_QUEUE_ENABLED', False)
+# Time in seconds for queued flows to wait for the project lock
+TASKFLOW_QUEUE_LOCK_TIMEOUT = env.int('TASKFLOW_QUEUE_LOCK_TIMEOUT', 300)
+# Interval in seconds for starting runners for queued and interrupted flows
+TASKFLOW_QUEUE_RECOVER_INTERVAL = env.int('TASKFLOW_QUEUE_RECOVER_INTERVAL', 60)
 TASKFLOW_LOCK_ENABLED = True
 TASKFLOW_TEST_MODE = False  # Important to protect iRODS data
 
@@ -732,6 +744,12 @@ IRODS_WEBDAV_IGV_PROXY = env.bool('IRODS_WEBDAV_IGV_PROXY', True)
 IRODSBACKEND_STATUS_INTERVAL = env.int('IRODSBACKEND_STATUS_INTERVAL', 15)
 # Set batch query size for improving sequential iRODS query performance (#432)
 IRODS_QUERY_BATCH_SIZE = env.int('IRODS_QUERY_BATCH_SIZE', 24)
+# Batch size for keyset paginated iRODS object list queries
+IRODS_LIST_BATCH_SIZE = env.int('IRODS_LIST_BATCH_SIZE', 1000)
+# Maximum number of idle iRODS sessions pooled per process (0 = disabled)
+IRODS_SESSION_POOL_SIZE = env.int('IRODS_SESSION_POOL_SIZE', 8)
+# Idle time in seconds after which pooled iRODS sessions are closed
+IRODS_SESSION_POOL_TIMEOUT = env.int('IRODS_SESSION_POOL_TIMEOUT', 300)
 
 
 # Samplesheets settings
@@ -745,6 +763,8 @@ SHEETS_ENABLE_STUDY_TABLE_CACHE = env.bool(
 )
 # iRODS file query limit
 SHEETS_IRODS_LIMIT = env.int('SHEETS_IRODS_LIMIT', 50)
+# Search material result limit
+SHEETS_SEARCH_MATERIAL_LIMIT = env.int('SHEETS_SEARCH_MATERIAL_LIMIT', 500)
 # Minimum edit config version
 SHEETS_CONFIG_VERSION = '0.8.0'
 # Min default column width
@@ -775,6 +795,10 @@ SHEETS_EXTERNAL_LINK_PATH = env.str(
 )
 # Remote sample sheet sync interval in minutes
 SHEETS_SYNC_INTERVAL = env.int('SHEETS_SYNC_INTERVAL', 5)
+# Maximum number of projects synchronized concurrently
+SHEETS_SYNC_WORKERS = env.int('SHEETS_SYNC_WORKERS', 4)
+# Timeout in seconds for sheet sync requests to the source site
+SHEETS_SYNC_TIMEOUT = env.int('SHEETS_SYNC_TIMEOUT', 60)
 # BAM/CRAM file path glob patterns to omit from study shortcuts and IGV sessions
 SHEETS_IGV_OMIT_BAM = env.list(
     'SHEETS_IGV_OMIT_BAM', default=['*dragen_evidence.bam']
@@ -799,6 +823,13 @@ SHEETS_PARSER_WARNING_SAVE_LIMIT = env.int(
 # Landingzones app settings
 # Status query interval in seconds
 LANDINGZONES_STATUS_INTERVAL = env.int('LANDINGZONES_STATUS_INTERVAL', 3)
+# Push zone status updates to the UI via Redis and server-sent events
+# NOTE: Each open zone list keeps a connection, requires threaded workers
+LANDINGZONES_STATUS_PUSH = env.bool('LANDINGZONES_STATUS_PUSH', False)
+# Status event stream duration in seconds before the client reconnects
+LANDINGZONES_STATUS_STREAM_TIMEOUT = env.int(
+    'LANDINGZONES_STATUS_STREAM_TIMEOUT', 300
+)
 # Enable automated move triggering based on touched file
 LANDINGZONES_TRIGGER_ENABLE = env.bool('LANDINGZONES_TRIGGER_ENABLE', True)
 # Automatic move triggering check interval in seconds
@@ -133,6 +133,8 @@ LANDINGZONES_DISABLE_FOR_USERS = False
 LANDINGZONES_ZONE_CREATE_LIMIT = None
 LANDINGZONES_ZONE_VALIDATE_LIMIT = 4
 LANDINGZONES_FILE_LIST_PAGINATION = 25
+LANDINGZONES_STATUS_PUSH = False
+LANDINGZONES_STATUS_STREAM_TIMEOUT = 1
 
 # iRODS settings shared by iRODS using apps
 ENABLE_IRODS = True
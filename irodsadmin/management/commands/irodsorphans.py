@@ -1,11 +1,16 @@
 """Irodsorphans management command"""
 
+import json
+import multiprocessing
 import re
 import sys
 
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from itertools import chain
 
 from django.core.management.base import BaseCommand
+from django.db import connections
 from django.template.defaultfilters import filesizeformat
 
 # Projectroles dependency
@@ -30,6 +35,82 @@ table_builder = SampleSheetTableBuilder()
 # Local constants
 DELETED = '<DELETED>'
 ERROR = '<ERROR>'
+FORMAT_TEXT = 'text'
+FORMAT_TSV = 'tsv'
+FORMAT_JSON = 'json'
+OUTPUT_FORMATS = [FORMAT_TEXT, FORMAT_TSV, FORMAT_JSON]
+OUTPUT_FIELDS = [
+    'project_uuid',
+    'project_title',
+    'path',
+    'file_count',
+    'total_size',
+]
+UUID_PATTERN = r'[a-f0-9]{8}-(?:[a-f0-9]{4}-){3}[a-f0-9]{12}'
+PROJECT_PATTERN = (
+    r'/([a-f0-9]{2})/(\1[a-f0-9]{6}-(?:[a-f0-9]{4}-){3}[a-f0-9]{12})'
+)
+
+
+def get_assay_subcollections(study, irods_backend):
+    """
+    Return a list of expected assay row and default subcollection paths for a
+    study.
+
+    :param study: Study object
+    :param irods_backend: IrodsAPI object
+    :return: List of strings
+    """
+    collections = []
+    try:
+        study_tables = table_builder.get_study_tables(study, save_cache=False)
+    except Exception as ex:
+        logger.error(
+            'Study table building exception for "{}" '
+            'in project "{}" ({}): {}'.format(
+                study.get_display_name(),
+                study.investigation.project.title,
+                study.investigation.project.sodar_uuid,
+                ex,
+            )
+        )
+        return collections
+
+    for assay in study.assays.all():
+        assay_table = study_tables['assays'][str(assay.sodar_uuid)]
+        assay_plugin = assay.get_plugin()
+        assay_path = irods_backend.get_path(assay)
+
+        if assay_plugin:
+            for row in assay_table['table_data']:
+                collections.append(
+                    assay_plugin.get_row_path(
+                        row, assay_table, assay, assay_path
+                    )
+                )
+            shortcuts = assay_plugin.get_shortcuts(assay)
+            if shortcuts:
+                for shortcut in shortcuts:
+                    collections.append(shortcut['path'])
+
+            # Add default expected subcollections of assay collection
+            collections.append(assay_path + '/' + TRACK_HUBS_COLL)
+            collections.append(assay_path + '/' + RESULTS_COLL)
+            collections.append(assay_path + '/' + MISC_FILES_COLL)
+    return collections
+
+
+def _get_assay_subcollections_worker(study_pk):
+    """
+    Return expected assay subcollection paths for a study in a worker process.
+
+    :param study_pk: Study primary key (int)
+    :return: List of strings
+    """
+    study = Study.objects.select_related('investigation__project').get(
+        pk=study_pk
+    )
+    return get_assay_subcollections(study, get_backend_api('omics_irods'))
 
 
 class Command(BaseCommand):
@@ -40,263 +121,256 @@ class Command(BaseCommand):
     def __init__(self):
         super().__init__()
         self.irods_backend = get_backend_api('omics_irods')
+        if not self.irods_backend:
+            return
+        projects_path = self.irods_backend.get_projects_path()
+        project_pattern = r'^' + projects_path + PROJECT_PATTERN
+        self.project_re = re.compile(project_pattern)
+        self.project_coll_re = re.compile(project_pattern + r'$')
+        self.zone_re = re.compile(project_pattern + r'/landing_zones')
+        self.zone_name_re = re.compile(r'^\d{8}_\d{6}')
+        self.assay_study_re = re.compile(
+            project_pattern + r'/.*/(assay|study)_' + UUID_PATTERN + r'$'
+        )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '-p',
+            '--project',
+            metavar='UUID',
+            type=str,
+            help='Limit search to a project',
+        )
+        parser.add_argument(
+            '-f',
+            '--format',
+            dest='format',
+            choices=OUTPUT_FORMATS,
+            default=FORMAT_TEXT,
+            help='Output format (default: {})'.format(FORMAT_TEXT),
+        )
+        parser.add_argument(
+            '-w',
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of worker processes for building expected study '
+            'collections (default: 1)',
+        )
 
     def _get_assay_collections(self, assays):
         """Return a list of all assay collection names."""
         return [self.irods_backend.get_path(a) for a in assays]
 
-    def _get_assay_subcollections(self, studies):
-        """Return a list of all assay row collection names."""
-        collections = []
-        for study in studies:
-            try:
-                study_tables = table_builder.get_study_tables(
-                    study, save_cache=False
-                )
-            except Exception as ex:
-                logger.error(
-                    'Study table building exception for "{}" '
-                    'in project "{}" ({}): {}'.format(
-                        study.get_display_name(),
-                        study.investigation.project.title,
-                        study.investigation.project.sodar_uuid,
-                        ex,
+    def _get_assay_subcollections(self, studies, workers=1):
+        """
+        Return a list of all assay row collection names. If workers is above
+        1, study tables are retrieved in a process pool.
+        """
+        if workers > 1 and len(studies) > 1:
+            # Forked workers must not share the parent database connection
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('fork'),
+            ) as executor:
+                collections = list(
+                    chain.from_iterable(
+                        executor.map(
+                            _get_assay_subcollections_worker,
+                            [s.pk for s in studies],
+                        )
                     )
                 )
-                continue
-
-            for assay in study.assays.all():
-                assay_table = study_tables['assays'][str(assay.sodar_uuid)]
-                assay_plugin = assay.get_plugin()
-                assay_path = self.irods_backend.get_path(assay)
-
-                if assay_plugin:
-                    for row in assay_table['table_data']:
-                        row_path = assay_plugin.get_row_path(
-                            row, assay_table, assay, assay_path
-                        )
-                        if row_path not in collections:
-                            collections.append(row_path)
-                    shortcuts = assay_plugin.get_shortcuts(assay)
-                    if shortcuts:
-                        for shortcut in shortcuts:
-                            collections.append(shortcut['path'])
-
-                    # Add default expected subcollections of assay collection
-                    collections.append(assay_path + '/' + TRACK_HUBS_COLL)
-                    collections.append(assay_path + '/' + RESULTS_COLL)
-                    collections.append(assay_path + '/' + MISC_FILES_COLL)
-        return collections
+        else:
+            collections = chain.from_iterable(
+                get_assay_subcollections(s, self.irods_backend) for s in studies
+            )
+        return list(dict.fromkeys(collections))
 
     def _get_study_collections(self, studies):
         """Return a list of all study collection names."""
         return [self.irods_backend.get_path(s) for s in studies]
 
-    def _get_zone_collections(self):
+    def _get_zone_collections(self, project=None):
         """
         Return a list of all landing zone collection names that are not MOVED or
         DELETED.
         """
-        return [
-            self.irods_backend.get_path(lz)
-            for lz in LandingZone.objects.exclude(
-                status__in=[ZONE_STATUS_MOVED, ZONE_STATUS_DELETED]
-            )
-        ]
-
-    def _get_project_collections(self):
-        """Return a list of all study collection names."""
+        zones = LandingZone.objects.exclude(
+            status__in=[ZONE_STATUS_MOVED, ZONE_STATUS_DELETED]
+        ).select_related('project', 'user', 'assay__study')
+        if project:
+            zones = zones.filter(project=project)
+        return [self.irods_backend.get_path(lz) for lz in zones]
+
+    def _get_project_collections(self, project=None):
+        """Return a list of all project collection names."""
+        if project:
+            return [self.irods_backend.get_path(project)]
         return [
             self.irods_backend.get_path(p)
             for p in Project.objects.all().order_by('full_title')
         ]
 
-    def _is_zone(self, collection):
+    def _is_zone(self, path):
         """
-        Check if a given collection matches the format of path to a landing zone
-        collection.
+        Check if a given collection path matches the format of path to a
+        landing zone collection.
         """
-        projects_path = self.irods_backend.get_projects_path()
-        pattern = (
-            r'^'
-            + projects_path
-            + r'/([a-f0-9]{2})/\1[a-f0-9]{6}-([a-f0-9]{4}-){3}[a-f0-9]{12}/'
-            r'landing_zones'
-        )
-        return re.search(r'{}'.format(pattern), collection.path) and re.search(
-            r'^\d{8}_\d{6}', collection.name
+        return bool(
+            self.zone_re.search(path)
+            and self.zone_name_re.search(path.split('/')[-1])
         )
 
-    def _is_assay_or_study(self, collection):
+    def _is_assay_or_study(self, path):
         """
-        Check if a given collection matches the format of path to a study or
-        assay collection.
+        Check if a given collection path matches the format of path to a study
+        or assay collection.
         """
-        projects_path = self.irods_backend.get_projects_path()
-        pattern = (
-            r'^'
-            + projects_path
-            + r'/([a-f0-9]{2})/\1[a-f0-9]{6}-([a-f0-9]{4}-){3}[a-f0-9]{12}/.*/'
-            r'(assay|study)_[a-f0-9]{8}-([a-f0-9]{4}-){3}[a-f0-9]{12}$'
-        )
-        return re.search(pattern, collection.path)
+        return bool(self.assay_study_re.search(path))
 
-    def _is_assay_orphan(self, collection):
+    def _is_project(self, path):
         """
-        Check if a given collection matches the format of path to a study or
-        assay orphan.
+        Check if a given collection path matches the format of path to a
+        project collection under the projects path.
         """
-        projects_path = self.irods_backend.get_projects_path()
-        pattern = (
-            r'^'
-            + projects_path
-            + r'/([a-f0-9]{2})/\1[a-f0-9]{6}-([a-f0-9]{4}-){3}[a-f0-9]{12}/.*/'
-            r'(assay|study)_[a-f0-9]{8}-([a-f0-9]{4}-){3}[a-f0-9]{12}'
-        )
-        return re.search(pattern, collection.path)
+        return bool(self.project_coll_re.search(path))
 
-    def _is_project(self, projects_path, collection):
+    def _get_project_uuid(self, path):
         """
-        Check if a given collection matches the format of path to a project
-        collection under the projects path.
+        Return project UUID from a collection path or None if the path is not
+        under a project collection.
         """
-        pattern = (
-            r'^'
-            + projects_path
-            + r'/([a-f0-9]{2})/\1[a-f0-9]{6}-([a-f0-9]{4}-){3}[a-f0-9]{12}$'
-        )
-        return re.search(r'{}'.format(pattern), collection.path)
-
-    def _sort_colls_on_projects(self, collections):
-        """Helper function to sort collections based on project list"""
-        colls_with_project = []
-        colls_no_project = []
-        temp_paths = []
-
-        # Create a set of valid project paths based on project UUIDs
-        valid_project_paths = [
-            self.irods_backend.get_path(p)
-            for p in Project.objects.filter(type=PROJECT_TYPE_PROJECT).order_by(
-                'full_title'
-            )
-        ]
+        m = self.project_re.search(path)
+        return m.group(2) if m else None
 
-        # Get the actual path to the projects collection
-        project_path = self.irods_backend.get_projects_path()
-        depth = len(project_path.split('/')) + 1
-        for coll in collections:
-            pattern = (
-                r'^'
-                + project_path
-                + r'/([a-f0-9]{2})/\1[a-f0-9]{6}-([a-f0-9]{4}-){3}[a-f0-9]{12}'
-            )
-            match = re.search(r'{}'.format(pattern), coll.path)
-            uuid = match.string.split('/')[depth] if match else ''
-            if (
-                uuid
-                and any(uuid in path for path in valid_project_paths)
-                and coll.path not in temp_paths
-            ):
-                colls_with_project.append(coll)
-                temp_paths.append(coll.path)
-            elif coll.path not in temp_paths:
-                colls_no_project.append(coll)
-                temp_paths.append(coll.path)
-
-        # Sort collections with project path based on project list
-        sorted_colls = sorted(
-            colls_with_project,
-            key=lambda coll: next(
-                (
-                    i
-                    for i, path in enumerate(valid_project_paths)
-                    if (
-                        coll.path.split('/')[depth]
-                        if len(coll.path.split('/')) > depth
-                        else ''
-                    )
-                    in path
-                ),
-                float('inf'),
-            ),
-        )
-        return sorted_colls + colls_no_project
-
-    def _get_orphans(self, irods, expected, assays):
+    def _get_orphans(
+        self, irods, expected, assays, project=None, out_format=FORMAT_TEXT
+    ):
         """
-        Return a list of orphans in a given irods session that are not in a given
-        list of expected collections.
+        Write orphans in a given irods session that are not in a given
+        collection of expected collections. Collections are streamed from iCAT
+        and orphans are written ordered by project title.
         """
-        # Get a sorted list of all project collections
-        project_collections = sorted(
-            self.irods_backend.get_colls_recursively(
-                irods.collections.get('/{}/projects'.format(irods.zone))
-            ),
-            key=lambda coll: coll.path,
-        )
-        assay_collections = list(
-            chain.from_iterable(
-                self.irods_backend.get_child_colls(
-                    irods, self.irods_backend.get_path(a)
-                )
-                for a in assays
-                if a.get_plugin()
-            )
-        )
-        assay_coll_paths = [coll.path for coll in assay_collections]
+        if not isinstance(expected, (set, frozenset)):
+            expected = set(expected)
+        assay_paths = {
+            self.irods_backend.get_path(a) for a in assays if a.get_plugin()
+        }
+        project_titles = {}
+        project_order = {}
+        for uuid, title, p_type in Project.objects.order_by(
+            'full_title'
+        ).values_list('sodar_uuid', 'full_title', 'type'):
+            project_titles[str(uuid)] = title
+            if p_type == PROJECT_TYPE_PROJECT:
+                project_order[str(uuid)] = len(project_order)
+
+        if project:
+            root_path = self.irods_backend.get_path(project)
+        else:
+            root_path = self.irods_backend.get_projects_path()
+        orphans = defaultdict(list)  # Orphan paths by project UUID
+        for coll in self.irods_backend.iter_colls(irods, root_path):
+            path = coll['path']
+            if path in expected or not (
+                self._is_zone(path)
+                or self._is_assay_or_study(path)
+                or self._is_project(path)
+                or path.rsplit('/', 1)[0] in assay_paths
+            ):
+                continue
+            uuid = self._get_project_uuid(path)
+            orphans[uuid if uuid in project_order else None].append(path)
 
-        # Sort collections by project full_title
-        sorted_collections = self._sort_colls_on_projects(
-            project_collections + assay_collections
+        paths = chain(
+            *(orphans[u] for u in project_order if u in orphans),
+            orphans[None],
+        )
+        rows = (
+            self._get_orphan_data(path, irods, project_titles) for path in paths
         )
+        self._write_orphans(rows, out_format)
 
-        projects_path = self.irods_backend.get_projects_path()
-        for collection in sorted_collections:
-            if (
-                self._is_zone(collection)
-                or self._is_assay_or_study(collection)
-                or self._is_project(projects_path, collection)
-                or collection.path in assay_coll_paths
-            ) and collection.path not in expected:
-                self._write_orphan(collection.path, irods)
-
-    def _write_orphan(self, path, irods):
+    def _get_orphan_data(self, path, irods, project_titles):
+        """Return output data for an orphan collection as a dict."""
         stats = self.irods_backend.get_stats(irods, path)
-        projects_path = self.irods_backend.get_projects_path()
-        pattern = projects_path + r'/([^/]{2})/(\1[^/]+)'
-        m = re.search(pattern, path)
-        if m:
-            uuid = m.group(2)
-            try:
-                project = Project.objects.get(sodar_uuid=uuid)
-                title = project.full_title
-            except Project.DoesNotExist:
-                title = DELETED
+        uuid = self._get_project_uuid(path)
+        if uuid:
+            title = project_titles.get(uuid, DELETED)
         else:
             uuid = ERROR
             title = ERROR
-        sys.stdout.write(
-            ';'.join(
-                [
-                    uuid,
-                    title,
-                    path,
-                    str(stats['file_count']),
-                    filesizeformat(stats['total_size']).replace(u'\xa0', ' '),
-                ]
+        return {
+            'project_uuid': uuid,
+            'project_title': title,
+            'path': path,
+            'file_count': stats['file_count'],
+            'total_size': stats['total_size'],
+        }
+
+    @classmethod
+    def _write_orphans(cls, rows, out_format=FORMAT_TEXT):
+        """Write orphan data rows to stdout in the given format."""
+        if out_format == FORMAT_JSON:
+            sys.stdout.write(json.dumps(list(rows), indent=2) + '\n')
+            return
+        if out_format == FORMAT_TSV:
+            sys.stdout.write('\t'.join(OUTPUT_FIELDS) + '\n')
+        for row in rows:
+            if out_format == FORMAT_TSV:
+                values = [str(row[k]) for k in OUTPUT_FIELDS]
+                sys.stdout.write('\t'.join(values) + '\n')
+                continue
+            sys.stdout.write(
+                ';'.join(
+                    [
+                        row['project_uuid'],
+                        row['project_title'],
+                        row['path'],
+                        str(row['file_count']),
+                        filesizeformat(row['total_size']).replace(u'\xa0', ' '),
+                    ]
+                )
+                + '\n'
             )
-            + '\n'
-        )
 
     def handle(self, *args, **options):
-        studies = list(Study.objects.all())
-        assays = list(Assay.objects.all().order_by())
-        expected = (
+        project = None
+        project_uuid = options.get('project')
+        if project_uuid:
+            project = Project.objects.filter(
+                sodar_uuid=project_uuid, type=PROJECT_TYPE_PROJECT
+            ).first()
+            if not project:
+                logger.error(
+                    'Project not found with UUID "{}"'.format(project_uuid)
+                )
+                sys.exit(1)
+        studies = Study.objects.select_related('investigation__project')
+        assays = Assay.objects.select_related(
+            'study__investigation__project'
+        ).order_by()
+        if project:
+            studies = studies.filter(investigation__project=project)
+            assays = assays.filter(study__investigation__project=project)
+        studies = list(studies)
+        assays = list(assays)
+        expected = {
             *self._get_assay_collections(assays),
             *self._get_study_collections(studies),
-            *self._get_zone_collections(),
-            *self._get_project_collections(),
-            *self._get_assay_subcollections(studies),
-        )
+            *self._get_zone_collections(project),
+            *self._get_project_collections(project),
+            *self._get_assay_subcollections(
+                studies, workers=options.get('workers') or 1
+            ),
+        }
         with self.irods_backend.get_session() as irods:
-            self._get_orphans(irods, expected, assays)
+            self._get_orphans(
+                irods,
+                expected,
+                assays,
+                project=project,
+                out_format=options.get('format') or FORMAT_TEXT,
+            )
@@ -0,0 +1,91 @@
+"""Irodsqueries management command"""
+
+from django.core.management.base import BaseCommand
+
+# Projectroles dependency
+from projectroles.management.logging import ManagementCommandLogger
+from projectroles.plugins import get_backend_api
+
+# Irodsbackend dependency
+from irodsbackend.api import QUERY_ALIASES
+
+
+logger = ManagementCommandLogger(__name__)
+
+
+# Local constants
+QUERIES_CHECK_MSG = 'Checking SODAR specific queries in iRODS..'
+QUERIES_REGISTER_MSG = 'Registered query: {alias}'
+QUERIES_REMOVE_MSG = 'Removed stale query: {alias}'
+QUERIES_MISSING_MSG = 'Missing query: {alias}'
+QUERIES_STALE_MSG = 'Stale query: {alias}'
+QUERIES_DONE_MSG = (
+    'Done, {registered} quer{r_plural} registered, {removed} stale '
+    'quer{s_plural} removed'
+)
+
+
+class Command(BaseCommand):
+    """
+    Command for registering SODAR specific queries in iRODS and removing stale
+    queries.
+    """
+
+    help = (
+        'Register SODAR specific queries in iRODS and remove stale or leaked '
+        'queries.'
+    )
+
+    def __init__(self):
+        super().__init__()
+        self.irods_backend = get_backend_api('omics_irods')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '-c',
+            '--check',
+            dest='check',
+            action='store_true',
+            help='Only report missing and stale queries without modifying '
+            'iRODS',
+        )
+
+    def handle(self, *args, **options):
+        logger.info(QUERIES_CHECK_MSG)
+        check = options.get('check', False)
+        with self.irods_backend.get_session() as irods:
+            queries = self.irods_backend.get_registered_queries(irods)
+            current = set(QUERY_ALIASES.values())
+            stale = sorted(a for a in queries if a not in current)
+            missing = [n for n, a in QUERY_ALIASES.items() if a not in queries]
+            if check:
+                for alias in stale:
+                    logger.info(QUERIES_STALE_MSG.format(alias=alias))
+                for name in missing:
+                    logger.info(
+                        QUERIES_MISSING_MSG.format(alias=QUERY_ALIASES[name])
+                    )
+                return
+            removed = 0
+            for alias in stale:
+                try:
+                    self.irods_backend.remove_query(irods, alias)
+                    logger.info(QUERIES_REMOVE_MSG.format(alias=alias))
+                    removed += 1
+                except Exception as ex:
+                    logger.error(
+                        'Unable to remove query "{}": {}'.format(alias, ex)
+                    )
+            registered = self.irods_backend.register_queries(
+                irods, names=missing
+            )
+            for alias in registered:
+                logger.info(QUERIES_REGISTER_MSG.format(alias=alias))
+        logger.info(
+            QUERIES_DONE_MSG.format(
+                registered=len(registered),
+                r_plural='y' if len(registered) == 1 else 'ies',
+                removed=removed,
+                s_plural='y' if removed == 1 else 'ies',
+            )
+        )
@@ -1,6 +1,7 @@
 """Management command tests for the irodsadmin app"""
 
 import io
+import json
 import os
 import sys
 import uuid
@@ -29,6 +30,9 @@ from samplesheets.tests.test_io import SampleSheetIOMixin, SHEET_DIR
 from samplesheets.tests.test_views_taskflow import SampleSheetTaskflowMixin
 from samplesheets.views import MISC_FILES_COLL
 
+# Irodsbackend dependency
+from irodsbackend.api import QUERY_ALIASES
+
 # Taskflowbackend dependency
 from taskflowbackend.tests.base import (
     TaskflowViewTestBase,
@@ -41,7 +45,18 @@ from irodsadmin.management.commands.checksampleaccess import (
     CHECK_ACCESS_START_MSG,
     CHECK_ACCESS_USER_MSG,
 )
-from irodsadmin.management.commands.irodsorphans import Command, DELETED
+from irodsadmin.management.commands.irodsorphans import (
+    Command,
+    DELETED,
+    FORMAT_JSON,
+    FORMAT_TSV,
+    OUTPUT_FIELDS,
+)
+from irodsadmin.management.commands.irodsqueries import (
+    QUERIES_REGISTER_MSG,
+    QUERIES_REMOVE_MSG,
+    QUERIES_STALE_MSG,
+)
 
 
 # SODAR constants
@@ -218,11 +233,11 @@ class TestIrodsOrphans(
     """Tests for the irodsorphans management command"""
 
     @staticmethod
-    def _get_stdout():
+    def _get_stdout(**kwargs):
         """Call irodsorphans management command and return output"""
         out = io.StringIO()
         sys.stdout = out
-        call_command('irodsorphans', stdout=out)
+        call_command('irodsorphans', stdout=out, **kwargs)
         output = out.getvalue()
         sys.stdout = sys.__stdout__
         return output
@@ -318,6 +333,19 @@ class TestIrodsOrphans(
             [self.irods_backend.get_path(self.project)],
         )
 
+    def test_get_project_collections_category(self):
+        """Test get_project_collections() with category"""
+        category = self.make_project(
+            'TestCategory', PROJECT_TYPE_CATEGORY, None
+        )
+        self.assertListEqual(
+            self.irodsorphans._get_project_collections(),
+            [
+                self.irods_backend.get_path(category),
+                self.irods_backend.get_path(self.project),
+            ],
+        )
+
     def test_get_assay_subcollections(self):
         """Test get_assay_subcollections()"""
         assay_path = self.irods_backend.get_path(self.assay)
@@ -334,48 +362,33 @@ class TestIrodsOrphans(
 
     def test_is_zone(self):
         """Test is_zone()"""
-        collection = self.irods.collections.get(
-            self.irods_backend.get_path(self.landing_zone)
-        )
-        self.assertTrue(self.irodsorphans._is_zone(collection))
+        path = self.irods_backend.get_path(self.landing_zone)
+        self.assertTrue(self.irodsorphans._is_zone(path))
 
     def test_is_assay_or_study_with_assay(self):
         """Test is_assay_or_study() with assay"""
-        collection = self.irods.collections.get(
-            self.irods_backend.get_path(self.assay)
-        )
-        self.assertTrue(self.irodsorphans._is_assay_or_study(collection))
+        path = self.irods_backend.get_path(self.assay)
+        self.assertTrue(self.irodsorphans._is_assay_or_study(path))
 
     def test_is_assay_or_study_with_study(self):
         """Test is_assay_or_study() with study"""
-        collection = self.irods.collections.get(
-            self.irods_backend.get_path(self.study)
-        )
-        self.assertTrue(self.irodsorphans._is_assay_or_study(collection))
+        path = self.irods_backend.get_path(self.study)
+        self.assertTrue(self.irodsorphans._is_assay_or_study(path))
 
     def test_is_project(self):
         """Test is_project()"""
-        collection = self.irods.collections.get(
-            self.irods_backend.get_path(self.project)
-        )
-        projects_path = self.irods_backend.get_projects_path()
-        self.assertTrue(
-            self.irodsorphans._is_project(projects_path, collection)
-        )
+        path = self.irods_backend.get_path(self.project)
+        self.assertTrue(self.irodsorphans._is_project(path))
 
     def test_is_zone_invalid(self):
         """Test is_zone() with a non-landingzone collection"""
-        collection = self.irods.collections.get(
-            self.irods_backend.get_path(self.project)
-        )
-        self.assertFalse(self.irodsorphans._is_zone(collection))
+        path = self.irods_backend.get_path(self.project)
+        self.assertFalse(self.irodsorphans._is_zone(path))
 
     def test_is_assay_or_study_invalid(self):
         """Test is_assay_or_study() with non-assay/study collection"""
-        collection = self.irods.collections.get(
-            self.irods_backend.get_path(self.project)
-        )
-        self.assertFalse(self.irodsorphans._is_assay_or_study(collection))
+        path = self.irods_backend.get_path(self.project)
+        self.assertFalse(self.irodsorphans._is_assay_or_study(path))
 
     def test_get_orphans_none(self):
         """Test get_orphans() with no orphans available"""
@@ -695,3 +708,109 @@ class TestIrodsOrphans(
             orphan_path2,
         )
         self.assertEqual(output, expected)
+
+    def test_command_project(self):
+        """Test command with project filter"""
+        orphan_path = '{}/sample_data/study_{}'.format(
+            self.irods_backend.get_path(self.project), str(uuid.uuid4())
+        )
+        self.irods.collections.create(orphan_path)
+        project2 = self.make_project('TestProject2', PROJECT_TYPE_PROJECT, None)
+        self.make_assignment(project2, self.user, self.role_owner)
+        orphan_path2 = '{}/sample_data/study_{}'.format(
+            self.irods_backend.get_path(project2), str(uuid.uuid4())
+        )
+        self.irods.collections.create(orphan_path2)
+        output = self._get_stdout(project=str(project2.sodar_uuid))
+        expected = '{};{};{};0;0 bytes\n'.format(
+            str(project2.sodar_uuid),
+            project2.full_title,
+            orphan_path2,
+        )
+        self.assertEqual(output, expected)
+
+    def test_command_project_invalid(self):
+        """Test command with non-existent project"""
+        with self.assertRaises(SystemExit):
+            self._get_stdout(project=DUMMY_UUID)
+
+    def test_command_format_tsv(self):
+        """Test command with TSV output"""
+        orphan_path = '{}/assay_{}'.format(
+            self.irods_backend.get_path(self.study), str(uuid.uuid4())
+        )
+        self.irods.collections.create(orphan_path)
+        output = self._get_stdout(format=FORMAT_TSV)
+        expected = '\t'.join(OUTPUT_FIELDS) + '\n'
+        expected += '\t'.join(
+            [
+                str(self.project.sodar_uuid),
+                self.project.full_title,
+                orphan_path,
+                '0',
+                '0',
+            ]
+        )
+        self.assertEqual(output, expected + '\n')
+
+    def test_command_format_json(self):
+        """Test command with JSON output"""
+        orphan_path = '{}/assay_{}'.format(
+            self.irods_backend.get_path(self.study), str(uuid.uuid4())
+        )
+        self.irods.collections.create(orphan_path)
+        output = self._get_stdout(format=FORMAT_JSON)
+        expected = [
+            {
+                'project_uuid': str(self.project.sodar_uuid),
+                'project_title': self.project.full_title,
+                'path': orphan_path,
+                'file_count': 0,
+                'total_size': 0,
+            }
+        ]
+        self.assertEqual(json.loads(output), expected)
+
+    def test_command_format_json_no_orphans(self):
+        """Test command with JSON output and no orphans"""
+        output = self._get_stdout(format=FORMAT_JSON)
+        self.assertEqual(json.loads(output), [])
+
+
+class TestIrodsQueries(TaskflowViewTestBase):
+    """Tests for the irodsqueries management command"""
+
+    def setUp(self):
+        super().setUp()
+        # Leak ad hoc query
+        self.query = self.irods_backend.get_query(
+            self.irods, 'SELECT coll_name FROM r_coll_main'
+        )
+        self.alias = self.query._alias
+        self.cmd_name = 'irodsqueries'
+        self.logger_name = LOGGER_PREFIX + self.cmd_name
+
+    def test_command(self):
+        """Test command"""
+        self.irods_backend.register_queries(self.irods, names=['stats'])
+        self.irods_backend.remove_query(self.irods, QUERY_ALIASES['stats'])
+        with self.assertLogs(self.logger_name) as cm:
+            call_command(self.cmd_name)
+        output = '\n'.join(cm.output)
+        self.assertIn(QUERIES_REMOVE_MSG.format(alias=self.alias), output)
+        self.assertIn(
+            QUERIES_REGISTER_MSG.format(alias=QUERY_ALIASES['stats']), output
+        )
+        queries = self.irods_backend.get_registered_queries(self.irods)
+        self.assertNotIn(self.alias, queries)
+        self.assertEqual(sorted(queries), sorted(QUERY_ALIASES.values()))
+
+    def test_command_check(self):
+        """Test command with check mode"""
+        with self.assertLogs(self.logger_name) as cm:
+            call_command(self.cmd_name, check=True)
+        output = '\n'.join(cm.output)
+        self.assertIn(QUERIES_STALE_MSG.format(alias=self.alias), output)
+        queries = self.irods_backend.get_registered_queries(self.irods)
+        self.assertIn(self.alias, queries)
+        self.query.remove()
@@ -1,5 +1,7 @@
 """iRODS backend API for SODAR Django apps"""
 
+import hashlib
+import heapq
 import logging
 import math
 import os
@@ -7,15 +9,23 @@ import pytz
 import random
 import re
 import string
+import threading
+import time
 import uuid
 
-from base64 import b64decode, b64encode
-from contextlib import contextmanager
+from base64 import b64decode, b64encode, urlsafe_b64encode
+from contextlib import closing, contextmanager
+from itertools import islice
 
 from irods.api_number import api_number
 from irods.collection import iRODSCollection
 from irods.column import Criterion
-from irods.exception import CollectionDoesNotExist, CAT_NO_ROWS_FOUND
+from irods.exception import (
+    CollectionDoesNotExist,
+    CAT_NO_ROWS_FOUND,
+    CAT_UNKNOWN_SPECIFIC_QUERY,
+    NetworkException,
+)
 from irods.message import TicketAdminRequest, iRODSMessage
 from irods.models import Collection, DataObject, TicketQuery
 from irods.query import SpecificQuery
@@ -61,8 +71,280 @@ TRASH_COLL_NAME = 'trash'
 PATH_PARENT_SUBSTRING = '/..'
 ERROR_PATH_PARENT = 'Use of parent not allowed in path'
 ERROR_PATH_UNSET = 'Path is not set'
+ERROR_CURSOR_INVALID = 'Invalid list cursor'
 TICKET_MODE_READ = 'read'
 TICKET_MODE_WRITE = 'write'
+POOL_CHECK_IDLE_TIME = 10  # Health check pooled sessions idle for N seconds
+QUERY_ALIAS_PREFIX = 'sodar_query_'
+QUERY_LIST_ALIAS = 'ls'  # Built-in query for listing specific queries
+SQL_PATH_FILTER = '(coll_name = ? OR coll_name LIKE ?)'
+SQL_CHECKSUM_FILTER = (
+    '(? = \'1\' OR (data_name NOT LIKE \'%.md5\' '
+    'AND data_name NOT LIKE \'%.sha256\'))'
+)
+# Specific queries registered in iCAT by name, with arguments as bind variables
+# NOTE: Empty arguments are not bound by iRODS, so all arguments must be set
+SPECIFIC_QUERIES = {
+    'stats': (
+        'SELECT COUNT(data_id) AS file_count, SUM(data_size) AS total_size '
+        'FROM (SELECT data_id, data_size FROM r_data_main '
+        'JOIN r_coll_main USING (coll_id) '
+        'WHERE ' + SQL_PATH_FILTER + ' '
+        'AND data_name NOT LIKE \'%.md5\' '
+        'AND data_name NOT LIKE \'%.sha256\' '
+        'GROUP BY data_id, data_size) AS sub_query'
+    ),
+    'stats_bulk': (
+        'SELECT path, COUNT(data_id) AS file_count, '
+        'SUM(data_size) AS total_size FROM ('
+        'SELECT path, data_id, MAX(data_size) AS data_size '
+        'FROM (SELECT ? || sub_path AS path '
+        'FROM unnest(CAST(? AS TEXT[])) AS sub_path) AS paths '
+        'JOIN r_coll_main ON (coll_name = path '
+        'OR left(coll_name, length(path) + 1) = path || \'/\') '
+        'LEFT JOIN r_data_main ON r_data_main.coll_id = r_coll_main.coll_id '
+        'AND data_name NOT LIKE \'%.md5\' '
+        'AND data_name NOT LIKE \'%.sha256\' '
+        'WHERE ' + SQL_PATH_FILTER + ' '
+        'GROUP BY path, data_id) AS sub_query GROUP BY path'
+    ),
+    'objects': (
+        'SELECT data_name, data_size, r_data_main.modify_ts AS modify_ts, '
+        'coll_name, data_checksum '
+        'FROM r_data_main JOIN r_coll_main USING (coll_id) '
+        'WHERE ' + SQL_PATH_FILTER + ' AND ' + SQL_CHECKSUM_FILTER + ' '
+        'AND data_name LIKE ANY (CAST(? AS TEXT[])) '
+        'AND coll_name || \'/\' || data_name > ? COLLATE "C" '
+        'ORDER BY coll_name || \'/\' || data_name COLLATE "C" '
+        'LIMIT CAST(? AS BIGINT)'
+    ),
+    'objects_recursive': (
+        'SELECT DISTINCT ON (data_id) data_name, data_size, '
+        'r_data_main.modify_ts AS modify_ts, coll_name, data_checksum '
+        'FROM r_data_main JOIN r_coll_main USING (coll_id) '
+        'WHERE ' + SQL_PATH_FILTER + ' AND ' + SQL_CHECKSUM_FILTER + ' '
+        'AND data_name LIKE ANY (CAST(? AS TEXT[])) '
+        'LIMIT CAST(NULLIF(?, \'0\') AS BIGINT) OFFSET CAST(? AS BIGINT)'
+    ),
+    'colls': (
+        'SELECT coll_name FROM r_coll_main '
+        'WHERE coll_name LIKE ? AND coll_name > ? COLLATE "C" '
+        'ORDER BY coll_name COLLATE "C" LIMIT CAST(? AS BIGINT)'
+    ),
+    'object_paths_by_name': (
+        'SELECT coll_name, data_name '
+        'FROM r_data_main JOIN r_coll_main USING (coll_id) '
+        'WHERE coll_name LIKE ? AND data_name = ?'
+    ),
+    'sample_checksum_objects': (
+        'SELECT DISTINCT ON (data_id) data_name '
+        'FROM r_data_main JOIN r_coll_main USING (coll_id) '
+        'WHERE (coll_name LIKE ? OR coll_name LIKE ?) '
+        'AND r_data_main.data_checksum = ? LIMIT 1'
+    ),
+}
+# Query aliases include a hash of the SQL so changed queries get a new alias
+QUERY_ALIASES = {
+    k: '{}{}_{}'.format(
+        QUERY_ALIAS_PREFIX, k, hashlib.sha256(v.encode()).hexdigest()[:8]
+    )
+    for k, v in SPECIFIC_QUERIES.items()
+}
+
+
+class IrodsSessionPool:
+    """
+    Process-local pool of idle iRODS sessions keyed by user. Sessions are
+    health checked on reuse after being idle, closed after exceeding
+    IRODS_SESSION_POOL_TIMEOUT and the least recently used sessions are closed
+    if the pool exceeds IRODS_SESSION_POOL_SIZE.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+        self.sessions = {}  # Lists of (iRODSSession, release time) by key
+        self.metrics = self._get_empty_metrics()
+
+    @classmethod
+    def _get_empty_metrics(cls):
+        return {
+            'hits': 0,
+            'misses': 0,
+            'discards': 0,
+            'evictions': 0,
+            'connect_count': 0,
+            'connect_time': 0.0,
+            'connect_time_max': 0.0,
+        }
+
+    @classmethod
+    def _close(cls, irods):
+        """Close session, ignoring errors from broken connections"""
+        try:
+            irods.cleanup()
+        except Exception as ex:
+            logger.debug(
+                'Exception in closing pooled iRODS session: {}'.format(ex)
+            )
+
+    @classmethod
+    def _check_session(cls, irods):
+        """Return True if session is able to query iRODS"""
+        try:
+            irods.collections.exists(
+                '/{}/home/{}'.format(irods.zone, irods.username)
+            )
+            return True
+        except Exception:
+            return False
+
+    def _reset_if_forked(self):
+        """Drop sessions inherited from a parent process"""
+        if os.getpid() != self.pid:
+            # Connections belong to the parent process, so do not close them
+            self.pid = os.getpid()
+            self.sessions = {}
+            self.metrics = self._get_empty_metrics()
+
+    def _evict(self, now):
+        """
+        Remove expired sessions and sessions exceeding pool size. Must be
+        called with lock acquired.
+
+        :param now: Current time (float)
+        :return: List of removed iRODSSession objects
+        """
+        ret = []
+        timeout = settings.IRODS_SESSION_POOL_TIMEOUT
+        for key in list(self.sessions.keys()):
+            keep = []
+            for irods, released in self.sessions[key]:
+                if now - released > timeout:
+                    ret.append(irods)
+                else:
+                    keep.append((irods, released))
+            if keep:
+                self.sessions[key] = keep
+            else:
+                del self.sessions[key]
+        idle = sorted(
+            (released, key)
+            for key, sessions in self.sessions.items()
+            for _, released in sessions
+        )
+        for _, key in idle[: max(0, len(idle) - self.max_size)]:
+            ret.append(self.sessions[key].pop(0)[0])  # Oldest first
+            if not self.sessions[key]:
+                del self.sessions[key]
+        self.metrics['evictions'] += len(ret)
+        return ret
+
+    @property
+    def max_size(self):
+        return settings.IRODS_SESSION_POOL_SIZE
+
+    def acquire(self, key, init_func):
+        """
+        Return an idle session for a key or create a new session.
+
+        :param key: Pool key (hashable)
+        :param init_func: Function for creating a new iRODSSession object
+        :return: iRODSSession object
+        """
+        now = time.monotonic()
+        irods = None
+        with self.lock:
+            self._reset_if_forked()
+            expired = self._evict(now)
+            if self.sessions.get(key):
+                irods, released = self.sessions[key].pop()  # Most recent
+                if not self.sessions[key]:
+                    del self.sessions[key]
+        for s in expired:
+            self._close(s)
+        if irods and (
+            now - released < POOL_CHECK_IDLE_TIME or self._check_session(irods)
+        ):
+            with self.lock:
+                self.metrics['hits'] += 1
+            return irods
+        if irods:  # Failed health check
+            self._close(irods)
+            with self.lock:
+                self.metrics['discards'] += 1
+        time_start = time.monotonic()
+        irods = init_func()
+        connect_time = time.monotonic() - time_start
+        with self.lock:
+            self.metrics['misses'] += 1
+            self.metrics['connect_count'] += 1
+            self.metrics['connect_time'] += connect_time
+            self.metrics['connect_time_max'] = max(
+                self.metrics['connect_time_max'], connect_time
+            )
+        logger.debug(
+            'Opened iRODS session for user "{}" in {:.3f}s'.format(
+                irods.username, connect_time
+            )
+        )
+        return irods
+
+    def release(self, key, irods):
+        """
+        Return a session to the pool, closing it if pooling is disabled.
+
+        :param key: Pool key (hashable)
+        :param irods: iRODSSession object
+        """
+        if self.max_size < 1:
+            self._close(irods)
+            return
+        with self.lock:
+            self._reset_if_forked()
+            self.sessions.setdefault(key, []).append((irods, time.monotonic()))
+            expired = self._evict(time.monotonic())
+        for s in expired:
+            self._close(s)
+
+    def discard(self, irods):
+        """
+        Close a session without returning it to the pool.
+
+        :param irods: iRODSSession object
+        """
+        self._close(irods)
+        with self.lock:
+            self.metrics['discards'] += 1
+
+    def clear(self):
+        """Close all idle sessions in the pool"""
+        with self.lock:
+            self._reset_if_forked()
+            sessions = [s[0] for v in self.sessions.values() for s in v]
+            self.sessions = {}
+        for s in sessions:
+            self._close(s)
+
+    def get_metrics(self):
+        """
+        Return pool metrics for the current process.
+
+        :return: Dict
+        """
+        with self.lock:
+            self._reset_if_forked()
+            ret = dict(self.metrics)
+            ret['size'] = sum(len(v) for v in self.sessions.values())
+        ret['connect_time_avg'] = (
+            ret['connect_time'] / ret['connect_count']
+            if ret['connect_count']
+            else 0.0
+        )
+        return ret
+
+
+session_pool = IrodsSessionPool()
 
 
 class IrodsAPI:
@@ -118,6 +400,13 @@ class IrodsAPI:
             )
             raise ex
 
+    def _get_pool_key(self):
+        """Return session pool key for the API user"""
+        return (
+            self.user_name,
+            hashlib.sha256(self.user_pass.encode()).hexdigest(),
+        )
+
     @classmethod
     def _get_datetime(cls, naive_dt, api_format=False):
         """
@@ -136,7 +425,7 @@ class IrodsAPI:
     @classmethod
     def _get_query_alias(cls):
         """Return a random iCAT SQL query alias"""
-        return 'sodar_query_{}'.format(
+        return QUERY_ALIAS_PREFIX + '{}'.format(
             ''.join(
                 random.SystemRandom().choice(
                     string.ascii_lowercase + string.ascii_uppercase
@@ -166,6 +455,197 @@ class IrodsAPI:
             response = conn.recv()
         return response
 
+    @classmethod
+    def _get_query_rows(cls, irods, alias, args, columns):
+        """
+        Return result rows of a registered specific query.
+
+        :param irods: iRODSSession object
+        :param alias: Query alias (string)
+        :param args: Query arguments (list or None)
+        :param columns: List of columns to return or None
+        :return: List of result rows
+        """
+        query = SpecificQuery(irods, alias=alias, columns=columns, args=args)
+        try:
+            return list(query.get_results())
+        except CAT_NO_ROWS_FOUND:
+            return []
+
+    @classmethod
+    def _split_name_like(cls, name_like):
+        """
+        Split a list of file name filters into chunks to work around the query
+        length limitation in iRODS.
+
+        :param name_like: List of strings
+        :return: List of lists
+        """
+        f_len = sum([len(x) + NAME_LIKE_OVERHEAD for x in name_like])
+        q_count = math.ceil(f_len / NAME_LIKE_MAX_LEN)
+        q_len = math.ceil(len(name_like) / q_count)
+        return [
+            name_like[i : i + q_len] for i in range(0, len(name_like), q_len)
+        ]
+
+    @classmethod
+    def _escape_name_like(cls, name_like):
+        """
+        Return file name filters as a list with LIKE wildcards escaped.
+
+        :param name_like: String or list of strings
+        :return: List of strings
+        """
+        if not isinstance(name_like, list):
+            name_like = [name_like]
+        return [n.replace('_', '\_') for n in name_like]  # noqa
+
+    @classmethod
+    def _get_name_like_arg(cls, name_like):
+        """
+        Return query argument for filtering data object names as a PostgreSQL
+        array literal of LIKE patterns. Matches all names if no filters are
+        given.
+
+        :param name_like: List of strings or None
+        :return: String
+        """
+        patterns = ['%{}%'.format(n) for n in name_like] if name_like else ['%']
+        return cls._get_array_arg(patterns)
+
+    @classmethod
+    def _get_array_arg(cls, values):
+        """
+        Return query argument as a PostgreSQL array literal of strings.
+
+        :param values: List of strings
+        :return: String
+        """
+        return '{{{}}}'.format(
+            ','.join(
+                '"{}"'.format(v.replace('\\', '\\\\').replace('"', '\\"'))
+                for v in values
+            )
+        )
+
+    @classmethod
+    def _get_path_args(cls, path):
+        """
+        Return query arguments for matching a collection and its
+        subcollections with SQL_PATH_FILTER.
+
+        :param path: Full path to iRODS collection (string)
+        :return: List of strings
+        """
+        return [path, cls.escape_like(path) + '/%']
+
+    def _iter_keyset_query(
+        self, irods, name, columns, key_func, cursor, args=None
+    ):
+        """
+        Iterate over the results of a keyset paginated registered query. The
+        query is executed in batches, each batch retrieving rows with a key
+        greater than the cursor given as the second last argument and limited
+        by the batch size given as the last argument.
+
+        :param irods: iRODSSession object
+        :param name: Query name in SPECIFIC_QUERIES (string), must be ordered
+                     by key
+        :param columns: List of columns to return
+        :param key_func: Function for returning the key of a result row
+        :param cursor: Key to start iteration after (non-empty string)
+        :param args: Query arguments preceding cursor and limit (list or None)
+        :yield: Result rows
+        """
+        args = list(args or [])
+        limit = settings.IRODS_LIST_BATCH_SIZE
+        while True:
+            rows = self.execute_query(
+                irods, name, args=args + [cursor, str(limit)], columns=columns
+            )
+            yield from rows
+            if len(rows) < limit:
+                break
+            cursor = key_func(rows[-1])
+
+    def _iter_obj_dicts(
+        self,
+        irods,
+        coll,
+        include_checksum,
+        name_like,
+        cursor,
+        api_format,
+        checksum,
+    ):
+        """
+        Iterate over data objects recursively under a collection, ordered by
+        path.
+
+        :param irods: iRODSSession object
+        :param coll: Collection object
+        :param include_checksum: Include .md5/.sha256 files (bool)
+        :param name_like: List of strings or None
+        :param cursor: Path to start iteration after (string)
+        :param api_format: Format data for REST API (bool)
+        :param checksum: Include checksum in info (bool)
+        :yield: Dicts
+        """
+        columns = [
+            DataObject.name,
+            DataObject.size,
+            DataObject.modify_time,
+            Collection.name,
+            DataObject.checksum,
+        ]
+
+        def _get_path(row):
+            return row[Collection.name] + '/' + row[DataObject.name]
+
+        for row in self._iter_keyset_query(
+            irods,
+            'objects',
+            columns,
+            _get_path,
+            cursor,
+            args=self._get_path_args(coll.path)
+            + ['1' if include_checksum else '0']
+            + [self._get_name_like_arg(name_like)],
+        ):
+            d = {
+                'name': row[DataObject.name],
+                'type': 'obj',
+                'path': _get_path(row),
+                'size': row[DataObject.size],
+                'modify_time': self._get_datetime(
+                    row[DataObject.modify_time], api_format
+                ),
+            }
+            if checksum:
+                d['checksum'] = row[DataObject.checksum]
+            yield d
+
+    def _iter_coll_dicts(self, irods, coll, cursor):
+        """
+        Iterate over subcollections recursively under a collection, ordered by
+        path.
+
+        :param irods: iRODSSession object
+        :param coll: Collection object
+        :param cursor: Path to start iteration after (string)
+        :yield: Dicts
+        """
+        for row in self._iter_keyset_query(
+            irods,
+            'colls',
+            [Collection.name],
+            lambda x: x[Collection.name],
+            cursor,
+            args=[self.escape_like(coll.path) + '/%'],
+        ):
+            path = row[Collection.name]
+            yield {'name': path.split('/')[-1], 'type': 'coll', 'path': path}
+
     @classmethod
     def _validate_project(cls, project):
         """
@@ -218,6 +698,18 @@ class IrodsAPI:
             path = path[:-1]
         return path
 
+    @classmethod
+    def escape_like(cls, value):
+        """
+        Escape LIKE wildcards in a string for use in a query argument.
+
+        :param value: String
+        :return: String
+        """
+        return (
+            value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        )
+
     @classmethod
     def get_sub_path(cls, obj, landing_zone=False, include_parent=True):
         """
@@ -490,25 +982,64 @@ class IrodsAPI:
             base64_str = base64_str.split(IRODS_SHA256_PREFIX)[1]
         return b64decode(base64_str).hex()
 
+    @classmethod
+    def get_list_cursor(cls, path):
+        """
+        Return an opaque cursor for continuing an object listing after a given
+        path.
+
+        :param path: Full iRODS path (string)
+        :return: String
+        """
+        return urlsafe_b64encode(path.encode('utf-8')).decode()
+
+    @classmethod
+    def get_list_cursor_path(cls, cursor):
+        """
+        Return the iRODS path encoded in a list cursor.
+
+        :param cursor: Cursor string returned by get_list_cursor()
+        :return: String
+        :raise: ValueError if cursor is invalid
+        """
+        try:
+            return b64decode(cursor, altchars=b'-_', validate=True).decode(
+                'utf-8'
+            )
+        except Exception:
+            raise ValueError(ERROR_CURSOR_INVALID)
+
     # iRODS Operations ---------------------------------------------------------
 
     @contextmanager
     def get_session(self):
         """
         Return the iRODS session object for direct API access as a generator.
-        Use with the "with" keyword to ensure connection cleanup.
+        Use with the "with" keyword to ensure connection cleanup. Sessions are
+        reused from a process-local pool.
 
         :return: iRODSSession object wrapped as a generator
         """
-        irods = self._init_irods()
+        key = self._get_pool_key()
+        irods = session_pool.acquire(key, self._init_irods)
         try:
             yield irods
-        finally:
-            irods.cleanup()
+        except NetworkException:
+            session_pool.discard(irods)
+            raise
+        except Exception:
+            session_pool.release(key, irods)
+            raise
+        except BaseException:  # Connection state unknown on interruption
+            session_pool.discard(irods)
+            raise
+        else:
+            session_pool.release(key, irods)
 
     def get_session_obj(self):
         """
-        Return the iRODS session object for direct API access.
+        Return the iRODS session object for direct API access. The session is
+        not pooled.
         NOTE: Connection needs to be manually closed with cleanup()! If
         possible, use get_session() instead.
 
@@ -516,6 +1047,16 @@ class IrodsAPI:
         """
         return self._init_irods()
 
+    @classmethod
+    def get_session_pool_metrics(cls):
+        """
+        Return session pool hit, miss and connection latency metrics for the
+        current process.
+
+        :return: Dict
+        """
+        return session_pool.get_metrics()
+
     @classmethod
     def get_info(cls, irods):
         """
@@ -562,36 +1103,18 @@ class IrodsAPI:
             raise FileNotFoundError('iRODS collection not found')
 
         ret = {}
-        sql = (
-            'SELECT COUNT(data_id) as file_count, '
-            'SUM(data_size) as total_size '
-            'FROM (SELECT data_id, data_size FROM r_data_main '
-            'JOIN r_coll_main USING (coll_id) '
-            'WHERE (coll_name = \'{coll_path}\' '
-            'OR coll_name LIKE \'{coll_path}/%\') '
-            'AND data_name NOT LIKE \'%.md5\' '
-            'AND data_name NOT LIKE \'%.sha256\' '
-            'GROUP BY data_id, data_size) AS sub_query'.format(
-                coll_path=coll.path
-            )
-        )
-        # logger.debug('Object stats query = "{}"'.format(sql))
-        query = self.get_query(irods, sql)
-
         try:
-            result = next(query.get_results())
-            ret['file_count'] = int(result[0]) if result[0] else 0
-            ret['total_size'] = int(result[1]) if result[1] else 0
-        except CAT_NO_ROWS_FOUND:
-            pass
+            rows = self.execute_query(
+                irods, 'stats', args=self._get_path_args(coll.path)
+            )
         except Exception as ex:
             logger.error(
-                f'iRODS exception in get_stats(): '
-                f'{ex.__class__.__name__}; SQL = "{sql}"'
+                f'iRODS exception in get_stats(): {ex.__class__.__name__}'
             )
             raise ex
-        finally:
-            query.remove()
+        if rows:
+            ret['file_count'] = int(rows[0][0]) if rows[0][0] else 0
+            ret['total_size'] = int(rows[0][1]) if rows[0][1] else 0
 
         if include_colls:
             try:
@@ -603,6 +1126,40 @@ class IrodsAPI:
                 raise ex
         return ret
 
+    def get_stats_bulk(self, irods, paths):
+        """
+        Return file count and total file size for multiple iRODS collections.
+        Statistics are aggregated for each path in the iCAT query, with paths
+        split into as few queries as the query length limitation allows.
+
+        :param irods: iRODSSession object
+        :param paths: Full paths to iRODS collections (list of strings)
+        :return: Dict of sanitized paths and stats dicts, omitting paths for
+                 non-existent collections
+        :raise: ValueError if a path is invalid
+        """
+        paths = set(self.sanitize_path(p) for p in paths)
+        if not paths:
+            return {}
+        root_path = os.path.commonpath(paths)
+        # Paths are given relative to the common path to shorten the arguments
+        sub_paths = sorted(p[len(root_path) :] for p in paths)
+        # NOTE: Aggregate values are labeled with data object columns
+        columns = [Collection.name, DataObject.id, DataObject.size]
+        ret = {}
+        # NOTE: Path arguments are subject to the same length limitation
+        for chunk in self._split_name_like(sub_paths):
+            args = [root_path, self._get_array_arg(chunk)]
+            args += self._get_path_args(root_path)
+            for row in self.execute_query(
+                irods, 'stats_bulk', args=args, columns=columns
+            ):
+                ret[row[Collection.name]] = {
+                    'file_count': int(row[DataObject.id] or 0),
+                    'total_size': int(row[DataObject.size] or 0),
+                }
+        return ret
+
     @classmethod
     def get_colls_recursively(cls, coll):
         """
@@ -644,92 +1201,61 @@ class IrodsAPI:
         :return: List of dicts
         """
         ret = []
-        chk_filter = (
-            ''
-            if include_checksum
-            else 'AND data_name NOT LIKE \'%.md5\' AND data_name NOT LIKE '
-            '\'%.sha256\''
-        )
-        path_lookup = []
+        path_lookup = set()
         q_count = 1
+        columns = [
+            DataObject.name,
+            DataObject.size,
+            DataObject.modify_time,
+            Collection.name,
+            DataObject.checksum,
+        ]
 
         def _do_query(irods, nl=None):
-            sql = (
-                'SELECT DISTINCT ON (data_id) data_name, data_size, '
-                'r_data_main.modify_ts as modify_ts, coll_name{checksum}'
-                'FROM r_data_main JOIN r_coll_main USING (coll_id) '
-                'WHERE (coll_name = \'{coll_path}\' '
-                'OR coll_name LIKE \'{coll_path}/%\') {chk_filter}'.format(
-                    checksum=', data_checksum ' if checksum else ' ',
-                    coll_path=coll.path,
-                    chk_filter=chk_filter,
-                )
-            )
-            if nl:
-                if not isinstance(nl, list):
-                    nl = [nl]
-                sql += ' AND ('
-                for i, n in enumerate(nl):
-                    if i > 0:
-                        sql += ' OR '
-                    sql += 'data_name LIKE \'%{}%\''.format(n)
-                sql += ')'
-            if limit:
-                sql += ' LIMIT {}'.format(limit)
-            if offset:
-                sql += ' OFFSET {}'.format(offset)
-
-            # logger.debug('Object list query = "{}"'.format(sql))
-            columns = [
-                DataObject.name,
-                DataObject.size,
-                DataObject.modify_time,
-                Collection.name,
+            if nl and not isinstance(nl, list):
+                nl = [nl]
+            args = self._get_path_args(coll.path) + [
+                '1' if include_checksum else '0',
+                self._get_name_like_arg(nl),
+                str(limit or 0),
+                str(offset or 0),
             ]
-            if checksum:
-                columns.append(DataObject.checksum)
-            query = self.get_query(irods, sql, columns)
-
             try:
-                results = query.get_results()
-                for row in results:
-                    obj_path = row[Collection.name] + '/' + row[DataObject.name]
-                    if q_count > 1 and obj_path in path_lookup:
-                        continue  # Skip possible dupes in case of split query
-                    d = {
-                        'name': row[DataObject.name],
-                        'type': 'obj',
-                        'path': obj_path,
-                        'size': row[DataObject.size],
-                        'modify_time': self._get_datetime(
-                            row[DataObject.modify_time], api_format
-                        ),
-                    }
-                    if checksum:
-                        d['checksum'] = row[DataObject.checksum]
-                    ret.append(d)
-                    if q_count > 1:
-                        path_lookup.append(obj_path)
-            except CAT_NO_ROWS_FOUND:
-                pass
+                rows = self.execute_query(
+                    irods, 'objects_recursive', args=args, columns=columns
+                )
             except Exception as ex:
                 logger.error(
                     'iRODS exception in get_objs_recursively(): {}'.format(
                         ex.__class__.__name__
                     )
                 )
-            finally:
-                query.remove()
+                return
+            for row in rows:
+                obj_path = row[Collection.name] + '/' + row[DataObject.name]
+                if q_count > 1 and obj_path in path_lookup:
+                    continue  # Skip possible dupes in case of split query
+                d = {
+                    'name': row[DataObject.name],
+                    'type': 'obj',
+                    'path': obj_path,
+                    'size': row[DataObject.size],
+                    'modify_time': self._get_datetime(
+                        row[DataObject.modify_time], api_format
+                    ),
+                }
+                if checksum:
+                    d['checksum'] = row[DataObject.checksum]
+                ret.append(d)
+                if q_count > 1:
+                    path_lookup.add(obj_path)
 
         # HACK: Long queries cause a crash with iRODS so we have to split them
         if name_like and isinstance(name_like, list) and len(name_like) > 1:
-            f_len = sum([len(x) + NAME_LIKE_OVERHEAD for x in name_like])
-            q_count = math.ceil(f_len / NAME_LIKE_MAX_LEN)
-            q_len = math.ceil(len(name_like) / q_count)
-            q_idx = 0
-            for i in range(q_count):
-                _do_query(irods, name_like[q_idx : q_idx + q_len])
-                q_idx = q_idx + q_len
+            name_chunks = self._split_name_like(name_like)
+            q_count = len(name_chunks)
+            for nl in name_chunks:
+                _do_query(irods, nl)
         else:  # Single query
             _do_query(irods, name_like)
         return sorted(ret, key=lambda x: x['path'])
@@ -766,33 +1292,156 @@ class IrodsAPI:
         except CollectionDoesNotExist:
             raise FileNotFoundError('iRODS collection not found')
 
+        # Collections are merged into a single ordered stream (see #2159)
+        if include_colls:
+            start = offset or 0
+            with closing(
+                self._iter_objects(
+                    irods,
+                    coll,
+                    include_checksum=include_checksum,
+                    include_colls=True,
+                    name_like=name_like,
+                    api_format=api_format,
+                    checksum=checksum,
+                )
+            ) as objs:
+                return list(
+                    islice(objs, start, (start + limit) if limit else None)
+                )
+
         if name_like:
-            if not isinstance(name_like, list):
-                name_like = [name_like]
-            name_like = [n.replace('_', '\_') for n in name_like]  # noqa
-        ret = self.get_objs_recursively(
+            name_like = self._escape_name_like(name_like)
+        return self.get_objs_recursively(
+            irods,
+            coll,
+            include_checksum=include_checksum,
+            name_like=name_like,
+            limit=limit,
+            offset=offset,
+            api_format=api_format,
+            checksum=checksum,
+        )
+
+    def iter_objects(
+        self,
+        irods,
+        path,
+        include_checksum=False,
+        include_colls=False,
+        name_like=None,
+        cursor=None,
+        api_format=False,
+        checksum=False,
+    ):
+        """
+        Return a generator for iterating over iRODS objects recursively under a
+        given path, ordered by path. Results are retrieved from iCAT in batches
+        of IRODS_LIST_BATCH_SIZE using keyset pagination, so memory use does not
+        depend on the size of the collection.
+
+        :param irods: iRODSSession object
+        :param path: Full path to iRODS collection
+        :param include_checksum: Include .md5/.sha256 files (bool)
+        :param include_colls: Include collections (bool)
+        :param name_like: Filtering of file names (string or list of strings)
+        :param cursor: Start iteration after this cursor as returned by
+                       get_list_cursor() (string or None)
+        :param api_format: Format data for REST API (bool, default=False)
+        :param checksum: Include checksum in info (bool, default=False)
+        :return: Generator of dicts
+        :raise: FileNotFoundError if collection is not found
+        :raise: ValueError if cursor is invalid
+        """
+        try:
+            coll = irods.collections.get(self.sanitize_path(path))
+        except CollectionDoesNotExist:
+            raise FileNotFoundError('iRODS collection not found')
+        if cursor:
+            cursor = self.get_list_cursor_path(cursor)
+            if not cursor.startswith(coll.path + '/'):
+                raise ValueError(ERROR_CURSOR_INVALID)
+        return self._iter_objects(
             irods,
             coll,
             include_checksum=include_checksum,
+            include_colls=include_colls,
             name_like=name_like,
-            limit=limit if not include_colls else None,  # See #2159
-            offset=offset if not include_colls else None,
+            cursor=cursor,
             api_format=api_format,
             checksum=checksum,
         )
 
-        # Add collections if enabled
-        # TODO: Combine into a single query? (see #1883)
+    def _iter_objects(
+        self,
+        irods,
+        coll,
+        include_checksum=False,
+        include_colls=False,
+        name_like=None,
+        cursor=None,
+        api_format=False,
+        checksum=False,
+    ):
+        """
+        Iterate over iRODS objects recursively under a collection. Split name
+        filter queries and collections are merged into a single ordered
+        stream.
+
+        :param irods: iRODSSession object
+        :param coll: Collection object
+        :param include_checksum: Include .md5/.sha256 files (bool)
+        :param include_colls: Include collections (bool)
+        :param name_like: Filtering of file names (string or list of strings)
+        :param cursor: Path to start iteration after (string or None)
+        :param api_format: Format data for REST API (bool, default=False)
+        :param checksum: Include checksum in info (bool, default=False)
+        :yield: Dicts
+        """
+        if not cursor:
+            cursor = coll.path
+        if name_like:
+            name_chunks = self._split_name_like(
+                self._escape_name_like(name_like)
+            )
+        else:
+            name_chunks = [None]
+        iters = [
+            self._iter_obj_dicts(
+                irods, coll, include_checksum, nl, cursor, api_format, checksum
+            )
+            for nl in name_chunks
+        ]
         if include_colls:
-            colls = self.get_colls_recursively(coll)
-            for c in colls:
-                ret.append({'name': c.name, 'type': 'coll', 'path': c.path})
-            ret = sorted(ret, key=lambda x: x['path'])
-            if offset:  # See #2159
-                ret = ret[offset:]
-            if limit:
-                ret = ret[:limit]
-        return ret
+            iters.append(self._iter_coll_dicts(irods, coll, cursor))
+        prev_path = None
+        try:
+            for d in heapq.merge(*iters, key=lambda x: x['path']):
+                # Skip replicas and dupes in case of split query
+                if d['path'] == prev_path:
+                    continue
+                prev_path = d['path']
+                yield d
+        finally:
+            for it in iters:
+                it.close()
+
+    def iter_colls(self, irods, path):
+        """
+        Return a generator for iterating over collections recursively under a
+        given path, ordered by path. Results are retrieved from iCAT in batches
+        of IRODS_LIST_BATCH_SIZE using keyset pagination.
+
+        :param irods: iRODSSession object
+        :param path: Full path to iRODS collection
+        :return: Generator of dicts
+        :raise: FileNotFoundError if collection is not found
+        """
+        try:
+            coll = irods.collections.get(self.sanitize_path(path))
+        except CollectionDoesNotExist:
+            raise FileNotFoundError('iRODS collection not found')
+        return self._iter_coll_dicts(irods, coll, coll.path)
 
     @classmethod
     def get_child_colls(cls, irods, path):
@@ -810,10 +1459,50 @@ class IrodsAPI:
         except CollectionDoesNotExist:
             return []
 
+    def get_object_paths_by_name(self, irods, path, name):
+        """
+        Return paths of data objects with an exact name recursively under a
+        given path, retrieved in a single catalog query.
+
+        :param irods: iRODSSession object
+        :param path: Full path to iRODS collection (string)
+        :param name: Data object name (string)
+        :return: List of strings
+        """
+        rows = self.execute_query(
+            irods,
+            'object_paths_by_name',
+            args=[self.escape_like(self.sanitize_path(path)) + '/%', name],
+            columns=[Collection.name, DataObject.name],
+        )
+        return sorted(
+            row[Collection.name] + '/' + row[DataObject.name] for row in rows
+        )
+
+    def check_sample_checksum(self, irods, checksum):
+        """
+        Check if a data object with a given checksum exists in any project
+        sample data collection.
+
+        :param irods: iRODSSession object
+        :param checksum: Checksum as stored in iCAT (string)
+        :return: Boolean
+        """
+        coll = '%/' + self.escape_like(settings.IRODS_SAMPLE_COLL)
+        rows = self.execute_query(
+            irods,
+            'sample_checksum_objects',
+            args=[coll, coll + '/%', checksum],
+            columns=[DataObject.name],
+        )
+        return len(rows) > 0
+
     def get_query(self, irods, sql, columns=None, register=True):
         """
         Return a SpecificQuery object with a standard query alias. If
-        registered, should be removed with remove() after use.
+        registered, should be removed with remove() after use. For queries run
+        repeatedly, execute_query() with a registered query should be used
+        instead.
 
         :param irods: iRODSSession object
         :param sql: SQL (string)
@@ -826,6 +1515,83 @@ class IrodsAPI:
             query.register()
         return query
 
+    def execute_query(self, irods, name, args=None, columns=None):
+        """
+        Execute a registered specific query from SPECIFIC_QUERIES with bind
+        arguments. The query is registered in iCAT on first use if not found.
+
+        :param irods: iRODSSession object
+        :param name: Query name (string)
+        :param args: Query arguments (list of non-empty strings, optional)
+        :param columns: List of columns to return (optional)
+        :return: List of result rows
+        :raise: KeyError if query name is not found
+        """
+        alias = QUERY_ALIASES[name]
+        try:
+            return self._get_query_rows(irods, alias, args, columns)
+        except CAT_UNKNOWN_SPECIFIC_QUERY:
+            self.register_queries(irods, names=[name])
+        return self._get_query_rows(irods, alias, args, columns)
+
+    def register_queries(self, irods, names=None):
+        """
+        Register specific queries from SPECIFIC_QUERIES in iCAT. Queries
+        already registered with the same alias are skipped.
+
+        :param irods: iRODSSession object
+        :param names: Query names (list or None for all queries)
+        :return: List of registered aliases
+        """
+        ret = []
+        if names is None:
+            names = SPECIFIC_QUERIES.keys()
+        for name in names:
+            query = SpecificQuery(
+                irods, SPECIFIC_QUERIES[name], QUERY_ALIASES[name]
+            )
+            try:
+                query.register()
+                ret.append(QUERY_ALIASES[name])
+            except Exception as ex:
+                # Registration may fail if query was registered concurrently
+                logger.debug(
+                    'Unable to register query "{}": {}'.format(
+                        QUERY_ALIASES[name], ex.__class__.__name__
+                    )
+                )
+        return ret
+
+    @classmethod
+    def get_registered_queries(cls, irods):
+        """
+        Return SODAR specific queries currently registered in iCAT. Includes
+        registered queries from SPECIFIC_QUERIES as well as queries registered
+        with get_query().
+
+        :param irods: iRODSSession object
+        :return: Dict of aliases and SQL strings
+        """
+        query = SpecificQuery(irods, alias=QUERY_LIST_ALIAS)
+        try:
+            return {
+                row[0]: row[1]
+                for row in query.get_results()
+                if row[0].startswith(QUERY_ALIAS_PREFIX)
+            }
+        except CAT_NO_ROWS_FOUND:
+            return {}
+
+    @classmethod
+    def remove_query(cls, irods, alias):
+        """
+        Remove a specific query from iCAT.
+
+        :param irods: iRODSSession object
+        :param alias: Query alias (string)
+        """
+        SpecificQuery(irods, alias=alias).remove()
+
     def issue_ticket(
         self,
         irods,
@@ -17,10 +17,13 @@ IRODS_INFO_SETTINGS = [
     'IRODS_HASH_SCHEME',
     'IRODS_HOST',
     'IRODS_LANDING_ZONE_COLL',
+    'IRODS_LIST_BATCH_SIZE',
     'IRODS_PORT',
     'IRODS_QUERY_BATCH_SIZE',
     'IRODS_ROOT_PATH',
     'IRODS_SAMPLE_COLL',
+    'IRODS_SESSION_POOL_SIZE',
+    'IRODS_SESSION_POOL_TIMEOUT',
     'IRODS_SODAR_AUTH',
     'IRODS_USER',
     'IRODS_WEBDAV_ENABLED',
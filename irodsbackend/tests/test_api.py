@@ -1,5 +1,7 @@
 """Tests for the API in the irodsbackend app"""
 
+import time
+
 from django.conf import settings
 from django.test import override_settings
 
@@ -21,6 +23,8 @@ from landingzones.tests.test_models import LandingZoneMixin
 
 from irodsbackend.api import (
     IrodsAPI,
+    IrodsSessionPool,
+    POOL_CHECK_IDLE_TIME,
     USER_GROUP_TEMPLATE,
     OWNER_GROUP_TEMPLATE,
     IRODS_SHA256_PREFIX,
@@ -373,3 +377,145 @@ class TestIrodsAPI(
             ),
             CHECKSUM_SHA256_HEX,
         )
+
+    def test_get_list_cursor(self):
+        """Test get_list_cursor()"""
+        path = self.irods_backend.get_path(self.project) + '/file_ä.txt'
+        cursor = self.irods_backend.get_list_cursor(path)
+        self.assertNotIn('/', cursor)
+        self.assertEqual(self.irods_backend.get_list_cursor_path(cursor), path)
+
+    def test_get_list_cursor_path_invalid(self):
+        """Test get_list_cursor_path() with invalid cursor"""
+        with self.assertRaises(ValueError):
+            self.irods_backend.get_list_cursor_path('%%%')
+
+
+class FakeSession:
+    """Minimal iRODS session for session pool tests"""
+
+    class FakeCollections:
+        def __init__(self, session):
+            self.session = session
+
+        def exists(self, path):
+            if not self.session.healthy:
+                raise ConnectionError('Connection lost')
+            return True
+
+    def __init__(self, username='rods'):
+        self.username = username
+        self.zone = IRODS_ZONE
+        self.healthy = True
+        self.closed = False
+        self.collections = self.FakeCollections(self)
+
+    def cleanup(self):
+        self.closed = True
+
+
+@override_settings(IRODS_SESSION_POOL_SIZE=2, IRODS_SESSION_POOL_TIMEOUT=300)
+class TestIrodsSessionPool(TestCase):
+    """Tests for IrodsSessionPool"""
+
+    def setUp(self):
+        self.pool = IrodsSessionPool()
+        self.created = []
+
+    def _init_session(self):
+        irods = FakeSession()
+        self.created.append(irods)
+        return irods
+
+    def test_acquire(self):
+        """Test acquire() with empty pool"""
+        irods = self.pool.acquire('user', self._init_session)
+        self.assertEqual(self.created, [irods])
+        metrics = self.pool.get_metrics()
+        self.assertEqual(metrics['hits'], 0)
+        self.assertEqual(metrics['misses'], 1)
+        self.assertEqual(metrics['connect_count'], 1)
+        self.assertEqual(metrics['size'], 0)
+
+    def test_acquire_release(self):
+        """Test acquire() after release()"""
+        irods = self.pool.acquire('user', self._init_session)
+        self.pool.release('user', irods)
+        self.assertEqual(self.pool.get_metrics()['size'], 1)
+        self.assertEqual(self.pool.acquire('user', self._init_session), irods)
+        self.assertEqual(len(self.created), 1)
+        self.assertFalse(irods.closed)
+        metrics = self.pool.get_metrics()
+        self.assertEqual(metrics['hits'], 1)
+        self.assertEqual(metrics['size'], 0)
+
+    def test_acquire_other_key(self):
+        """Test acquire() with session pooled for another key"""
+        irods = self.pool.acquire('user', self._init_session)
+        self.pool.release('user', irods)
+        self.assertNotEqual(
+            self.pool.acquire('user2', self._init_session), irods
+        )
+        self.assertEqual(len(self.created), 2)
+
+    def test_acquire_unhealthy(self):
+        """Test acquire() with failing health check"""
+        irods = self.pool.acquire('user', self._init_session)
+        self.pool.release('user', irods)
+        irods.healthy = False
+        self.pool.sessions['user'][0] = (
+            irods,
+            time.monotonic() - POOL_CHECK_IDLE_TIME - 1,
+        )
+        new_irods = self.pool.acquire('user', self._init_session)
+        self.assertNotEqual(new_irods, irods)
+        self.assertTrue(irods.closed)
+        self.assertEqual(self.pool.get_metrics()['discards'], 1)
+
+    def test_acquire_expired(self):
+        """Test acquire() with expired session"""
+        irods = self.pool.acquire('user', self._init_session)
+        self.pool.release('user', irods)
+        self.pool.sessions['user'][0] = (irods, time.monotonic() - 301)
+        new_irods = self.pool.acquire('user', self._init_session)
+        self.assertNotEqual(new_irods, irods)
+        self.assertTrue(irods.closed)
+        self.assertEqual(self.pool.get_metrics()['evictions'], 1)
+
+    def test_release_max_size(self):
+        """Test release() exceeding pool size"""
+        sessions = [
+            self.pool.acquire('user', self._init_session) for _ in range(3)
+        ]
+        for irods in sessions:
+            self.pool.release('user', irods)
+        # Least recently released session should be closed
+        self.assertTrue(sessions[0].closed)
+        self.assertFalse(sessions[1].closed)
+        self.assertFalse(sessions[2].closed)
+        metrics = self.pool.get_metrics()
+        self.assertEqual(metrics['size'], 2)
+        self.assertEqual(metrics['evictions'], 1)
+
+    @override_settings(IRODS_SESSION_POOL_SIZE=0)
+    def test_release_disabled(self):
+        """Test release() with pool disabled"""
+        irods = self.pool.acquire('user', self._init_session)
+        self.pool.release('user', irods)
+        self.assertTrue(irods.closed)
+        self.assertEqual(self.pool.get_metrics()['size'], 0)
+
+    def test_discard(self):
+        """Test discard()"""
+        irods = self.pool.acquire('user', self._init_session)
+        self.pool.discard(irods)
+        self.assertTrue(irods.closed)
+        self.assertEqual(self.pool.get_metrics()['size'], 0)
+
+    def test_clear(self):
+        """Test clear()"""
+        irods = self.pool.acquire('user', self._init_session)
+        self.pool.release('user', irods)
+        self.pool.clear()
+        self.assertTrue(irods.closed)
+        self.assertEqual(self.pool.get_metrics()['size'], 0)
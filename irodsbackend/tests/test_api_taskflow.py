@@ -31,7 +31,11 @@ from taskflowbackend.tests.base import (
     HASH_SCHEME_SHA256,
 )
 
-from irodsbackend.api import TICKET_MODE_READ, TICKET_MODE_WRITE
+from irodsbackend.api import (
+    QUERY_ALIASES,
+    TICKET_MODE_READ,
+    TICKET_MODE_WRITE,
+)
 
 
 # SODAR constants
@@ -196,6 +200,74 @@ class TestIrodsAPIGetStats(IrodsAPITaskflowTestBase):
             self.irods_backend.get_stats(self.irods, path)
 
 
+class TestIrodsAPIGetStatsBulk(IrodsAPITaskflowTestBase):
+    """Tests for IrodsAPI.get_stats_bulk() with Taskflow"""
+
+    def setUp(self):
+        super().setUp()
+        self.make_irods_colls(self.investigation)
+        self.assay_path = self.irods_backend.get_path(self.assay)
+        self.subcoll_path = os.path.join(self.assay_path, SUBCOLL_NAME)
+        self.coll = self.irods.collections.create(self.subcoll_path)
+
+    def test_get_stats_bulk_empty(self):
+        """Test get_stats_bulk() with no files"""
+        stats = self.irods_backend.get_stats_bulk(
+            self.irods, [self.assay_path, self.subcoll_path]
+        )
+        expected = {
+            self.assay_path: {'file_count': 0, 'total_size': 0},
+            self.subcoll_path: {'file_count': 0, 'total_size': 0},
+        }
+        self.assertEqual(stats, expected)
+
+    def test_get_stats_bulk_files(self):
+        """Test get_stats_bulk() with files in nested collections"""
+        obj = self.make_irods_object(self.coll, TEST_FILE_NAME)
+        self.make_checksum_object(obj)
+        assay_coll = self.irods.collections.get(self.assay_path)
+        obj2 = self.make_irods_object(assay_coll, TEST_FILE_NAME2)
+        self.make_checksum_object(obj2, scheme=HASH_SCHEME_SHA256)
+        paths = [self.assay_path, self.subcoll_path]
+        stats = self.irods_backend.get_stats_bulk(self.irods, paths)
+        # Checksum files should not be included
+        expected = {
+            self.assay_path: {'file_count': 2, 'total_size': 2048},
+            self.subcoll_path: {'file_count': 1, 'total_size': 1024},
+        }
+        self.assertEqual(stats, expected)
+        for path in paths:
+            self.assertEqual(
+                stats[path], self.irods_backend.get_stats(self.irods, path)
+            )
+
+    def test_get_stats_bulk_prefix(self):
+        """Test get_stats_bulk() with sibling paths sharing a name prefix"""
+        coll2 = self.irods.collections.create(self.subcoll_path + '2')
+        self.make_irods_object(coll2, TEST_FILE_NAME)
+        stats = self.irods_backend.get_stats_bulk(
+            self.irods, [self.subcoll_path, coll2.path]
+        )
+        expected = {
+            self.subcoll_path: {'file_count': 0, 'total_size': 0},
+            coll2.path: {'file_count': 1, 'total_size': 1024},
+        }
+        self.assertEqual(stats, expected)
+
+    def test_get_stats_bulk_invalid_path(self):
+        """Test get_stats_bulk() with invalid path"""
+        path = os.path.join(self.assay_path, INVALID_COLL)
+        stats = self.irods_backend.get_stats_bulk(
+            self.irods, [self.subcoll_path, path]
+        )
+        expected = {self.subcoll_path: {'file_count': 0, 'total_size': 0}}
+        self.assertEqual(stats, expected)
+
+    def test_get_stats_bulk_no_paths(self):
+        """Test get_stats_bulk() with no paths"""
+        self.assertEqual(self.irods_backend.get_stats_bulk(self.irods, []), {})
+
+
 class TestIrodsAPIGetObjects(IrodsAPITaskflowTestBase):
     """Tests for IrodsAPI.get_objects() with Taskflow"""
 
@@ -597,6 +669,238 @@ class TestIrodsAPIGetObjects(IrodsAPITaskflowTestBase):
         self.assertIsNotNone(obj_list[0]['checksum'])
 
 
+class TestIrodsAPIGetObjectPathsByName(IrodsAPITaskflowTestBase):
+    """Tests for IrodsAPI.get_object_paths_by_name() with Taskflow"""
+
+    def setUp(self):
+        super().setUp()
+        self.make_irods_colls(self.investigation)
+        self.assay_path = self.irods_backend.get_path(self.assay)
+        self.coll = self.irods.collections.get(self.assay_path)
+
+    def test_get(self):
+        """Test get_object_paths_by_name()"""
+        sub_coll = self.irods.collections.create(self.assay_path + '/sub')
+        self.make_irods_object(self.coll, TEST_FILE_NAME)
+        self.make_irods_object(sub_coll, TEST_FILE_NAME)
+        self.make_irods_object(self.coll, TEST_FILE_NAME + '.bak')
+        paths = self.irods_backend.get_object_paths_by_name(
+            self.irods, self.irods_backend.get_projects_path(), TEST_FILE_NAME
+        )
+        expected = [
+            os.path.join(sub_coll.path, TEST_FILE_NAME),
+            os.path.join(self.assay_path, TEST_FILE_NAME),
+        ]
+        self.assertEqual(paths, expected)
+
+    def test_get_no_results(self):
+        """Test get_object_paths_by_name() with no matching objects"""
+        self.make_irods_object(self.coll, TEST_FILE_NAME)
+        paths = self.irods_backend.get_object_paths_by_name(
+            self.irods, self.assay_path, 'not_found.txt'
+        )
+        self.assertEqual(paths, [])
+
+
+class TestIrodsAPIIterObjects(IrodsAPITaskflowTestBase):
+    """Tests for IrodsAPI.iter_objects() with Taskflow"""
+
+    def setUp(self):
+        super().setUp()
+        # Create iRODS collections
+        self.make_irods_colls(self.investigation)
+        self.assay_path = self.irods_backend.get_path(self.assay)
+        self.coll = self.irods.collections.get(self.assay_path)
+
+    def test_iter_objects(self):
+        """Test iter_objects() with files in a sample collection"""
+        data_obj = self.make_irods_object(self.coll, TEST_FILE_NAME)
+        self.make_checksum_object(data_obj)
+        obj_list = list(
+            self.irods_backend.iter_objects(self.irods, self.assay_path)
+        )
+        self.assertEqual(
+            obj_list,
+            self.irods_backend.get_objects(self.irods, self.assay_path),
+        )
+
+    def test_iter_objects_include_colls(self):
+        """Test iter_objects() with include_colls"""
+        sub_coll = self.irods.collections.create(
+            os.path.join(self.assay_path, SUBCOLL_NAME)
+        )
+        self.make_irods_object(sub_coll, TEST_FILE_NAME)
+        self.make_irods_object(self.coll, TEST_FILE_NAME2)
+        obj_list = list(
+            self.irods_backend.iter_objects(
+                self.irods, self.assay_path, include_colls=True
+            )
+        )
+        expected = [
+            os.path.join(self.assay_path, SUBCOLL_NAME),
+            os.path.join(self.assay_path, SUBCOLL_NAME, TEST_FILE_NAME),
+            os.path.join(self.assay_path, TEST_FILE_NAME2),
+        ]
+        self.assertEqual([o['path'] for o in obj_list], expected)
+        self.assertEqual(obj_list[0]['type'], 'coll')
+        self.assertEqual(obj_list[0]['name'], SUBCOLL_NAME)
+
+    @override_settings(IRODS_LIST_BATCH_SIZE=2)
+    def test_iter_objects_batch(self):
+        """Test iter_objects() with multiple query batches"""
+        for i in range(5):
+            self.make_irods_object(self.coll, 'test{}'.format(i))
+        obj_list = list(
+            self.irods_backend.iter_objects(self.irods, self.assay_path)
+        )
+        self.assertEqual(
+            [o['name'] for o in obj_list],
+            ['test{}'.format(i) for i in range(5)],
+        )
+
+    def test_iter_objects_cursor(self):
+        """Test iter_objects() with cursor"""
+        self.make_irods_object(self.coll, TEST_FILE_NAME)
+        self.make_irods_object(self.coll, TEST_FILE_NAME2)
+        self.make_irods_object(self.coll, TEST_FILE_NAME3)
+        cursor = self.irods_backend.get_list_cursor(
+            os.path.join(self.assay_path, TEST_FILE_NAME)
+        )
+        obj_list = list(
+            self.irods_backend.iter_objects(
+                self.irods, self.assay_path, cursor=cursor
+            )
+        )
+        self.assertEqual(
+            [o['name'] for o in obj_list], [TEST_FILE_NAME2, TEST_FILE_NAME3]
+        )
+
+    def test_iter_objects_cursor_invalid_path(self):
+        """Test iter_objects() with cursor outside of collection"""
+        cursor = self.irods_backend.get_list_cursor(
+            self.irods_backend.get_path(self.project)
+        )
+        with self.assertRaises(ValueError):
+            self.irods_backend.iter_objects(
+                self.irods, self.assay_path, cursor=cursor
+            )
+
+    def test_iter_objects_name_like_multi(self):
+        """Test iter_objects() with split name filter queries"""
+        self.make_irods_object(self.coll, TEST_FILE_NAME)
+        self.make_irods_object(self.coll, TEST_FILE_NAME2)
+        name_like = [TEST_FILE_NAME2, 'test'] + [
+            ''.join(random.choice(string.ascii_lowercase) for _ in range(64))
+            for _ in range(50)
+        ]
+        obj_list = list(
+            self.irods_backend.iter_objects(
+                self.irods, self.assay_path, name_like=name_like
+            )
+        )
+        self.assertEqual(
+            [o['name'] for o in obj_list], [TEST_FILE_NAME, TEST_FILE_NAME2]
+        )
+
+    def test_iter_objects_non_existent_coll(self):
+        """Test iter_objects() with non-existent collection"""
+        path = os.path.join(self.assay_path, INVALID_COLL)
+        with self.assertRaises(FileNotFoundError):
+            self.irods_backend.iter_objects(self.irods, path)
+
+
+class TestIrodsAPIIterColls(IrodsAPITaskflowTestBase):
+    """Tests for IrodsAPI.iter_colls() with Taskflow"""
+
+    def setUp(self):
+        super().setUp()
+        self.make_irods_colls(self.investigation)
+        self.assay_path = self.irods_backend.get_path(self.assay)
+        self.coll = self.irods.collections.get(self.assay_path)
+
+    @override_settings(IRODS_LIST_BATCH_SIZE=2)
+    def test_iter_colls(self):
+        """Test iter_colls()"""
+        sub_coll = self.irods.collections.create(
+            os.path.join(self.assay_path, SUBCOLL_NAME)
+        )
+        self.irods.collections.create(os.path.join(sub_coll.path, 'sub'))
+        self.make_irods_object(sub_coll, TEST_FILE_NAME)
+        coll_list = list(
+            self.irods_backend.iter_colls(self.irods, self.assay_path)
+        )
+        expected = sorted(
+            [c.path for c in self.coll.subcollections]
+            + [os.path.join(sub_coll.path, 'sub')]
+        )
+        self.assertEqual([c['path'] for c in coll_list], expected)
+        self.assertTrue(all(c['type'] == 'coll' for c in coll_list))
+
+    def test_iter_colls_non_existent_coll(self):
+        """Test iter_colls() with non-existent collection"""
+        path = os.path.join(self.assay_path, INVALID_COLL)
+        with self.assertRaises(FileNotFoundError):
+            self.irods_backend.iter_colls(self.irods, path)
+
+
+class TestIrodsAPIRegisteredQueries(IrodsAPITaskflowTestBase):
+    """Tests for IrodsAPI registered specific queries with Taskflow"""
+
+    def setUp(self):
+        super().setUp()
+        self.make_irods_colls(self.investigation)
+        self.assay_path = self.irods_backend.get_path(self.assay)
+        self.alias = QUERY_ALIASES['stats']
+
+    def test_register_queries(self):
+        """Test register_queries()"""
+        self.irods_backend.register_queries(self.irods)
+        queries = self.irods_backend.get_registered_queries(self.irods)
+        for alias in QUERY_ALIASES.values():
+            self.assertIn(alias, queries)
+        # Registering again should not fail
+        self.assertEqual(
+            self.irods_backend.register_queries(self.irods, names=['stats']),
+            [],
+        )
+
+    def test_remove_query(self):
+        """Test remove_query()"""
+        self.irods_backend.register_queries(self.irods, names=['stats'])
+        self.irods_backend.remove_query(self.irods, self.alias)
+        queries = self.irods_backend.get_registered_queries(self.irods)
+        self.assertNotIn(self.alias, queries)
+
+    def test_execute_query(self):
+        """Test execute_query()"""
+        self.irods_backend.register_queries(self.irods, names=['stats'])
+        rows = self.irods_backend.execute_query(
+            self.irods, 'stats', args=[self.assay_path, self.assay_path + '/%']
+        )
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(int(rows[0][0]), 0)
+
+    def test_execute_query_unregistered(self):
+        """Test execute_query() with unregistered query"""
+        self.irods_backend.register_queries(self.irods, names=['stats'])
+        self.irods_backend.remove_query(self.irods, self.alias)
+        rows = self.irods_backend.execute_query(
+            self.irods, 'stats', args=[self.assay_path, self.assay_path + '/%']
+        )
+        self.assertEqual(len(rows), 1)
+        queries = self.irods_backend.get_registered_queries(self.irods)
+        self.assertIn(self.alias, queries)
+
+    def test_get_registered_queries_adhoc(self):
+        """Test get_registered_queries() with ad hoc query"""
+        query = self.irods_backend.get_query(
+            self.irods, 'SELECT coll_name FROM r_coll_main'
+        )
+        queries = self.irods_backend.get_registered_queries(self.irods)
+        self.assertIn(query._alias, queries)
+        query.remove()
+
+
 class TestIrodsAPITickets(IrodsAPITaskflowTestBase):
     """Tests for IrodsAPI ticket methods with Taskflow"""
 
@@ -168,28 +168,37 @@ class IrodsStatisticsAjaxView(BaseIrodsAjaxView):
     def post(self, request, *args, **kwargs):
         ret = {}
         project_path = self.irods_backend.get_path(self.project)
+        stat_paths = {}  # Sanitized paths by requested path
         try:
-            irods = self.irods_backend.get_session_obj()
+            with self.irods_backend.get_session() as irods:
+                for p in request.POST.getlist('paths'):
+                    if not p.startswith(project_path):
+                        ret[p] = {'status': 400}
+                    elif not self._check_collection_perm(
+                        p, request.user, irods
+                    ):
+                        ret[p] = {'status': 403}
+                    else:
+                        try:
+                            stat_paths[p] = self.irods_backend.sanitize_path(p)
+                        except Exception:
+                            ret[p] = {'status': 500}
+                # Retrieve stats for all permitted paths in a single query
+                try:
+                    stats = self.irods_backend.get_stats_bulk(
+                        irods, stat_paths.values()
+                    )
+                except Exception:
+                    stats = None
         except Exception as ex:
             return JsonResponse(self._get_detail(ex), status=500)
-        for p in request.POST.getlist('paths'):
-            d = {}
-            if not p.startswith(project_path):
-                d['status'] = 400
-            elif not self._check_collection_perm(p, request.user, irods):
-                d['status'] = 403
+        for p, sp in stat_paths.items():
+            if stats is None:
+                ret[p] = {'status': 500}
+            elif sp in stats:
+                ret[p] = {**stats[sp], 'status': 200}
             else:
-                try:
-                    if irods.collections.exists(p):
-                        stats = self.irods_backend.get_stats(irods, p)
-                        d.update(stats)
-                        d['status'] = 200
-                    else:
-                        d['status'] = 404
-                except Exception:
-                    d['status'] = 500
-            ret[p] = d
-        irods.cleanup()
+                ret[p] = {'status': 404}
         return Response({'irods_stats': ret}, status=200)
 
 
@@ -10,6 +10,7 @@ from projectroles.models import Project
 from samplesheets.models import Assay
 
 import landingzones.constants as lc
+from landingzones.utils import publish_zone_status
 
 # Access Django user model
 AUTH_USER_MODEL = getattr(settings, 'AUTH_USER_MODEL', 'auth.User')
@@ -138,6 +139,8 @@ class LandingZone(models.Model):
         else:
             self.status_info = lc.DEFAULT_STATUS_INFO[status][:1024]
         self.save()
+        if settings.LANDINGZONES_STATUS_PUSH:
+            publish_zone_status(self)
 
     def is_locked(self):
         """
@@ -91,6 +91,8 @@ LANDINGZONES_INFO_SETTINGS = [
     'LANDINGZONES_DISABLE_FOR_USERS',
     'LANDINGZONES_FILE_LIST_PAGINATION',
     'LANDINGZONES_STATUS_INTERVAL',
+    'LANDINGZONES_STATUS_PUSH',
+    'LANDINGZONES_STATUS_STREAM_TIMEOUT',
     'LANDINGZONES_TRIGGER_ENABLE',
     'LANDINGZONES_TRIGGER_FILE',
     'LANDINGZONES_TRIGGER_MOVE_INTERVAL',
@@ -4,6 +4,91 @@ var isSuperuser = false;
 /*********************
  Zone status updating
  *********************/
+var updateZoneRow = function(zoneTr, zoneInfo) {
+    var zoneUuid = zoneTr.attr('data-zone-uuid');
+    var sampleUrl = zoneTr.attr('data-sample-url');
+    var statusTd = zoneTr.find('td#sodar-lz-zone-status-' + zoneUuid);
+    var statusInfoSpan = zoneTr.find(
+        'span#sodar-lz-zone-status-info-' + zoneUuid);
+    var statusStyles = {
+        'CREATING': 'bg-warning',
+        'NOT CREATED': 'bg-danger',
+        'ACTIVE': 'bg-info',
+        'PREPARING': 'bg-warning',
+        'VALIDATING': 'bg-warning',
+        'MOVING': 'bg-warning',
+        'MOVED': 'bg-success',
+        'FAILED': 'bg-danger',
+        'DELETING': 'bg-warning',
+        'DELETED': 'bg-secondary'
+    };
+
+    var zoneStatus = zoneInfo.status;
+    var zoneStatusInfo = zoneInfo.status_info.replaceAll(
+        '\n', '<br />');
+    var statusInfoHtml = zoneStatusInfo;
+    if (zoneInfo.truncated) {
+        statusInfoHtml += '<span class="sodar-lz-zone-status-truncate">...</span>';
+        statusInfoHtml += '<div><a class="sodar-lz-zone-status-link">See more</a></div>';
+    }
+    // Update data-zone-modified
+    zoneTr.attr('data-zone-modified', zoneInfo.modified);
+    if (
+        statusTd.text() !== zoneStatus ||
+        statusInfoSpan.text() !== zoneStatusInfo
+    ) {
+        statusTd.text(zoneStatus);
+        statusTd.removeClass();
+        statusTd.addClass(
+            'sodar-lz-zone-status ' + statusStyles[zoneStatus] + ' text-white');
+        statusInfoSpan.html(statusInfoHtml);
+        if (['PREPARING', 'VALIDATING', 'MOVING', 'DELETING'].includes(zoneStatus)) {
+            statusTd.append(
+                '<span class="pull-right"><i class="iconify" data-icon="mdi:lock"></i></span>'
+            );
+        }
+        if (['CREATING', 'NOT CREATED', 'MOVED', 'DELETED'].includes(zoneStatus)) {
+            zoneTr.find('p#sodar-lz-zone-stats-container-' + zoneUuid).hide();
+            if (zoneStatus === 'MOVED') {
+                var statusMovedSpan = zoneTr.find(
+                    'span#sodar-lz-zone-status-moved-' + zoneUuid
+                );
+                statusMovedSpan.html(
+                    '<p class="sodar-lz-zone-sample-link mb-0">' +
+                    '<a href="' + sampleUrl + '">' +
+                    '<i class="iconify" data-icon="mdi:arrow-right-circle"></i> ' +
+                    'Browse files in sample sheets</a></p>'
+                );
+            }
+        }
+
+        // Button modification
+        if (zoneStatus !== 'ACTIVE' &&
+            zoneStatus !== 'FAILED' && !isSuperuser) {
+            zoneTr.find('.btn').each(function () {
+                if ($(this).is('button')) {
+                    $(this).attr('disabled', 'disabled');
+                } else if ($(this).is('a')) {
+                    $(this).addClass('disabled');
+                }
+            });
+            zoneTr.find('.sodar-list-dropdown').addClass('disabled');
+        } else {
+            if (zoneStatus !== 'DELETED') {
+                zoneTr.find(
+                    'p#sodar-lz-zone-stats-container-' + zoneUuid).show();
+            }
+            zoneTr.find('.btn').each(function () {
+                if ($(this).is('button')) {
+                    $(this).removeAttr('disabled');
+                }
+                $(this).removeClass('disabled');
+            });
+            zoneTr.find('.sodar-list-dropdown').removeClass('disabled');
+        }
+    }
+};
+
 var updateZoneStatus = function() {
     window.zoneStatusUpdated = false;
     var zoneData = {};
@@ -88,90 +173,9 @@ var updateZoneStatus = function() {
         // Update individual zones
         $('.sodar-lz-zone-tr-existing').each(function() {
             var zoneUuid = $(this).attr('data-zone-uuid');
-            var sampleUrl = $(this).attr('data-sample-url');
             var zoneTr = $('#' + $(this).attr('id'));
-            var statusTd = zoneTr.find('td#sodar-lz-zone-status-' + zoneUuid);
-            var statusInfoSpan = zoneTr.find(
-                'span#sodar-lz-zone-status-info-' + zoneUuid);
-            var statusStyles = {
-                'CREATING': 'bg-warning',
-                'NOT CREATED': 'bg-danger',
-                'ACTIVE': 'bg-info',
-                'PREPARING': 'bg-warning',
-                'VALIDATING': 'bg-warning',
-                'MOVING': 'bg-warning',
-                'MOVED': 'bg-success',
-                'FAILED': 'bg-danger',
-                'DELETING': 'bg-warning',
-                'DELETED': 'bg-secondary'
-            };
-
             if (data.zones[zoneUuid]) {
-                var zoneInfo = data.zones[zoneUuid];
-                var zoneStatus = zoneInfo.status;
-                var zoneStatusInfo = zoneInfo.status_info.replaceAll(
-                    '\n', '<br />');
-                var statusInfoHtml = zoneStatusInfo;
-                if (zoneInfo.truncated) {
-                    statusInfoHtml += '<span class="sodar-lz-zone-status-truncate">...</span>';
-                    statusInfoHtml += '<div><a class="sodar-lz-zone-status-link">See more</a></div>';
-                }
-                // Update data-zone-modified
-                zoneTr.attr('data-zone-modified', zoneInfo.modified);
-                if (
-                    statusTd.text() !== zoneStatus ||
-                    statusInfoSpan.text() !== zoneStatusInfo
-                ) {
-                    statusTd.text(zoneStatus);
-                    statusTd.removeClass();
-                    statusTd.addClass(
-                        'sodar-lz-zone-status ' + statusStyles[zoneStatus] + ' text-white');
-                    statusInfoSpan.html(statusInfoHtml);
-                    if (['PREPARING', 'VALIDATING', 'MOVING', 'DELETING'].includes(zoneStatus)) {
-                        statusTd.append(
-                            '<span class="pull-right"><i class="iconify" data-icon="mdi:lock"></i></span>'
-                        );
-                    }
-                    if (['CREATING', 'NOT CREATED', 'MOVED', 'DELETED'].includes(zoneStatus)) {
-                        zoneTr.find('p#sodar-lz-zone-stats-container-' + zoneUuid).hide();
-                        if (zoneStatus === 'MOVED') {
-                            var statusMovedSpan = zoneTr.find(
-                                'span#sodar-lz-zone-status-moved-' + zoneUuid
-                            );
-                            statusMovedSpan.html(
-                                '<p class="sodar-lz-zone-sample-link mb-0">' +
-                                '<a href="' + sampleUrl + '">' +
-                                '<i class="iconify" data-icon="mdi:arrow-right-circle"></i> ' +
-                                'Browse files in sample sheets</a></p>'
-                            );
-                        }
-                    }
-
-                    // Button modification
-                    if (zoneStatus !== 'ACTIVE' &&
-                        zoneStatus !== 'FAILED' && !isSuperuser) {
-                        zoneTr.find('.btn').each(function () {
-                            if ($(this).is('button')) {
-                                $(this).attr('disabled', 'disabled');
-                            } else if ($(this).is('a')) {
-                                $(this).addClass('disabled');
-                            }
-                        });
-                        zoneTr.find('.sodar-list-dropdown').addClass('disabled');
-                    } else {
-                        if (zoneStatus !== 'DELETED') {
-                            zoneTr.find(
-                                'p#sodar-lz-zone-stats-container-' + zoneUuid).show();
-                        }
-                        zoneTr.find('.btn').each(function () {
-                            if ($(this).is('button')) {
-                                $(this).removeAttr('disabled');
-                            }
-                            $(this).removeClass('disabled');
-                        });
-                        zoneTr.find('.sodar-list-dropdown').removeClass('disabled');
-                    }
-                }
+                updateZoneRow(zoneTr, data.zones[zoneUuid]);
             }
 
             // Validate/move link modification
@@ -198,6 +202,25 @@ var updateZoneStatus = function() {
     });
 };
 
+var streamZoneStatus = function() {
+    var eventSource = new EventSource(zoneStatusStreamURL);
+    eventSource.onmessage = function(event) {
+        var zoneInfo = JSON.parse(event.data);
+        var zoneTr = $('.sodar-lz-zone-tr-existing[data-zone-uuid="' +
+            zoneInfo.zone + '"]');
+        if (zoneTr.length === 0) {
+            return;
+        }
+        var statusTd = zoneTr.find('td#sodar-lz-zone-status-' + zoneInfo.zone);
+        var statusChanged = statusTd.text() !== zoneInfo.status;
+        updateZoneRow(zoneTr, zoneInfo);
+        // Update project lock and limits if zone status changed
+        if (statusChanged) {
+            updateZoneStatus();
+        }
+    };
+};
+
 
 /**********************
  Modal copy path method
@@ -434,6 +457,11 @@ $(document).ready(function() {
          ******************/
         updateZoneStatus();
         var statusInterval = window.statusInterval;
+        // Receive pushed updates if enabled, poll less often as fallback
+        if (typeof zoneStatusStreamURL !== 'undefined' && window.EventSource) {
+            streamZoneStatus();
+            statusInterval = statusInterval * 20;
+        }
         // Poll and update active zones
         setInterval(function() { updateZoneStatus(); }, statusInterval);
     });
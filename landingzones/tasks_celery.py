@@ -1,19 +1,19 @@
 """Celery tasks for the landingzones app"""
 
 import logging
-import os
+import time
 
 from django.conf import settings
-from django.db.models import Count
 
 from config.celery import app
 
 # Projectroles dependency
 from projectroles.app_settings import AppSettingAPI
-from projectroles.models import Project
+from projectroles.models import SODAR_CONSTANTS
 from projectroles.plugins import get_backend_api
 
 from landingzones.constants import STATUS_ALLOW_UPDATE, STATUS_LOCKING
+from landingzones.models import LandingZone
 from landingzones.views import ZoneMoveMixin
 
 
@@ -21,6 +21,10 @@ app_settings = AppSettingAPI()
 logger = logging.getLogger(__name__)
 
 
+# SODAR constants
+PROJECT_TYPE_PROJECT = SODAR_CONSTANTS['PROJECT_TYPE_PROJECT']
+
+# Local constants
 APP_NAME = 'landingzones'
 
 
@@ -44,46 +48,62 @@ def trigger_zone_move():
 class TriggerZoneMoveTask(ZoneMoveMixin):
     """Task for triggering landing zone validation and moving"""
 
-    def handle_project(self, project, request, irods_backend):
-        """Handle zone triggering for a single project"""
-        irods = irods_backend.get_session_obj()
-        for zone in project.landing_zones.filter(
-            status__in=STATUS_ALLOW_UPDATE
-        ):
-            path = os.path.join(
-                irods_backend.get_path(zone), settings.LANDINGZONES_TRIGGER_FILE
+    @classmethod
+    def get_zones(cls):
+        """
+        Return landing zones which can be triggered, omitting zones in projects
+        which should currently be locked by Taskflow.
+
+        :return: QuerySet of LandingZone objects
+        """
+        # TODO: Check for lock status directly, see #2048
+        locked_projects = LandingZone.objects.filter(
+            status__in=STATUS_LOCKING
+        ).values('project')
+        return (
+            LandingZone.objects.filter(
+                project__type=PROJECT_TYPE_PROJECT,
+                status__in=STATUS_ALLOW_UPDATE,
             )
-            s = '{}:{} in project "{}" ({})'.format(
-                zone.user.username,
-                zone.title,
-                zone.project.title,
-                zone.project.sodar_uuid,
+            .exclude(project__in=locked_projects)
+            .select_related('project', 'user', 'assay__study')
+        )
+
+    def trigger_zone(self, zone, path, irods, request):
+        """
+        Delete trigger file and submit validation and moving for a zone.
+
+        :param zone: LandingZone object
+        :param path: Full iRODS path to trigger file (string)
+        :param irods: iRODSSession object
+        :param request: HttpRequest object or None
+        :return: True if triggering succeeded (bool)
+        """
+        s = '{}:{} in project "{}" ({})'.format(
+            zone.user.username,
+            zone.title,
+            zone.project.title,
+            zone.project.sodar_uuid,
+        )
+        logger.info('Trigger file found for zone {}'.format(s))
+        try:
+            irods.data_objects.unlink(path, force=True)
+            logger.debug('Trigger file deleted')
+            # Submit request to Taskflow
+            self.submit_validate_move(
+                zone, validate_only=False, request=request
             )
-            logger.debug(
-                'Searching for trigger file "{}" for zone {}'.format(path, s)
+            logger.info(
+                'Initiated landing zone validation and moving for '
+                'zone {}'.format(s)
             )
-            if not irods.data_objects.exists(path):
-                logger.debug('Trigger file not found for zone {}'.format(s))
-                continue  # Continue looking into other zones in project
-            logger.info('Trigger file found for zone {}'.format(s))
-            try:
-                irods.data_objects.unlink(path, force=True)
-                logger.debug('Trigger file deleted')
-                # Submit request to Taskflow
-                self.submit_validate_move(
-                    zone, validate_only=False, request=request
-                )
-                logger.info(
-                    'Initiated landing zone validation and moving for '
-                    'zone {}'.format(s)
-                )
-                break  # Skip the rest of the zones in project
-            except Exception as ex:
-                logger.error(
-                    'Triggering automated moving failed in zone '
-                    '{}: {}'.format(s, ex)
-                )
-        irods.cleanup()
+            return True
+        except Exception as ex:
+            logger.error(
+                'Triggering automated moving failed in zone '
+                '{}: {}'.format(s, ex)
+            )
+        return False
 
     def run(self, request=None):
         if app_settings.get('projectroles', 'site_read_only'):
@@ -96,13 +116,39 @@ class TriggerZoneMoveTask(ZoneMoveMixin):
             return
         if not irods_backend:
             return
-        # Get projects, omit those which should currently be locked by Taskflow
-        # TODO: Check for lock status directly, see #2048
-        projects = (
-            Project.objects.filter(type='PROJECT')
-            .annotate(zone_count=Count('landing_zones'))
-            .exclude(zone_count=0)
-            .exclude(landing_zones__status__in=STATUS_LOCKING)
+        time_start = time.time()
+        trigger_file = settings.LANDINGZONES_TRIGGER_FILE
+        zone_paths = {
+            irods_backend.get_path(z) + '/' + trigger_file: z
+            for z in self.get_zones()
+        }
+        if not zone_paths:
+            logger.debug('No zones found for triggering')
+            return
+        trigger_paths = []
+        triggered = set()  # Trigger only one zone per project
+        try:
+            with irods_backend.get_session() as irods:
+                trigger_paths = irods_backend.get_object_paths_by_name(
+                    irods, irods_backend.get_projects_path(), trigger_file
+                )
+                for path in trigger_paths:
+                    zone = zone_paths.get(path)
+                    if not zone or zone.project.pk in triggered:
+                        continue
+                    if self.trigger_zone(zone, path, irods, request):
+                        triggered.add(zone.project.pk)
+        except Exception as ex:
+            logger.error('Exception in zone move triggering: {}'.format(ex))
+        logger.info(
+            'Zone move trigger check done in {:.2f}s: {} zone{}, {} trigger '
+            'file{} found, {} zone{} triggered'.format(
+                time.time() - time_start,
+                len(zone_paths),
+                's' if len(zone_paths) != 1 else '',
+                len(trigger_paths),
+                's' if len(trigger_paths) != 1 else '',
+                len(triggered),
+                's' if len(triggered) != 1 else '',
+            )
         )
-        for project in projects:
-            self.handle_project(project, request, irods_backend)
@@ -103,6 +103,14 @@ class TestTriggerZoneMoveTask(
         self.task.run(request)
         self.assert_zone_status(self.landing_zone, ZONE_STATUS_MOVED)
 
+    def test_trigger_subcoll(self):
+        """Test triggering with file in a zone subcollection"""
+        self.assertEqual(self.landing_zone.status, ZONE_STATUS_ACTIVE)
+        sub_coll = self.irods.collections.create(self.zone_coll.path + '/sub')
+        self.make_irods_object(sub_coll, settings.LANDINGZONES_TRIGGER_FILE)
+        self.task.run()
+        self.assert_zone_status(self.landing_zone, ZONE_STATUS_ACTIVE)
+
     def test_trigger_no_file(self):
         """Test triggering without an uploaded file"""
         self.assertEqual(self.landing_zone.status, ZONE_STATUS_ACTIVE)
@@ -32,7 +32,7 @@ from landingzones.constants import (
     ZONE_STATUS_DELETED,
 )
 from landingzones.tests.test_models import LandingZoneMixin
-from landingzones.views_ajax import STATUS_TRUNCATE_LEN
+from landingzones.utils import STATUS_TRUNCATE_LEN
 
 
 app_settings = AppSettingAPI()
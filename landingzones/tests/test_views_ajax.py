@@ -12,7 +12,7 @@ from taskflowbackend.lock_api import ProjectLockAPI
 
 from landingzones.constants import ZONE_STATUS_VALIDATING, ZONE_STATUS_MOVED
 from landingzones.tests.test_views import ViewTestBase
-from landingzones.views_ajax import STATUS_TRUNCATE_LEN
+from landingzones.utils import STATUS_TRUNCATE_LEN
 
 
 lock_api = ProjectLockAPI()
@@ -211,6 +211,48 @@ class TestZoneStatusRetrieveAjaxView(ViewTestBase):
         self.assertEqual(rd['zone_validate_limit_reached'], False)
 
 
+class TestZoneStatusStreamAjaxView(ViewTestBase):
+    """Tests for ZoneStatusStreamAjaxView"""
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse(
+            'landingzones:ajax_status_stream',
+            kwargs={'project': self.project.sodar_uuid},
+        )
+
+    @override_settings(LANDINGZONES_STATUS_PUSH=True)
+    def test_get(self):
+        """Test ZoneStatusStreamAjaxView GET"""
+        with self.login(self.user):
+            response = self.client.get(
+                self.url, HTTP_ACCEPT='text/event-stream'
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        content = iter(response.streaming_content)
+        self.assertTrue(next(content).startswith(b'retry: '))
+        self.zone.set_status(ZONE_STATUS_VALIDATING, 'Validating')
+        events = [
+            c
+            for c in b''.join(content).split(b'\n\n')
+            if c.startswith(b'data: ')
+        ]
+        self.assertEqual(len(events), 1)
+        data = json.loads(events[0][len('data: ') :])
+        self.assertEqual(data['zone'], str(self.zone.sodar_uuid))
+        self.assertEqual(data['status'], ZONE_STATUS_VALIDATING)
+        self.assertEqual(data['status_info'], 'Validating')
+
+    def test_get_disabled(self):
+        """Test GET with status push disabled"""
+        with self.login(self.user):
+            response = self.client.get(
+                self.url, HTTP_ACCEPT='text/event-stream'
+            )
+        self.assertEqual(response.status_code, 404)
+
+
 class TestZoneStatusInfoRetrieveAjaxView(ViewTestBase):
     """Tests for ZoneStatusInfoRetrieveAjaxView"""
 
@@ -86,6 +86,11 @@ urls_ajax = [
         view=views_ajax.ZoneStatusRetrieveAjaxView.as_view(),
         name='ajax_status',
     ),
+    path(
+        route='ajax/status/stream/<uuid:project>',
+        view=views_ajax.ZoneStatusStreamAjaxView.as_view(),
+        name='ajax_status_stream',
+    ),
     path(
         route='ajax/status-info/retrieve/<uuid:landingzone>',
         view=views_ajax.ZoneStatusInfoRetrieveAjaxView.as_view(),
@@ -1,14 +1,25 @@
 """Utilities for the landingzones app"""
 
+import json
+import logging
 import re
+import redis
 
 from datetime import datetime as dt
 
+from django.conf import settings
 from django.utils.text import slugify
 
 
+logger = logging.getLogger(__name__)
+
+
 # Local constants
 SUFFIX_CLEAN_RE = re.compile(r'\A\W+|\W+\Z')
+STATUS_TRUNCATE_LEN = 320
+STATUS_CHANNEL = 'landingzones:status:{project}'
+# Redis client shared for publishing zone statuses in the current process
+_redis_client = None
 
 
 def get_zone_title(suffix):
@@ -34,3 +45,64 @@ def cleanup_file_prohibit(prohibit_val):
         ]
         if x
     ]
+
+
+def get_zone_status_data(zone):
+    """
+    Return landing zone status data for status updates in the UI.
+
+    :param zone: LandingZone object
+    :return: Dict
+    """
+    status_info = zone.status_info[:STATUS_TRUNCATE_LEN]
+    return {
+        'modified': zone.date_modified.timestamp(),
+        'status': zone.status,
+        'status_info': status_info,
+        'truncated': len(zone.status_info) > len(status_info),
+    }
+
+
+def get_zone_status_channel(project):
+    """
+    Return name of the Redis pub/sub channel for zone status updates.
+
+    :param project: Project object
+    :return: String
+    """
+    return STATUS_CHANNEL.format(project=project.sodar_uuid)
+
+
+def _get_redis_client():
+    """
+    Return Redis client for publishing zone statuses. The client is created on
+    first use and its connection pool is reused for subsequent calls.
+
+    :return: Redis object
+    """
+    global _redis_client
+    if not _redis_client:
+        _redis_client = redis.from_url(settings.REDIS_URL)
+    return _redis_client
+
+
+def publish_zone_status(zone):
+    """
+    Publish landing zone status to the project zone status channel. Errors are
+    logged but not raised, as clients fall back to polling.
+
+    :param zone: LandingZone object
+    """
+    data = get_zone_status_data(zone)
+    data['zone'] = str(zone.sodar_uuid)
+    data['user'] = str(zone.user.sodar_uuid)
+    try:
+        _get_redis_client().publish(
+            get_zone_status_channel(zone.project), json.dumps(data)
+        )
+    except Exception as ex:
+        logger.error(
+            'Exception publishing status for zone "{}": {}'.format(
+                zone.sodar_uuid, ex
+            )
+        )
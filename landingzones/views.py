@@ -144,7 +144,10 @@ class ProjectZoneInfoMixin:
         valid_limit = settings.LANDINGZONES_ZONE_VALIDATE_LIMIT or 1
         ret['zone_validate_count'] = valid_count
         ret['zone_validate_limit'] = valid_limit
-        ret['zone_validate_limit_reached'] = valid_count >= valid_limit
+        # Queued flows are run one at a time, so the limit does not apply
+        ret['zone_validate_limit_reached'] = (
+            valid_count >= valid_limit and not settings.TASKFLOW_QUEUE_ENABLED
+        )
         return ret
 
 
@@ -471,6 +474,7 @@ class ZoneMoveMixin(ZoneConfigPluginMixin):
         :param zone: LandingZone object
         :param validate_only: Only perform validation if true (bool)
         :param request: Request object (optional)
+        :return: Queue position (int) if the flow was queued, else None
         :raise: taskflow.FlowSubmitException if taskflow submit fails
         """
         if not request and hasattr(self, 'request'):
@@ -522,7 +526,7 @@ class ZoneMoveMixin(ZoneConfigPluginMixin):
         )
         if validate_only:
             flow_data['validate_only'] = True
-        taskflow.submit(
+        return taskflow.submit(
             project=project,
             flow_name='landing_zone_move',
             flow_data=flow_data,
@@ -569,6 +573,7 @@ class ProjectZoneView(
         context['zones'] = zones
         # Status query interval
         context['zone_status_interval'] = settings.LANDINGZONES_STATUS_INTERVAL
+        context['zone_status_push'] = settings.LANDINGZONES_STATUS_PUSH
         # Disable status
         context['zone_access_disabled'] = (
             settings.LANDINGZONES_DISABLE_FOR_USERS
@@ -932,7 +937,7 @@ class ZoneMoveView(
             status__in=[ZONE_STATUS_PREPARING, ZONE_STATUS_VALIDATING],
         ).count()
         valid_limit = settings.LANDINGZONES_ZONE_VALIDATE_LIMIT or 1
-        if valid_count >= valid_limit:
+        if valid_count >= valid_limit and not settings.TASKFLOW_QUEUE_ENABLED:
             messages.error(self.request, ZONE_VALIDATE_LIMIT_MSG + '.')
             return redirect(redirect_url)
 
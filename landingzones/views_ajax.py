@@ -1,12 +1,21 @@
 """Ajax API views for the landingzones app"""
 
+import json
 import logging
 import math
+import redis
+import time
 
 from django.conf import settings
-from django.http import Http404, HttpResponseForbidden, HttpResponseBadRequest
+from django.http import (
+    Http404,
+    HttpResponseForbidden,
+    HttpResponseBadRequest,
+    StreamingHttpResponse,
+)
 from django.urls import reverse
 
+from rest_framework.renderers import BaseRenderer, JSONRenderer
 from rest_framework.response import Response
 
 # Projectroles dependency
@@ -14,6 +23,7 @@ from projectroles.plugins import get_backend_api
 from projectroles.views_ajax import SODARBaseProjectAjaxView
 
 from landingzones.models import LandingZone
+from landingzones.utils import get_zone_status_channel, get_zone_status_data
 from landingzones.views import ProjectZoneInfoMixin
 
 
@@ -21,7 +31,18 @@ logger = logging.getLogger(__name__)
 
 
 # Local constants
-STATUS_TRUNCATE_LEN = 320
+STREAM_KEEPALIVE = 15  # Seconds between keepalive comments in status stream
+
+
+class EventStreamRenderer(BaseRenderer):
+    """Renderer for accepting server-sent event requests"""
+
+    media_type = 'text/event-stream'
+    format = 'event-stream'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data)
 
 
 class ZoneBaseAjaxView(SODARBaseProjectAjaxView):
@@ -62,19 +83,69 @@ class ZoneStatusRetrieveAjaxView(ProjectZoneInfoMixin, ZoneBaseAjaxView):
                 and float(post_modified) == zone.date_modified.timestamp()
             ):
                 continue
-            status_info = zone.status_info[:STATUS_TRUNCATE_LEN]
-            truncated = False
-            if len(zone.status_info) > len(status_info):
-                truncated = True
-            ret['zones'][str(zone.sodar_uuid)] = {
-                'modified': zone.date_modified.timestamp(),
-                'status': zone.status,
-                'status_info': status_info,
-                'truncated': truncated,
-            }
+            ret['zones'][str(zone.sodar_uuid)] = get_zone_status_data(zone)
         return Response(ret, status=200)
 
 
+class ZoneStatusStreamAjaxView(ZoneBaseAjaxView):
+    """
+    Ajax API view for streaming project landing zone status updates as
+    server-sent events. Requires LANDINGZONES_STATUS_PUSH to be enabled.
+    """
+
+    permission_required = 'landingzones.view_zone_own'
+    renderer_classes = [JSONRenderer, EventStreamRenderer]
+
+    @classmethod
+    def _stream_events(cls, channel, user_uuid=None):
+        """
+        Yield zone status updates from Redis channel as server-sent events
+        until LANDINGZONES_STATUS_STREAM_TIMEOUT is reached.
+
+        :param channel: Redis channel name (string)
+        :param user_uuid: Only yield zones of this user if set (string)
+        """
+        redis_conn = redis.from_url(settings.REDIS_URL, decode_responses=True)
+        pubsub = redis_conn.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(channel)
+        time_end = time.time() + settings.LANDINGZONES_STATUS_STREAM_TIMEOUT
+        try:
+            yield 'retry: {}\n\n'.format(
+                settings.LANDINGZONES_STATUS_INTERVAL * 1000
+            )
+            while time.time() < time_end:
+                msg = pubsub.get_message(
+                    timeout=min(STREAM_KEEPALIVE, time_end - time.time())
+                )
+                if not msg:
+                    yield ': keepalive\n\n'
+                    continue
+                data = json.loads(msg['data'])
+                if user_uuid and data['user'] != user_uuid:
+                    continue
+                yield 'data: {}\n\n'.format(json.dumps(data))
+        finally:
+            pubsub.close()
+
+    def get(self, request, *args, **kwargs):
+        if not settings.LANDINGZONES_STATUS_PUSH:
+            return Response(
+                {'detail': 'Zone status push not enabled'}, status=404
+            )
+        project = self.get_project()
+        user_uuid = None
+        # Only stream own zones to users without view_zone_all perm
+        if not request.user.has_perm('landingzones.view_zone_all', project):
+            user_uuid = str(request.user.sodar_uuid)
+        response = StreamingHttpResponse(
+            self._stream_events(get_zone_status_channel(project), user_uuid),
+            content_type='text/event-stream',
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'  # Disable proxy buffering
+        return response
+
+
 class ZoneStatusInfoRetrieveAjaxView(ZoneBaseAjaxView):
     """Ajax API view for returning full status info for given landing zone"""
 
@@ -426,7 +426,9 @@ class ZoneSubmitMoveAPIView(ZoneMoveMixin, ZoneSubmitBaseAPIView):
     should be called with ``submit/validate``.
 
     Returns ``503`` if the project is currently locked by another operation or
-    if the concurrent validation limit for the project has been reached.
+    if the concurrent validation limit for the project has been reached. If
+    the flow queue is enabled on the server, the operation is queued instead
+    and its position is displayed in the zone ``status_info``.
 
     **URL for Validation:** ``/landingzones/api/submit/validate/{LandingZone.sodar_uuid}``
 
@@ -450,7 +452,7 @@ class ZoneSubmitMoveAPIView(ZoneMoveMixin, ZoneSubmitBaseAPIView):
             status__in=[ZONE_STATUS_PREPARING, ZONE_STATUS_VALIDATING],
         ).count()
         valid_limit = settings.LANDINGZONES_ZONE_VALIDATE_LIMIT or 1
-        if valid_count >= valid_limit:
+        if valid_count >= valid_limit and not settings.TASKFLOW_QUEUE_ENABLED:
             ex = APIException(ZONE_VALIDATE_LIMIT_MSG)
             ex.status_code = 503
             raise ex
@@ -470,15 +472,18 @@ class ZoneSubmitMoveAPIView(ZoneMoveMixin, ZoneSubmitBaseAPIView):
         self._validate_zone_obj(zone, STATUS_ALLOW_UPDATE, action_obj)
 
         try:
-            self.submit_validate_move(zone, validate_only)
+            position = self.submit_validate_move(zone, validate_only)
         except Exception as ex:
             ex_msg = 'Initiating landing zone {} failed: '.format(action_msg)
             if taskflow:
                 taskflow.raise_submit_api_exception(ex_msg, ex)
             raise APIException('{}{}'.format(ex_msg, ex))
+        detail = 'Landing zone {} initiated'.format(action_msg)
+        if position:
+            detail += ' (queue position {})'.format(position)
         return Response(
             {
-                'detail': 'Landing zone {} initiated'.format(action_msg),
+                'detail': detail,
                 'sodar_uuid': str(zone.sodar_uuid),
             },
             status=status.HTTP_200_OK,
@@ -0,0 +1,56 @@
+# Generated by Django 4.2.23 on 2026-10-17 09:12
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+import django.db.models.functions.text
+import ontologyaccess.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ontologyaccess", "0001_squashed_0003_term_name_length"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunSQL(
+            sql=(
+                "CREATE OR REPLACE FUNCTION ontologyaccess_array_upper(text[]) "
+                "RETURNS text LANGUAGE sql IMMUTABLE PARALLEL SAFE "
+                "AS $$ SELECT upper(array_to_string($1, ' | ')) $$;"
+            ),
+            reverse_sql="DROP FUNCTION IF EXISTS ontologyaccess_array_upper(text[]);",
+        ),
+        migrations.AddIndex(
+            model_name="oboformatontologyterm",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"),
+                    name="gin_trgm_ops",
+                ),
+                name="ontologyaccess_term_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="oboformatontologyterm",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("term_id"),
+                    name="gin_trgm_ops",
+                ),
+                name="ontologyaccess_term_id_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="oboformatontologyterm",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    ontologyaccess.models.UpperArrayText("synonyms"),
+                    name="gin_trgm_ops",
+                ),
+                name="ontologyaccess_term_syn_trgm",
+            ),
+        ),
+    ]
@@ -3,8 +3,10 @@
 import uuid
 
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Upper
 
 # Local constants
 DEFAULT_LENGTH = 255
@@ -13,6 +15,18 @@ TERM_URL_HELP = (
     'Format string for term accession URL. Supports {id_space} '
     'and {local_id}.'
 )
+# Immutable database function for indexing term synonyms, see UpperArrayText
+ARRAY_UPPER_FUNC = 'ontologyaccess_array_upper'
+
+
+class UpperArrayText(models.Func):
+    """
+    Return array elements joined into an uppercase string. Uses an immutable
+    database function created in migrations, to support trigram indexes.
+    """
+
+    function = ARRAY_UPPER_FUNC
+    output_field = models.TextField()
 
 
 class OBOFormatOntology(models.Model):
@@ -256,7 +270,20 @@ class OBOFormatOntologyTerm(models.Model):
         )
 
     class Meta:
-        pass
+        indexes = [
+            GinIndex(
+                OpClass(Upper('name'), name='gin_trgm_ops'),
+                name='ontologyaccess_term_name_trgm',
+            ),
+            GinIndex(
+                OpClass(Upper('term_id'), name='gin_trgm_ops'),
+                name='ontologyaccess_term_id_trgm',
+            ),
+            GinIndex(
+                OpClass(UpperArrayText('synonyms'), name='gin_trgm_ops'),
+                name='ontologyaccess_term_syn_trgm',
+            ),
+        ]
 
     def __str__(self):
         return '{} ({})'.format(self.term_id, self.name)
@@ -2,6 +2,7 @@
 
 import json
 
+from django.test import override_settings
 from django.urls import reverse
 
 from ontologyaccess.tests.test_views import (
@@ -17,6 +18,8 @@ OBO_ONTOLOGY_FILE_ALT = 'alt.obo'
 OBO_ONTOLOGY_TITLE_ALT = 'Alternative ontology'
 OBO_TERM_ID_ALT = 'ALT:0000003'
 OBO_TERM_NAME_ALT = 'Alt term'
+OBO_TERM_ID_EXTRA = 'TST:9990010'
+OBO_TERM_NAME_EXTRA = 'Another test term'
 
 
 class TestOBOOntologyListAjaxView(OntologyAccessViewTestBase):
@@ -171,6 +174,46 @@ class TestOBOTermQueryAjaxView(OntologyAccessViewTestBase):
         }
         self.assertEqual(response_data['terms'][0], expected)
 
+    def test_get_synonym(self):
+        """Test GET with term synonym"""
+        query_data = {'s': 'imaginary'}
+        with self.login(self.superuser):
+            response = self.client.get(self.url, data=query_data)
+        self.assertEqual(response.status_code, 200)
+        response_data = json.loads(response.content)
+        self.assertEqual(len(response_data['terms']), 1)
+        self.assertEqual(
+            response_data['terms'][0]['term_id'], self.term.term_id
+        )
+
+    def test_get_order_match(self):
+        """Test GET with exact match ordered first"""
+        self.make_obo_term(
+            ontology=self.ontology,
+            term_id=OBO_TERM_ID_EXTRA,
+            name=OBO_TERM_NAME_EXTRA,
+        )
+        query_data = {'s': OBO_TERM_NAME.lower()}
+        with self.login(self.superuser):
+            response = self.client.get(self.url, data=query_data)
+        self.assertEqual(response.status_code, 200)
+        response_data = json.loads(response.content)
+        self.assertEqual(
+            [t['name'] for t in response_data['terms']],
+            [OBO_TERM_NAME, OBO_TERM_NAME_EXTRA],
+        )
+
+    @override_settings(ONTOLOGYACCESS_QUERY_LIMIT=1)
+    def test_get_query_limit(self):
+        """Test GET with results exceeding query limit"""
+        query_data = {'s': 'term'}
+        with self.login(self.superuser):
+            response = self.client.get(self.url, data=query_data)
+        self.assertEqual(response.status_code, 200)
+        response_data = json.loads(response.content)
+        self.assertEqual(len(response_data['terms']), 1)
+        self.assertEqual(response_data['detail_type'], 'warning')
+
 
 class TestOBOTermListAjaxView(OntologyAccessViewTestBase):
     """Tests for OBOTermListAjaxView"""
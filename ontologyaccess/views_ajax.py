@@ -4,7 +4,8 @@ from functools import reduce
 import logging
 
 from django.conf import settings
-from django.db.models import Case, When, Q
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import Case, When, Q, Value
 
 from rest_framework.response import Response
 
@@ -12,7 +13,7 @@ from rest_framework.response import Response
 from projectroles.views_ajax import SODARBasePermissionAjaxView
 
 from ontologyaccess.api import OntologyAccessAPI
-from ontologyaccess.models import OBOFormatOntologyTerm
+from ontologyaccess.models import OBOFormatOntologyTerm, UpperArrayText
 
 
 logger = logging.getLogger(__name__)
@@ -69,8 +70,11 @@ class OBOTermQueryAjaxView(OBOOntologyTermMixin, SODARBasePermissionAjaxView):
             return Response({'detail': 'Incorrect query string'}, status=400)
 
         ret_data = {'terms': []}
-        filter_q = Q(name__icontains=request.GET['s']) | Q(
-            term_id__icontains=request.GET['s']
+        query = request.GET['s']
+        filter_q = (
+            Q(name__icontains=query)
+            | Q(term_id__icontains=query)
+            | Q(synonyms_upper__contains=query.upper())
         )
         filter_kwargs = {}
         query_limit = settings.ONTOLOGYACCESS_QUERY_LIMIT
@@ -100,13 +104,30 @@ class OBOTermQueryAjaxView(OBOOntologyTermMixin, SODARBasePermissionAjaxView):
             )
             logger.debug('Order by ontology: {}'.format(', '.join(o_list)))
 
+        # Order exact and prefix matches first, then by similarity
+        order.append(
+            Case(
+                When(Q(name__iexact=query) | Q(term_id__iexact=query), then=0),
+                When(
+                    Q(name__istartswith=query) | Q(term_id__istartswith=query),
+                    then=1,
+                ),
+                default=Value(2),
+            )
+        )
+        order.append(TrigramSimilarity('name', query).desc())
         order.append('name')
-        terms = OBOFormatOntologyTerm.objects.filter(
-            filter_q, **filter_kwargs
-        ).order_by(*order)
-        logger.debug('Term count: {}'.format(terms.count()))
+        terms = list(
+            OBOFormatOntologyTerm.objects.annotate(
+                synonyms_upper=UpperArrayText('synonyms')
+            )
+            .filter(filter_q, **filter_kwargs)
+            .select_related('ontology')
+            .order_by(*order)[: query_limit + 1]
+        )
+        logger.debug('Term count: {}'.format(len(terms)))
 
-        if terms.count() > query_limit:
+        if len(terms) > query_limit:
             ret_data['detail'] = (
                 'Query exceeds {} results. Please refine your search to see '
                 'all results.'.format(query_limit)
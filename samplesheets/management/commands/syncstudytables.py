@@ -85,33 +85,17 @@ class Command(BaseCommand):
                 )
             )
             for study in investigation.studies.all():
-                try:
-                    study_tables = table_builder.build_study_tables(
-                        study, use_config=True
-                    )
-                except Exception as ex:
-                    logger.error(
-                        'Error building tables for study {}: {}'.format(
-                            self._get_log_study(study), ex
-                        )
-                    )
-                    continue
                 item_name = STUDY_TABLE_CACHE_ITEM.format(
                     study=study.sodar_uuid
                 )
                 try:
-                    cache_backend.set_cache_item(
-                        app_name=APP_NAME,
-                        name=item_name,
-                        data=study_tables,
-                        project=project,
-                    )
+                    table_builder.build_study_cache(study, force=True)
                     logger.info('Set cache item "{}"'.format(item_name))
                     study_count += 1
                 except Exception as ex:
                     logger.error(
-                        'Failed to set cache item "{}": {}'.format(
-                            item_name, ex
+                        'Error building tables for study {}: {}'.format(
+                            self._get_log_study(study), ex
                         )
                     )
             logger.info(
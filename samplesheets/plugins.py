@@ -5,6 +5,7 @@ import os
 import re
 import time
 
+from collections import defaultdict
 from copy import deepcopy
 from irods.exception import NetworkException
 from urllib.parse import urlparse
@@ -139,6 +140,15 @@ SHEETS_APP_SETTINGS = [
         'project',
         user_modifiable=True,
     ),
+    PluginAppSettingDef(
+        name='sheet_sync_hash',
+        scope=APP_SETTING_SCOPE_PROJECT,
+        type=APP_SETTING_TYPE_JSON,
+        label='Last synchronized sample sheet',
+        description='Investigation UUID and content hash of the last sample '
+        'sheet imported by sheet synchronization',
+        user_modifiable=False,
+    ),
     PluginAppSettingDef(
         name='sheet_table_height',
         scope=APP_SETTING_SCOPE_USER,
@@ -241,7 +251,10 @@ SHEETS_INFO_SETTINGS = [
     'SHEETS_MIN_COLUMN_WIDTH',
     'SHEETS_ONTOLOGY_URL_SKIP',
     'SHEETS_PARSER_WARNING_SAVE_LIMIT',
+    'SHEETS_SEARCH_MATERIAL_LIMIT',
     'SHEETS_SYNC_INTERVAL',
+    'SHEETS_SYNC_TIMEOUT',
+    'SHEETS_SYNC_WORKERS',
     'SHEETS_VERSION_PAGINATION',
     'SHEETS_IGV_OMIT_BAM',
     'SHEETS_IGV_OMIT_VCF',
@@ -376,25 +389,55 @@ class ProjectAppPlugin(
     @classmethod
     def _get_search_materials(cls, search_terms, user, keywords, item_types):
         """Return materials for search results"""
-        ret = []
         materials = GenericMaterial.objects.find(
             search_terms, keywords, item_types=item_types
         )
+        # Evaluate permissions once per project instead of per material
+        project_ids = (
+            materials.order_by()
+            .values_list('study__investigation__project', flat=True)
+            .distinct()
+        )
+        projects = [
+            p
+            for p in Project.objects.filter(pk__in=list(project_ids))
+            if user.has_perm('samplesheets.view_sheet', p)
+        ]
+        if not projects:
+            return []
+        materials = materials.filter(
+            study__investigation__project__in=projects
+        ).select_related('study__investigation__project', 'assay')
+        materials = list(materials[: settings.SHEETS_SEARCH_MATERIAL_LIMIT])
+        # Map samples to assays where they are used in one query
+        sample_assays = defaultdict(list)
+        sample_names = defaultdict(set)
         for m in materials:
-            if user.has_perm('samplesheets.view_sheet', m.get_project()):
-                if m.item_type == 'SAMPLE':
-                    assays = m.get_sample_assays()
-                else:
-                    assays = [m.assay]
-                ret.append(
-                    {
-                        'name': m.name,
-                        'type': m.item_type,
-                        'project': m.get_project(),
-                        'study': m.study,
-                        'assays': assays,
-                    }
-                )
+            if m.item_type == 'SAMPLE':
+                sample_names[m.study_id].add(m.unique_name)
+        if sample_names:
+            for a in Assay.objects.filter(
+                study__in=sample_names.keys()
+            ).order_by('file_name'):
+                arc_names = {n for arc in a.arcs for n in arc}
+                for name in sample_names[a.study_id] & arc_names:
+                    sample_assays[(a.study_id, name)].append(a)
+
+        ret = []
+        for m in materials:
+            if m.item_type == 'SAMPLE':
+                assays = sample_assays[(m.study_id, m.unique_name)]
+            else:
+                assays = [m.assay]
+            ret.append(
+                {
+                    'name': m.name,
+                    'type': m.item_type,
+                    'project': m.study.investigation.project,
+                    'study': m.study,
+                    'assays': assays,
+                }
+            )
         return ret
 
     @classmethod
@@ -764,9 +807,10 @@ class ProjectAppPlugin(
         :raise: Exception if required backends (sodar_cache and omics_irods)
                 are not found.
         """
-        # NOTE: This will not sync cached study render tables, they are created
-        #       synchronously upon access if not up-to-date. To sync the cache
-        #       for all study tables, use the syncstudytables command.
+        # NOTE: This will not sync cached study render tables, they are built
+        #       in update_study_tables_task after sheet import, sync or editing
+        #       or upon access if not up-to-date. To sync the cache for all
+        #       study tables, use the syncstudytables command.
         cache_backend = get_backend_api('sodar_cache')
         irods_backend = get_backend_api('omics_irods')
         if not cache_backend or not irods_backend:
@@ -1080,26 +1124,31 @@ class SampleSheetAssayPluginPoint(PluginPoint):
             for assay in [a for a in study.assays.all() if a in config_assays]:
                 assay_table = study_tables['assays'][str(assay.sodar_uuid)]
                 assay_path = self.irods_backend.get_path(assay)
-                row_paths = []
+                row_paths = {}  # Dict for ordered deduplication
                 item_name = 'irods/rows/{}'.format(assay.sodar_uuid)
 
                 for row in assay_table['table_data']:
                     path = self.get_row_path(
                         row, assay_table, assay, assay_path
                     )
-                    if path and path not in row_paths:
-                        row_paths.append(self.irods_backend.sanitize_path(path))
+                    if path:
+                        row_paths[self.irods_backend.sanitize_path(path)] = None
 
                 # Build cache for paths
-                cache_data = {'paths': {}}
                 with self.irods_backend.get_session() as irods:
-                    for path in row_paths:
-                        try:
-                            cache_data['paths'][path] = (
-                                self.irods_backend.get_stats(irods, path)
+                    try:
+                        stats = self.irods_backend.get_stats_bulk(
+                            irods, row_paths
+                        )
+                    except Exception as ex:
+                        logger.error(
+                            'Exception in retrieving row path stats for assay '
+                            '"{}" ({}): {}'.format(
+                                assay.get_display_name(), assay.sodar_uuid, ex
                             )
-                        except Exception:
-                            cache_data['paths'][path] = None
+                        )
+                        stats = {}
+                cache_data = {'paths': {p: stats.get(p) for p in row_paths}}
                 cache_backend.set_cache_item(
                     name=item_name,
                     app_name=app_name,
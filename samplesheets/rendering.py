@@ -2,10 +2,12 @@
 
 import functools
 import itertools
+import json
 import logging
 import re
 import time
 
+from collections import defaultdict
 from datetime import date
 from packaging import version
 
@@ -13,6 +15,7 @@ from altamisa.constants import table_headers as th
 from altamisa.isatab.write_assay_study import RefTableBuilder
 
 from django.conf import settings
+from django.db import transaction
 
 # Projectroles dependency
 from projectroles.app_settings import AppSettingAPI
@@ -29,6 +32,11 @@ from samplesheets.utils import get_node_obj
 header_re = re.compile(r'^([a-zA-Z\s]+)[\[](.+)[\]]$')
 # Rexex for simple links and contacts
 link_re = re.compile(r'(.+?)\s?(?:[<|[])(.+?)(?:[>\]])')
+# Regex for numeric values accepted by float(), excluding underscores
+num_re = re.compile(
+    r'\s*[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?|inf(?:inity)?|nan)\s*',
+    re.IGNORECASE,
+)
 logger = logging.getLogger(__name__)
 app_settings = AppSettingAPI()
 
@@ -49,8 +57,11 @@ TOP_HEADER_MATERIAL_VALUES = {
 EMPTY_VALUE = '-'
 STUDY_HIDEABLE_CLASS = 'sodar-ss-hideable-study'
 SOURCE_SEARCH_STR = '-source-'
-NARROW_CHARS = 'fIijlt;:.,/"!\'!()[]{}'
+NARROW_CHARS = 'fIijlt;:.,/"!\'()[]{}'
 WIDE_CHARS = 'ABCDEFHKLMNOPQRSTUVXYZ<>%$_'
+# Translation tables for counting narrow and wide characters
+NARROW_TABLE = str.maketrans('', '', NARROW_CHARS)
+WIDE_TABLE = str.maketrans('', '', WIDE_CHARS)
 IGNORED_HEADERS = ['Unit', 'Term Source REF', 'Term Accession Number']
 # Name fields (NOTE: Missing labeled extract name by purpose)
 ALTAMISA_MATERIAL_NAMES = [
@@ -84,6 +95,8 @@ MODEL_JSON_ATTRS = [
 ]
 STUDY_TABLE_CACHE_ITEM = 'sheet/tables/study/{study}'
 SIMPLE_LINK_TEMPLATE = '{label} <{url}>'
+# Max ratio of distinct to all values for using a dictionary in compact tables
+COMPACT_DICT_RATIO = 0.5
 
 
 # Table building ---------------------------------------------------------------
@@ -134,12 +147,14 @@ class SampleSheetTableBuilder:
             return field['value']
         return ''
 
-    def _add_top_header(self, obj, colspan):
+    @classmethod
+    def _get_top_header(cls, obj, colspan):
         """
-        Append columns to top header.
+        Return top header for a node.
 
         :param obj: GenericMaterial or Process object
         :param colspan: Column count for the node
+        :return: Dict
         """
         if isinstance(obj, GenericMaterial):  # Material
             colour = TOP_HEADER_MATERIAL_COLOURS[obj.item_type]
@@ -152,16 +167,70 @@ class SampleSheetTableBuilder:
         else:  # Process
             colour = 'danger'
             value = 'Process'
-        th = {
+        return {
             'value': value.strip(),
             'colour': colour,
             'colspan': colspan,
             'headers': obj.headers,
         }
-        self._top_header.append(th)
+
+    def _add_top_header(self, obj, colspan):
+        """
+        Append columns to top header.
+
+        :param obj: GenericMaterial or Process object
+        :param colspan: Column count for the node
+        """
+        self._top_header.append(self._get_top_header(obj, colspan))
         self._node_idx += 1
         self._field_idx = 0
 
+    @classmethod
+    def _get_basic_col_type(cls, name, item_type):
+        """
+        Return column type if it can be determined from the header name alone.
+
+        :param name: Original header name (string)
+        :param item_type: Material item type (string or None)
+        :return: String or None
+        """
+        if (
+            name.lower() == 'name' or name in th.PROCESS_NAME_HEADERS
+        ) and item_type != 'DATA':
+            return 'NAME'
+        elif name.lower() == 'protocol':
+            return 'PROTOCOL'
+        elif 'contact' in name.lower() or name == 'Performer':
+            return 'CONTACT'
+        elif name == 'Perform Date':
+            return 'DATE'
+        elif name.lower() == 'external links':
+            return 'EXTERNAL_LINKS'
+        elif name.lower() == 'name' and item_type == 'DATA':
+            return 'LINK_FILE'
+        return None
+
+    def _get_field_config(self):
+        """
+        Return sheet config for the current field, if set.
+
+        :return: Dict or None
+        """
+        if not self._sheet_config:
+            return None
+        study_config = self._sheet_config['studies'][
+            str(self._study.sodar_uuid)
+        ]
+        if not self._assay or self._node_idx < len(study_config['nodes']):
+            return study_config['nodes'][self._node_idx]['fields'][
+                self._field_idx
+            ]
+        # Assay
+        a_node_idx = self._node_idx - len(study_config['nodes'])
+        return study_config['assays'][str(self._assay.sodar_uuid)]['nodes'][
+            a_node_idx
+        ]['fields'][self._field_idx]
+
     def _add_header(self, name, header_type=None, obj=None):
         """
         Add column field header value.
@@ -179,22 +248,8 @@ class SampleSheetTableBuilder:
                 obj.item_type if isinstance(obj, GenericMaterial) else None
             ),
         }
-        field_config = None
-
         # Get existing field config
-        if self._sheet_config:
-            study_config = self._sheet_config['studies'][
-                str(self._study.sodar_uuid)
-            ]
-            if not self._assay or self._node_idx < len(study_config['nodes']):
-                field_config = study_config['nodes'][self._node_idx]['fields'][
-                    self._field_idx
-                ]
-            else:  # Assay
-                a_node_idx = self._node_idx - len(study_config['nodes'])
-                field_config = study_config['assays'][
-                    str(self._assay.sodar_uuid)
-                ]['nodes'][a_node_idx]['fields'][self._field_idx]
+        field_config = self._get_field_config()
 
         # Save info on whether a pre-existing config is set for this field
         if field_config and field_config.get('format'):
@@ -210,20 +265,10 @@ class SampleSheetTableBuilder:
         ):
             header['col_type'] = 'NUMERIC'
         # Else detect type without config
-        elif (
-            name.lower() == 'name' or name in th.PROCESS_NAME_HEADERS
-        ) and header['item_type'] != 'DATA':
-            header['col_type'] = 'NAME'
-        elif name.lower() == 'protocol':
-            header['col_type'] = 'PROTOCOL'
-        elif 'contact' in name.lower() or name == 'Performer':
-            header['col_type'] = 'CONTACT'
-        elif name == 'Perform Date':
-            header['col_type'] = 'DATE'
-        elif name.lower() == 'external links':
-            header['col_type'] = 'EXTERNAL_LINKS'
-        elif name.lower() == 'name' and header['item_type'] == 'DATA':
-            header['col_type'] = 'LINK_FILE'
+        elif self._get_basic_col_type(name, header['item_type']):
+            header['col_type'] = self._get_basic_col_type(
+                name, header['item_type']
+            )
         # Recognize ONTOLOGY by headers
         elif obj.is_ontology_field(name, header_type):
             header['col_type'] = 'ONTOLOGY'
@@ -442,6 +487,24 @@ class SampleSheetTableBuilder:
 
     # Table building functions -------------------------------------------------
 
+    def _get_node_cells(self, obj):
+        """
+        Return cells for a single node without adding them to table data.
+
+        :param obj: GenericMaterial or Process object
+        :return: List of dicts
+        """
+        self._row = []
+        self._first_row = False
+        self._col_idx = 0
+        self._col_values = defaultdict(int)  # Not used for a single node
+        self._add_ordered_element(obj)
+        ret = self._row
+        self._row = []
+        self._node_idx = 0
+        self._field_idx = 0
+        return ret
+
     def _append_row(self):
         """Append current row to table data and cleanup"""
         self._table_data.append(self._row)
@@ -451,125 +514,173 @@ class SampleSheetTableBuilder:
         self._node_idx = 0
         self._field_idx = 0
 
-    def _add_ui_table_data(self):
-        """Add UI specific data to a table"""
-        # TODO: Un-hackify
+    @classmethod
+    def _get_length(cls, value, col_type=None):
+        """Return estimated length for proportional text"""
+        if not value:
+            return 0
+        # Convert perform date
+        if isinstance(value, date):
+            value = str(value)
+        # Lists (altamISA v0.1+)
+        elif isinstance(value, list) and col_type != 'EXTERNAL_LINKS':
+            if isinstance(value[0], dict):
+                value = '; '.join([x['name'] for x in value])
+            elif isinstance(value[0], list) and value[0]:
+                value = '; '.join([x[0] for x in value])
+            elif isinstance(value[0], str):
+                value = '; '.join(value)
+        # Simple link or contact
+        else:
+            link_match = link_re.search(value)
+            if link_match:
+                value = link_match.group(1)
 
-        def _get_length(value, col_type=None):
-            """Return estimated length for proportional text"""
-            if not value:
-                return 0
-            # Convert perform date
-            if isinstance(value, date):
-                value = str(value)
-            # Lists (altamISA v0.1+)
-            elif isinstance(value, list) and col_type != 'EXTERNAL_LINKS':
-                if isinstance(value[0], dict):
-                    value = '; '.join([x['name'] for x in value])
-                elif isinstance(value[0], list) and value[0]:
-                    value = '; '.join([x[0] for x in value])
-                elif isinstance(value[0], str):
-                    value = '; '.join(value)
-            # Simple link or contact
-            else:
-                link_groups = re.findall(link_re, value)
-                if link_groups:
-                    value = link_groups[0][0]
-
-            # Very unscientific and font-specific, don't try this at home
-            nc = sum([value.count(c) for c in NARROW_CHARS])
-            wc = sum([value.count(c) for c in WIDE_CHARS])
-            return round(len(value) - nc - wc + 0.6 * nc + 1.3 * wc)
-
-        def _is_num(value):
-            """Return whether a value contains only integers/doubles"""
-            # Supports lists
-            values = value if isinstance(value, list) else [value]
-            for v in values:
-                if isinstance(v, str) and '_' in v:
-                    return False  # HACK because float() accepts underscore
-                try:
-                    float(v)
-                except (ValueError, TypeError):
-                    return False
-            return True
+        # Very unscientific and font-specific, don't try this at home
+        nc = len(value) - len(value.translate(NARROW_TABLE))
+        wc = len(value) - len(value.translate(WIDE_TABLE))
+        return round(len(value) - nc - wc + 0.6 * nc + 1.3 * wc)
 
-        top_idx = 0  # Top header index
-        grp_idx = 0  # Index within current top header group
-        for i in range(len(self._field_header)):
-            header_name = self._field_header[i]['value']
-            # Set column type to NUMERIC if values are all numeric or empty
-            # Skip check for name, process and already determined column types
-            num_skip_cols = ['NUMERIC', 'ONTOLOGY', 'UNIT']
-            if (
-                header_name != 'Name'
-                and header_name not in th.PROCESS_NAME_HEADERS
-                and not self._field_configs[i]
-                and self._field_header[i]['col_type'] not in num_skip_cols
-                and any(_is_num(x[i]['value']) for x in self._table_data)
-                and all(
-                    (_is_num(x[i]['value']) or not x[i]['value'])
-                    for x in self._table_data
-                )
-            ):
-                self._field_header[i]['col_type'] = 'NUMERIC'
+    @classmethod
+    def _is_num(cls, value):
+        """Return whether a value contains only integers/doubles"""
+        # Supports lists
+        values = value if isinstance(value, list) else [value]
+        for v in values:
+            if isinstance(v, str):
+                if not num_re.fullmatch(v):
+                    return False
+                continue
+            try:
+                float(v)
+            except (ValueError, TypeError):
+                return False
+        return True
 
-            # Maximum column value length for column width estimate
-            field_header_len = round(
-                _get_length(self._field_header[i]['value'])
-            )
-            # If there is only one column in top header, use top header length
-            if self._top_header[top_idx]['colspan'] == 1:
-                top_header_len = round(
-                    _get_length(self._top_header[top_idx]['value'])
-                )
-                header_len = max(field_header_len, top_header_len)
-            else:
-                header_len = field_header_len
-
-            col_type = self._field_header[i]['col_type']
-            if col_type == 'CONTACT':
-                contact_vals = []
-                for x in self._table_data:
-                    if not x[i].get('value'):
-                        contact_vals.append('')
-                    elif isinstance(x[i]['value'], list):
-                        contact_vals.append('; '.join(x[i]['value']))
-                    else:
-                        contact_vals.append(x[i]['value'])
-                cell_lengths = [
-                    (
-                        _get_length(re.findall(link_re, x)[0][0])
-                        if re.findall(link_re, x)
-                        else len(x or '')
-                    )
-                    for x in contact_vals
-                ]
-                max_cell_len = max(cell_lengths)
-            elif col_type == 'EXTERNAL_LINKS':  # Special case, count elements
-                header_len = 0  # Header length is not comparable
-                cell_lengths = [
-                    (
-                        len(x[i]['value'])
-                        if x[i]['value'] and isinstance(x[i]['value'], list)
-                        else 0
+    @classmethod
+    def _get_contact_length(cls, value):
+        """Return estimated length for a contact cell value"""
+        if not value:
+            return 0
+        if isinstance(value, list):
+            value = '; '.join(value)
+        link_match = link_re.search(value)
+        if link_match:
+            return cls._get_length(link_match.group(1))
+        return len(value)
+
+    def _get_column_stats(self, i, col_type, num_check):
+        """
+        Return numeric status and maximum value length for a table column in a
+        single pass over the column. Statistics for repeated values are only
+        calculated once.
+
+        :param i: Column index (int)
+        :param col_type: Column type for length estimation (string)
+        :param num_check: Check for numeric values if True (bool)
+        :return: Tuple of any_num (bool), all_num (bool), max_len (int)
+        """
+        _get_length = self._get_length
+        _is_num = self._is_num
+        any_num = False
+        all_num = True
+        max_len = 0
+        value_stats = {}
+        for row in self._table_data:
+            cell = row[i]
+            value = cell.get('value')
+            unit = cell.get('unit')
+            key = (value, unit)
+            try:
+                stats = value_stats.get(key)
+            except TypeError:  # Unhashable value, e.g. list
+                key = None
+                stats = None
+            if stats is None:
+                num = _is_num(value) if num_check else False
+                if col_type == 'CONTACT':
+                    length = self._get_contact_length(value)
+                elif col_type == 'EXTERNAL_LINKS':  # Count elements
+                    length = (
+                        len(value) if value and isinstance(value, list) else 0
                     )
-                    for x in self._table_data
-                ]
-                max_cell_len = max(cell_lengths)
-            else:  # Generic type
-                max_cell_len = max(
-                    [
-                        _get_length(x[i]['value'], col_type)
-                        + _get_length(x[i].get('unit'), col_type)
+                else:
+                    length = (
+                        _get_length(value, col_type)
+                        + _get_length(unit, col_type)
                         + 1
-                        for x in self._table_data
-                    ]
-                )
-            self._field_header[i]['max_value_len'] = max(
-                [header_len, max_cell_len]
+                    )
+                stats = (num, num or not value, length)
+                if key is not None:
+                    value_stats[key] = stats
+            any_num = any_num or stats[0]
+            all_num = all_num and stats[1]
+            max_len = max(max_len, stats[2])
+        return any_num, all_num, max_len
+
+    def _add_column_ui_data(self, i, top_idx):
+        """
+        Add UI specific data to a table column.
+
+        :param i: Column index (int)
+        :param top_idx: Top header index for column (int)
+        """
+        _get_length = self._get_length
+        header = self._field_header[i]
+        col_type = header['col_type']
+        # Set column type to NUMERIC if values are all numeric or empty
+        # Skip check for name, process and already determined column types
+        num_check = (
+            header['value'] != 'Name'
+            and header['value'] not in th.PROCESS_NAME_HEADERS
+            and not self._field_configs[i]
+            and col_type not in ['ONTOLOGY', 'UNIT']
+        )
+        any_num, all_num, max_cell_len = self._get_column_stats(
+            i, col_type, num_check
+        )
+        if num_check and col_type != 'NUMERIC' and any_num and all_num:
+            header['col_type'] = 'NUMERIC'
+        # Revert detected type if values are no longer numeric (cache update)
+        elif num_check and col_type == 'NUMERIC' and not (any_num and all_num):
+            header['col_type'] = self._get_basic_col_type(
+                header['name'], header['item_type']
             )
+        # Recount lengths in the rare case of a special type being changed
+        len_types = ['CONTACT', 'EXTERNAL_LINKS']
+        if header['col_type'] != col_type and (
+            header['col_type'] in len_types or col_type in len_types
+        ):
+            _, _, max_cell_len = self._get_column_stats(
+                i, header['col_type'], False
+            )
+
+        # Maximum column value length for column width estimate
+        field_header_len = round(_get_length(header['value']))
+        # If there is only one column in top header, use top header length
+        if self._top_header[top_idx]['colspan'] == 1:
+            top_header_len = round(
+                _get_length(self._top_header[top_idx]['value'])
+            )
+            header_len = max(field_header_len, top_header_len)
+        else:
+            header_len = field_header_len
+        if header['col_type'] == 'EXTERNAL_LINKS':
+            header_len = 0  # Header length is not comparable
+        header['max_value_len'] = max([header_len, max_cell_len])
+
+    def _add_ui_table_data(self, cols=None):
+        """
+        Add UI specific data to a table.
 
+        :param cols: Only update columns with these indices if set (set)
+        """
+        # TODO: Un-hackify
+        top_idx = 0  # Top header index
+        grp_idx = 0  # Index within current top header group
+        for i in range(len(self._field_header)):
+            if cols is None or i in cols:
+                self._add_column_ui_data(i, top_idx)
             if grp_idx == self._top_header[top_idx]['colspan'] - 1:
                 top_idx += 1
                 grp_idx = 0
@@ -600,6 +711,8 @@ class SampleSheetTableBuilder:
         self._first_row = True
         self._col_values = []
         self._col_idx = 0
+        self._node_idx = 0
+        self._field_idx = 0
         row_id = 0
         if not node_map:
             node_map = self.get_node_map(self._study.get_nodes())
@@ -714,6 +827,49 @@ class SampleSheetTableBuilder:
                 assay_refs.append(row[start_idx:])
         return assay_refs
 
+    @classmethod
+    def get_compact_table(cls, table):
+        """
+        Return a copy of a render table with table data in a compact columnar
+        format. Table data is returned in "table_cols" as a list of columns,
+        each a dict of cell keys mapped to a list of values by row. Columns
+        with repeated values are returned as a dict of distinct values in
+        "dict" and row indices to the dict in "index". Cells missing a key
+        have the value set to None.
+
+        :param table: Study or assay render table (dict)
+        :return: Dict
+        """
+        ret = {k: v for k, v in table.items() if k != 'table_data'}
+        rows = table['table_data']
+        ret['row_count'] = len(rows)
+        ret['table_cols'] = []
+        col_count = len(rows[0]) if rows else 0
+        for i in range(col_count):
+            cells = [row[i] for row in rows]
+            col = {}
+            for k in dict.fromkeys(k for c in cells for k in c):
+                values = [c.get(k) for c in cells]
+                distinct = {}
+                index = []
+                for v in values:
+                    if isinstance(v, str):
+                        v_key = v
+                    else:  # Separate non-string values from strings
+                        v_key = (json.dumps(v, sort_keys=True),)
+                    if v_key not in distinct:
+                        distinct[v_key] = (len(distinct), v)
+                    index.append(distinct[v_key][0])
+                if len(distinct) <= len(values) * COMPACT_DICT_RATIO:
+                    col[k] = {
+                        'dict': [v[1] for v in distinct.values()],
+                        'index': index,
+                    }
+                else:
+                    col[k] = values
+            ret['table_cols'].append(col)
+        return ret
+
     def get_headers(self, investigation):
         """
         Return lists of headers for the studies and assays in an investigation.
@@ -869,6 +1025,15 @@ class SampleSheetTableBuilder:
                     logger.debug('Returning cached study tables')
                     return item.data
                 logger.debug('Cache item "{}" not set'.format(item_name))
+                if save_cache:
+                    try:
+                        return self.build_study_cache(study)
+                    except Exception as ex:
+                        logger.error(
+                            'Failed to build cache item "{}": {}'.format(
+                                item_name, ex
+                            )
+                        )
         else:
             logger.debug(
                 'Study table cache disabled in settings, building new tables'
@@ -891,6 +1056,46 @@ class SampleSheetTableBuilder:
                 )
         return study_tables
 
+    def build_study_cache(self, study, force=False):
+        """
+        Build study and assay tables and save them in sodarcache. The cache item
+        is locked for the duration of the build, so concurrent calls for the
+        same study wait for a single build and return its result.
+
+        :param study: Study object
+        :param force: Rebuild tables even if already cached (bool)
+        :return: Dict
+        """
+        cache_backend = get_backend_api('sodar_cache')
+        item_name = STUDY_TABLE_CACHE_ITEM.format(study=study.sodar_uuid)
+        project = study.get_project()
+        with transaction.atomic():
+            item, _ = JSONCacheItem.objects.get_or_create(
+                app_name=APP_NAME, name=item_name, project=project
+            )
+            # Wait for an in-flight build of the same study to finish
+            item = JSONCacheItem.objects.select_for_update().get(pk=item.pk)
+            if item.data and not force:
+                logger.debug(
+                    'Returning tables built by concurrent request for cache '
+                    'item "{}"'.format(item_name)
+                )
+                return item.data
+            b_start = time.time()
+            study_tables = self.build_study_tables(study, use_config=True)
+            cache_backend.set_cache_item(
+                app_name=APP_NAME,
+                name=item_name,
+                data=study_tables,
+                project=project,
+            )
+        logger.debug(
+            'Set cache item "{}" ({:.1f}s)'.format(
+                item_name, time.time() - b_start
+            )
+        )
+        return study_tables
+
     @classmethod
     def clear_study_cache(cls, study, delete=False):
         """
@@ -931,3 +1136,270 @@ class SampleSheetTableBuilder:
                 logger.error(
                     'Failed to clear cache item "{}": {}'.format(item_name, ex)
                 )
+
+    # Cache Updating -----------------------------------------------------------
+
+    @classmethod
+    def _get_table_groups(cls, table):
+        """
+        Return column ranges for top header groups of a table, along with the
+        index of the column containing the node UUID, if present.
+
+        :param table: Table dict
+        :return: List of tuples of (start, end, uuid_idx)
+        """
+        ret = []
+        start = 0
+        for top_header in table['top_header']:
+            end = start + top_header['colspan']
+            uuid_idx = next(
+                (
+                    i
+                    for i in range(start, end)
+                    if table['field_header'][i]['type'] in ['name', 'protocol']
+                ),
+                None,
+            )
+            ret.append((start, end, uuid_idx))
+            start = end
+        return ret
+
+    def _update_node_cells(self, table, node_cells):
+        """
+        Replace cells of edited nodes in table data.
+
+        :param table: Table dict
+        :param node_cells: Dict of cell lists keyed by node UUID
+        :raise: SampleSheetRenderingException if cells do not match columns
+        :return: Set of updated node UUIDs, set of updated column indices
+        """
+        updated_nodes = set()
+        updated_cols = set()
+        for start, end, uuid_idx in self._get_table_groups(table):
+            if uuid_idx is None:
+                continue
+            for row in table['table_data']:
+                uuid = row[uuid_idx].get('uuid')
+                if uuid not in node_cells:
+                    continue
+                if len(node_cells[uuid]) != end - start:
+                    raise SampleSheetRenderingException(
+                        'Cell count mismatch for node {}'.format(uuid)
+                    )
+                row[start:end] = node_cells[uuid]
+                updated_nodes.add(uuid)
+                updated_cols.update(range(start, end))
+        return updated_nodes, updated_cols
+
+    def _update_table_rows(self, table, table_refs, node_map, node_cells):
+        """
+        Rebuild table rows from references using existing node cells. Only
+        nodes not found in node_cells are rendered.
+
+        :param table: Table dict
+        :param table_refs: Object unique_name:s in a list of lists
+        :param node_map: Lookup dictionary containing objects
+        :param node_cells: Dict of cell lists keyed by node UUID
+        :raise: SampleSheetRenderingException if headers have changed
+        :return: Set of updated column indices
+        """
+        groups = self._get_table_groups(table)
+        old_nodes = [set() for _ in groups]
+        for row in table['table_data']:
+            for i, (start, end, uuid_idx) in enumerate(groups):
+                if uuid_idx is not None:
+                    old_nodes[i].add(row[uuid_idx].get('uuid'))
+        new_nodes = [set() for _ in groups]
+        table_data = []
+        for row_refs in table_refs:
+            if len(row_refs) != len(groups):
+                raise SampleSheetRenderingException('Table headers changed')
+            row = []
+            for i, ref in enumerate(row_refs):
+                obj = node_map[ref]
+                uuid = str(obj.sodar_uuid)
+                start, end, _ = groups[i]
+                if uuid not in node_cells:
+                    if obj.headers != table['top_header'][i]['headers']:
+                        raise SampleSheetRenderingException(
+                            'Table headers changed'
+                        )
+                    node_cells[uuid] = self._get_node_cells(obj)
+                if len(node_cells[uuid]) != end - start:
+                    raise SampleSheetRenderingException('Table headers changed')
+                row += node_cells[uuid]
+                new_nodes[i].add(uuid)
+            table_data.append(row)
+        # Top headers are set from the first row
+        for i, ref in enumerate(table_refs[0]):
+            if (
+                self._get_top_header(node_map[ref], groups[i][1] - groups[i][0])
+                != table['top_header'][i]
+            ):
+                raise SampleSheetRenderingException('Table headers changed')
+        table['table_data'] = table_data
+        updated_cols = set()
+        for i, (start, end, uuid_idx) in enumerate(groups):
+            if uuid_idx is None or old_nodes[i] != new_nodes[i]:
+                updated_cols.update(range(start, end))
+        return updated_cols
+
+    def _update_table_ui_data(self, table, study, assay, cols):
+        """
+        Update UI specific data for columns of an existing table.
+
+        :param table: Table dict
+        :param study: Study object
+        :param assay: Assay object or None
+        :param cols: Column indices (set)
+        """
+        self._study = study
+        self._assay = assay
+        self._top_header = table['top_header']
+        self._field_header = table['field_header']
+        self._table_data = table['table_data']
+        self._field_configs = []
+        for node_idx, (start, end, _) in enumerate(
+            self._get_table_groups(table)
+        ):
+            self._node_idx = node_idx
+            for field_idx in range(end - start):
+                self._field_idx = field_idx
+                field_config = self._get_field_config()
+                self._field_configs.append(
+                    bool(field_config and field_config.get('format'))
+                )
+        self._node_idx = 0
+        self._field_idx = 0
+        self._add_ui_table_data(cols)
+        for i in cols:
+            table['col_values'][i] = (
+                1 if any(row[i]['value'] for row in self._table_data) else 0
+            )
+        table['col_last_vis'] = (
+            len(table['col_values']) - table['col_values'][::-1].index(1) - 1
+        )
+
+    def _update_study_tables(self, study, tables, nodes, rows):
+        """
+        Update study and assay tables in place.
+
+        :param study: Study object
+        :param tables: Dict of study tables
+        :param nodes: Edited GenericMaterial or Process objects (list)
+        :param rows: Rebuild rows for inserted or deleted rows (bool)
+        :raise: SampleSheetRenderingException if tables can't be updated
+        """
+        assays = list(study.assays.all().order_by('pk'))
+        if set(tables['assays'].keys()) != set(
+            str(a.sodar_uuid) for a in assays
+        ):
+            raise SampleSheetRenderingException('Assays changed')
+        table_list = [(tables['study'], None)] + [
+            (tables['assays'][str(a.sodar_uuid)], a) for a in assays
+        ]
+        node_cells = {str(n.sodar_uuid): self._get_node_cells(n) for n in nodes}
+        updated_cols = []
+        found_nodes = set()
+        for table, assay in table_list:
+            t_nodes, t_cols = self._update_node_cells(table, node_cells)
+            found_nodes.update(t_nodes)
+            updated_cols.append(t_cols)
+        if not rows and found_nodes != set(node_cells.keys()):
+            raise SampleSheetRenderingException('Edited node not found')
+
+        if rows:
+            # Collect existing node cells from tables to avoid re-rendering
+            for table, assay in table_list:
+                for start, end, uuid_idx in self._get_table_groups(table):
+                    if uuid_idx is None:
+                        continue
+                    for row in table['table_data']:
+                        uuid = row[uuid_idx].get('uuid')
+                        if uuid not in node_cells:
+                            node_cells[uuid] = row[start:end]
+            study_nodes = study.get_nodes()
+            all_refs = self.build_study_reference(study, study_nodes)
+            sample_idx = self.get_sample_idx(all_refs)
+            node_map = self.get_node_map(study_nodes)
+            for i, (table, assay) in enumerate(table_list):
+                if assay:
+                    table_refs = self.get_assay_refs(
+                        all_refs, i - 1, sample_idx
+                    )
+                else:
+                    table_refs = self.get_study_refs(all_refs, sample_idx)
+                if not table_refs:
+                    raise SampleSheetRenderingException('Empty table')
+                updated_cols[i].update(
+                    self._update_table_rows(
+                        table, table_refs, node_map, node_cells
+                    )
+                )
+
+        for i, (table, assay) in enumerate(table_list):
+            if updated_cols[i]:
+                self._update_table_ui_data(table, study, assay, updated_cols[i])
+
+    def update_study_cache(self, study, nodes=None, rows=False):
+        """
+        Update cached study render tables in place after editing, instead of
+        clearing them for a full rebuild. Only the cells of edited nodes are
+        rendered and only the metadata of affected columns is updated. If the
+        tables can not be updated, the cache is cleared.
+
+        :param study: Study object
+        :param nodes: Edited GenericMaterial or Process objects (list)
+        :param rows: Update table rows after inserting or deleting (bool)
+        :return: True if tables were updated (bool)
+        """
+        cache_backend = get_backend_api('sodar_cache')
+        if not cache_backend:
+            return False
+        if not settings.SHEETS_ENABLE_STUDY_TABLE_CACHE:
+            self.clear_study_cache(study)
+            return False
+        item_name = STUDY_TABLE_CACHE_ITEM.format(study=study.sodar_uuid)
+        project = study.get_project()
+        u_start = time.time()
+        try:
+            with transaction.atomic():
+                # Lock item to prevent concurrent updates overwriting changes
+                item = (
+                    JSONCacheItem.objects.select_for_update()
+                    .filter(app_name=APP_NAME, name=item_name, project=project)
+                    .first()
+                )
+                if not item or not item.data:
+                    return False  # Nothing to update
+                self._sheet_config = app_settings.get(
+                    APP_NAME, 'sheet_config', project=project
+                )
+                if (
+                    self._sheet_config
+                    and str(study.sodar_uuid)
+                    not in self._sheet_config['studies']
+                ):
+                    self._sheet_config = None
+                tables = item.data
+                self._update_study_tables(study, tables, nodes or [], rows)
+                cache_backend.set_cache_item(
+                    app_name=APP_NAME,
+                    name=item_name,
+                    data=tables,
+                    project=project,
+                )
+        except Exception as ex:
+            logger.info(
+                'Unable to update cache item "{}", clearing: {}'.format(
+                    item_name, ex
+                )
+            )
+            self.clear_study_cache(study)
+            return False
+        logger.debug(
+            'Updated cache item "{}" ({:.1f}s)'.format(
+                item_name, time.time() - u_start
+            )
+        )
+        return True
@@ -10,13 +10,10 @@ from django.urls import reverse
 from projectroles.models import Project, SODAR_CONSTANTS
 from projectroles.plugins import get_backend_api
 
-from samplesheets.models import Investigation, Study, Assay, GenericMaterial
+from samplesheets.models import Investigation, Study, GenericMaterial
 from samplesheets.plugins import SampleSheetStudyPluginPoint
 from samplesheets.rendering import SampleSheetTableBuilder
-from samplesheets.studyapps.cancer.utils import (
-    get_library_file_path,
-    get_latest_file_path,
-)
+from samplesheets.studyapps.cancer.utils import get_study_library_file_paths
 from samplesheets.studyapps.utils import get_igv_session_url, get_igv_irods_url
 from samplesheets.utils import get_isa_field_name, get_last_material_index
 
@@ -174,10 +171,23 @@ class SampleSheetStudyPlugin(SampleSheetStudyPluginPoint):
             },
         }
 
+        lib_data = cache_item.data if cache_item else None
+        irods_backend = get_backend_api('omics_irods')
+        if not cache_item and irods_backend:
+            # Resolve library files from iRODS if not yet cached
+            try:
+                lib_data = get_study_library_file_paths(
+                    study_tables, irods_backend, source=case_id
+                )
+            except Exception as ex:
+                logger.error(
+                    'Error retrieving library file paths: {}'.format(ex)
+                )
+
         def _add_lib_path(library_name, file_type):
             path = None
-            if cache_item and library_name in cache_item.data[file_type]:
-                path = cache_item.data[file_type][library_name]
+            if lib_data and library_name in lib_data[file_type]:
+                path = lib_data[file_type][library_name]
             if path:
                 ret['data'][file_type]['files'].append(
                     {
@@ -252,44 +262,10 @@ class SampleSheetStudyPlugin(SampleSheetStudyPluginPoint):
         """
         irods_backend = get_backend_api('omics_irods')
         item_name = 'irods/{}'.format(study.sodar_uuid)
-        bam_paths = {}
-        vcf_paths = {}
         # Get/build render tables
         study_tables = table_builder.get_study_tables(study)
-
-        # Get libraries and library file paths
-        for k, assay_table in study_tables['assays'].items():
-            libs = []
-            lib_idx = get_last_material_index(assay_table)
-            for row in assay_table['table_data']:
-                lib_name = row[lib_idx]['value'].strip()
-                if lib_name not in libs:
-                    libs.append(lib_name)
-            assay = Assay.objects.get(sodar_uuid=k)
-            with irods_backend.get_session() as irods:
-                # NOTE: If multiple libraries with the same name are found, they
-                #       are treated as one with only the latest file returned
-                for lib in libs:
-                    bam_path = get_library_file_path(
-                        assay, lib, 'bam', irods_backend, irods
-                    )
-                    if bam_path and bam_paths.get(lib):
-                        bam_paths[lib] = get_latest_file_path(
-                            [bam_paths[lib], bam_path]
-                        )
-                    elif not bam_paths.get(lib):
-                        bam_paths[lib] = bam_path
-                    vcf_path = get_library_file_path(
-                        assay, lib, 'vcf', irods_backend, irods
-                    )
-                    if vcf_path and vcf_paths.get(lib):
-                        vcf_paths[lib] = get_latest_file_path(
-                            [vcf_paths[lib], vcf_path]
-                        )
-                    elif not vcf_paths.get(lib):
-                        vcf_paths[lib] = vcf_path
-
-        updated_data = {'bam': bam_paths, 'vcf': vcf_paths}
+        # Get library file paths
+        updated_data = get_study_library_file_paths(study_tables, irods_backend)
         logger.debug('Set cache item "{}": {}'.format(item_name, updated_data))
         cache_backend.set_cache_item(
             name=item_name,
@@ -16,7 +16,10 @@ from taskflowbackend.tests.base import TaskflowViewTestBase
 from samplesheets.models import ISA_META_STUDY_PLUGIN
 from samplesheets.plugins import SampleSheetStudyPluginPoint
 from samplesheets.rendering import SampleSheetTableBuilder
-from samplesheets.studyapps.cancer.utils import get_library_file_path
+from samplesheets.studyapps.cancer.utils import (
+    get_library_file_path,
+    get_library_file_paths,
+)
 from samplesheets.studyapps.utils import get_igv_session_url
 from samplesheets.tests.test_io import SampleSheetIOMixin, SHEET_DIR
 from samplesheets.tests.test_models import SampleSheetModelMixin
@@ -240,6 +243,34 @@ class TestCancerPlugin(
             ),
         )
 
+    def test_get_shortcut_links_files_no_cache(self):
+        """Test get_shortcut_links() with files in iRODS and no cache item"""
+        self.irods.collections.create(self.source_path)
+        bam_path = os.path.join(
+            self.source_path, '{}_test.bam'.format(SAMPLE_ID_NORMAL)
+        )
+        vcf_path = os.path.join(
+            self.source_path, '{}_test.vcf.gz'.format(SAMPLE_ID_NORMAL)
+        )
+        self.irods.data_objects.create(bam_path)
+        self.irods.data_objects.create(vcf_path)
+
+        study_tables = self.tb.build_study_tables(self.study)
+        sl = self.plugin.get_shortcut_links(
+            self.study, study_tables, case=[SOURCE_ID_NORMAL]
+        )
+        self.assertEqual(len(sl['data']['session']['files']), 1)
+        self.assertEqual(len(sl['data']['bam']['files']), 1)
+        self.assertEqual(len(sl['data']['vcf']['files']), 1)
+        self.assertEqual(
+            sl['data']['bam']['files'][0]['url'],
+            settings.IRODS_WEBDAV_URL + bam_path,
+        )
+        self.assertEqual(
+            sl['data']['vcf']['files'][0]['url'],
+            settings.IRODS_WEBDAV_URL + vcf_path,
+        )
+
     def test_get_shortcut_links_cram(self):
         """Test get_shortcut_links() with CRAM file in iRODS"""
         self.irods.collections.create(self.source_path)
@@ -782,3 +813,36 @@ class TestCancerPlugin(
         for i in range(1, len(CASE_IDS) - 1):
             self.assertEqual(ci['bam'][CASE_IDS[i]], None)
             self.assertEqual(ci['vcf'][CASE_IDS[i]], None)
+
+    def test_get_library_file_paths(self):
+        """Test get_library_file_paths()"""
+        self.irods.collections.create(self.source_path)
+        bam_path = os.path.join(
+            self.source_path, '{}_test.bam'.format(SAMPLE_ID_NORMAL)
+        )
+        bam_path2 = os.path.join(
+            self.source_path, '{}_test_2022-11-06.bam'.format(SAMPLE_ID_NORMAL)
+        )
+        vcf_path = os.path.join(
+            self.source_path, '{}_test.vcf.gz'.format(SAMPLE_ID_NORMAL)
+        )
+        self.irods.data_objects.create(bam_path)
+        self.irods.data_objects.create(bam_path2)
+        self.irods.data_objects.create(vcf_path)
+        libs = [LIBRARY_ID_NORMAL, LIBRARY_ID_TUMOR]
+        paths = get_library_file_paths(
+            self.assay, libs, self.irods_backend, self.irods
+        )
+        expected = {
+            ft: {
+                lib: get_library_file_path(
+                    self.assay, lib, ft, self.irods_backend, self.irods
+                )
+                for lib in libs
+            }
+            for ft in ['bam', 'vcf']
+        }
+        self.assertEqual(paths, expected)
+        self.assertEqual(paths['bam'][LIBRARY_ID_NORMAL], bam_path2)
+        self.assertEqual(paths['vcf'][LIBRARY_ID_NORMAL], vcf_path)
+        self.assertIsNone(paths['bam'][LIBRARY_ID_TUMOR])
@@ -2,12 +2,17 @@
 
 import os
 
+from samplesheets.models import Assay
 from samplesheets.studyapps.utils import (
     get_igv_omit_list,
     check_igv_file_suffix,
     check_igv_file_path,
 )
-from samplesheets.utils import get_latest_file_path
+from samplesheets.utils import get_last_material_index, get_latest_file_path
+
+
+# Local constants
+FILE_TYPES = ['bam', 'vcf']
 
 
 def get_library_file_path(assay, library_name, file_type, irods_backend, irods):
@@ -39,3 +44,83 @@ def get_library_file_path(assay, library_name, file_type, irods_backend, irods):
         return None
     # Return the last file of type by file name
     return get_latest_file_path(file_paths)
+
+
+def get_library_file_paths(assay, library_names, irods_backend, irods):
+    """
+    Return iRODS paths for the most recent files of type "bam" and "vcf" linked
+    to multiple libraries in an assay. The assay collection is listed once and
+    objects are grouped by library collection. CRAM files are included in "bam"
+    results.
+
+    :param assay: Assay object
+    :param library_names: Library names (list of strings)
+    :param irods_backend: IrodsAPI object
+    :param irods: IRODSSession object
+    :return: Dict of file type and dicts of library name and path or None
+    """
+    assay_path = irods_backend.get_path(assay)
+    project = assay.get_project()
+    omit_lists = {ft: get_igv_omit_list(project, ft) for ft in FILE_TYPES}
+    file_paths = {ft: {n: [] for n in library_names} for ft in FILE_TYPES}
+    prefix_len = len(assay_path) + 1
+    try:
+        for obj in irods_backend.iter_objects(irods, assay_path):
+            lib_name, sep, _ = obj['path'][prefix_len:].partition('/')
+            if not sep or lib_name not in file_paths['bam']:
+                continue
+            for ft in FILE_TYPES:
+                if check_igv_file_suffix(
+                    obj['name'].lower(), ft
+                ) and check_igv_file_path(obj['path'], omit_lists[ft]):
+                    file_paths[ft][lib_name].append(obj['path'])
+    except Exception:
+        pass
+    # Return the last file of type by file name
+    return {
+        ft: {
+            k: get_latest_file_path(v) if v else None
+            for k, v in file_paths[ft].items()
+        }
+        for ft in FILE_TYPES
+    }
+
+
+def get_study_library_file_paths(study_tables, irods_backend, source=None):
+    """
+    Return iRODS paths for the most recent files of type "bam" and "vcf" linked
+    to libraries in a study, listing each assay collection once. If multiple
+    libraries with the same name are found, they are treated as one with only
+    the latest file returned.
+
+    :param study_tables: Rendered study tables (dict)
+    :param irods_backend: IrodsAPI object
+    :param source: Limit to libraries of a source by name (string, optional)
+    :return: Dict of file type and dicts of library name and path or None
+    """
+    ret = {ft: {} for ft in FILE_TYPES}
+    with irods_backend.get_session() as irods:
+        for k, assay_table in study_tables['assays'].items():
+            lib_idx = get_last_material_index(assay_table)
+            libs = list(
+                dict.fromkeys(
+                    row[lib_idx]['value'].strip()
+                    for row in assay_table['table_data']
+                    if not source or row[0]['value'].strip() == source
+                )
+            )
+            if not libs:
+                continue
+            assay = Assay.objects.get(sodar_uuid=k)
+            lib_paths = get_library_file_paths(
+                assay, libs, irods_backend, irods
+            )
+            for ft in FILE_TYPES:
+                for lib, path in lib_paths[ft].items():
+                    if path and ret[ft].get(lib):
+                        ret[ft][lib] = get_latest_file_path(
+                            [ret[ft][lib], path]
+                        )
+                    elif not ret[ft].get(lib):
+                        ret[ft][lib] = path
+    return ret
@@ -1,5 +1,7 @@
 """Views for the cancer study app"""
 
+import logging
+
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
@@ -21,9 +23,11 @@ from projectroles.views import (
 from samplesheets.models import GenericMaterial
 from samplesheets.rendering import SampleSheetTableBuilder
 from samplesheets.utils import get_sheets_url, get_last_material_index
+from samplesheets.studyapps.cancer.utils import get_study_library_file_paths
 from samplesheets.studyapps.utils import get_igv_xml
 
 
+logger = logging.getLogger(__name__)
 table_builder = SampleSheetTableBuilder()
 
 
@@ -89,10 +93,22 @@ class IGVSessionFileRenderView(BaseCancerConfigView):
             )
         bam_urls = {}
         vcf_urls = {}
-        if cache_item:
+        study_tables = table_builder.get_study_tables(study)
+        source_name = self.material.name
+        lib_data = cache_item.data if cache_item else None
+        irods_backend = get_backend_api('omics_irods')
+        if not cache_item and irods_backend:
+            # Resolve library files from iRODS if not yet cached
+            try:
+                lib_data = get_study_library_file_paths(
+                    study_tables, irods_backend, source=source_name
+                )
+            except Exception as ex:
+                logger.error(
+                    'Error retrieving library file paths: {}'.format(ex)
+                )
+        if lib_data:
             # Get libraries
-            study_tables = table_builder.get_study_tables(study)
-            source_name = self.material.name
             libs = []
             for k, assay_table in study_tables['assays'].items():
                 lib_idx = get_last_material_index(assay_table)
@@ -102,10 +118,10 @@ class IGVSessionFileRenderView(BaseCancerConfigView):
                     if row_name == source_name and lib_name not in libs:
                         libs.append(lib_name)
             # Add URLs
-            for k, v in cache_item.data['bam'].items():
+            for k, v in lib_data['bam'].items():
                 if k in libs and v:
                     bam_urls[k] = webdav_url + v
-            for k, v in cache_item.data['vcf'].items():
+            for k, v in lib_data['vcf'].items():
                 if k in libs and v:
                     vcf_urls[k] = webdav_url + v
 
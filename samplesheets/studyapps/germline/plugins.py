@@ -24,6 +24,7 @@ from samplesheets.studyapps.utils import (
     check_igv_file_path,
     get_igv_session_url,
     get_igv_irods_url,
+    get_paths_in_coll,
 )
 from samplesheets.utils import get_index_by_header
 
@@ -324,6 +325,20 @@ class SampleSheetStudyPlugin(SampleSheetStudyPluginPoint):
         project = study.get_project()
         bam_omit_list = get_igv_omit_list(project, 'bam')
         vcf_omit_list = get_igv_omit_list(project, 'vcf')
+        # Filter study objects by file type once and index them by path
+        study_bam_paths = []
+        study_vcf_paths = []
+        for o in study_objs or []:
+            if check_igv_file_suffix(o['name'], 'bam') and check_igv_file_path(
+                o['path'], bam_omit_list
+            ):
+                study_bam_paths.append(o['path'])
+            elif o['name'].lower().endswith('vcf.gz') and check_igv_file_path(
+                o['path'], vcf_omit_list
+            ):
+                study_vcf_paths.append(o['path'])
+        study_bam_paths.sort()
+        study_vcf_paths.sort()
 
         for assay in study.assays.all():
             skip_msg = 'skipping pedigree file path search: "{}" ({})'.format(
@@ -354,13 +369,9 @@ class SampleSheetStudyPlugin(SampleSheetStudyPluginPoint):
                     row_idx += 1
                     continue
                 if obj_len > 0 and path not in bam_paths[source_name]:
-                    bam_paths[source_name] += [
-                        o['path']
-                        for o in study_objs
-                        if o['path'].startswith(path + '/')
-                        and check_igv_file_suffix(o['name'], 'bam')
-                        and check_igv_file_path(o['path'], bam_omit_list)
-                    ]
+                    bam_paths[source_name] += get_paths_in_coll(
+                        study_bam_paths, path
+                    )
                 # Add VCF objects
                 if fam_idx and row[fam_idx].get('value'):
                     vcf_query_id = row[fam_idx]['value']
@@ -369,13 +380,9 @@ class SampleSheetStudyPlugin(SampleSheetStudyPluginPoint):
                 if vcf_query_id not in vcf_paths:
                     vcf_paths[vcf_query_id] = []
                 if obj_len > 0 and path not in vcf_paths[vcf_query_id]:
-                    vcf_paths[vcf_query_id] += [
-                        o['path']
-                        for o in study_objs
-                        if o['path'].startswith(path + '/')
-                        and o['name'].lower().endswith('vcf.gz')
-                        and check_igv_file_path(o['path'], vcf_omit_list)
-                    ]
+                    vcf_paths[vcf_query_id] += get_paths_in_coll(
+                        study_vcf_paths, path
+                    )
                 row_idx += 1
 
         # Update data
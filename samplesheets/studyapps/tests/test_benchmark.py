@@ -0,0 +1,157 @@
+"""
+Benchmarks for IGV file lookups in the samplesheets study apps.
+
+These are run on synthetic study object lists and do not require an iRODS
+server. Benchmarks are skipped unless the SODAR_BENCHMARK environment variable
+is set. Example:
+
+SODAR_BENCHMARK=1 make test arg=samplesheets.studyapps.tests.test_benchmark
+"""
+
+import os
+import time
+
+from pathlib import PurePosixPath
+from unittest import skipUnless
+
+from django.test import SimpleTestCase
+
+from samplesheets.studyapps.utils import (
+    check_igv_file_path,
+    check_igv_file_suffix,
+    get_paths_in_coll,
+)
+
+
+# Local constants
+BENCHMARK_ENABLED = bool(os.environ.get('SODAR_BENCHMARK'))
+BENCHMARK_SKIP_MSG = 'SODAR_BENCHMARK not set'
+ASSAY_PATH = '/sodarZone/projects/00/project/sample_data/study/assay'
+# Row and data object counts
+SIZES = [(100, 15000), (500, 75000), (2000, 300000)]
+SCAN_MAX_OBJS = 75000  # Maximum object count for full scan benchmarks
+OMIT_LIST = ['*dragen_evidence.bam', '*/tmp/*', '*.g.vcf.gz', '*/qc/*.bam']
+FILE_NAMES = [
+    'sample.bam',
+    'sample.bam.bai',
+    'sample.cram',
+    'sample.vcf.gz',
+    'sample.vcf.gz.tbi',
+    'sample.g.vcf.gz',
+    'dragen_evidence.bam',
+    'sample.bam.md5',
+]
+
+
+def check_igv_file_path_glob(path, omit_list):
+    """Check IGV file path by matching each glob pattern separately"""
+    return not any(
+        [p for p in omit_list if PurePosixPath(path.lower()).match(p.lower())]
+    )
+
+
+def make_objects(row_count, obj_count):
+    """
+    Return synthetic study data objects evenly distributed over library
+    collections.
+
+    :param row_count: Number of rows (int)
+    :param obj_count: Number of data objects (int)
+    :return: List of dicts
+    """
+    ret = []
+    per_row = obj_count // row_count
+    for i in range(row_count):
+        lib_path = '{}/S{:06d}-N1-DNA1-WGS1'.format(ASSAY_PATH, i)
+        for j in range(per_row):
+            subcoll = ['2024-01-01', 'tmp', 'qc'][j % 3]
+            name = '{}_{}'.format(j, FILE_NAMES[j % len(FILE_NAMES)])
+            path = '{}/{}/{}'.format(lib_path, subcoll, name)
+            ret.append({'name': name, 'path': path})
+    return ret
+
+
+@skipUnless(BENCHMARK_ENABLED, BENCHMARK_SKIP_MSG)
+class TestStudyAppFileLookupBenchmark(SimpleTestCase):
+    """Benchmark for study app IGV file lookups with large studies"""
+
+    @classmethod
+    def _get_lib_paths(cls, row_count):
+        return [
+            '{}/S{:06d}-N1-DNA1-WGS1'.format(ASSAY_PATH, i)
+            for i in range(row_count)
+        ]
+
+    def test_germline_row_lookup(self):
+        """Benchmark germline study cache BAM and VCF lookups per row"""
+        print('\nGermline study row file lookup')
+        for row_count, obj_count in SIZES:
+            objs = make_objects(row_count, obj_count)
+            lib_paths = self._get_lib_paths(row_count)
+            scan_time = None
+            if obj_count <= SCAN_MAX_OBJS:
+                time_start = time.time()
+                for path in lib_paths:
+                    [
+                        o['path']
+                        for o in objs
+                        if o['path'].startswith(path + '/')
+                        and check_igv_file_suffix(o['name'], 'bam')
+                        and check_igv_file_path_glob(o['path'], OMIT_LIST)
+                    ]
+                    [
+                        o['path']
+                        for o in objs
+                        if o['path'].startswith(path + '/')
+                        and o['name'].lower().endswith('vcf.gz')
+                        and check_igv_file_path_glob(o['path'], OMIT_LIST)
+                    ]
+                scan_time = time.time() - time_start
+            time_start = time.time()
+            bam_paths = sorted(
+                o['path']
+                for o in objs
+                if check_igv_file_suffix(o['name'], 'bam')
+                and check_igv_file_path(o['path'], OMIT_LIST)
+            )
+            vcf_paths = sorted(
+                o['path']
+                for o in objs
+                if o['name'].lower().endswith('vcf.gz')
+                and check_igv_file_path(o['path'], OMIT_LIST)
+            )
+            for path in lib_paths:
+                get_paths_in_coll(bam_paths, path)
+                get_paths_in_coll(vcf_paths, path)
+            index_time = time.time() - time_start
+            print(
+                'Rows: {:>5}  Objects: {:>6}  Scan: {}  '
+                'Index: {:>6.3f}s'.format(
+                    row_count,
+                    obj_count,
+                    '{:>7.2f}s'.format(scan_time) if scan_time else '    n/a',
+                    index_time,
+                )
+            )
+
+    def test_cancer_library_filter(self):
+        """Benchmark cancer study library file filtering"""
+        print('\nCancer study library file filtering')
+        for row_count, obj_count in SIZES:
+            objs = make_objects(row_count, obj_count)
+            results = []
+            for check_func in [check_igv_file_path_glob, check_igv_file_path]:
+                time_start = time.time()
+                for file_type in ['bam', 'vcf']:
+                    [
+                        o['path']
+                        for o in objs
+                        if check_igv_file_suffix(o['name'].lower(), file_type)
+                        and check_func(o['path'], OMIT_LIST)
+                    ]
+                results.append(time.time() - time_start)
+            print(
+                'Objects: {:>6}  Glob: {:>6.2f}s  Regex: {:>6.3f}s'.format(
+                    obj_count, *results
+                )
+            )
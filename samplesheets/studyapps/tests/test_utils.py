@@ -18,7 +18,9 @@ from samplesheets.studyapps.utils import (
     get_igv_omit_list,
     check_igv_file_suffix,
     check_igv_file_path,
+    get_igv_omit_regex,
     get_igv_xml,
+    get_paths_in_coll,
 )
 from samplesheets.tests.test_io import SampleSheetIOMixin
 
@@ -205,6 +207,96 @@ class TestCheckIGVFilePath(TestCase):
         omit_list = ['*/aaa/*/yyy.bam']
         self.assertFalse(check_igv_file_path(path, omit_list))
 
+    def test_path_omit_wildcard_separator(self):
+        """Test check_igv_file_path() with wildcard not matching separator"""
+        path = '000/aaa/bbb/yyy.bam'
+        omit_list = ['*/aaa/yyy.bam']
+        self.assertTrue(check_igv_file_path(path, omit_list))
+
+    def test_path_omit_char_class(self):
+        """Test check_igv_file_path() with character class"""
+        path = '000/aaa/bbb/yyy.bam'
+        omit_list = ['*/[ab]*/yyy.bam']
+        self.assertFalse(check_igv_file_path(path, omit_list))
+
+    def test_path_omit_char_class_negated(self):
+        """Test check_igv_file_path() with negated character class"""
+        path = '000/aaa/bbb/yyy.bam'
+        omit_list = ['*/[!b]*/yyy.bam']
+        self.assertTrue(check_igv_file_path(path, omit_list))
+
+    def test_path_omit_absolute(self):
+        """Test check_igv_file_path() with absolute pattern"""
+        path = '/000/aaa/yyy.bam'
+        self.assertFalse(check_igv_file_path(path, ['/*/aaa/*.bam']))
+        self.assertTrue(check_igv_file_path(path, ['/aaa/*.bam']))
+
+
+class TestGetIGVOmitRegex(TestCase):
+    """Tests for get_igv_omit_regex()"""
+
+    def test_get(self):
+        """Test get_igv_omit_regex()"""
+        regex = get_igv_omit_regex(['*yyy.bam', '*/aaa/*'])
+        self.assertIsNotNone(regex.search('xxx/yyy.bam'))
+        self.assertIsNotNone(regex.search('000/aaa/zzz.bam'))
+        self.assertIsNone(regex.search('000/bbb/zzz.bam'))
+
+    def test_get_escape(self):
+        """Test get_igv_omit_regex() with regex special characters"""
+        regex = get_igv_omit_regex(['*/a.b/*'])
+        self.assertIsNotNone(regex.search('000/a.b/yyy.bam'))
+        self.assertIsNone(regex.search('000/axb/yyy.bam'))
+
+    def test_get_empty(self):
+        """Test get_igv_omit_regex() with empty list"""
+        self.assertIsNone(get_igv_omit_regex([]))
+
+    def test_get_bracket(self):
+        """Test get_igv_omit_regex() with bracket expressions"""
+        regex = get_igv_omit_regex(['*/[[]a^]/*', '*[!x]y.bam', '*[z-a].bam'])
+        self.assertIsNotNone(regex.search('000/[a^]/yyy.bam'))
+        self.assertIsNone(regex.search('000/a^]/zzz.bam'))
+        self.assertIsNotNone(regex.search('000/zyy.bam'))
+        self.assertIsNone(regex.search('000/xy.bam'))
+        self.assertIsNone(regex.search('000/m.bam'))
+
+    def test_get_cached(self):
+        """Test get_igv_omit_regex() returns cached regex"""
+        self.assertIs(
+            get_igv_omit_regex(['*yyy.bam']), get_igv_omit_regex(['*yyy.bam'])
+        )
+
+
+class TestGetPathsInColl(TestCase):
+    """Tests for get_paths_in_coll()"""
+
+    def setUp(self):
+        self.paths = sorted(
+            [
+                '/zone/aaa/bbb-ccc/yyy.bam',
+                '/zone/aaa/bbb/ccc/yyy.bam',
+                '/zone/aaa/bbb/yyy.bam',
+                '/zone/aaa/bbb0/yyy.bam',
+                '/zone/aaa/bbbccc/yyy.bam',
+            ]
+        )
+
+    def test_get(self):
+        """Test get_paths_in_coll()"""
+        self.assertEqual(
+            get_paths_in_coll(self.paths, '/zone/aaa/bbb'),
+            ['/zone/aaa/bbb/ccc/yyy.bam', '/zone/aaa/bbb/yyy.bam'],
+        )
+
+    def test_get_no_match(self):
+        """Test get_paths_in_coll() with no matching paths"""
+        self.assertEqual(get_paths_in_coll(self.paths, '/zone/aaa/ccc'), [])
+
+    def test_get_empty(self):
+        """Test get_paths_in_coll() with empty path list"""
+        self.assertEqual(get_paths_in_coll([], '/zone/aaa/bbb'), [])
+
 
 class TestGetIGVXML(StudyAppUtilsTestBase):
     """Tests for get_igv_xml()"""
@@ -1,9 +1,11 @@
 """General utility functions for samplesheets study apps"""
 
 import hashlib
+import re
 
+from bisect import bisect_left
+from functools import lru_cache
 from lxml import etree as ET
-from pathlib import PurePosixPath
 
 from django.conf import settings
 from django.urls import reverse
@@ -64,6 +66,101 @@ def check_igv_file_suffix(file_name, file_type):
     )
 
 
+def _translate_glob_part(part):
+    """
+    Translate a single path component of a glob pattern into a regular
+    expression. Wildcards never match the path separator.
+
+    :param part: Glob pattern path component (string)
+    :return: String
+    """
+    ret = ''
+    i = 0
+    n = len(part)
+    while i < n:
+        c = part[i]
+        i += 1
+        if c == '*':
+            if not ret.endswith('[^/]*'):
+                ret += '[^/]*'
+        elif c == '?':
+            ret += '[^/]'
+        elif c == '[':
+            j = i
+            if j < n and part[j] == '!':
+                j += 1
+            if j < n and part[j] == ']':
+                j += 1
+            while j < n and part[j] != ']':
+                j += 1
+            if j >= n:  # No closing bracket, treat as literal
+                ret += '\\['
+                continue
+            chars = part[i:j]
+            i = j + 1
+            negate = chars.startswith('!')
+            if negate:
+                chars = chars[1:]
+            # Escape set members as in fnmatch, omitting empty ranges
+            members = ''
+            k = 0
+            while k < len(chars):
+                if k + 2 < len(chars) and chars[k + 1] == '-':
+                    if chars[k] <= chars[k + 2]:
+                        members += '{}-{}'.format(
+                            re.escape(chars[k]), re.escape(chars[k + 2])
+                        )
+                    k += 3
+                else:
+                    members += re.escape(chars[k])
+                    k += 1
+            if negate:
+                ret += '[^/{}]'.format(members)
+            elif members:
+                ret += '[{}]'.format(members)
+            else:  # Only empty ranges, never matches
+                ret += '(?!)'
+        else:
+            ret += re.escape(c)
+    return ret
+
+
+@lru_cache(maxsize=128)
+def _compile_igv_omit_regex(omit_patterns):
+    """
+    Compile IGV omit glob patterns into a single regular expression.
+
+    :param omit_patterns: Path glob patterns (tuple)
+    :return: Pattern object or None
+    """
+    regexes = []
+    for pattern in omit_patterns:
+        pattern = pattern.lower()
+        parts = [p for p in pattern.split('/') if p and p != '.']
+        if not parts:
+            continue
+        # Relative patterns are matched from the right as in PurePath.match()
+        prefix = '^/' if pattern.startswith('/') else '(?:^|/)'
+        regexes.append(
+            prefix + '/'.join(_translate_glob_part(p) for p in parts) + '$'
+        )
+    if not regexes:
+        return None
+    return re.compile('|'.join('(?:{})'.format(r) for r in regexes))
+
+
+def get_igv_omit_regex(omit_list):
+    """
+    Return IGV omit glob patterns compiled into a single regular expression.
+    Paths are matched as in PurePosixPath.match(), so the expression should be
+    searched for in lowercase paths. Compiled expressions are cached.
+
+    :param omit_list: List of path glob patterns to omit (list)
+    :return: Pattern object or None if there are no patterns
+    """
+    return _compile_igv_omit_regex(tuple(omit_list))
+
+
 def check_igv_file_path(path, omit_list):
     """
     Check if file path is acceptable for IGV session inclusion. Returns False if
@@ -73,9 +170,24 @@ def check_igv_file_path(path, omit_list):
     :param omit_list: List of path glob patterns to omit (list)
     :return: Boolean (True if path is OK)
     """
-    return not any(
-        [p for p in omit_list if PurePosixPath(path.lower()).match(p.lower())]
-    )
+    omit_regex = get_igv_omit_regex(omit_list)
+    return not omit_regex or not omit_regex.search(path.lower())
+
+
+def get_paths_in_coll(paths, coll_path):
+    """
+    Return paths located recursively under a collection from a sorted list of
+    paths. The paths are located with binary search, so the lookup time does
+    not depend on the number of paths outside the collection.
+
+    :param paths: Sorted list of full iRODS paths (strings)
+    :param coll_path: Full iRODS collection path (string)
+    :return: List of strings
+    """
+    start = bisect_left(paths, coll_path + '/')
+    # "0" is the character following "/"
+    end = bisect_left(paths, coll_path + '0', lo=start)
+    return paths[start:end]
 
 
 def get_igv_session_url(source, app_name, merge=False):
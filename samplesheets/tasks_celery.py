@@ -2,8 +2,12 @@
 
 import logging
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 from django.conf import settings
 from django.contrib import auth
+from django.db import connection
 from django.urls import reverse
 
 from config.celery import app
@@ -14,9 +18,13 @@ from projectroles.constants import SODAR_CONSTANTS
 from projectroles.models import Project
 from projectroles.plugins import get_backend_api, get_app_plugin
 
+from samplesheets.models import Investigation
+from samplesheets.rendering import SampleSheetTableBuilder
+
 
 app_settings = AppSettingAPI()
 logger = logging.getLogger(__name__)
+table_builder = SampleSheetTableBuilder()
 User = auth.get_user_model()
 
 
@@ -114,39 +122,96 @@ def update_project_cache_task(
 
 
 @app.task(bind=True)
-def sheet_sync_task(_self):
-    """Task for synchronizing sample sheets from a source project"""
+def update_study_tables_task(_self, investigation_uuid):
+    """
+    Build and cache study render tables for all studies of an investigation
+    asynchronously, so they don't have to be built upon first access.
+
+    :param investigation_uuid: Investigation UUID (string)
+    """
+    investigation = Investigation.objects.filter(
+        sodar_uuid=investigation_uuid
+    ).first()
+    if not investigation:
+        logger.error(
+            'Investigation not found (uuid={})'.format(investigation_uuid)
+        )
+        return
+    if not settings.SHEETS_ENABLE_STUDY_TABLE_CACHE or not get_backend_api(
+        'sodar_cache'
+    ):
+        logger.debug('Study table cache not enabled, skipping')
+        return
+
+    for study in investigation.studies.all():
+        try:
+            table_builder.build_study_cache(study)
+        except Exception as ex:
+            logger.error(
+                'Failed to build study tables for study "{}" ({}): {}'.format(
+                    study.get_name(), study.sodar_uuid, ex
+                )
+            )
+    logger.info(
+        'Study table cache update OK for project {}'.format(
+            investigation.project.get_log_title()
+        )
+    )
+
+
+def _sync_project_sheets(project, close_db=False):
+    """
+    Synchronize sample sheets for a single project.
+
+    :param project: Project object
+    :param close_db: Close database connection when done (bool, set True if
+                     called in a worker thread)
+    :return: Tuple of sync result (bool) and error message (string or None)
+    """
     from samplesheets.views import SheetRemoteSyncAPI
 
+    try:
+        return SheetRemoteSyncAPI().sync_sheets(project, None), None
+    except Exception as ex:
+        return False, str(ex)
+    finally:
+        if close_db:
+            connection.close()
+
+
+@app.task(bind=True)
+def sheet_sync_task(_self):
+    """Task for synchronizing sample sheets from a source project"""
     if app_settings.get('projectroles', 'site_read_only'):
         logger.info('Site read-only mode enabled, skipping')
         return
 
     timeline = get_backend_api('timeline_backend')
-    tl_add = False
-    tl_status_type = timeline.TL_STATUS_OK if timeline else 'OK'
-    tl_status_desc = 'Sync OK'
-
-    for project in Project.objects.filter(type=PROJECT_TYPE_PROJECT):
-        sheet_sync_enable = app_settings.get(
-            APP_NAME, 'sheet_sync_enable', project=project
-        )
-        if not sheet_sync_enable:
-            continue
+    projects = [
+        p
+        for p in Project.objects.filter(type=PROJECT_TYPE_PROJECT)
+        if app_settings.get(APP_NAME, 'sheet_sync_enable', project=p)
+    ]
+    workers = min(settings.SHEETS_SYNC_WORKERS, len(projects))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    partial(_sync_project_sheets, close_db=True), projects
+                )
+            )
+    else:
+        results = [_sync_project_sheets(p) for p in projects]
 
-        sync_api = SheetRemoteSyncAPI()
-        try:
-            ret = sync_api.sync_sheets(project, None)
-            if ret:
-                tl_add = True
-        except Exception as ex:
-            fail_msg = 'Sync failed: {}'.format(ex)
-            logger.error(fail_msg)
-            tl_add = True  # Add timeline event
+    for project, (ret, error) in zip(projects, results):
+        if error:
             tl_status_type = timeline.TL_STATUS_FAILED if timeline else 'FAILED'
-            tl_status_desc = fail_msg
-
-        if timeline and tl_add:
+            tl_status_desc = 'Sync failed: {}'.format(error)
+            logger.error(tl_status_desc)
+        else:
+            tl_status_type = timeline.TL_STATUS_OK if timeline else 'OK'
+            tl_status_desc = 'Sync OK'
+        if timeline and (ret or error):
             timeline.add_event(
                 project=project,
                 app_name=APP_NAME,
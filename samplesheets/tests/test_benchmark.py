@@ -0,0 +1,95 @@
+"""
+Benchmarks for sample sheet rendering in the samplesheets app.
+
+These are run on synthetic sample sheets generated from a test ISA-Tab.
+Benchmarks are skipped unless the SODAR_BENCHMARK environment variable is set.
+Example:
+
+SODAR_BENCHMARK=1 make test arg=samplesheets.tests.test_benchmark
+"""
+
+import os
+import time
+
+from unittest import skipUnless
+from zipfile import ZipFile
+
+from test_plus.test import TestCase
+
+# Projectroles dependency
+from projectroles.models import SODAR_CONSTANTS
+from projectroles.tests.test_models import ProjectMixin
+
+from samplesheets.io import SampleSheetIO
+from samplesheets.rendering import SampleSheetTableBuilder
+from samplesheets.tests.test_io import SHEET_DIR
+
+
+# SODAR constants
+PROJECT_TYPE_PROJECT = SODAR_CONSTANTS['PROJECT_TYPE_PROJECT']
+
+# Local constants
+BENCHMARK_ENABLED = bool(os.environ.get('SODAR_BENCHMARK'))
+BENCHMARK_SKIP_MSG = 'SODAR_BENCHMARK not set'
+SHEET_PATH = SHEET_DIR + 'i_small.zip'
+ROW_COUNTS = [1000, 5000, 10000]
+TEMPLATE_ID = '0815'  # Source ID in template rows
+TEMPLATE_SAMPLE = '0815-N1'  # Sample name in template rows
+
+
+def make_isa_data(row_count):
+    """
+    Return synthetic ISA-Tab data with one source, sample and assay row per
+    row count, based on the first sample of the small test sheet.
+
+    :param row_count: Number of rows (int)
+    :return: Dict
+    """
+    isa_data = SampleSheetIO.get_isa_from_zip(ZipFile(SHEET_PATH))
+    for tables in [isa_data['studies'], isa_data['assays']]:
+        for table in tables.values():
+            lines = table['tsv'].strip().split('\n')
+            row = next(r for r in lines[1:] if TEMPLATE_SAMPLE in r)
+            rows = [
+                row.replace(TEMPLATE_ID, 'S{:06d}'.format(i))
+                for i in range(row_count)
+            ]
+            table['tsv'] = '\n'.join([lines[0]] + rows) + '\n'
+    return isa_data
+
+
+@skipUnless(BENCHMARK_ENABLED, BENCHMARK_SKIP_MSG)
+class TestSampleSheetTableBuilderBenchmark(ProjectMixin, TestCase):
+    """Benchmark for SampleSheetTableBuilder with large sheets"""
+
+    def setUp(self):
+        self.tb = SampleSheetTableBuilder()
+        self.sheet_io = SampleSheetIO(warn=False, allow_critical=True)
+
+    def _import_sheet(self, row_count):
+        project = self.make_project(
+            'Project{}'.format(row_count), PROJECT_TYPE_PROJECT, None
+        )
+        investigation = self.sheet_io.import_isa(
+            make_isa_data(row_count), project
+        )
+        return investigation.studies.first()
+
+    def test_build_study_tables(self):
+        """Benchmark building study tables with different row counts"""
+        print('\nSampleSheetTableBuilder.build_study_tables()')
+        for row_count in ROW_COUNTS:
+            study = self._import_sheet(row_count)
+            time_start = time.time()
+            tables = self.tb.build_study_tables(study, use_config=False)
+            build_time = time.time() - time_start
+            table = tables['study']
+            cols = set(range(len(table['field_header'])))
+            time_start = time.time()
+            self.tb._update_table_ui_data(table, study, None, cols)
+            ui_time = time.time() - time_start
+            print(
+                'Rows: {:>6}  Build: {:>6.2f}s  UI data: {:>6.3f}s'.format(
+                    len(table['table_data']), build_time, ui_time
+                )
+            )
@@ -393,6 +393,26 @@ class TestSheetExcelExportView(SamplesheetsPermissionTestBase):
         self.assert_response(self.study_url, self.bad_users_read, 302)
 
 
+class TestSheetTSVExportView(SamplesheetsPermissionTestBase):
+    """Permission tests for SheetTSVExportView"""
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse(
+            'samplesheets:export_tsv', kwargs={'study': self.study.sodar_uuid}
+        )
+
+    def test_get(self):
+        """Test SheetTSVExportView GET"""
+        self.assert_response(self.url, self.good_users_read, 200)
+        self.assert_response(self.url, self.bad_users_read, 302)
+        self.project.set_public()
+        self.assert_response(
+            self.url, [self.user_finder_cat, self.user_no_roles], 200
+        )
+        self.assert_response(self.url, self.anonymous, 302)
+
+
 class TestSheetISAExportView(SamplesheetsPermissionTestBase):
     """Permission tests for SheetISAExportView"""
 
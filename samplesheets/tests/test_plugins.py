@@ -3,6 +3,8 @@
 # NOTE: These are generic tests for common plugin methods and helpers,
 # study/assay plugin specific tests should go in their own modules
 
+from django.test import override_settings
+
 from test_plus.test import TestCase
 
 # Projectroles dependency
@@ -15,7 +17,7 @@ from projectroles.tests.test_models import (
 )
 
 from samplesheets.models import GenericMaterial
-from samplesheets.plugins import get_irods_content
+from samplesheets.plugins import ProjectAppPlugin, get_irods_content
 from samplesheets.assayapps.dna_sequencing.plugins import (
     SampleSheetAssayPlugin as DnaSequencingPlugin,
 )
@@ -131,3 +133,58 @@ class TestUpdateCacheRows(SamplesheetsPluginTestBase):
             self.plugin.update_cache_rows(
                 ASSAY_PLUGIN_NAME, project=self.project
             )
+
+
+class TestGetSearchMaterials(SamplesheetsPluginTestBase):
+    """Tests for _get_search_materials()"""
+
+    def setUp(self):
+        super().setUp()
+        self.plugin = ProjectAppPlugin()
+
+    def test_get_sample(self):
+        """Test _get_search_materials() with sample"""
+        sample = GenericMaterial.objects.filter(
+            study=self.study, item_type='SAMPLE'
+        ).first()
+        ret = self.plugin._get_search_materials(
+            [sample.name], self.user_owner, None, ['SAMPLE']
+        )
+        self.assertEqual(len(ret), 1)
+        self.assertEqual(ret[0]['name'], sample.name)
+        self.assertEqual(ret[0]['project'], self.project)
+        self.assertEqual(ret[0]['study'], self.study)
+        self.assertEqual(ret[0]['assays'], list(sample.get_sample_assays()))
+
+    def test_get_source(self):
+        """Test _get_search_materials() with source"""
+        source = GenericMaterial.objects.filter(
+            study=self.study, item_type='SOURCE'
+        ).first()
+        ret = self.plugin._get_search_materials(
+            [source.name], self.user_owner, None, ['SOURCE']
+        )
+        self.assertEqual(len(ret), 1)
+        self.assertEqual(ret[0]['assays'], [None])
+
+    def test_get_no_perms(self):
+        """Test _get_search_materials() with user without project access"""
+        user_no_roles = self.make_user('user_no_roles')
+        ret = self.plugin._get_search_materials(
+            [MATERIAL_NAME], user_no_roles, None, None
+        )
+        self.assertEqual(ret, [])
+
+    @override_settings(SHEETS_SEARCH_MATERIAL_LIMIT=1)
+    def test_get_limit(self):
+        """Test _get_search_materials() with result limit"""
+        names = list(
+            GenericMaterial.objects.filter(study=self.study)
+            .exclude(item_type__in=['DATA', 'MATERIAL'])
+            .values_list('name', flat=True)
+        )
+        self.assertGreater(len(names), 1)
+        ret = self.plugin._get_search_materials(
+            names, self.user_owner, None, None
+        )
+        self.assertEqual(len(ret), 1)
@@ -199,6 +199,44 @@ class TestSampleSheetTableBuilder(
             [h['col_type'] for h in assay_table['field_header']], expected
         )
 
+    def test_is_num(self):
+        """Test _is_num()"""
+        for v in ['1', '-1.5', '.5', '1e-3', ' 2 ', 'NaN', 3, 1.5, ['1', '2']]:
+            self.assertTrue(self.tb._is_num(v), msg=v)
+        for v in ['', 'a', '1_000', '1,5', '0x10', None, ['1', 'a']]:
+            self.assertFalse(self.tb._is_num(v), msg=v)
+
+    def test_get_length(self):
+        """Test _get_length()"""
+        self.assertEqual(self.tb._get_length(None), 0)
+        self.assertEqual(self.tb._get_length('aaaaa'), 5)
+        self.assertEqual(self.tb._get_length('iiiii'), 3)
+        self.assertEqual(self.tb._get_length('AAAAA'), 6)
+        self.assertEqual(self.tb._get_length('Name <name@example.com>'), 4)
+
+    def test_get_compact_table(self):
+        """Test get_compact_table()"""
+        table = self.tb.build_study_tables(self.study)['study']
+        compact = self.tb.get_compact_table(table)
+        self.assertNotIn('table_data', compact)
+        self.assertEqual(compact['field_header'], table['field_header'])
+        self.assertEqual(compact['row_count'], len(table['table_data']))
+        self.assertEqual(
+            len(compact['table_cols']), len(table['table_data'][0])
+        )
+        # Expand table data and compare to original
+        for i, row in enumerate(table['table_data']):
+            for j, cell in enumerate(row):
+                col = compact['table_cols'][j]
+                expanded = {}
+                for k, v in col.items():
+                    if isinstance(v, dict):
+                        expanded[k] = v['dict'][v['index'][i]]
+                    else:
+                        expanded[k] = v[i]
+                expected = {k: cell.get(k) for k in col.keys()}
+                self.assertEqual(expanded, expected)
+
     def test_build_study_tables_config(self):
         """Test build_study_tables() with sheet config"""
         tables = self.tb.build_study_tables(self.study)
@@ -354,3 +392,112 @@ class TestSampleSheetTableBuilder(
         self.assertIsNone(self.cache_backend.get_cache_item(*self.cache_args))
         self.tb.clear_study_cache(self.study, delete=True)
         self.assertIsNone(self.cache_backend.get_cache_item(*self.cache_args))
+
+    def test_build_study_cache(self):
+        """Test build_study_cache()"""
+        self.assertIsNone(self.cache_backend.get_cache_item(*self.cache_args))
+        study_tables = self.tb.build_study_cache(self.study)
+        self.assertEqual(study_tables, self.tb.build_study_tables(self.study))
+        cache_item = self.cache_backend.get_cache_item(*self.cache_args)
+        self.assertEqual(cache_item.data, study_tables)
+
+    def test_build_study_cache_cleared(self):
+        """Test build_study_cache() with cleared cache item"""
+        self.cache_backend.set_cache_item(
+            APP_NAME, self.cache_name, {}, 'json', self.project
+        )
+        study_tables = self.tb.build_study_cache(self.study)
+        self.assertEqual(study_tables, self.tb.build_study_tables(self.study))
+        cache_item = self.cache_backend.get_cache_item(*self.cache_args)
+        self.assertEqual(cache_item.data, study_tables)
+
+    def test_build_study_cache_existing(self):
+        """Test build_study_cache() with existing cache item"""
+        # Simulate tables built by a concurrent request
+        self.cache_backend.set_cache_item(
+            APP_NAME, self.cache_name, {'study': {}}, 'json', self.project
+        )
+        study_tables = self.tb.build_study_cache(self.study)
+        self.assertEqual(study_tables, {'study': {}})
+        cache_item = self.cache_backend.get_cache_item(*self.cache_args)
+        self.assertEqual(cache_item.data, {'study': {}})
+
+    def test_build_study_cache_force(self):
+        """Test build_study_cache() with existing cache item and force=True"""
+        self.cache_backend.set_cache_item(
+            APP_NAME, self.cache_name, {'study': {}}, 'json', self.project
+        )
+        study_tables = self.tb.build_study_cache(self.study, force=True)
+        self.assertEqual(study_tables, self.tb.build_study_tables(self.study))
+        cache_item = self.cache_backend.get_cache_item(*self.cache_args)
+        self.assertEqual(cache_item.data, study_tables)
+
+    def _set_cache(self):
+        """Build study tables and set cache item"""
+        study_tables = self.tb.build_study_tables(self.study)
+        self.cache_backend.set_cache_item(
+            APP_NAME, self.cache_name, study_tables, 'json', self.project
+        )
+
+    def test_update_study_cache(self):
+        """Test update_study_cache() with edited node"""
+        self._set_cache()
+        source = GenericMaterial.objects.filter(
+            study=self.study, item_type='SOURCE'
+        ).first()
+        source.characteristics['age']['value'] = '70'
+        source.save()
+        self.assertTrue(self.tb.update_study_cache(self.study, nodes=[source]))
+        cache_item = self.cache_backend.get_cache_item(*self.cache_args)
+        self.assertEqual(
+            cache_item.data, self.tb.build_study_tables(self.study)
+        )
+
+    def test_update_study_cache_col_type(self):
+        """Test update_study_cache() with edit changing column type"""
+        self._set_cache()
+        tables = self.cache_backend.get_cache_item(*self.cache_args).data
+        self.assertEqual(
+            tables['study']['field_header'][8]['col_type'], 'NUMERIC'
+        )
+        sample = GenericMaterial.objects.filter(
+            study=self.study, item_type='SAMPLE'
+        ).first()
+        sample.characteristics['status']['value'] = 'abc'
+        sample.save()
+        self.assertTrue(self.tb.update_study_cache(self.study, nodes=[sample]))
+        cache_item = self.cache_backend.get_cache_item(*self.cache_args)
+        self.assertEqual(
+            cache_item.data, self.tb.build_study_tables(self.study)
+        )
+        self.assertEqual(
+            cache_item.data['study']['field_header'][8]['col_type'], None
+        )
+
+    def test_update_study_cache_rows(self):
+        """Test update_study_cache() with rows=True"""
+        self._set_cache()
+        self.assertTrue(self.tb.update_study_cache(self.study, rows=True))
+        cache_item = self.cache_backend.get_cache_item(*self.cache_args)
+        self.assertEqual(
+            cache_item.data, self.tb.build_study_tables(self.study)
+        )
+
+    def test_update_study_cache_no_item(self):
+        """Test update_study_cache() without existing item"""
+        source = GenericMaterial.objects.filter(
+            study=self.study, item_type='SOURCE'
+        ).first()
+        self.assertFalse(self.tb.update_study_cache(self.study, nodes=[source]))
+        self.assertIsNone(self.cache_backend.get_cache_item(*self.cache_args))
+
+    @override_settings(SHEETS_ENABLE_STUDY_TABLE_CACHE=False)
+    def test_update_study_cache_disabled(self):
+        """Test update_study_cache() with SHEETS_ENABLE_STUDY_TABLE_CACHE=False"""
+        self._set_cache()
+        source = GenericMaterial.objects.filter(
+            study=self.study, item_type='SOURCE'
+        ).first()
+        self.assertFalse(self.tb.update_study_cache(self.study, nodes=[source]))
+        cache_item = self.cache_backend.get_cache_item(*self.cache_args)
+        self.assertEqual(cache_item.data, {})
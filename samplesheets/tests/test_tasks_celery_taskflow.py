@@ -285,6 +285,22 @@ class TestSheetRemoteSyncTask(SheetRemoteSyncTestBase):
             '300',
         )
 
+    def test_sync_unchanged(self):
+        """Test sync with unchanged source sheet"""
+        sheet_sync_task()
+        self.assertEqual(ISATab.objects.count(), 2)
+        sync_hash = app_settings.get(
+            APP_NAME, 'sheet_sync_hash', project=self.project_target
+        )
+        self.assertEqual(
+            sync_hash['investigation'],
+            str(self.project_target.investigations.first().sodar_uuid),
+        )
+        # Touch source without changing content
+        self.inv_source.save()
+        sheet_sync_task()
+        self.assertEqual(ISATab.objects.count(), 2)
+
     def test_sync_wrong_token(self):
         """Test sync with wrong token"""
         app_settings.set(
@@ -1,5 +1,9 @@
 """Tests for utility functions in the samplesheets app"""
 
+import io
+
+from openpyxl import load_workbook
+
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 from django.test import override_settings
@@ -28,6 +32,8 @@ from samplesheets.utils import (
     get_webdav_url,
     get_ext_link_labels,
     get_latest_file_path,
+    iter_tsv_table,
+    write_excel_table,
 )
 from samplesheets.tests.test_io import (
     SampleSheetIOMixin,
@@ -310,3 +316,36 @@ class TestGetLatestFilePath(SamplesheetsUtilsTestBase):
         self.assertEqual(
             get_latest_file_path([BAM_PATH, BAM_PATH2, CRAM_PATH]), BAM_PATH2
         )
+
+
+class TestWriteExcelTable(SamplesheetsUtilsTestBase):
+    """Tests for write_excel_table()"""
+
+    def test_write(self):
+        """Test writing study table"""
+        table = self.tb.build_study_tables(self.study)['study']
+        output = io.BytesIO()
+        write_excel_table(table, output, self.study.get_display_name())
+        output.seek(0)
+        ws = load_workbook(output).active
+        self.assertEqual(ws.max_row, len(table['table_data']) + 2)
+        self.assertEqual(ws.max_column, len(table['field_header']))
+        self.assertEqual(ws['A2'].value, table['field_header'][0]['value'])
+        self.assertEqual(
+            ws.column_dimensions['A'].width,
+            table['field_header'][0]['max_value_len'] + 2,
+        )
+
+
+class TestIterTSVTable(SamplesheetsUtilsTestBase):
+    """Tests for iter_tsv_table()"""
+
+    def test_iter(self):
+        """Test iterating study table lines"""
+        table = self.tb.build_study_tables(self.study)['study']
+        lines = list(iter_tsv_table(table))
+        self.assertEqual(len(lines), len(table['table_data']) + 2)
+        self.assertEqual(
+            lines[1].rstrip('\n').split('\t'),
+            [h['value'] for h in table['field_header']],
+        )
@@ -301,16 +301,14 @@ class TestSheetImportView(
         self.assertListEqual(isa_version.tags, ['IMPORT'])
         self.assertIsNotNone(isa_version.data['sheet_config'])
         self.assertIsNotNone(isa_version.data['display_config'])
-        # Assert study render table cache
-        # NOTE: Cache item not created in this case
-        inv = Investigation.objects.first()
-        cache_name = STUDY_TABLE_CACHE_ITEM.format(
-            study=inv.studies.first().sodar_uuid
-        )
-        self.assertIsNone(
-            self.cache_backend.get_cache_item(
-                APP_NAME, cache_name, self.project
-            )
+        # Assert study render table cache built in the background
+        study = Investigation.objects.first().studies.first()
+        cache_name = STUDY_TABLE_CACHE_ITEM.format(study=study.sodar_uuid)
+        cache_item = self.cache_backend.get_cache_item(
+            APP_NAME, cache_name, self.project
+        )
+        self.assertEqual(
+            cache_item.data, table_builder.build_study_tables(study)
         )
 
     def test_post_replace(self):
@@ -352,15 +350,14 @@ class TestSheetImportView(
         self.assertEqual(
             AppSetting.objects.filter(name='display_config').count(), 0
         )
-        # Assert study render table cache
-        inv = Investigation.objects.first()
-        cache_name = STUDY_TABLE_CACHE_ITEM.format(
-            study=inv.studies.first().sodar_uuid
+        # Assert study render table cache built in the background
+        study = Investigation.objects.first().studies.first()
+        cache_name = STUDY_TABLE_CACHE_ITEM.format(study=study.sodar_uuid)
+        cache_item = self.cache_backend.get_cache_item(
+            APP_NAME, cache_name, self.project
         )
-        self.assertIsNone(
-            self.cache_backend.get_cache_item(
-                APP_NAME, cache_name, self.project
-            )
+        self.assertEqual(
+            cache_item.data, table_builder.build_study_tables(study)
         )
 
     def test_post_replace_config_keep(self):
@@ -494,8 +491,12 @@ class TestSheetImportView(
         self.assertEqual(response.status_code, 302)
         self.assertEqual(Investigation.objects.count(), 1)
         self.assertEqual(ISATab.objects.count(), 2)
+        # Cache item should be rebuilt in the background
         cache_item = self.cache_backend.get_cache_item(*cache_args)
-        self.assertEqual(cache_item.data, {})
+        study = Investigation.objects.get(project=self.project).studies.first()
+        self.assertEqual(
+            cache_item.data, table_builder.build_study_tables(study)
+        )
         self.assertEqual(JSONCacheItem.objects.count(), 1)
 
     def test_post_replace_study_cache_new_sheet(self):
@@ -525,7 +526,17 @@ class TestSheetImportView(
         self.assertEqual(ISATab.objects.count(), 2)
         cache_item = self.cache_backend.get_cache_item(*cache_args)
         self.assertIsNone(cache_item)
-        self.assertEqual(JSONCacheItem.objects.count(), 0)
+        # Cache item for new study should be built in the background
+        study = Investigation.objects.get(project=self.project).studies.first()
+        cache_item = self.cache_backend.get_cache_item(
+            APP_NAME,
+            STUDY_TABLE_CACHE_ITEM.format(study=study.sodar_uuid),
+            self.project,
+        )
+        self.assertEqual(
+            cache_item.data, table_builder.build_study_tables(study)
+        )
+        self.assertEqual(JSONCacheItem.objects.count(), 1)
 
     def test_post_import_critical_warnings(self):
         """Test POST with critical warnings raised in altamISA"""
@@ -953,6 +964,27 @@ class TestSheetExcelExportView(SamplesheetsViewTestBase):
                 )
             )
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response['Content-Disposition'],
+            'attachment; filename="{}.xlsx"'.format(
+                self.assay.file_name.split('.')[0]
+            ),
+        )
+
+    def test_get_tsv(self):
+        """Test GET with TSV export of study table"""
+        with self.login(self.user):
+            response = self.client.get(
+                reverse(
+                    'samplesheets:export_tsv',
+                    kwargs={'study': self.study.sodar_uuid},
+                )
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        table = table_builder.get_study_tables(self.study)['study']
+        self.assertEqual(len(lines), len(table['table_data']) + 2)
 
 
 class TestSheetISAExportView(SamplesheetsViewTestBase):
@@ -1232,8 +1264,12 @@ class TestSheetVersionRestoreView(SamplesheetsViewTestBase):
             )
 
         self.assertEqual(response.status_code, 302)
+        # Cache item should be rebuilt in the background
         cache_item = self.cache_backend.get_cache_item(*cache_args)
-        self.assertEqual(cache_item.data, {})
+        study = Investigation.objects.get(project=self.project).studies.first()
+        self.assertEqual(
+            cache_item.data, table_builder.build_study_tables(study)
+        )
         self.assertEqual(JSONCacheItem.objects.count(), 1)
 
 
@@ -174,6 +174,8 @@ class RowEditMixin:
                         self.row_names.append(a[1])
                         break
                 n_uuid = self.row_uuids[i]
+        # Clear cached tables as UUIDs were modified outside of views
+        table_builder.clear_study_cache(self.study)
 
 
 class TestSheetContextAjaxView(SamplesheetsViewTestBase):
@@ -521,6 +523,39 @@ class TestStudyTablesAjaxView(IrodsAccessTicketMixin, SamplesheetsViewTestBase):
         self.assertIn('display_config', ret_data)
         self.assertNotIn('edit_context', ret_data)
 
+    def test_get_compact(self):
+        """Test GET with compact table data"""
+        tables = table_builder.get_study_tables(self.study)
+        with self.login(self.user):
+            response = self.client.get(
+                reverse(
+                    'samplesheets:ajax_study_tables',
+                    kwargs={'study': self.study.sodar_uuid},
+                ),
+                data={'compact': 1},
+                HTTP_ACCEPT_ENCODING='gzip',
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        ret_data = response.data
+        study_table = ret_data['tables']['study']
+        self.assertNotIn('table_data', study_table)
+        self.assertEqual(
+            study_table['row_count'], len(tables['study']['table_data'])
+        )
+        self.assertEqual(
+            len(study_table['table_cols']),
+            len(tables['study']['table_data'][0]),
+        )
+        self.assertEqual(
+            ret_data['table_heights']['study'],
+            RENDER_HEIGHT_HEADERS
+            + study_table['row_count'] * RENDER_HEIGHT_ROW
+            + RENDER_HEIGHT_SCROLLBAR,
+        )
+        a_uuid = str(self.assay.sodar_uuid)
+        self.assertIn('table_cols', ret_data['tables']['assays'][a_uuid])
+
     def test_get_edit(self):
         """Test GET with edit mode enabled"""
         with self.login(self.user):
@@ -1281,9 +1316,11 @@ class TestSheetCellEditAjaxView(SamplesheetsViewTestBase):
         obj.refresh_from_db()
         self.assertEqual(obj.name, new_name)
 
-        # We should have the cache item but without data
+        # Cache item should be updated
         cache_item = self.cache_backend.get_cache_item(*self.cache_args)
-        self.assertEqual(cache_item.data, {})
+        self.assertEqual(
+            cache_item.data, table_builder.build_study_tables(self.study)
+        )
         self.assertEqual(JSONCacheItem.objects.count(), 1)
 
 
@@ -1623,7 +1660,10 @@ class TestSheetRowInsertAjaxView(
         response = self.insert_row(path=STUDY_INSERT_PATH)
         self.assertEqual(response.status_code, 200)
         cache_item = self.cache_backend.get_cache_item(*self.cache_args)
-        self.assertEqual(cache_item.data, {})
+        self.study.refresh_from_db()
+        self.assertEqual(
+            cache_item.data, table_builder.build_study_tables(self.study)
+        )
         self.assertEqual(JSONCacheItem.objects.count(), 1)
 
 
@@ -1751,7 +1791,10 @@ class TestSheetRowDeleteAjaxView(
         response = self.delete_row(ASSAY_DELETE_PATH)
         self.assertEqual(response.status_code, 200)
         cache_item = self.cache_backend.get_cache_item(*self.cache_args)
-        self.assertEqual(cache_item.data, {})
+        self.study.refresh_from_db()
+        self.assertEqual(
+            cache_item.data, table_builder.build_study_tables(self.study)
+        )
         self.assertEqual(JSONCacheItem.objects.count(), 1)
 
 
@@ -1819,6 +1862,30 @@ class TestSheetEditFinishAjaxView(SamplesheetsViewTestBase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(ISATab.objects.count(), 1)  # No new version
 
+    def test_post_study_cache(self):
+        """Test POST with cleared study table cache"""
+        cache_backend = get_backend_api('sodar_cache')
+        cache_name = STUDY_TABLE_CACHE_ITEM.format(study=self.study.sodar_uuid)
+        cache_backend.set_cache_item(
+            APP_NAME, cache_name, {}, 'json', self.project
+        )
+        with self.login(self.user):
+            response = self.client.post(
+                reverse(
+                    'samplesheets:ajax_edit_finish',
+                    kwargs={'project': self.project.sodar_uuid},
+                ),
+                json.dumps({'updated': True, 'version_saved': True}),
+                content_type='application/json',
+            )
+        self.assertEqual(response.status_code, 200)
+        cache_item = cache_backend.get_cache_item(
+            APP_NAME, cache_name, self.project
+        )
+        self.assertEqual(
+            cache_item.data, table_builder.build_study_tables(self.study)
+        )
+
     def test_post_no_updates(self):
         """Test POST with updates=False"""
         self.assertEqual(ISATab.objects.count(), 1)
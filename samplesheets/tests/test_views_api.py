@@ -502,8 +502,12 @@ class TestSheetImportAPIView(
             Investigation.objects.filter(project=self.project).count(), 1
         )
         self.assertEqual(ISATab.objects.filter(project=self.project).count(), 2)
+        # Cache item should be rebuilt in the background
         cache_item = self.cache_backend.get_cache_item(*cache_args)
-        self.assertEqual(cache_item.data, {})
+        study = Investigation.objects.get(project=self.project).studies.first()
+        self.assertEqual(
+            cache_item.data, table_builder.build_study_tables(study)
+        )
         self.assertEqual(JSONCacheItem.objects.count(), 1)
 
     def test_post_replace_study_cache_new_sheet(self):
@@ -536,7 +540,17 @@ class TestSheetImportAPIView(
         self.assertEqual(ISATab.objects.filter(project=self.project).count(), 2)
         cache_item = self.cache_backend.get_cache_item(*cache_args)
         self.assertIsNone(cache_item)
-        self.assertEqual(JSONCacheItem.objects.count(), 0)
+        # Cache item for new study should be built in the background
+        study = Investigation.objects.get(project=self.project).studies.first()
+        cache_item = self.cache_backend.get_cache_item(
+            APP_NAME,
+            STUDY_TABLE_CACHE_ITEM.format(study=study.sodar_uuid),
+            self.project,
+        )
+        self.assertEqual(
+            cache_item.data, table_builder.build_study_tables(study)
+        )
+        self.assertEqual(JSONCacheItem.objects.count(), 1)
 
     def test_post_import_no_plugin_assay(self):
         """Test POST with assay without plugin"""
@@ -615,6 +629,23 @@ class TestSheetISAExportAPIView(SampleSheetAPIViewTestBase):
         expected['date_modified'] = str(investigation.date_modified)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data, expected)
+        self.assertIsNotNone(response.get('ETag'))
+
+    def test_get_json_not_modified(self):
+        """Test GET with JSON export and matching ETag"""
+        self.import_isa_from_file(SHEET_PATH, self.project)
+        url = reverse(
+            'samplesheets:api_export_json',
+            kwargs={'project': self.project.sodar_uuid},
+        )
+        etag = self.request_knox(url)['ETag']
+        response = self.client.get(
+            url,
+            HTTP_AUTHORIZATION='token {}'.format(self.get_token(self.user)),
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
 
 
 class TestIrodsAccessTicketRetrieveAPIView(IrodsAccessTicketAPITestBase):
@@ -1106,3 +1137,18 @@ class TestRemoteSheetGetAPIView(
         expected = sheet_io.export_isa(self.investigation)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data, expected)
+
+    def test_get_isatab_not_modified(self):
+        """Test GET as ISA-Tab with matching ETag"""
+        etag = self.client.get(self.url, {'isa': '1'})['ETag']
+        response = self.client.get(
+            self.url, {'isa': '1'}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_get_isatab_modified(self):
+        """Test GET as ISA-Tab with non-matching ETag"""
+        response = self.client.get(
+            self.url, {'isa': '1'}, HTTP_IF_NONE_MATCH='"0000"'
+        )
+        self.assertEqual(response.status_code, 200)
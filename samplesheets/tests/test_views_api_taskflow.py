@@ -1601,3 +1601,44 @@ class TestProjectIrodsFileListAPIView(SampleSheetAPITaskflowTestBase):
         self.assertEqual(response.data['previous'], self.url + '?page=2')
         self.assertEqual(len(response.data['results']), 1)
         self.assertEqual(response.data['results'][0]['name'], 'test10.txt')
+
+    @override_settings(SODAR_API_PAGE_SIZE=5)
+    def test_get_cursor(self):
+        """Test GET with cursor pagination"""
+        self.make_irods_colls(self.investigation)
+        coll_path = self.irods_backend.get_sample_path(self.project)
+        coll = self.irods.collections.get(coll_path)
+        for i in range(0, 11):
+            self.make_irods_object(coll, 'test{:02d}.txt'.format(i))
+
+        response = self.request_knox(self.url + '?cursor=')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['previous'], None)
+        self.assertIsNotNone(response.data['next'])
+        file_names = [r['name'] for r in response.data['results']]
+        self.assertEqual(file_names, [f'test0{i}.txt' for i in range(0, 5)])
+
+        response = self.request_knox(response.data['next'])
+        self.assertEqual(response.status_code, 200)
+        file_names = [r['name'] for r in response.data['results']]
+        self.assertEqual(
+            file_names, ['test{:02d}.txt'.format(i) for i in range(5, 10)]
+        )
+
+        response = self.request_knox(response.data['next'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['next'], None)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['name'], 'test10.txt')
+
+    def test_get_cursor_invalid(self):
+        """Test GET with invalid cursor"""
+        self.make_irods_colls(self.investigation)
+        response = self.request_knox(self.url + '?cursor=%%%')
+        self.assertEqual(response.status_code, 400)
+
+    def test_get_cursor_v1_1(self):
+        """Test GET with cursor and API version 1.1"""
+        self.make_irods_colls(self.investigation)
+        response = self.request_knox(self.url + '?cursor=', version='1.1')
+        self.assertEqual(response.status_code, 406)
@@ -42,6 +42,16 @@ urls_ui = [
         view=views.SheetExcelExportView.as_view(),
         name='export_excel',
     ),
+    path(
+        route='export/tsv/study/<uuid:study>',
+        view=views.SheetTSVExportView.as_view(),
+        name='export_tsv',
+    ),
+    path(
+        route='export/tsv/assay/<uuid:assay>',
+        view=views.SheetTSVExportView.as_view(),
+        name='export_tsv',
+    ),
     path(
         route='export/isa/<uuid:project>',
         view=views.SheetISAExportView.as_view(),
@@ -1,5 +1,8 @@
 """Utilities for the samplesheets app"""
 
+import csv
+import hashlib
+import io
 import json
 import os
 import random
@@ -7,9 +10,11 @@ import re
 import string
 
 from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
 from openpyxl.workbook.child import INVALID_TITLE_REGEX
 
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.urls import reverse
 
 # Projectroles dependency
@@ -258,44 +263,74 @@ def get_config_name(config):
     return re.split('[/\\\\]', config)[-1]
 
 
+def _get_export_value(c_val):
+    """Return rendered table cell value as a string for export"""
+    if isinstance(c_val, str):
+        return c_val
+    elif isinstance(c_val, dict):
+        return c_val['name']
+    elif isinstance(c_val, list):
+        return ';'.join([_get_export_value(x) for x in c_val])
+    return ''
+
+
+def _get_export_top_header(table):
+    """Return top header row of a rendered table for export"""
+    ret = []
+    for c in table['top_header']:
+        ret.append(c['value'])
+        if c['colspan'] > 1:
+            ret += [''] * (c['colspan'] - 1)
+    return ret
+
+
 def write_excel_table(table, output, display_name):
     """
-    Write an Excel 2010 file (.xlsx) from a rendered study/assay table.
+    Write an Excel 2010 file (.xlsx) from a rendered study/assay table. Uses a
+    write-only workbook, so rows are written out as they are appended instead
+    of keeping the full cell grid in memory.
 
     :param table: Study/assay render table (dict)
-    :param output: HttpResponse object in which output will be written
+    :param output: File name or writable binary file object
     :param display_name: Study or assay display name (string)
     """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=re.sub(INVALID_TITLE_REGEX, '_', display_name))
+    # Set column widths from lengths estimated by the table builder (plus a
+    # little extra for padding), these must be set before writing rows
+    # NOTE: There is a "bestFit" attribute but it doesn't really work at all
+    for i, h in enumerate(table['field_header']):
+        ws.column_dimensions[get_column_letter(i + 1)].width = (
+            h.get('max_value_len', len(h['value'])) + 2
+        )
+    ws.append(_get_export_top_header(table))
+    ws.append([c['value'] for c in table['field_header']])
+    for row in table['table_data']:
+        ws.append([_get_export_value(c['value']) for c in row])
+    wb.save(output)
 
-    def _get_val(c_val):
-        if isinstance(c_val, str):
-            return c_val
-        elif isinstance(c_val, dict):
-            return c_val['name']
-        elif isinstance(c_val, list):
-            return ';'.join([_get_val(x) for x in c_val])
-        return ''
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = re.sub(INVALID_TITLE_REGEX, '_', display_name)
-    top_header_row = []
+def iter_tsv_table(table):
+    """
+    Yield lines of a TSV file from a rendered study/assay table.
 
-    for c in table['top_header']:
-        top_header_row.append(c['value'])
-        if c['colspan'] > 1:
-            top_header_row += [''] * (c['colspan'] - 1)
-    ws.append(top_header_row)
-    ws.append([c['value'] for c in table['field_header']])
-    for row in table['table_data']:
-        ws.append([_get_val(c['value']) for c in row])
+    :param table: Study/assay render table (dict)
+    :return: Generator of strings
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf, delimiter='\t', lineterminator='\n')
 
-    # Resize columns (plus a little extra for padding)
-    # NOTE: There is a "bestFit" attribute but it doesn't really work at all
-    for col_cells in ws.columns:
-        length = max(len(c.value) if c.value else 0 for c in col_cells) + 2
-        ws.column_dimensions[col_cells[0].column_letter].width = length
-    wb.save(output)
+    def _get_line(row):
+        writer.writerow(row)
+        ret = buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+        return ret
+
+    yield _get_line(_get_export_top_header(table))
+    yield _get_line([c['value'] for c in table['field_header']])
+    for row in table['table_data']:
+        yield _get_line([_get_export_value(c['value']) for c in row])
 
 
 def get_top_header(table, field_idx):
@@ -394,3 +429,16 @@ def get_bool(bool_string):
     if bool_string.strip().lower() in ['0', 'f', 'false', 'n', 'no']:
         return False
     raise ValueError('Unable to parse value: {}'.format(bool_string))
+
+
+def get_data_hash(data):
+    """
+    Return content hash for JSON serializable data, e.g. exported ISA-Tab or
+    rendered study tables. Used for ETags and skipping unchanged sheet syncs.
+
+    :param data: JSON serializable object
+    :return: String
+    """
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder).encode()
+    ).hexdigest()
@@ -7,6 +7,7 @@ import logging
 import os
 import pytz
 import requests
+import tempfile
 import zipfile
 
 from cubi_isa_templates import _TEMPLATES as CUBI_TEMPLATES
@@ -17,9 +18,10 @@ from urllib.parse import urljoin
 from django.conf import settings
 from django.contrib import messages
 from django.db.models.functions import Now
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
 from django.shortcuts import redirect
 from django.urls import reverse
+from django.utils.http import parse_etags, quote_etag
 from django.utils.safestring import mark_safe
 from django.utils.text import slugify
 from django.utils.timezone import localtime
@@ -89,9 +91,11 @@ from samplesheets.utils import (
     get_sample_colls,
     compare_inv_replace,
     get_sheets_url,
+    iter_tsv_table,
     write_excel_table,
     get_isa_field_name,
     clean_sheet_dir_name,
+    get_data_hash,
 )
 
 
@@ -485,6 +489,13 @@ class SheetImportMixin:
             for study in investigation.studies.all():
                 study.refresh_from_db()
                 table_builder.clear_study_cache(study)
+        # Build study tables in the background
+        if settings.SHEETS_ENABLE_STUDY_TABLE_CACHE:
+            from samplesheets.tasks_celery import update_study_tables_task
+
+            update_study_tables_task.delay(
+                investigation_uuid=str(investigation.sodar_uuid)
+            )
 
         # Update project cache if replacing sheets and iRODS collections exists
         if (
@@ -631,8 +642,15 @@ class SheetISAExportMixin:
             )
             return response
         elif format == 'json':
-            export_data['date_modified'] = str(investigation.date_modified)
-            return Response(export_data, status=200)
+            # Return 304 if the client already has the same ISA-Tab content
+            etag = quote_etag(get_data_hash(export_data))
+            if etag in parse_etags(request.headers.get('If-None-Match', '')):
+                response = Response(status=304)
+            else:
+                export_data['date_modified'] = str(investigation.date_modified)
+                response = Response(export_data, status=200)
+            response['ETag'] = etag
+            return response
 
 
 class SheetCreateImportAccessMixin:
@@ -1210,15 +1228,34 @@ class SheetRemoteSyncAPI(SheetImportMixin):
         if not token:
             raise ValueError(SYNC_FAIL_UNSET_TOKEN)
 
+        old_inv = project.investigations.first()
+        replace = bool(old_inv)
+        # Content hash of last synced sheet, only valid for the same sheet
+        sync_hash = None
+        if old_inv:
+            sync_data = app_settings.get(
+                APP_NAME, 'sheet_sync_hash', project=project
+            )
+            if sync_data and sync_data.get('investigation') == str(
+                old_inv.sodar_uuid
+            ):
+                sync_hash = sync_data.get('hash')
+
         # Get remote sheet data (source)
+        headers = {'Authorization': 'token {}'.format(token)}
+        if sync_hash:
+            headers['If-None-Match'] = quote_etag(sync_hash)
         try:
             response = requests.get(
-                url, headers={'Authorization': 'token {}'.format(token)}
+                url, headers=headers, timeout=settings.SHEETS_SYNC_TIMEOUT
             )
         except Exception:
             raise requests.exceptions.ConnectionError(
                 '{}: {}'.format(SYNC_FAIL_CONNECT, url)
             )
+        if response.status_code == 304 and sync_hash:
+            logger.debug('Source sheet not modified, skipping sync')
+            return False
         if not response.status_code == 200:
             raise requests.exceptions.ConnectionError(
                 'Source API responded with status code: {}'.format(
@@ -1237,9 +1274,10 @@ class SheetRemoteSyncAPI(SheetImportMixin):
             source_data.pop('date_modified'),
             '%Y-%m-%d %H:%M:%S.%f+00:00',
         ).replace(tzinfo=pytz.UTC)
-        old_inv = project.investigations.first()
-        replace = bool(old_inv)
-        if old_inv and source_date < old_inv.date_modified:
+        source_hash = get_data_hash(source_data)
+        if old_inv and (
+            source_hash == sync_hash or source_date < old_inv.date_modified
+        ):
             logger.debug('No updates detected, skipping sync')
             return False
 
@@ -1261,9 +1299,25 @@ class SheetRemoteSyncAPI(SheetImportMixin):
         # Activate investigation
         investigation.active = True
         investigation.save()
+        app_settings.set(
+            APP_NAME,
+            'sheet_sync_hash',
+            {
+                'investigation': str(investigation.sodar_uuid),
+                'hash': source_hash,
+            },
+            project=project,
+        )
         # Clear cached study tables
         for study in investigation.studies.all():
             table_builder.clear_study_cache(study)
+        # Build study tables in the background
+        if settings.SHEETS_ENABLE_STUDY_TABLE_CACHE:
+            from samplesheets.tasks_celery import update_study_tables_task
+
+            update_study_tables_task.delay(
+                investigation_uuid=str(investigation.sodar_uuid)
+            )
 
         # Update project cache if replacing sheets and iRODS collections exist
         if (
@@ -1586,9 +1640,11 @@ class SheetExcelExportView(
     """Sample sheet table Excel export view"""
 
     permission_required = 'samplesheets.export_sheet'
+    #: Export format ("xlsx" or "tsv")
+    export_format = 'xlsx'
 
     def get(self, request, *args, **kwargs):
-        """Override get() to return an Excel file"""
+        """Override get() to stream an Excel or TSV file"""
         redirect_url = get_sheets_url(self.get_project())
         assay = None
         study = None
@@ -1626,14 +1682,37 @@ class SheetExcelExportView(
             input_name = study.file_name
             display_name = study.get_display_name()
 
-        # Set up response
-        response = HttpResponse(content_type='text/tab-separated-values')
-        response['Content-Disposition'] = (
-            'attachment; filename="{}.xlsx"'.format(input_name.split('.')[0])
-        )  # TODO: TBD: Output file name?
-        # Build Excel file
-        write_excel_table(table, response, display_name)
-        return response
+        # TODO: TBD: Output file name?
+        file_name = '{}.{}'.format(input_name.split('.')[0], self.export_format)
+        if self.export_format == 'tsv':
+            response = StreamingHttpResponse(
+                iter_tsv_table(table), content_type='text/tab-separated-values'
+            )
+            response['Content-Disposition'] = (
+                'attachment; filename="{}"'.format(file_name)
+            )
+            return response
+        # Build Excel file in a temporary file and stream it to the client
+        f = tempfile.TemporaryFile()
+        try:
+            write_excel_table(table, f, display_name)
+        except Exception:
+            f.close()
+            raise
+        f.seek(0)
+        return FileResponse(
+            f,
+            as_attachment=True,
+            filename=file_name,
+            content_type='application/vnd.openxmlformats-officedocument.'
+            'spreadsheetml.sheet',
+        )
+
+
+class SheetTSVExportView(SheetExcelExportView):
+    """Sample sheet table TSV export view"""
+
+    export_format = 'tsv'
 
 
 class SheetISAExportView(
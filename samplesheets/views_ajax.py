@@ -11,6 +11,8 @@ from django.conf import settings
 from django.db import transaction
 from django.middleware.csrf import get_token
 from django.urls import reverse
+from django.utils.decorators import method_decorator
+from django.views.decorators.gzip import gzip_page
 
 from rest_framework.response import Response
 
@@ -507,8 +509,12 @@ class SheetContextAjaxView(SODARBaseProjectAjaxView):
         return Response(ret_data, status=200)
 
 
+@method_decorator(gzip_page, name='dispatch')
 class StudyTablesAjaxView(SODARBaseProjectAjaxView):
-    """View to retrieve study tables built from the sample sheet graph"""
+    """
+    View to retrieve study tables built from the sample sheet graph. Table data
+    is returned in a compact columnar format if the "compact" parameter is set.
+    """
 
     def _get_table_height(self, table, user, edit):
         """
@@ -722,6 +728,13 @@ class StudyTablesAjaxView(SODARBaseProjectAjaxView):
                 ret_data['edit_context']['protocols'].append(
                     {'uuid': str(protocol.sodar_uuid), 'name': protocol.name}
                 )
+
+        # Return table data in compact format if requested
+        if bool(request.GET.get('compact')):
+            tables = ret_data['tables']
+            tables['study'] = table_builder.get_compact_table(tables['study'])
+            for k, v in tables['assays'].items():
+                tables['assays'][k] = table_builder.get_compact_table(v)
         return Response(ret_data, status=200)
 
 
@@ -962,7 +975,7 @@ class SheetCellEditAjaxView(BaseSheetEditAjaxView):
         ).first()
         updated_cells = request.data.get('updated_cells', [])
         verify = request.data.get('verify', False)
-        studies = []
+        studies = {}
 
         for cell in updated_cells:
             logger.debug('Cell update: {}'.format(cell))
@@ -991,10 +1004,12 @@ class SheetCellEditAjaxView(BaseSheetEditAjaxView):
             # Update cell, save immediately (now we are only editing one cell)
             try:
                 self._update_cell(node_obj, cell, save=True)
-                # Add node study for study table cache clearing
+                # Add node and study for study table cache updating
                 study = node_obj.get_study()
                 if study not in studies:
-                    studies.append(study)
+                    studies[study] = []
+                if node_obj not in studies[study]:
+                    studies[study].append(node_obj)
             except self.SheetEditException as ex:
                 return Response({'detail': str(ex)}, status=500)
 
@@ -1006,9 +1021,9 @@ class SheetCellEditAjaxView(BaseSheetEditAjaxView):
                 )
             except Exception as ex:
                 return Response({'detail': str(ex)}, status=500)
-            # Clear cached study tables
-            for study in studies:
-                table_builder.clear_study_cache(study)
+            # Update cached study tables
+            for study, nodes in studies.items():
+                table_builder.update_study_cache(study, nodes=nodes)
         # TODO: Log edits in timeline here, once saving in bulk
         return Response(self.ok_data, status=200)
 
@@ -1403,8 +1418,8 @@ class SheetRowInsertAjaxView(BaseSheetEditAjaxView):
         except Exception as ex:
             self._raise_ex('altamISA Error: {}'.format(ex))
         logger.debug('Inserting row OK')
-        # Clear cached study tables
-        table_builder.clear_study_cache(study)
+        # Update cached study tables
+        table_builder.update_study_cache(study, rows=True)
         # Return node UUIDs if successful
         return [str(o.sodar_uuid) for o in node_objects]
 
@@ -1567,8 +1582,8 @@ class SheetRowDeleteAjaxView(BaseSheetEditAjaxView):
             sheet_io.export_isa(study.investigation)
         except Exception as ex:
             self._raise_ex('altamISA Error: {}'.format(ex))
-        # Clear cached study tables
-        table_builder.clear_study_cache(study)
+        # Update cached study tables
+        table_builder.update_study_cache(study, rows=True)
         logger.debug('Deleting row OK')
 
     def post(self, request, *args, **kwargs):
@@ -1705,6 +1720,13 @@ class SheetEditFinishAjaxView(SheetVersionMixin, SODARBaseProjectAjaxView):
                     + 'Saved ISA-Tab "{}"'.format(isa_version.get_full_name())
                 )
             inv.save()  # Update date_modified
+            # Build study tables in the background if cleared during editing
+            if settings.SHEETS_ENABLE_STUDY_TABLE_CACHE:
+                from samplesheets.tasks_celery import update_study_tables_task
+
+                update_study_tables_task.delay(
+                    investigation_uuid=str(inv.sodar_uuid)
+                )
             return Response({'detail': 'ok'}, status=200)
         return Response({'detail': export_ex}, status=500)
 
@@ -4,12 +4,14 @@ import logging
 import re
 import sys
 
-from irods.exception import CAT_NO_ROWS_FOUND
-from irods.models import DataObject
+from contextlib import closing
+from itertools import islice
+
 from packaging.version import parse as parse_version
 
 from django.conf import settings
 from django.urls import reverse
+from django.utils.http import parse_etags, quote_etag, urlencode
 
 from rest_framework import serializers, status
 from rest_framework.exceptions import (
@@ -66,6 +68,7 @@ from samplesheets.serializers import (
     IrodsAccessTicketSerializer,
     IrodsDataRequestSerializer,
 )
+from samplesheets.utils import get_data_hash
 from samplesheets.views import (
     IrodsAccessTicketModifyMixin,
     IrodsCollsCreateViewMixin,
@@ -88,8 +91,8 @@ PROJECT_ROLE_GUEST = SODAR_CONSTANTS['PROJECT_ROLE_GUEST']
 # Local constants
 APP_NAME = 'samplesheets'
 SAMPLESHEETS_API_MEDIA_TYPE = 'application/vnd.bihealth.sodar.samplesheets+json'
-SAMPLESHEETS_API_ALLOWED_VERSIONS = ['1.0', '1.1']
-SAMPLESHEETS_API_DEFAULT_VERSION = '1.1'
+SAMPLESHEETS_API_ALLOWED_VERSIONS = ['1.0', '1.1', '1.2']
+SAMPLESHEETS_API_DEFAULT_VERSION = '1.2'
 HASH_SCHEME_MD5 = 'MD5'
 HASH_SCHEME_SHA256 = 'SHA256'
 CHECKSUM_RE = {
@@ -105,6 +108,10 @@ FILE_EXISTS_RESTRICT_MSG = (
     'above in any project (SHEETS_API_FILE_EXISTS_RESTRICT=True)'
 )
 FILE_LIST_PAGINATE_VERSION_MSG = 'Pagination not supported in API version 1.0'
+FILE_LIST_CURSOR_VERSION_MSG = (
+    'Cursor pagination requires samplesheets API version 1.2 or above'
+)
+FILE_LIST_CURSOR_PAGE_MSG = 'Parameters cursor and page can not be combined'
 HOST_VERSION_ERR_MSG = (
     'Field allowed_hosts requires samplesheets API version 1.1 or above'
 )
@@ -1024,27 +1031,12 @@ class SampleDataFileExistsAPIView(SamplesheetsAPIVersioningMixin, APIView):
             c = irods_backend.get_sha256_base64(c, prefix=True)
 
         ret = {'detail': 'File does not exist', 'status': False}
-        sql = (
-            'SELECT DISTINCT ON (data_id) data_name '
-            'FROM r_data_main JOIN r_coll_main USING (coll_id) '
-            'WHERE (coll_name LIKE \'%/{coll}\' '
-            'OR coll_name LIKE \'%/{coll}/%\') '
-            'AND r_data_main.data_checksum = \'{sum}\''.format(
-                coll=settings.IRODS_SAMPLE_COLL, sum=c
-            )
-        )
-        # print('QUERY: {}'.format(sql))  # DEBUG
-        columns = [DataObject.name]
         try:
             with irods_backend.get_session() as irods:
-                query = irods_backend.get_query(irods, sql, columns)
                 try:
-                    results = query.get_results()
-                    if sum(1 for _ in results) > 0:
+                    if irods_backend.check_sample_checksum(irods, c):
                         ret['detail'] = 'File exists'
                         ret['status'] = True
-                except CAT_NO_ROWS_FOUND:
-                    pass  # No results, this is OK
                 except Exception as ex:
                     logger.error(
                         '{} iRODS query exception: {}'.format(
@@ -1055,8 +1047,6 @@ class SampleDataFileExistsAPIView(SamplesheetsAPIVersioningMixin, APIView):
                         'iRODS query exception, please contact an admin if '
                         'issue persists'
                     )
-                finally:
-                    query.remove()
         except Exception as ex:
             return Response(
                 {'detail': 'Unable to connect to iRODS: {}'.format(ex)},
@@ -1090,6 +1080,12 @@ class ProjectIrodsFileListAPIView(
     string. This will return results in the Django Rest Framework
     ``PageNumberPagination`` format.
 
+    For large collections, cursor pagination is recommended instead. Provide
+    the ``cursor`` query string with an empty value to retrieve the first page.
+    The response is returned in the Django Rest Framework ``CursorPagination``
+    format, with the URL of the next page in ``next``. Results are retrieved
+    in constant memory regardless of the collection size.
+
     **URL:** ``/samplesheets/api/file/list/{Project.sodar_uuid}``
 
     **Methods:** ``GET``
@@ -1097,6 +1093,7 @@ class ProjectIrodsFileListAPIView(
     **Parameters:**
 
     - ``page``: Page number for paginated results (int, optional)
+    - ``cursor``: Cursor for paginated results (string, optional)
 
     **Returns:**
 
@@ -1113,24 +1110,90 @@ class ProjectIrodsFileListAPIView(
 
     - ``1.1``: Add ``checksum`` field to return data
     - ``1.1``: Add ``page`` parameter for optional pagination
+    - ``1.2``: Add ``cursor`` parameter for optional cursor pagination
     """
 
     http_method_names = ['get']
     permission_required = 'samplesheets.view_sheet'
 
+    @classmethod
+    def _get_cursor_response(cls, irods_backend, path, cursor, url):
+        """
+        Return cursor paginated file list response data.
+
+        :param irods_backend: IrodsAPI object
+        :param path: Full iRODS path to collection (string)
+        :param cursor: Cursor string, empty for first page
+        :param url: URL of the view (string)
+        :return: Dict
+        """
+        page_size = settings.SODAR_API_PAGE_SIZE
+        with irods_backend.get_session() as irods:
+            with closing(
+                irods_backend.iter_objects(
+                    irods,
+                    path,
+                    cursor=cursor or None,
+                    api_format=True,
+                    checksum=True,
+                )
+            ) as objs:
+                # Retrieve one extra object to know if there is a next page
+                obj_list = list(islice(objs, page_size + 1))
+        next_url = None
+        if len(obj_list) > page_size:
+            obj_list = obj_list[:page_size]
+            next_url = (
+                url
+                + '?'
+                + urlencode(
+                    {
+                        'cursor': irods_backend.get_list_cursor(
+                            obj_list[-1]['path']
+                        )
+                    }
+                )
+            )
+        return {'next': next_url, 'previous': None, 'results': obj_list}
+
     def get(self, request, *args, **kwargs):
         if not settings.ENABLE_IRODS:
             raise APIException('iRODS not enabled')
         version = parse_version(request.version)
         page = request.GET.get('page')
+        cursor = request.GET.get('cursor')
         if page and version < parse_version('1.1'):
             raise NotAcceptable(FILE_LIST_PAGINATE_VERSION_MSG)
         elif page:
             page = int(page)
+        if cursor is not None and version < parse_version('1.2'):
+            raise NotAcceptable(FILE_LIST_CURSOR_VERSION_MSG)
+        if cursor is not None and page:
+            raise ParseError(FILE_LIST_CURSOR_PAGE_MSG)
 
         irods_backend = get_backend_api('omics_irods')
         project = self.get_project()
         path = irods_backend.get_sample_path(project)
+        url = reverse(
+            'samplesheets:api_file_list',
+            kwargs={'project': project.sodar_uuid},
+        )
+        if cursor is not None:
+            try:
+                ret = self._get_cursor_response(
+                    irods_backend, path, cursor, url
+                )
+            except FileNotFoundError as ex:
+                raise NotFound('{}: {}'.format(IRODS_QUERY_ERROR_MSG, ex))
+            except ValueError as ex:
+                raise ParseError(str(ex))
+            except Exception as ex:
+                return Response(
+                    {'detail': '{}: {}'.format(IRODS_QUERY_ERROR_MSG, ex)},
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                )
+            return Response(ret, status=status.HTTP_200_OK)
+
         page_size = settings.SODAR_API_PAGE_SIZE
         limit = None
         offset = None
@@ -1163,10 +1226,6 @@ class ProjectIrodsFileListAPIView(
             )
 
         if page:
-            url = reverse(
-                'samplesheets:api_file_list',
-                kwargs={'project': project.sodar_uuid},
-            )
             ret = {
                 'count': file_count,
                 'next': (
@@ -1245,4 +1304,11 @@ class RemoteSheetGetAPIView(APIView):
                 ret = sheet_io.export_isa(investigation)
             except Exception as ex:
                 return Response(str(ex), status=500)
-        return Response(ret, status=200)
+        # Return 304 if the target site already has the same content
+        etag = quote_etag(get_data_hash(ret))
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            response = Response(status=304)
+        else:
+            response = Response(ret, status=200)
+        response['ETag'] = etag
+        return response
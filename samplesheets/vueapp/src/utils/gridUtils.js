@@ -482,9 +482,36 @@ export function buildColDef (params) {
   return colDef
 }
 
+// Expand table data from compact columnar format into table_data
+export function expandTableData (table) {
+  const tableData = []
+  for (let i = 0; i < table.row_count; i++) {
+    const rowCells = []
+    for (const col of table.table_cols) {
+      const cellVal = {}
+      for (const [key, colVals] of Object.entries(col)) {
+        let value
+        if (Array.isArray(colVals)) value = colVals[i]
+        else value = colVals.dict[colVals.index[i]]
+        // Copy shared objects as cells may be modified in the grid
+        if (value !== null && typeof value === 'object') {
+          value = JSON.parse(JSON.stringify(value))
+        }
+        if (key === 'value' || value !== null) cellVal[key] = value
+      }
+      rowCells.push(cellVal)
+    }
+    tableData.push(rowCells)
+  }
+  table.table_data = tableData
+  delete table.table_cols
+  delete table.row_count
+}
+
 // Build row data for a grid
 export function buildRowData (params) {
   const rowData = []
+  if ('table_cols' in params.table) expandTableData(params.table)
 
   // Iterate through rows
   for (let i = 0; i < params.table.table_data.length; i++) {
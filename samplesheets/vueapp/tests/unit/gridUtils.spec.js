@@ -7,7 +7,12 @@ import {
 // import sodarContext from './data/sodarContext.json'
 // import studyTables from './data/studyTables.json'
 // import studyTablesEdit from './data/studyTablesEdit.json'
-import { initGridOptions, buildColDef, buildRowData } from '@/utils/gridUtils.js'
+import {
+  initGridOptions,
+  buildColDef,
+  expandTableData,
+  buildRowData
+} from '@/utils/gridUtils.js'
 
 // TODO: Should be tested with multiple ISAtabs
 
@@ -193,6 +198,29 @@ describe('buildColDef()', () => {
   // TODO: More detailed tests where appropriate
 })
 
+describe('expandTableData()', () => {
+  it('expands compact table data', () => {
+    const table = {
+      row_count: 2,
+      table_cols: [
+        { value: ['s1', 's2'], uuid: ['u1', 'u2'] },
+        {
+          value: { dict: [[{ name: 'x' }]], index: [0, 0] },
+          unit: { dict: [null, 'mg'], index: [1, 0] }
+        }
+      ]
+    }
+    expandTableData(table)
+
+    expect(table.table_data).toEqual([
+      [{ value: 's1', uuid: 'u1' }, { value: [{ name: 'x' }], unit: 'mg' }],
+      [{ value: 's2', uuid: 'u2' }, { value: [{ name: 'x' }] }]
+    ])
+    expect(table.table_data[0][1].value).not.toBe(table.table_data[1][1].value)
+    expect('table_cols' in table).toBe(false)
+  })
+})
+
 describe('buildRowData()', () => {
   beforeAll(() => {
     // Disable warnings
@@ -13,19 +13,21 @@ from landingzones.constants import (
     ZONE_STATUS_NOT_CREATED,
     ZONE_STATUS_CREATING,
     ZONE_STATUS_FAILED,
+    ZONE_STATUS_PREPARING,
     STATUS_FINISHED,
 )
 from landingzones.models import LandingZone
 
 # Projectroles dependency
 from projectroles.app_settings import AppSettingAPI
-from projectroles.models import SODAR_CONSTANTS
+from projectroles.models import Project, SODAR_CONSTANTS
 from projectroles.plugins import get_backend_api
 
 from taskflowbackend import flows
 from taskflowbackend.irods_utils import get_flow_role as _get_flow_role
 from taskflowbackend.lock_api import ProjectLockAPI, PROJECT_LOCKED_MSG
-from taskflowbackend.tasks_celery import submit_flow_task
+from taskflowbackend.queue_api import FlowQueueAPI
+from taskflowbackend.tasks_celery import submit_flow_task, run_flow_queue_task
 
 
 app_settings = AppSettingAPI()
@@ -41,6 +43,8 @@ UNKNOWN_RUN_ERROR = 'Running flow failed: unknown error, see server log'
 LOCK_FAIL_MSG = 'Unable to acquire project lock'
 READ_ONLY_MSG = 'Site in read-only mode, taskflow operations not allowed'
 COORDINATOR_EX_MSG = 'Failed to retrieve lock coordinator'
+QUEUE_LOCK_ID = '{project_uuid}_queue'
+QUEUED_MSG = 'Queued for execution (position {position})'
 
 
 class TaskflowAPI:
@@ -203,6 +207,7 @@ class TaskflowAPI:
         force_fail=False,
         async_mode=False,
         tl_event=None,
+        lock_timeout=None,
     ):
         """
         Run a flow, either synchronously or asynchronously.
@@ -216,6 +221,9 @@ class TaskflowAPI:
         :param async_mode: Submit in async mode (boolean, default=False)
         :param tl_event: TimelineEvent object or None. Event status will be
                          updated if the flow is run in async mode
+        :param lock_timeout: Time in seconds to wait for project lock (int or
+                             None). If None, acquiring fails fast after the
+                             configured retries.
         :return: Dict
         """
         flow_result = None
@@ -239,14 +247,17 @@ class TaskflowAPI:
                 lock_id = str(project.sodar_uuid)
                 lock = coordinator.get_lock(lock_id)
                 try:
-                    lock_api.acquire(lock)
+                    if lock_timeout:
+                        lock_api.acquire_wait(lock, lock_timeout)
+                    else:
+                        lock_api.acquire(lock)
                 except Exception as ex:
                     # In case of regular locked project API, delete tl_event and
                     # do not provide it to the raise method
                     # TODO: Check for project lock before running flow and
                     #       creating timeline event (see #2136)
                     raise_event = tl_event
-                    if PROJECT_LOCKED_MSG in str(ex):
+                    if PROJECT_LOCKED_MSG in str(ex) and not lock_timeout:
                         if tl_event:
                             tl_event.delete()
                         raise_event = None
@@ -276,10 +287,9 @@ class TaskflowAPI:
         elif not flow_result and not ex_msg:
             ex_msg = UNKNOWN_RUN_ERROR
 
-        # Release lock if acquired
+        # Release lock if acquired, the coordinator is shared and kept running
         if flow.require_lock and lock:
             lock_api.release(lock)
-            coordinator.stop()
 
         # Raise exception if failed, otherwise return result
         if ex_msg:
@@ -305,7 +315,8 @@ class TaskflowAPI:
         :param async_mode: Run flow asynchronously (boolean, default False)
         :param tl_event: Corresponding TimelineEvent (optional)
         :param force_fail: Make flow fail on purpose (boolean, default False)
-        :return: Boolean
+        :return: Dict if run synchronously, queue position (int) if queued or
+                 None if submitted asynchronously without queue
         :raise: FlowSubmitException if submission fails
         """
         irods_backend = get_backend_api('omics_irods')
@@ -323,6 +334,8 @@ class TaskflowAPI:
         if async_mode:
             project_uuid = project.sodar_uuid
             tl_uuid = tl_event.sodar_uuid if tl_event else None
+            if settings.TASKFLOW_QUEUE_ENABLED:
+                return self._enqueue(project, flow_name, flow_data, tl_uuid)
             submit_flow_task.delay(
                 project_uuid,
                 flow_name,
@@ -348,6 +361,169 @@ class TaskflowAPI:
             tl_event=tl_event,
         )
 
+    @classmethod
+    def _enqueue(cls, project, flow_name, flow_data, tl_uuid=None):
+        """
+        Add flow to the project flow queue and launch the queue runner task.
+
+        :param project: Project object
+        :param flow_name: Name of flow to be executed (string)
+        :param flow_data: Input data for flow execution (dict)
+        :param tl_uuid: TimelineEvent UUID or None
+        :return: Queue position (int)
+        """
+        queue_api = FlowQueueAPI()
+        job_id, position = queue_api.enqueue(
+            project.sodar_uuid, flow_name, flow_data, tl_uuid
+        )
+        # Display queue position for zone until the flow is started
+        zone = None
+        if flow_data.get('zone_uuid'):
+            zone = LandingZone.objects.filter(
+                sodar_uuid=flow_data['zone_uuid']
+            ).first()
+        if zone:
+            status = (
+                ZONE_STATUS_PREPARING
+                if flow_name == 'landing_zone_move'
+                else zone.status
+            )
+            zone.set_status(status, QUEUED_MSG.format(position=position))
+        run_flow_queue_task.delay(str(project.sodar_uuid))
+        return position
+
+    def _run_queue_job(self, irods_backend, project, job):
+        """
+        Run a single job retrieved from the project flow queue. Errors are
+        logged and stored in the timeline event and zone status, but not
+        raised.
+
+        :param irods_backend: IrodsbackendAPI instance
+        :param project: Project object
+        :param job: Job data (dict)
+        """
+        timeline = get_backend_api('timeline_backend')
+        tl_event = None
+        if timeline and job.get('tl_uuid'):
+            tl_event = (
+                timeline.get_models()[0]
+                .objects.filter(sodar_uuid=job['tl_uuid'])
+                .first()
+            )
+        logger.info(
+            'Running queued flow "{}" for project {} (job={})'.format(
+                job['flow_name'], project.sodar_uuid, job['job_id']
+            )
+        )
+        try:
+            try:
+                flow = self.get_flow(
+                    irods_backend,
+                    project,
+                    job['flow_name'],
+                    job['flow_data'],
+                    True,
+                    tl_event,
+                )
+            except Exception as ex:
+                zone = None
+                if job['flow_data'].get('zone_uuid'):
+                    zone = LandingZone.objects.filter(
+                        sodar_uuid=job['flow_data']['zone_uuid']
+                    ).first()
+                self._raise_run_flow_exception(
+                    'Error getting flow: {}'.format(ex), tl_event, zone
+                )
+            self.run_flow(
+                flow=flow,
+                project=project,
+                force_fail=False,
+                async_mode=True,
+                tl_event=tl_event,
+                lock_timeout=settings.TASKFLOW_QUEUE_LOCK_TIMEOUT,
+            )
+        except Exception as ex:
+            logger.error(
+                'Queued flow "{}" failed for project {} (job={}): {}'.format(
+                    job['flow_name'], project.sodar_uuid, job['job_id'], ex
+                )
+            )
+
+    def run_queue(self, project):
+        """
+        Run queued flows for a project in FIFO order. Only one queue runner is
+        active for a project at a time, concurrent calls return immediately
+        and leave the queued flows to the active runner.
+
+        :param project: Project object
+        """
+        irods_backend = get_backend_api('omics_irods')
+        if not irods_backend:
+            raise Exception('Irodsbackend not enabled')
+        coordinator = lock_api.get_coordinator()
+        if not coordinator:
+            logger.error(COORDINATOR_EX_MSG)
+            return
+        queue_api = FlowQueueAPI()
+        project_uuid = str(project.sodar_uuid)
+        runner_lock = coordinator.get_lock(
+            QUEUE_LOCK_ID.format(project_uuid=project_uuid)
+        )
+        # Re-check length after releasing in case a job was queued while the
+        # previous runner was finishing
+        while queue_api.get_length(project_uuid, processing=True) > 0:
+            if not runner_lock.acquire(blocking=False):
+                logger.debug(
+                    'Queue runner already active for project {}'.format(
+                        project_uuid
+                    )
+                )
+                return
+            try:
+                # Jobs left in processing were interrupted by a previous runner
+                queue_api.requeue(project_uuid)
+                job = queue_api.pop(project_uuid)
+                while job:
+                    self._run_queue_job(irods_backend, project, job)
+                    queue_api.complete(project_uuid, job)
+                    job = queue_api.pop(project_uuid)
+            finally:
+                runner_lock.release()
+
+    def recover_queues(self):
+        """
+        Start queue runners for all projects with queued flows or flows left
+        in processing. Used for recovering jobs interrupted e.g. by a worker
+        restart without waiting for a new flow to be queued for the project.
+        Queues of deleted projects are cleared.
+
+        :return: List of project UUIDs for which runners were started
+        """
+        queue_api = FlowQueueAPI()
+        ret = []
+        for project_uuid in sorted(queue_api.get_project_uuids()):
+            if not Project.objects.filter(sodar_uuid=project_uuid).exists():
+                logger.warning(
+                    'Clearing flow queue of deleted project {}'.format(
+                        project_uuid
+                    )
+                )
+                queue_api.clear(project_uuid)
+                continue
+            run_flow_queue_task.delay(project_uuid)
+            ret.append(project_uuid)
+        return ret
+
+    @classmethod
+    def get_queue_length(cls, project):
+        """
+        Return number of flows waiting in the project flow queue.
+
+        :param project: Project object
+        :return: Int
+        """
+        return FlowQueueAPI().get_length(project.sodar_uuid)
+
     @classmethod
     def get_error_msg(cls, flow_name, submit_info):
         """
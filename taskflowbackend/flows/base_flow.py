@@ -1,7 +1,9 @@
 import logging
+import threading
 
 from taskflow import engines
 from taskflow.patterns import linear_flow as lf
+from taskflow.patterns import unordered_flow as uf
 
 from django.conf import settings
 
@@ -11,8 +13,50 @@ from taskflowbackend.tasks.base_task import ForceFailException
 logger = logging.getLogger('taskflowbackend.flows')
 
 
+class IrodsThreadSessions:
+    """
+    iRODS session proxy for flows run with the parallel engine. Each thread
+    accessing the proxy gets its own iRODS session, so concurrently executed
+    tasks never share a connection.
+    """
+
+    def __init__(self, irods_backend):
+        self._irods_backend = irods_backend
+        self._local = threading.local()
+        self._sessions = []
+        self._lock = threading.Lock()
+
+    def _get_session(self):
+        irods = getattr(self._local, 'irods', None)
+        if irods is None:
+            irods = self._irods_backend.get_session_obj()
+            irods.connection_timeout = settings.TASKFLOW_IRODS_CONN_TIMEOUT
+            self._local.irods = irods
+            with self._lock:
+                self._sessions.append(irods)
+        return irods
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._get_session(), name)
+
+    def cleanup(self):
+        """Clean up sessions opened by all threads"""
+        with self._lock:
+            sessions = self._sessions
+            self._sessions = []
+            self._local = threading.local()
+        for irods in sessions:
+            irods.cleanup()
+
+
 class BaseLinearFlow:
-    """Base class for linear flows used for task queues"""
+    """
+    Base class for linear flows used for task queues. Tasks not depending on
+    each other can be added as task groups, which are run concurrently if
+    TASKFLOW_PARALLEL_WORKERS is set above 1.
+    """
 
     def __init__(
         self,
@@ -24,8 +68,12 @@ class BaseLinearFlow:
         tl_event=None,
     ):
         self.irods_backend = irods_backend
-        self.irods = irods_backend.get_session_obj()
-        self.irods.connection_timeout = settings.TASKFLOW_IRODS_CONN_TIMEOUT
+        self.workers = settings.TASKFLOW_PARALLEL_WORKERS
+        if self.workers > 1:
+            self.irods = IrodsThreadSessions(irods_backend)
+        else:
+            self.irods = irods_backend.get_session_obj()
+            self.irods.connection_timeout = settings.TASKFLOW_IRODS_CONN_TIMEOUT
         self.project = project
         self.flow_name = flow_name
         self.flow_data = flow_data
@@ -35,6 +83,7 @@ class BaseLinearFlow:
         self.supported_modes = ['sync']  # "sync" and/or "async", default=sync
         self.require_lock = True  # Require project lock by default
         self.flow = lf.Flow(flow_name)
+        self.parallel = False  # Set True if flow contains task groups
 
     def validate(self):
         """
@@ -55,6 +104,24 @@ class BaseLinearFlow:
         """Add task into the flow"""
         self.flow.add(task)
 
+    def add_task_group(self, name, tasks):
+        """
+        Add a group of tasks into the flow. The tasks must not depend on each
+        other or modify the same data. They are run concurrently if parallel
+        execution is enabled, otherwise sequentially in the given order. The
+        group is always run after the preceding tasks and before the following
+        ones, and reverted in the opposite order.
+
+        :param name: Group name (string, must be unique within the flow)
+        :param tasks: List of Task objects
+        """
+        if self.workers <= 1 or len(tasks) < 2:
+            for task in tasks:
+                self.add_task(task)
+            return
+        self.flow.add(uf.Flow(name).add(*tasks))
+        self.parallel = True
+
     def build(self, force_fail=False):
         """
         Build linear flow to be executed for one project. Override this in
@@ -73,7 +140,15 @@ class BaseLinearFlow:
         """
         if verbose:
             logger.info('Running flow "{}"'.format(self.flow.name))
-        engine = engines.load(self.flow, engine='serial')
+        if self.parallel:
+            engine = engines.load(
+                self.flow,
+                engine='parallel',
+                executor='threads',
+                max_workers=self.workers,
+            )
+        else:
+            engine = engines.load(self.flow, engine='serial')
         try:
             engine.run()
             # TODO: Better reporting of failed jobs?
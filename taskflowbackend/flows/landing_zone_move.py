@@ -12,6 +12,7 @@ from landingzones.constants import (
 )
 import landingzones.tasks_taskflow as lz_tasks
 from landingzones.models import LandingZone
+from landingzones.utils import cleanup_file_prohibit
 
 from taskflowbackend.flows.base_flow import BaseLinearFlow
 from taskflowbackend.tasks import irods_tasks, sodar_tasks
@@ -86,29 +87,44 @@ class Flow(BaseLinearFlow):
             self.irods, zone_path, include_checksum=True, include_colls=True
         )
         zone_stats = self.irods_backend.get_stats(self.irods, zone_path)
-        zone_objects = [o['path'] for o in zone_all if o['type'] == 'obj']
-        zone_objects_no_chk = [
-            p for p in zone_objects if not p.lower().endswith(chk_suffix)
-        ]  # Zone objects without checksum files
-
-        zone_objects_chk = [
-            p for p in zone_objects if p.lower().endswith(chk_suffix)
-        ]  # Zone checksum files
+        # Index zone data objects, checksum files and collections in one pass
+        zone_objects = []  # All zone data objects
+        zone_objects_no_chk = []  # Zone objects without checksum files
+        zone_objects_chk = []  # Zone checksum files
+        zone_all_colls = [zone_path]  # All collections with root path
+        zone_object_colls = set()  # Collections containing files
+        for o in zone_all:
+            path = o['path']
+            if o['type'] == 'coll':
+                zone_all_colls.append(path)
+                continue
+            zone_objects.append(path)
+            zone_object_colls.add(path[: path.rfind('/')])
+            if path.lower().endswith(chk_suffix):
+                zone_objects_chk.append(path)
+            else:
+                zone_objects_no_chk.append(path)
         file_count = len(zone_objects_no_chk)
         file_count_msg_plural = 's' if file_count != 1 else ''
 
-        # Get all collections with root path
-        zone_all_colls = [zone_path]
-        zone_all_colls += [o['path'] for o in zone_all if o['type'] == 'coll']
-        # Get list of collections containing files (ignore empty colls)
-        zone_object_colls = list(set([p[: p.rfind('/')] for p in zone_objects]))
         # Convert paths to collections inside sample collection
-        zone_path_len = len(zone_path.split('/'))
         sample_colls = [
-            sample_path + '/' + '/'.join(p.split('/')[zone_path_len:])
+            sample_path + p[len(zone_path) :]
             for p in zone_object_colls
-            if len(p.split('/')) > zone_path_len
+            if p.startswith(zone_path + '/')
         ]
+        # Precompute pre-move check results for check tasks
+        missing_paths = irods_tasks.BatchCheckFileExistTask.get_missing_paths(
+            zone_objects_no_chk, zone_objects_chk, chk_suffix
+        )
+        prohibited_paths = None
+        if file_name_prohibit:
+            prohibited_paths = (
+                irods_tasks.BatchCheckFileSuffixTask.get_prohibited_paths(
+                    zone_objects_no_chk,
+                    cleanup_file_prohibit(file_name_prohibit),
+                )
+            )
         # Get user names of allowed users for access cleanup
         allowed_users = [zone.user.username, admin_name, owner_group]
         for a in self.project.get_owners() + self.project.get_delegates():
@@ -238,6 +254,7 @@ class Flow(BaseLinearFlow):
                         'file_paths': zone_objects_no_chk,
                         'suffixes': file_name_prohibit,
                         'zone_path': zone_path,
+                        'err_paths': prohibited_paths,
                     },
                 )
             )
@@ -251,6 +268,7 @@ class Flow(BaseLinearFlow):
                     'chk_paths': zone_objects_chk,
                     'zone_path': zone_path,
                     'chk_suffix': chk_suffix,
+                    'err_paths': missing_paths,
                 },
             )
         )
@@ -276,6 +294,7 @@ class Flow(BaseLinearFlow):
                     'landing_zone': zone,
                     'file_paths': zone_objects_no_chk,
                     'force': False,
+                    'irods_backend': self.irods_backend,
                 },
             )
         )
@@ -347,6 +366,32 @@ class Flow(BaseLinearFlow):
                 },
             )
         )
+        # Get leaf collections which can be moved as a whole
+        sample_all_colls = [
+            c.path
+            for c in self.irods_backend.get_colls_recursively(
+                self.irods.collections.get(sample_path)
+            )
+        ]
+        coll_moves = irods_tasks.BatchMoveDataObjectsTask.get_coll_moves(
+            zone_path,
+            sample_path,
+            zone_objects,
+            zone_all_colls,
+            sample_all_colls,
+        )
+        # Only create parents for collections moved as a whole
+        moved_colls = set(coll_moves.values())
+        sample_colls = sorted(
+            set(
+                [p for p in sample_colls if p not in moved_colls]
+                + [
+                    p[: p.rfind('/')]
+                    for p in moved_colls
+                    if p[: p.rfind('/')] != sample_path
+                ]
+            )
+        )
         if sample_colls:
             self.add_task(
                 irods_tasks.BatchCreateCollectionsTask(
@@ -368,6 +413,7 @@ class Flow(BaseLinearFlow):
                     'access_name': 'read',
                     'user_name': project_group,
                     'irods_backend': self.irods_backend,
+                    'coll_moves': coll_moves,
                 },
             )
         )
@@ -133,39 +133,29 @@ class Flow(BaseLinearFlow):
             )
         )
         # Add inherited users
-        for r in self.flow_data.get('roles_add', []):
+        roles_add = self.flow_data.get('roles_add', [])
+        members = []
+        for r in roles_add:
+            members.append((project_group, r['user_name'], True))
+            if r.get('role_rank') and r['role_rank'] <= min_owner_rank:
+                members.append((owner_group, r['user_name'], True))
+        if roles_add:
             self.add_task(
-                irods_tasks.CreateUserTask(
-                    name='Create user "{}" in irods'.format(r['user_name']),
+                irods_tasks.BatchCreateUsersTask(
+                    name='Create inherited users in irods',
                     irods=self.irods,
                     inject={
-                        'user_name': r['user_name'],
+                        'user_names': sorted(
+                            set(r['user_name'] for r in roles_add)
+                        ),
                         'user_type': 'rodsuser',
                     },
                 )
             )
             self.add_task(
-                irods_tasks.AddUserToGroupTask(
-                    name='Add user "{}" to project user group "{}"'.format(
-                        r['user_name'], project_group
-                    ),
+                irods_tasks.BatchUpdateGroupMembersTask(
+                    name='Add inherited users to project groups',
                     irods=self.irods,
-                    inject={
-                        'group_name': project_group,
-                        'user_name': r['user_name'],
-                    },
+                    inject={'members': members},
                 )
             )
-            if r.get('role_rank') and r['role_rank'] <= min_owner_rank:
-                self.add_task(
-                    irods_tasks.AddUserToGroupTask(
-                        name='Add user "{}" to project owner group "{}"'.format(
-                            r['user_name'], owner_group
-                        ),
-                        irods=self.irods,
-                        inject={
-                            'group_name': owner_group,
-                            'user_name': r['user_name'],
-                        },
-                    )
-                )
@@ -68,81 +68,41 @@ class Flow(BaseLinearFlow):
                 inject={'name': owner_group},
             )
         )
+        # Group memberships as (group, user, is_member), last entry is applied
+        members = []
         # Add owner to owner group if not present
         if self.flow_data.get('owner') and self.flow_data['owner'] not in [
             r['user_name'] for r in self.flow_data.get('roles_add', [])
         ]:
-            self.add_task(
-                irods_tasks.AddUserToGroupTask(
-                    name='Add owner user to project owner group',
-                    irods=self.irods,
-                    inject={
-                        'group_name': owner_group,
-                        'user_name': self.flow_data['owner'],
-                    },
-                )
-            )
+            members.append((owner_group, self.flow_data['owner'], True))
         # Add new inherited roles
+        users_add = set()
         for r in self.flow_data.get('roles_add', []):
+            users_add.add(r['user_name'])
+            members.append((project_group, r['user_name'], True))
+            if r.get('role_rank') and r['role_rank'] <= min_owner_rank:
+                members.append((owner_group, r['user_name'], True))
+        # Delete old inherited roles
+        for r in self.flow_data.get('roles_delete', []):
+            members.append((project_group, r['user_name'], False))
+            if r.get('role_rank') and r['role_rank'] <= min_owner_rank:
+                members.append((owner_group, r['user_name'], False))
+        if users_add:
             self.add_task(
-                irods_tasks.CreateUserTask(
-                    name='Create user "{}" in irods'.format(r['user_name']),
+                irods_tasks.BatchCreateUsersTask(
+                    name='Create users in irods',
                     irods=self.irods,
                     inject={
-                        'user_name': r['user_name'],
+                        'user_names': sorted(users_add),
                         'user_type': 'rodsuser',
                     },
                 )
             )
-        for r in self.flow_data.get('roles_add', []):
+        if members:
             self.add_task(
-                irods_tasks.AddUserToGroupTask(
-                    name='Add user "{}" to project user group "{}"'.format(
-                        r['user_name'], project_group
-                    ),
+                irods_tasks.BatchUpdateGroupMembersTask(
+                    name='Update project group members',
                     irods=self.irods,
-                    inject={
-                        'group_name': project_group,
-                        'user_name': r['user_name'],
-                    },
+                    inject={'members': members},
                 )
             )
-            if r.get('role_rank') and r['role_rank'] <= min_owner_rank:
-                self.add_task(
-                    irods_tasks.AddUserToGroupTask(
-                        name='Add user "{}" to project owner group "{}"'.format(
-                            r['user_name'], owner_group
-                        ),
-                        irods=self.irods,
-                        inject={
-                            'group_name': owner_group,
-                            'user_name': r['user_name'],
-                        },
-                    )
-                )
-        # Delete old inherited roles
-        for r in self.flow_data.get('roles_delete', []):
-            self.add_task(
-                irods_tasks.RemoveUserFromGroupTask(
-                    name='Remove user "{}" from project user group "{}"'.format(
-                        r['user_name'], project_group
-                    ),
-                    irods=self.irods,
-                    inject={
-                        'group_name': project_group,
-                        'user_name': r['user_name'],
-                    },
-                )
-            )
-            if r.get('role_rank') and r['role_rank'] <= min_owner_rank:
-                self.add_task(
-                    irods_tasks.RemoveUserFromGroupTask(
-                        name='Remove user "{}" from project owner group '
-                        '"{}"'.format(r['user_name'], owner_group),
-                        irods=self.irods,
-                        inject={
-                            'group_name': owner_group,
-                            'user_name': r['user_name'],
-                        },
-                    )
-                )
@@ -27,94 +27,35 @@ class Flow(BaseLinearFlow):
                 if r.get('role_rank') and r['role_rank'] <= min_owner_rank
             ]
         )
-
-        # Create missing users
-        for user_name in users_add:
-            self.add_task(
-                irods_tasks.CreateUserTask(
-                    name='Create user "{}" in irods'.format(user_name),
-                    irods=self.irods,
-                    inject={'user_name': user_name, 'user_type': 'rodsuser'},
-                )
-            )
-        # Create missing owner groups
-        for owner_group in owner_groups_add:
-            self.add_task(
-                irods_tasks.CreateUserGroupTask(
-                    name='Create owner group "{}" in irods'.format(owner_group),
-                    irods=self.irods,
-                    inject={'name': owner_group},
-                )
-            )
-
-        # Add/update roles
+        # Group memberships as (group, user, is_member), last entry is applied
+        members = []
         for role_add in self.flow_data['roles_add']:
+            user_name = role_add['user_name']
             project_group = self.irods_backend.get_group_name(
                 role_add['project_uuid']
             )
             owner_group = self.irods_backend.get_group_name(
                 role_add['project_uuid'], owner=True
             )
-            self.add_task(
-                irods_tasks.AddUserToGroupTask(
-                    name='Add user "{}" to project user group "{}"'.format(
-                        role_add['user_name'], project_group
+            members.append((project_group, user_name, True))
+            # If role is delegate or owner, add to owner group, else remove
+            # (in case of update)
+            members.append(
+                (
+                    owner_group,
+                    user_name,
+                    bool(
+                        role_add.get('role_rank')
+                        and role_add['role_rank'] <= min_owner_rank
                     ),
-                    irods=self.irods,
-                    inject={
-                        'group_name': project_group,
-                        'user_name': role_add['user_name'],
-                    },
                 )
             )
-            # If role is delegate or owner, add to owner group
-            if (
-                role_add.get('role_rank')
-                and role_add['role_rank'] <= min_owner_rank
-            ):
-                self.add_task(
-                    irods_tasks.AddUserToGroupTask(
-                        name='Add user "{}" to project owner group "{}"'.format(
-                            role_add['user_name'], owner_group
-                        ),
-                        irods=self.irods,
-                        inject={
-                            'group_name': owner_group,
-                            'user_name': role_add['user_name'],
-                        },
-                    )
-                )
-            # Else remove from owner group (in case of update)
-            else:
-                self.add_task(
-                    irods_tasks.RemoveUserFromGroupTask(
-                        name='Remove user "{}" from project owner group '
-                        '"{}"'.format(role_add['user_name'], owner_group),
-                        irods=self.irods,
-                        inject={
-                            'group_name': owner_group,
-                            'user_name': role_add['user_name'],
-                        },
-                    )
-                )
-
-        # Delete roles
         for role_delete in self.flow_data['roles_delete']:
+            user_name = role_delete['user_name']
             project_group = self.irods_backend.get_group_name(
                 role_delete['project_uuid']
             )
-            self.add_task(
-                irods_tasks.RemoveUserFromGroupTask(
-                    name='Remove user "{}" from project user group "{}"'.format(
-                        role_delete['user_name'], project_group
-                    ),
-                    irods=self.irods,
-                    inject={
-                        'group_name': project_group,
-                        'user_name': role_delete['user_name'],
-                    },
-                )
-            )
+            members.append((project_group, user_name, False))
             # If role is delegate, owner or None, remove from owner group
             if (
                 not role_delete.get('role_rank')
@@ -123,14 +64,35 @@ class Flow(BaseLinearFlow):
                 owner_group = self.irods_backend.get_group_name(
                     role_delete['project_uuid'], owner=True
                 )
-                self.add_task(
-                    irods_tasks.RemoveUserFromGroupTask(
-                        name='Remove user "{}" from project owner group '
-                        '"{}"'.format(role_delete['user_name'], owner_group),
-                        irods=self.irods,
-                        inject={
-                            'group_name': owner_group,
-                            'user_name': role_delete['user_name'],
-                        },
-                    )
+                members.append((owner_group, user_name, False))
+
+        # Create missing users
+        if users_add:
+            self.add_task(
+                irods_tasks.BatchCreateUsersTask(
+                    name='Create users in irods',
+                    irods=self.irods,
+                    inject={
+                        'user_names': sorted(users_add),
+                        'user_type': 'rodsuser',
+                    },
+                )
+            )
+        # Create missing owner groups
+        if owner_groups_add:
+            self.add_task(
+                irods_tasks.BatchCreateUserGroupsTask(
+                    name='Create owner groups in irods',
+                    irods=self.irods,
+                    inject={'names': sorted(owner_groups_add)},
                 )
+            )
+        # Add, update and delete roles
+        if members:
+            self.add_task(
+                irods_tasks.BatchUpdateGroupMembersTask(
+                    name='Update project group members',
+                    irods=self.irods,
+                    inject={'members': members},
+                )
+            )
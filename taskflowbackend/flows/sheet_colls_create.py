@@ -1,5 +1,7 @@
 import os
 
+from collections import defaultdict
+
 from django.conf import settings
 
 # Samplesheets dependency
@@ -52,15 +54,31 @@ class Flow(BaseLinearFlow):
                 },
             )
         )
+        # Create collections level by level, so that collections on the same
+        # level do not race to create a shared parent collection
+        levels = defaultdict(list)
         for c in self.flow_data['colls']:
-            coll_path = os.path.join(sample_path, c)
-            self.add_task(
+            levels[c.strip('/').count('/')].append(c.strip('/'))
+        created = {''}
+        for level in sorted(levels):
+            tasks = [
                 irods_tasks.CreateCollectionTask(
-                    name='Create collection {}'.format(coll_path),
+                    name='Create collection {}'.format(
+                        os.path.join(sample_path, c)
+                    ),
                     irods=self.irods,
-                    inject={'path': coll_path},
+                    inject={'path': os.path.join(sample_path, c)},
                 )
-            )
+                for c in levels[level]
+            ]
+            if all(os.path.dirname(c) in created for c in levels[level]):
+                self.add_task_group(
+                    'Create collections on level {}'.format(level), tasks
+                )
+            else:
+                for task in tasks:
+                    self.add_task(task)
+            created.update(levels[level])
         # If project is public, add public access to sample repository
         if self.project.public_guest_access:
             self.add_task(
@@ -1,6 +1,8 @@
 """Project locking API"""
 
 import logging
+import os
+import threading
 import time
 import uuid
 
@@ -16,6 +18,10 @@ PROJECT_LOCKED_MSG = 'Project is locked by another operation'
 
 
 logger = logging.getLogger(__name__)
+# Coordinator shared by all flows in the current process
+_coordinator = None
+_coordinator_pid = None
+_coordinator_lock = threading.Lock()
 
 
 class LockAcquireException(Exception):
@@ -36,20 +42,34 @@ class ProjectLockAPI:
 
     @classmethod
     def get_coordinator(cls):
-        """Return a Tooz coordinator object"""
-        host_id = 'sodar_{}'.format(uuid.uuid4())
-        try:
-            coordinator = coordination.get_coordinator(
-                backend_url=settings.REDIS_URL,
-                member_id=host_id,
-                socket_keepalive=True,
-            )
-            if coordinator:
-                coordinator.start(start_heart=True)
-                return coordinator
-        except coordination.ToozConnectionError as ex:
-            logger.error('Tooz connection error: {}'.format(ex))
-        return None
+        """
+        Return a Tooz coordinator object. The coordinator and its heartbeat
+        thread are started once and shared by all flows in the current
+        process. Forked processes start their own coordinator.
+        """
+        global _coordinator, _coordinator_pid
+        with _coordinator_lock:
+            if (
+                _coordinator
+                and _coordinator_pid == os.getpid()
+                and _coordinator.is_started
+            ):
+                return _coordinator
+            host_id = 'sodar_{}'.format(uuid.uuid4())
+            try:
+                coordinator = coordination.get_coordinator(
+                    backend_url=settings.REDIS_URL,
+                    member_id=host_id,
+                    socket_keepalive=True,
+                )
+                if coordinator:
+                    coordinator.start(start_heart=True)
+                    _coordinator = coordinator
+                    _coordinator_pid = os.getpid()
+                    return coordinator
+            except coordination.ToozConnectionError as ex:
+                logger.error('Tooz connection error: {}'.format(ex))
+            return None
 
     @classmethod
     def acquire(
@@ -82,6 +102,25 @@ class ProjectLockAPI:
         cls._log_status(lock, unlock=False, failed=True)
         raise LockAcquireException(PROJECT_LOCKED_MSG)
 
+    @classmethod
+    def acquire_wait(cls, lock, timeout):
+        """
+        Acquire project lock, waiting for it to be released by other
+        operations.
+
+        :param lock: Tooz lock object
+        :param timeout: Maximum time in seconds to wait (int)
+        :return: Boolean
+        :raise: LockAcquireException if lock is not acquired within timeout
+        """
+        if not LOCK_ENABLED:
+            return True
+        if lock.acquire(blocking=timeout):
+            cls._log_status(lock, unlock=False, failed=False)
+            return True
+        cls._log_status(lock, unlock=False, failed=True)
+        raise LockAcquireException(PROJECT_LOCKED_MSG)
+
     @classmethod
     def release(cls, lock):
         """
@@ -41,9 +41,15 @@ RANK_OWNER = ROLE_RANKING[PROJECT_ROLE_OWNER]
 RANK_DELEGATE = ROLE_RANKING[PROJECT_ROLE_DELEGATE]
 RANK_FINDER = ROLE_RANKING[PROJECT_ROLE_FINDER]
 TASKFLOW_INFO_SETTINGS = [
+    'TASKFLOW_CHECKSUM_WORKERS',
     'TASKFLOW_IRODS_CONN_TIMEOUT',
     'TASKFLOW_LOCK_RETRY_COUNT',
     'TASKFLOW_LOCK_RETRY_INTERVAL',
+    'TASKFLOW_PARALLEL_WORKERS',
+    'TASKFLOW_QUEUE_ENABLED',
+    'TASKFLOW_QUEUE_LOCK_TIMEOUT',
+    'TASKFLOW_QUEUE_RECOVER_INTERVAL',
+    'TASKFLOW_VALIDATE_WORKERS',
     'TASKFLOW_ZONE_PROGRESS_INTERVAL',
 ]
 TL_SUBMIT_DESC = 'Job submitted to Taskflow'
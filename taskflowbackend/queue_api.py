@@ -0,0 +1,183 @@
+"""Per-project flow queue API"""
+
+import json
+import logging
+import redis
+import uuid
+
+from django.conf import settings
+
+
+QUEUE_KEY_PREFIX = 'sodar_flow_queue_'
+PROCESSING_KEY_SUFFIX = '_processing'
+
+
+logger = logging.getLogger(__name__)
+
+
+class FlowQueueAPI:
+    """
+    API for queueing async flows per project in Redis. Queued flows are run
+    in FIFO order by the run_flow_queue_task Celery task.
+
+    New jobs are pushed to the head of the queue list and taken from its tail.
+    Taken jobs are atomically moved into a processing list and only removed
+    once they have been run, so jobs interrupted e.g. by a worker restart can
+    be requeued. Runners for such jobs are started periodically by the
+    recover_flow_queues_task Celery task.
+    """
+
+    def __init__(self):
+        self.redis = redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+    @classmethod
+    def get_key(cls, project_uuid):
+        """
+        Return Redis key for project flow queue.
+
+        :param project_uuid: Project UUID (UUID or string)
+        :return: String
+        """
+        return '{}{}'.format(QUEUE_KEY_PREFIX, project_uuid)
+
+    @classmethod
+    def get_processing_key(cls, project_uuid):
+        """
+        Return Redis key for list of project flow jobs being processed.
+
+        :param project_uuid: Project UUID (UUID or string)
+        :return: String
+        """
+        return cls.get_key(project_uuid) + PROCESSING_KEY_SUFFIX
+
+    def enqueue(self, project_uuid, flow_name, flow_data, tl_uuid=None):
+        """
+        Add flow to the end of the project flow queue.
+
+        :param project_uuid: Project UUID (UUID or string)
+        :param flow_name: Name of flow to be executed (string)
+        :param flow_data: Input data for flow execution (dict)
+        :param tl_uuid: TimelineEvent UUID (UUID, string or None)
+        :return: Tuple of job ID (string) and queue position (int, 1-based)
+        """
+        job_id = str(uuid.uuid4())
+        job = {
+            'job_id': job_id,
+            'flow_name': flow_name,
+            'flow_data': flow_data,
+            'tl_uuid': str(tl_uuid) if tl_uuid else None,
+        }
+        position = self.redis.lpush(self.get_key(project_uuid), json.dumps(job))
+        logger.info(
+            'Queued flow "{}" for project {} (job={}; position={})'.format(
+                flow_name, project_uuid, job_id, position
+            )
+        )
+        return job_id, position
+
+    def pop(self, project_uuid):
+        """
+        Move the next job from the project flow queue into the processing list
+        and return it. The job must be removed with complete() once run.
+
+        :param project_uuid: Project UUID (UUID or string)
+        :return: Dict or None if queue is empty
+        """
+        job = self.redis.lmove(
+            self.get_key(project_uuid),
+            self.get_processing_key(project_uuid),
+            'RIGHT',
+            'LEFT',
+        )
+        return json.loads(job) if job else None
+
+    def complete(self, project_uuid, job):
+        """
+        Remove a job returned by pop() from the processing list.
+
+        :param project_uuid: Project UUID (UUID or string)
+        :param job: Job data (dict)
+        """
+        # NOTE: Serializing the decoded job returns the original string
+        self.redis.lrem(
+            self.get_processing_key(project_uuid), 1, json.dumps(job)
+        )
+
+    def requeue(self, project_uuid):
+        """
+        Move jobs left in the processing list back to be run next in the
+        project flow queue. Must only be called when no queue runner is
+        active for the project.
+
+        :param project_uuid: Project UUID (UUID or string)
+        :return: Number of requeued jobs (int)
+        """
+        count = 0
+        # Oldest jobs are at the tail of both lists
+        while self.redis.lmove(
+            self.get_processing_key(project_uuid),
+            self.get_key(project_uuid),
+            'LEFT',
+            'RIGHT',
+        ):
+            count += 1
+        if count:
+            logger.warning(
+                'Requeued {} interrupted flow job{} for project {}'.format(
+                    count, 's' if count != 1 else '', project_uuid
+                )
+            )
+        return count
+
+    def get_position(self, project_uuid, job_id):
+        """
+        Return position of job in the project flow queue.
+
+        :param project_uuid: Project UUID (UUID or string)
+        :param job_id: Job ID (string)
+        :return: Int (1-based) or None if job is not in queue
+        """
+        jobs = self.redis.lrange(self.get_key(project_uuid), 0, -1)
+        for i, job in enumerate(reversed(jobs)):
+            if json.loads(job)['job_id'] == job_id:
+                return i + 1
+        return None
+
+    def get_project_uuids(self):
+        """
+        Return UUIDs of projects with jobs in their flow queue or processing
+        list.
+
+        :return: Set of strings
+        """
+        ret = set()
+        # NOTE: Redis removes empty lists, so existing keys contain jobs
+        for key in self.redis.scan_iter(match=QUEUE_KEY_PREFIX + '*'):
+            key = key[len(QUEUE_KEY_PREFIX) :]
+            if key.endswith(PROCESSING_KEY_SUFFIX):
+                key = key[: -len(PROCESSING_KEY_SUFFIX)]
+            ret.add(key)
+        return ret
+
+    def get_length(self, project_uuid, processing=False):
+        """
+        Return number of jobs in the project flow queue.
+
+        :param project_uuid: Project UUID (UUID or string)
+        :param processing: Include jobs being processed (boolean)
+        :return: Int
+        """
+        ret = self.redis.llen(self.get_key(project_uuid))
+        if processing:
+            ret += self.redis.llen(self.get_processing_key(project_uuid))
+        return ret
+
+    def clear(self, project_uuid):
+        """
+        Remove all jobs from the project flow queue and processing list.
+
+        :param project_uuid: Project UUID (UUID or string)
+        """
+        self.redis.delete(
+            self.get_key(project_uuid), self.get_processing_key(project_uuid)
+        )
@@ -7,11 +7,15 @@ import os
 import random
 import re
 import string
+import threading
 import time
 
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+
 from irods import keywords as kw
 from irods.access import iRODSAccess
-from irods.column import Like
+from irods.column import In, Like
 from irods.exception import (
     GroupDoesNotExist,
     NetworkException,
@@ -25,9 +29,11 @@ from irods.models import (
     DataObject,
     DataAccess,
     User,
+    UserGroup,
 )
 
 from django.conf import settings
+from django.template.defaultfilters import filesizeformat
 
 # Landingzones dependency
 from landingzones.utils import cleanup_file_prohibit
@@ -142,12 +148,72 @@ class IrodsAccessMixin:
             self.irods.acls.set(acl, recursive=recursive)
 
 
+class IrodsUserGroupMixin:
+    """Mixin for bulk iRODS user and group membership queries"""
+
+    @classmethod
+    def _get_batches(cls, names):
+        """Return sorted unique names split into query batches"""
+        names = sorted(set(names))
+        size = settings.IRODS_QUERY_BATCH_SIZE
+        return [names[i : i + size] for i in range(0, len(names), size)]
+
+    def get_existing_users(self, user_names, groups=False):
+        """
+        Return names of existing users or groups.
+
+        :param user_names: List of user or group names (strings)
+        :param groups: Return only groups if True (boolean)
+        :return: Set of strings
+        """
+        ret = set()
+        for batch in self._get_batches(user_names):
+            query = self.irods.query(User.name, User.type).filter(
+                In(User.name, batch)
+            )
+            for res in query:
+                if res[User.name] in batch and (
+                    not groups or res[User.type] == 'rodsgroup'
+                ):
+                    ret.add(res[User.name])
+            query.close()
+        return ret
+
+    def get_group_members(self, group_names):
+        """
+        Return current user members of groups.
+
+        :param group_names: List of group names (strings)
+        :return: Set of (group name, user name) tuples
+        """
+        ret = set()
+        for batch in self._get_batches(group_names):
+            query = self.irods.query(UserGroup.name, User.name).filter(
+                User.type != 'rodsgroup', In(UserGroup.name, batch)
+            )
+            for res in query:
+                if res[UserGroup.name] in batch:
+                    ret.add((res[UserGroup.name], res[User.name]))
+            query.close()
+        return ret
+
+
 class ProgressCounterMixin:
     """Mixin for file operation progress counter helpers"""
 
+    @classmethod
+    def get_rate_str(cls, rate):
+        """
+        Return human readable throughput string.
+
+        :param rate: Throughput in bytes per second (int or float)
+        :return: String
+        """
+        return filesizeformat(int(rate)).replace('\xa0', ' ') + '/s'
+
     @classmethod
     def update_zone_progress(
-        cls, zone, status_base, current, previous, total, time_start
+        cls, zone, status_base, current, previous, total, time_start, rate=None
     ):
         """
         Update landing zone status for progress counter.
@@ -158,13 +224,16 @@ class ProgressCounterMixin:
         :param previous: Previous logged file index (int)
         :param total: Total file count (int)
         :param time_start: Time of operation start (datetime)
+        :param rate: Throughput in bytes per second (optional)
         :return: Tuple of int, datetime
         """
         interval = settings.TASKFLOW_ZONE_PROGRESS_INTERVAL
         if time.time() - time_start > interval and previous != current:
             pct = math.floor(current / total * 100) if total > 0 else '?'
+            rate_str = f', {cls.get_rate_str(rate)}' if rate is not None else ''
             zone.set_status(
-                zone.status, f'{status_base} ({current}/{total}: {pct}%)'
+                zone.status,
+                f'{status_base} ({current}/{total}: {pct}%{rate_str})',
             )
             return current, time.time()
         return previous, time_start  # If not updated, return previous values
@@ -181,6 +250,60 @@ class ProgressCounterMixin:
         zone.set_status(zone.status, f'{status_base} ({total}/{total}: 100%)')
 
 
+class WorkerSessionMixin:
+    """Mixin for running iRODS operations in a pool of worker sessions"""
+
+    def map_worker_sessions(self, func, items, irods_backend, workers):
+        """
+        Map function over items in a bounded thread pool, each worker thread
+        using its own iRODS session. Results are yielded in the order of items.
+        Items are submitted in a bounded window, and items not yet started are
+        cancelled if an exception is raised or iteration is stopped. If workers
+        is 1 or less, items are processed sequentially using the task session.
+
+        :param func: Function taking an iRODSSession object and an item
+        :param items: Iterable of items
+        :param irods_backend: IrodsAPI object
+        :param workers: Maximum number of worker threads (int)
+        :yield: Return values of func
+        """
+        if workers <= 1:
+            for item in items:
+                yield func(self.irods, item)
+            return
+        local = threading.local()
+        sessions = []
+        lock = threading.Lock()
+
+        def _init_worker():
+            irods = irods_backend.get_session_obj()
+            irods.connection_timeout = settings.TASKFLOW_IRODS_CONN_TIMEOUT
+            local.irods = irods
+            with lock:
+                sessions.append(irods)
+
+        def _run(item):
+            return func(local.irods, item)
+
+        executor = ThreadPoolExecutor(
+            max_workers=workers, initializer=_init_worker
+        )
+        pending = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(_run, item))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Cancel items not yet started if an exception was raised or
+            # iteration was stopped, then wait for running items
+            executor.shutdown(wait=True, cancel_futures=True)
+            for irods in sessions:
+                irods.cleanup()
+
+
 # Base Task --------------------------------------------------------------------
 
 
@@ -484,51 +607,131 @@ class SetAccessTask(IrodsAccessMixin, IrodsBaseTask):
 class CleanupAccessTask(IrodsBaseTask):
     """Cleanup access under collection to exclude all but provided users"""
 
-    def _cleanup_coll_access(self, path, user_ids):
-        """Cleanup collection access"""
+    def _get_user_ids(self, user_names):
+        """Return IDs of existing users and groups as a set"""
+        if not user_names:
+            return set()
+        query = self.irods.query(User.id).filter(
+            In(User.name, list(set(user_names)))
+        )
+        ret = {r[User.id] for r in query}
+        query.close()
+        return ret
+
+    @classmethod
+    def _in_path(cls, name, path):
+        """Return True if collection name equals or is under path"""
+        return name == path or name.startswith(path + '/')
+
+    def _get_coll_access(self, path, user_ids):
+        """Return disallowed collection ACLs under path as a list of dicts"""
+        ret = []
         query = self.irods.query(
-            Collection, CollectionAccess, CollectionUser
+            Collection.name,
+            CollectionAccess.user_id,
+            CollectionAccess.name,
+            CollectionUser.name,
         ).filter(Like(Collection.name, path + '%'))
         for res in query:
-            if res[CollectionAccess.user_id] not in user_ids:
-                acl = iRODSAccess(
-                    access_name='null',
-                    path=res[Collection.name],
-                    user_name=res[CollectionUser.name],
-                    user_zone=self.irods.zone,
-                )
-                self.irods.acls.set(acl, recursive=True)
-                logger.debug(
-                    'Removed collection ACL from user "{}": {}'.format(
-                        res[CollectionUser.name], res[Collection.name]
-                    )
-                )
+            if res[CollectionAccess.user_id] in user_ids or not self._in_path(
+                res[Collection.name], path
+            ):
+                continue
+            ret.append(
+                {
+                    'user_name': res[CollectionUser.name],
+                    'path': res[Collection.name],
+                    'access_name': res[CollectionAccess.name],
+                    'type': 'coll',
+                }
+            )
         query.close()
+        return ret
 
-    def _cleanup_obj_access(self, path, user_ids):
-        """Cleanup data object access"""
+    def _get_obj_access(self, path, user_ids):
+        """Return disallowed data object ACLs under path as a list of dicts"""
+        ret = {}  # Replicas are returned as separate rows
         query = self.irods.query(
-            DataObject, DataAccess, Collection, User
+            Collection.name,
+            DataObject.name,
+            DataAccess.user_id,
+            DataAccess.name,
+            User.name,
         ).filter(Like(Collection.name, path + '%'))
         for res in query:
-            if res[DataAccess.user_id] not in user_ids:
-                # NOTE: Can't use DataObject.path as it refers to physical path
-                obj_path = os.path.join(
-                    res[Collection.name], res[DataObject.name]
-                )
-                acl = iRODSAccess(
-                    access_name='null',
-                    path=obj_path,
-                    user_name=res[User.name],
-                    user_zone=self.irods.zone,
-                )
-                self.irods.acls.set(acl, recursive=False)
-                logger.debug(
-                    'Removed data object ACL from user "{}": {}'.format(
-                        res[User.name], obj_path
-                    )
-                )
+            if res[DataAccess.user_id] in user_ids or not self._in_path(
+                res[Collection.name], path
+            ):
+                continue
+            # NOTE: Can't use DataObject.path as it refers to physical path
+            obj_path = os.path.join(res[Collection.name], res[DataObject.name])
+            ret[(res[User.name], obj_path)] = {
+                'user_name': res[User.name],
+                'path': obj_path,
+                'access_name': res[DataAccess.name],
+                'type': 'obj',
+                'coll_path': res[Collection.name],
+            }
         query.close()
+        return list(ret.values())
+
+    @classmethod
+    def _get_removals(cls, coll_access, obj_access):
+        """
+        Return minimal set of ACL removals for disallowed access. Collection
+        ACLs are removed recursively, so collection and data object ACLs under
+        a removed collection for the same user are omitted.
+
+        :param coll_access: List of collection ACL dicts
+        :param obj_access: List of data object ACL dicts
+        :return: List of (user name, path, recursive) tuples
+        """
+        coll_paths = defaultdict(set)
+        for a in coll_access:
+            coll_paths[a['user_name']].add(a['path'])
+        roots = {}  # Topmost collection paths by user name
+        for user_name, paths in coll_paths.items():
+            roots[user_name] = []
+            for p in sorted(paths, key=lambda x: x.split('/')):
+                last = roots[user_name][-1] if roots[user_name] else None
+                if last and cls._in_path(p, last):
+                    continue  # Covered by recursive parent removal
+                roots[user_name].append(p)
+        ret = [(u, p, True) for u in sorted(roots) for p in roots[u]]
+        for a in sorted(obj_access, key=lambda x: (x['user_name'], x['path'])):
+            user_roots = set(roots.get(a['user_name'], []))
+            parent = a['coll_path']
+            covered = False
+            while parent and not covered:
+                covered = parent in user_roots
+                parent = parent.rsplit('/', 1)[0]
+            if not covered:
+                ret.append((a['user_name'], a['path'], False))
+        return ret
+
+    @classmethod
+    def _get_removed_access(cls, access, removed):
+        """
+        Return ACLs covered by successful removals.
+
+        :param access: List of collection and data object ACL dicts
+        :param removed: List of (user name, path, recursive) tuples
+        :return: List of ACL dicts
+        """
+        roots = defaultdict(list)  # Recursively removed paths by user
+        paths = set()  # Non-recursively removed (user name, path)
+        for user_name, acl_path, recursive in removed:
+            if recursive:
+                roots[user_name].append(acl_path)
+            else:
+                paths.add((user_name, acl_path))
+        ret = []
+        for a in access:
+            if (a['user_name'], a['path']) in paths or any(
+                cls._in_path(a['path'], r) for r in roots[a['user_name']]
+            ):
+                ret.append({k: v for k, v in a.items() if k != 'coll_path'})
+        return ret
 
     def execute(
         self,
@@ -537,25 +740,61 @@ class CleanupAccessTask(IrodsBaseTask):
         *args,
         **kwargs,
     ):
-        user_ids = []  # Get IDs of allowed users
-        for u in user_names:
-            try:
-                user = self.irods.users.get(u)
-                if user.id not in user_ids:
-                    user_ids.append(user.id)
-            except Exception:
-                pass  # Nothing to do if user doesn't exist
-        # Cleanup collection access
+        user_ids = self._get_user_ids(user_names)  # IDs of allowed users
+        coll_access = []
+        obj_access = []
         try:
-            self._cleanup_coll_access(path, user_ids)
+            coll_access = self._get_coll_access(path, user_ids)
         except Exception as ex:
             # NOTE: No raise, only log
-            logger.error('Exception in _cleanup_coll_access(): {}'.format(ex))
-        # Cleanup data object access
+            logger.error('Exception in _get_coll_access(): {}'.format(ex))
         try:
-            self._cleanup_obj_access(path, user_ids)
+            obj_access = self._get_obj_access(path, user_ids)
         except Exception as ex:
-            logger.error('Exception in _cleanup_obj_access(): {}'.format(ex))
+            logger.error('Exception in _get_obj_access(): {}'.format(ex))
+        removals = self._get_removals(coll_access, obj_access)
+        removed = []  # Successful removals
+        for user_name, acl_path, recursive in removals:
+            acl = iRODSAccess(
+                access_name='null',
+                path=acl_path,
+                user_name=user_name,
+                user_zone=self.irods.zone,
+            )
+            try:
+                self.irods.acls.set(acl, recursive=recursive)
+                removed.append((user_name, acl_path, recursive))
+            except Exception as ex:
+                logger.error(
+                    'Exception removing ACL from user "{}" for {}: {}'.format(
+                        user_name, acl_path, ex
+                    )
+                )
+        # Record and log access covered by successful removals for auditing
+        removed_access = self._get_removed_access(
+            coll_access + obj_access, removed
+        )
+        for a in removed_access:
+            logger.info(
+                'Removed {} ACL "{}" from user "{}": {}'.format(
+                    'collection' if a['type'] == 'coll' else 'data object',
+                    a['access_name'],
+                    a['user_name'],
+                    a['path'],
+                )
+            )
+        self.execute_data['removed_access'] = removed_access
+        if removals:
+            logger.info(
+                'Cleaned up {} ACL{} under {} with {}/{} removal{}'.format(
+                    len(removed_access),
+                    's' if len(removed_access) != 1 else '',
+                    path,
+                    len(removed),
+                    len(removals),
+                    's' if len(removals) != 1 else '',
+                )
+            )
         super().execute(*args, **kwargs)
 
     # NOTE: No revert as these are roles which should not exist
@@ -752,18 +991,183 @@ class BatchSetAccessTask(IrodsAccessMixin, IrodsBaseTask):
             self.revert_set_access(path, user_name, obj_target, recursive)
 
 
+class BatchCreateUsersTask(IrodsUserGroupMixin, IrodsBaseTask):
+    """Create multiple users if they do not exist (iadmin mkuser)"""
+
+    # NOTE: Password not needed as users log in via LDAP
+
+    def execute(self, user_names, user_type, *args, **kwargs):
+        existing = self.get_existing_users(user_names)
+        self.execute_data['created_users'] = []
+        for user_name in sorted(set(user_names) - existing):
+            try:
+                self.irods.users.create(
+                    user_name=user_name,
+                    user_type=user_type,
+                    user_zone=self.irods.zone,
+                )
+            except Exception as ex:
+                self.raise_irods_exception(
+                    ex, info='Failed to create user "{}"'.format(user_name)
+                )
+            self.execute_data['created_users'].append(user_name)
+            self.data_modified = True
+        super().execute(*args, **kwargs)
+
+    def revert(self, user_names, user_type, *args, **kwargs):
+        # Remove users only if they were added in this run
+        if self.data_modified:
+            for user_name in self.execute_data['created_users']:
+                self.irods.users.remove(user_name)
+
+
+class BatchCreateUserGroupsTask(IrodsUserGroupMixin, IrodsBaseTask):
+    """Create multiple user groups if they do not exist (iadmin mkgroup)"""
+
+    def execute(self, names, *args, **kwargs):
+        existing = self.get_existing_users(names, groups=True)
+        self.execute_data['created_groups'] = []
+        for name in sorted(set(names) - existing):
+            try:
+                self.irods.user_groups.create(
+                    name=name, user_zone=self.irods.zone
+                )
+            except Exception as ex:
+                self.raise_irods_exception(
+                    ex, info='Failed to create group "{}"'.format(name)
+                )
+            self.execute_data['created_groups'].append(name)
+            self.data_modified = True
+        super().execute(*args, **kwargs)
+
+    def revert(self, names, *args, **kwargs):
+        if self.data_modified:
+            for name in self.execute_data['created_groups']:
+                self.irods.users.remove(user_name=name)  # NOTE: Not group_name
+
+
+class BatchUpdateGroupMembersTask(IrodsUserGroupMixin, IrodsBaseTask):
+    """
+    Add users to and remove users from multiple groups (iadmin atg/rfg).
+    Current memberships are retrieved in bulk and only the differing ones are
+    updated. If the same user and group appear multiple times in members, the
+    last entry is applied. Removing users from nonexistent groups is ignored.
+    """
+
+    @classmethod
+    def get_updates(cls, members, current, groups):
+        """
+        Return membership updates needed to reach the requested state.
+
+        :param members: List of (group name, user name, is member) tuples
+        :param current: Set of current (group name, user name) tuples
+        :param groups: Set of existing group names
+        :return: Tuple of lists of (group name, user name) tuples for added
+                 and removed members
+        """
+        target = {}
+        for group_name, user_name, is_member in members:
+            target[(group_name, user_name)] = is_member
+        add = []
+        remove = []
+        for k, is_member in target.items():
+            if is_member and k not in current:
+                add.append(k)
+            elif not is_member and k in current and k[0] in groups:
+                remove.append(k)
+        return add, remove
+
+    def execute(self, members, *args, **kwargs):
+        group_names = {m[0] for m in members}
+        groups = self.get_existing_users(group_names, groups=True)
+        add_groups = {m[0] for m in members if m[2]}
+        missing = sorted(add_groups - groups)
+        if missing:
+            self.raise_irods_exception(
+                GroupDoesNotExist(),
+                info='Failed to retrieve group{} "{}"'.format(
+                    's' if len(missing) != 1 else '', '", "'.join(missing)
+                ),
+            )
+        current = self.get_group_members(groups)
+        add, remove = self.get_updates(members, current, groups)
+        # Store applied updates as lists for reverting
+        self.execute_data['added'] = []
+        self.execute_data['removed'] = []
+        for group_name, user_name in add:
+            try:
+                self.irods.user_groups.addmember(
+                    group_name, user_name, user_zone=self.irods.zone
+                )
+            except Exception as ex:
+                self.raise_irods_exception(
+                    ex,
+                    info='Failed to add user "{}" into group "{}"'.format(
+                        user_name, group_name
+                    ),
+                )
+            self.execute_data['added'].append([group_name, user_name])
+            self.data_modified = True
+        for group_name, user_name in remove:
+            try:
+                self.irods.user_groups.removemember(
+                    group_name, user_name, user_zone=self.irods.zone
+                )
+            except Exception as ex:
+                self.raise_irods_exception(
+                    ex,
+                    info='Failed to remove user "{}" from group "{}"'.format(
+                        user_name, group_name
+                    ),
+                )
+            self.execute_data['removed'].append([group_name, user_name])
+            self.data_modified = True
+        if add or remove:
+            logger.info(
+                'Updated group members: {} added, {} removed'.format(
+                    len(add), len(remove)
+                )
+            )
+        super().execute(*args, **kwargs)
+
+    def revert(self, members, *args, **kwargs):
+        if self.data_modified:
+            for group_name, user_name in reversed(self.execute_data['removed']):
+                self.irods.user_groups.addmember(
+                    group_name, user_name, user_zone=self.irods.zone
+                )
+            for group_name, user_name in reversed(self.execute_data['added']):
+                self.irods.user_groups.removemember(
+                    group_name, user_name, user_zone=self.irods.zone
+                )
+
+
 class BatchCheckFileSuffixTask(IrodsBaseTask):
     """Batch check for prohibited file name suffixes"""
 
-    def execute(self, file_paths, suffixes, zone_path, *args, **kwargs):
+    @staticmethod
+    def get_prohibited_paths(file_paths, suffixes):
+        """
+        Return paths of files with prohibited file name suffixes.
+
+        :param file_paths: Paths of data objects (list)
+        :param suffixes: Cleaned up prohibited suffixes without dots (list)
+        :return: List
+        """
+        if not suffixes:
+            return []
+        suffixes = tuple('.' + s for s in suffixes)
+        return [p for p in file_paths if p.lower().endswith(suffixes)]
+
+    def execute(
+        self, file_paths, suffixes, zone_path, err_paths=None, *args, **kwargs
+    ):
         suffixes = cleanup_file_prohibit(suffixes)
         if not suffixes:
             super().execute(*args, **kwargs)
             return
-        err_paths = []
-        for p in file_paths:
-            if any(p.lower().endswith('.' + s) for s in suffixes):
-                err_paths.append(p)
+        if err_paths is None:
+            err_paths = self.get_prohibited_paths(file_paths, suffixes)
         err_len = len(err_paths)
         if err_len > 0:
             msg = '{} file{} found with prohibited file type ({}):\n{}'.format(
@@ -776,7 +1180,9 @@ class BatchCheckFileSuffixTask(IrodsBaseTask):
             self.raise_irods_exception(Exception(), msg)
         super().execute(*args, **kwargs)
 
-    def revert(self, file_paths, suffixes, zone_path, *args, **kwargs):
+    def revert(
+        self, file_paths, suffixes, zone_path, err_paths=None, *args, **kwargs
+    ):
         pass  # Nothing to revert
 
 
@@ -785,18 +1191,43 @@ class BatchCheckFileExistTask(IrodsBaseTask):
     Batch check for existence of files and corresponding checksum files
     """
 
-    def execute(
-        self, file_paths, chk_paths, zone_path, chk_suffix, *args, **kwargs
-    ):
-        err_paths = []
-        for p in file_paths:
-            p_chk = p + chk_suffix
-            if p_chk not in chk_paths:
-                err_paths.append(p_chk)
+    @staticmethod
+    def get_missing_paths(file_paths, chk_paths, chk_suffix):
+        """
+        Return expected paths of missing checksum files and data objects.
+
+        :param file_paths: Paths of data objects (list)
+        :param chk_paths: Paths of checksum files (list)
+        :param chk_suffix: Checksum file suffix (string)
+        :return: List
+        """
+        file_lookup = set(file_paths)
+        chk_lookup = set(chk_paths)
+        ret = [
+            p + chk_suffix
+            for p in file_paths
+            if p + chk_suffix not in chk_lookup
+        ]
         for p in chk_paths:
             p_file = p[: p.rfind('.')]
-            if p_file not in file_paths:
-                err_paths.append(p_file)
+            if p_file not in file_lookup:
+                ret.append(p_file)
+        return ret
+
+    def execute(
+        self,
+        file_paths,
+        chk_paths,
+        zone_path,
+        chk_suffix,
+        err_paths=None,
+        *args,
+        **kwargs,
+    ):
+        if err_paths is None:
+            err_paths = self.get_missing_paths(
+                file_paths, chk_paths, chk_suffix
+            )
         err_len = len(err_paths)
         if err_len > 0:
             msg = '{} expected file{} missing:\n{}'.format(
@@ -809,52 +1240,93 @@ class BatchCheckFileExistTask(IrodsBaseTask):
         super().execute(*args, **kwargs)
 
     def revert(
-        self, file_paths, chk_paths, zone_path, chk_suffix, *args, **kwargs
+        self,
+        file_paths,
+        chk_paths,
+        zone_path,
+        chk_suffix,
+        err_paths=None,
+        *args,
+        **kwargs,
     ):
         pass  # Nothing is modified so no need for revert
 
 
-class BatchValidateChecksumsTask(ProgressCounterMixin, IrodsBaseTask):
+class BatchValidateChecksumsTask(
+    WorkerSessionMixin, ProgressCounterMixin, IrodsBaseTask
+):
     """Batch validate checksums of a given list of data object paths"""
 
-    def _read_checksum(self, chk_path, zone_path_len, read_errors):
+    @classmethod
+    def _read_checksum(cls, irods, chk_path, zone_path_len):
         """
-        Read checksum file. Appends error and returns False if error is
-        reached.
+        Read checksum file.
+
+        :param irods: iRODSSession object
+        :param chk_path: Full iRODS path to checksum file (string)
+        :param zone_path_len: Landing zone iRODS path length (int)
+        :return: Tuple of checksum (string or False) and error message (string
+                 or None)
         """
         try:
-            with self.irods.data_objects.open(chk_path, mode='r') as f:
+            with irods.data_objects.open(chk_path, mode='r') as f:
                 dec = 'utf-8'
                 chk_content = f.read()
                 # Support for BOM header forced by PowerShell (see #1818)
                 if chk_content[:3] == codecs.BOM_UTF8:
                     dec += '-sig'
-                return re.split(CHECKSUM_FILE_RE, chk_content.decode(dec))[0]
+                return (
+                    re.split(CHECKSUM_FILE_RE, chk_content.decode(dec))[0],
+                    None,
+                )
         except Exception as ex:
             ex_msg = 'File: {}\nException: {}'.format(
                 '/'.join(chk_path.split('/')[zone_path_len:]), ex
             )
-            read_errors.append(ex_msg)
-            return False
+            return False, ex_msg
+
+    def _get_replica_checksums(self, zone_path):
+        """
+        Return checksums of all data object replicas under the landing zone in
+        a single catalog query.
+
+        :param zone_path: Full iRODS path to landing zone (string)
+        :return: Dict of lists of (resource name, checksum) tuples, keyed by
+                 data object path
+        """
+        ret = defaultdict(list)
+        query = self.irods.query(
+            Collection.name,
+            DataObject.name,
+            DataObject.replica_number,
+            DataObject.resource_name,
+            DataObject.checksum,
+        ).filter(Like(Collection.name, zone_path + '%'))
+        for row in query:
+            ret[row[Collection.name] + '/' + row[DataObject.name]].append(
+                (row[DataObject.resource_name], row[DataObject.checksum])
+            )
+        query.close()
+        return ret
 
     @classmethod
     def _compare_checksums(
-        cls, data_obj, checksum, zone_path_len, hash_scheme, irods_backend
+        cls, path, replicas, checksum, zone_path_len, hash_scheme, irods_backend
     ):
         """
         Compare object replicate checksums to expected sum. Raises exception if
         checksums do not match.
 
-        :param data_obj: Data object
+        :param path: Full iRODS path to data object (string)
+        :param replicas: List of (resource name, checksum) tuples
         :param checksum: Expected checksum (string)
         :param zone_path_len: Landing zone iRODS path length (int)
         :param hash_scheme: Checksum hashing scheme (string)
         :param irods_backend: IrodsAPI object
         :raises: Exception if checksums do not match
         """
-        for replica in data_obj.replicas:
-            repl_checksum = replica.checksum
-            if hash_scheme == HASH_SCHEME_SHA256:
+        for resource_name, repl_checksum in replicas:
+            if repl_checksum and hash_scheme == HASH_SCHEME_SHA256:
                 # Convert SHA256 from base64
                 repl_checksum = irods_backend.get_sha256_hex(repl_checksum)
             if (
@@ -865,17 +1337,17 @@ class BatchValidateChecksumsTask(ProgressCounterMixin, IrodsBaseTask):
                 log_msg = (
                     'Checksums do not match for "{}" in resource "{}" '
                     '(File: {}; iRODS: {})'.format(
-                        os.path.basename(data_obj.path),
-                        replica.resource_name,
+                        os.path.basename(path),
+                        resource_name,
                         checksum or NO_FILE_CHECKSUM_LABEL,
                         repl_checksum,
                     )
                 )
                 logger.error(log_msg)
-                ex_path = '/'.join(data_obj.path.split('/')[zone_path_len:])
+                ex_path = '/'.join(path.split('/')[zone_path_len:])
                 ex_msg = 'Path: {}\nResource: {}\nFile: {}\niRODS: {}'.format(
                     ex_path,
-                    replica.resource_name,
+                    resource_name,
                     checksum or NO_FILE_CHECKSUM_LABEL,
                     repl_checksum,
                 )
@@ -900,14 +1372,33 @@ class BatchValidateChecksumsTask(ProgressCounterMixin, IrodsBaseTask):
         read_errors = []
         cmp_errors = []
         time_start = time.time()
+        replica_checksums = self._get_replica_checksums(zone_path)
+
+        def _read(irods, f_path):
+            return self._read_checksum(
+                irods, f_path + chk_suffix, zone_path_len
+            )
 
-        for f_path in file_paths:
-            chk_path = f_path + chk_suffix
-            file_sum = self._read_checksum(chk_path, zone_path_len, read_errors)
-            if file_sum is not False:
+        results = self.map_worker_sessions(
+            _read,
+            file_paths,
+            irods_backend,
+            settings.TASKFLOW_VALIDATE_WORKERS,
+        )
+        for f_path, (file_sum, read_error) in zip(file_paths, results):
+            if read_error:
+                read_errors.append(read_error)
+            elif f_path not in replica_checksums:
+                cmp_errors.append(
+                    'Path: {}\nData object not found'.format(
+                        '/'.join(f_path.split('/')[zone_path_len:])
+                    )
+                )
+            else:
                 try:
                     self._compare_checksums(
-                        self.irods.data_objects.get(f_path),
+                        f_path,
+                        replica_checksums[f_path],
                         file_sum,
                         zone_path_len,
                         hash_scheme,
@@ -916,10 +1407,10 @@ class BatchValidateChecksumsTask(ProgressCounterMixin, IrodsBaseTask):
                 except Exception as ex:
                     cmp_errors.append(str(ex))
 
+            i += 1
             i_prev, time_start = self.update_zone_progress(
                 landing_zone, status_base, i, i_prev, file_count, time_start
             )
-            i += 1
         self.set_zone_final_status(landing_zone, status_base, file_count)
 
         if read_errors or cmp_errors:
@@ -982,7 +1473,10 @@ class BatchCreateCollectionsTask(IrodsBaseTask):
 
 
 class BatchMoveDataObjectsTask(ProgressCounterMixin, IrodsBaseTask):
-    """Batch move files (imv) and set access to user group (ichmod)"""
+    """
+    Batch move files (imv) and set access to user group (ichmod). Leaf
+    collections provided in coll_moves are moved as a whole.
+    """
 
     @staticmethod
     def get_dest_coll_path(src_path, src_root, dest_root):
@@ -997,6 +1491,152 @@ class BatchMoveDataObjectsTask(ProgressCounterMixin, IrodsBaseTask):
             + src_path.split('/')[-1]
         )
 
+    @staticmethod
+    def get_coll_moves(src_root, dest_root, src_paths, src_colls, dest_colls):
+        """
+        Return leaf collections containing moved data objects which do not
+        exist in the destination and can thus be moved as a whole.
+
+        :param src_root: Root path of source collections (string)
+        :param dest_root: Root path of destination collections (string)
+        :param src_paths: Paths of data objects to be moved (list)
+        :param src_colls: Paths of all collections under src_root (list)
+        :param dest_colls: Paths of existing collections under dest_root
+                           (list)
+        :return: Dict of destination collection paths keyed by source path
+        """
+        src_depth = len(src_root.split('/'))
+        obj_colls = set(p[: p.rfind('/')] for p in src_paths)
+        parent_colls = set(p[: p.rfind('/')] for p in src_colls)
+        dest_lookup = set(dest_colls)
+        ret = {}
+        for path in sorted(obj_colls):
+            if len(path.split('/')) <= src_depth or path in parent_colls:
+                continue  # Skip root and non-leaf collections
+            dest_path = dest_root + '/' + '/'.join(path.split('/')[src_depth:])
+            if dest_path not in dest_lookup:
+                ret[path] = dest_path
+        return ret
+
+    def _get_user_access(self, src_root, user_name):
+        """
+        Return access of user for collections and data objects under root
+        collection in two catalog queries.
+
+        :param src_root: Root path of source collections (string)
+        :param user_name: Name of user or group (string)
+        :return: Dict of access names keyed by path
+        """
+        ret = {}
+        try:
+            user_id = self.irods.users.get(user_name).id
+        except Exception as ex:
+            self.raise_irods_exception(
+                ex, 'Error retrieving user "{}"'.format(user_name)
+            )
+        query = self.irods.query(Collection.name, CollectionAccess.name).filter(
+            Like(Collection.name, src_root + '%'),
+            CollectionAccess.user_id == user_id,
+        )
+        for row in query:
+            ret[row[Collection.name]] = ACCESS_LOOKUP[
+                row[CollectionAccess.name]
+            ]
+        query.close()
+        query = self.irods.query(
+            Collection.name, DataObject.name, DataAccess.name
+        ).filter(
+            Like(Collection.name, src_root + '%'),
+            DataAccess.user_id == user_id,
+        )
+        for row in query:
+            path = row[Collection.name] + '/' + row[DataObject.name]
+            ret[path] = ACCESS_LOOKUP[row[DataAccess.name]]
+        query.close()
+        return ret
+
+    def _set_access(self, access_name, path, user_name, recursive=False):
+        acl = iRODSAccess(
+            access_name=access_name,
+            path=path,
+            user_name=user_name,
+            user_zone=self.irods.zone,
+        )
+        try:
+            self.irods.acls.set(acl, recursive=recursive)
+        except Exception as ex:
+            self.raise_irods_exception(
+                ex, 'Error setting permission for "{}"'.format(path)
+            )
+
+    @staticmethod
+    def get_coll_access(access, coll_moves):
+        """
+        Group previous access differing from "null" by moved leaf collection
+        in a single pass. As moved collections have no subcollections, only
+        the collection itself and its data objects are included.
+
+        :param access: Dict of access names keyed by path
+        :param coll_moves: Dict of moved collections keyed by source path
+        :return: Dict of access dicts keyed by source collection path, with
+                 access keyed by path relative to the collection
+        """
+        ret = defaultdict(dict)
+        for path, access_name in access.items():
+            if access_name == 'null':
+                continue
+            if path in coll_moves:
+                ret[path][''] = access_name
+                continue
+            coll = path[: path.rfind('/')]
+            if coll in coll_moves:
+                ret[coll][path[len(coll) + 1 :]] = access_name
+        return ret
+
+    def _move_coll(
+        self, src_coll, dest_coll, access_name, user_name, prev_access
+    ):
+        """
+        Move leaf collection as a whole and set user access recursively.
+        Previous access is stored for reverting, keyed by path relative to the
+        collection.
+        """
+        try:
+            self.irods.collections.move(src_path=src_coll, dest_path=dest_coll)
+        except Exception as ex:
+            self.raise_irods_exception(
+                ex,
+                'Error moving collection "{}" to "{}"'.format(
+                    src_coll, dest_coll
+                ),
+            )
+        self.execute_data['moved_colls'].append((src_coll, prev_access))
+        self._set_access(access_name, dest_coll, user_name, recursive=True)
+
+    def _move_obj(
+        self, src_path, dest_obj_path, access_name, user_name, access
+    ):
+        """Move single data object and set user access if needed"""
+        try:
+            self.irods.data_objects.move(
+                src_path=src_path, dest_path=dest_obj_path
+            )
+        except Exception as ex:
+            if ex.__class__.__name__ == 'CAT_NAME_EXISTS_AS_DATAOBJ':
+                msg = 'Target file already exists: {}'.format(dest_obj_path)
+            else:
+                msg = 'Error moving move data object "{}" to "{}"'.format(
+                    src_path, dest_obj_path
+                )
+            self.raise_irods_exception(ex, msg)
+        # Access is retained in move, so we can compare to source access
+        prev_access = access.get(src_path, 'null')
+        if prev_access == access_name:
+            prev_access = None
+        self.execute_data['moved_objects'].append((src_path, prev_access))
+        if prev_access:
+            self._set_access(access_name, dest_obj_path, user_name)
+
     def execute(
         self,
         landing_zone,
@@ -1006,88 +1646,54 @@ class BatchMoveDataObjectsTask(ProgressCounterMixin, IrodsBaseTask):
         access_name,
         user_name,
         irods_backend,
+        coll_moves=None,
         *args,
         **kwargs,
     ):
         self.execute_data['moved_objects'] = []
+        self.execute_data['moved_colls'] = []
+        coll_moves = coll_moves or {}
         # Disregard checksum files in file count
         chk_suffix = irods_backend.get_checksum_file_suffix()
         file_count = len([p for p in src_paths if not p.endswith(chk_suffix)])
         status_base = landing_zone.status_info
         i = 0
         i_prev = 0
+        # Retrieve previous access in bulk instead of for each object
+        access = self._get_user_access(src_root, user_name)
+        # Index file counts and access by moved collection in one pass
+        coll_counts = defaultdict(int)
+        if coll_moves:
+            for p in src_paths:
+                coll = p[: p.rfind('/')]
+                if coll in coll_moves and not p.endswith(chk_suffix):
+                    coll_counts[coll] += 1
+        coll_access = self.get_coll_access(access, coll_moves)
         time_start = time.time()
 
+        for src_coll, dest_coll in coll_moves.items():
+            self._move_coll(
+                src_coll,
+                dest_coll,
+                access_name,
+                user_name,
+                coll_access.get(src_coll, {}),
+            )
+            i += coll_counts[src_coll]
+            i_prev, time_start = self.update_zone_progress(
+                landing_zone, status_base, i, i_prev, file_count, time_start
+            )
+
         for src_path in src_paths:
+            if src_path[: src_path.rfind('/')] in coll_moves:
+                continue  # Already moved with collection
             dest_coll_path = self.get_dest_coll_path(
                 src_path, src_root, dest_root
             )
             dest_obj_path = self.get_dest_obj_path(src_path, dest_coll_path)
-
-            try:
-                self.irods.data_objects.move(
-                    src_path=src_path, dest_path=dest_obj_path
-                )
-            except Exception as ex:
-                if ex.__class__.__name__ == 'CAT_NAME_EXISTS_AS_DATAOBJ':
-                    msg = 'Target file already exists: {}'.format(dest_obj_path)
-                else:
-                    msg = 'Error moving move data object "{}" to "{}"'.format(
-                        src_path, dest_obj_path
-                    )
-                self.raise_irods_exception(ex, msg)
-            try:
-                target = self.irods.data_objects.get(dest_obj_path)
-            except Exception as ex:
-                self.raise_irods_exception(
-                    ex,
-                    'Error retrieving destination object "{}"'.format(
-                        dest_obj_path
-                    ),
-                )
-            try:
-                target_access = self.irods.acls.get(target=target)
-            except Exception as ex:
-                self.raise_irods_exception(
-                    ex,
-                    'Error getting permissions of target "{}"'.format(target),
-                )
-
-            # TODO: Remove repetition, use IrodsAccessMixin
-            user_access = next(
-                (x for x in target_access if x.user_name == user_name), None
+            self._move_obj(
+                src_path, dest_obj_path, access_name, user_name, access
             )
-            prev_access = None
-            if (
-                user_access
-                and user_access.access_name != ACCESS_LOOKUP[access_name]
-            ):
-                prev_access = ACCESS_LOOKUP[user_access.access_name]
-                modifying_access = True
-            elif not user_access:
-                prev_access = 'null'
-                modifying_access = True
-            else:
-                modifying_access = False
-            self.execute_data['moved_objects'].append((src_path, prev_access))
-
-            if modifying_access:
-                acl = iRODSAccess(
-                    access_name=access_name,
-                    path=dest_obj_path,
-                    user_name=user_name,
-                    user_zone=self.irods.zone,
-                )
-                try:
-                    self.irods.acls.set(acl, recursive=False)
-                except Exception as ex:
-                    self.raise_irods_exception(
-                        ex,
-                        'Error setting permission for "{}"'.format(
-                            dest_coll_path
-                        ),
-                    )
-
             i_prev, time_start = self.update_zone_progress(
                 landing_zone, status_base, i, i_prev, file_count, time_start
             )
@@ -1105,88 +1711,165 @@ class BatchMoveDataObjectsTask(ProgressCounterMixin, IrodsBaseTask):
         access_name,
         user_name,
         irods_backend,
+        coll_moves=None,
         *args,
         **kwargs,
     ):
-        for moved_object in self.execute_data['moved_objects']:
-            src_path = moved_object[0]
-            prev_access = moved_object[1]
+        for src_path, prev_access in self.execute_data['moved_objects']:
             dest_path = self.get_dest_coll_path(src_path, src_root, dest_root)
-            new_src = (
-                dest_path
-                + ('/' if dest_path[-1] != '/' else '')
-                + src_path.split('/')[-1]
-            )
+            new_src = self.get_dest_obj_path(src_path, dest_path)
             new_dest = '/'.join(src_path.split('/')[:-1])
-            new_dest_obj = new_dest + '/' + src_path.split('/')[-1]
             self.irods.data_objects.move(src_path=new_src, dest_path=new_dest)
-
-            acl = iRODSAccess(
-                access_name=prev_access,
-                path=new_dest_obj,
-                user_name=user_name,
-                user_zone=self.irods.zone,
+            if prev_access:
+                self._set_access(prev_access, src_path, user_name)
+        coll_moves = coll_moves or {}
+        for src_coll, prev_access in self.execute_data.get('moved_colls', []):
+            self.irods.collections.move(
+                src_path=coll_moves[src_coll], dest_path=src_coll
             )
-            self.irods.acls.set(acl, recursive=False)
+            self._set_access('null', src_coll, user_name, recursive=True)
+            for rel_path, access in prev_access.items():
+                path = src_coll + '/' + rel_path if rel_path else src_coll
+                self._set_access(access, path, user_name)
 
 
-class BatchCalculateChecksumTask(ProgressCounterMixin, IrodsBaseTask):
+class BatchCalculateChecksumTask(
+    WorkerSessionMixin, ProgressCounterMixin, IrodsBaseTask
+):
     """Batch calculate checksum for data objects (ichksum)"""
 
-    def _raise_checksum_exception(self, ex, replica, data_obj, info=None):
+    def _raise_checksum_exception(self, ex, path, resc_hier, info=None):
         info_str = (': ' + info) if info else ''
         self.raise_irods_exception(
             ex,
             f'Failed to calculate checksum{info_str}\nReplica: '
-            f'{replica.resc_hier}\nFile: {data_obj.path}',
+            f'{resc_hier}\nFile: {path}',
         )
 
-    def _compute_checksum(self, data_obj, replica, force):
-        if replica.checksum and not force:
-            return
+    def _get_replicas(self, file_paths):
+        """
+        Return replica info for data objects in a single catalog query.
+
+        :param file_paths: List of full iRODS paths to data objects
+        :return: Dict of lists of replica info dicts, keyed by data object path
+        """
+        root_path = os.path.commonpath([p[: p.rfind('/')] for p in file_paths])
+        path_lookup = set(file_paths)
+        ret = defaultdict(list)
+        query = self.irods.query(
+            Collection.name,
+            DataObject.name,
+            DataObject.replica_number,
+            DataObject.resc_hier,
+            DataObject.checksum,
+            DataObject.size,
+        ).filter(Like(Collection.name, root_path + '%'))
+        for row in query:
+            path = row[Collection.name] + '/' + row[DataObject.name]
+            if path in path_lookup:
+                ret[path].append(
+                    {
+                        'resc_hier': row[DataObject.resc_hier],
+                        'checksum': row[DataObject.checksum],
+                        'size': row[DataObject.size],
+                    }
+                )
+        query.close()
+        return ret
+
+    def _compute_checksum(self, irods, path, replica, force):
+        """
+        Compute checksum for a data object replica.
+
+        :param irods: iRODSSession object
+        :param path: Full iRODS path to data object (string)
+        :param replica: Replica info dict
+        :param force: Compute checksum even if it exists (bool)
+        :return: Size of checksummed replica in bytes (int)
+        """
+        if replica['checksum'] and not force:
+            return 0
+        resc_hier = replica['resc_hier']
         for j in range(CHECKSUM_RETRY):
             if j > 0:  # Retry if iRODS times out (see #1941)
                 logger.info('Retrying ({})..'.format(j + 1))
             try:
-                data_obj.chksum(**{kw.RESC_HIER_STR_KW: replica.resc_hier})
-                return
+                irods.data_objects.chksum(
+                    path, **{kw.RESC_HIER_STR_KW: resc_hier}
+                )
+                return replica['size'] or 0
             # Retry for network exceptions
             except NetworkException as ex:
                 logger.error(
                     f'NetworkException in BatchCalculateChecksumTask for path '
-                    f'"{data_obj.path}" in replica "{replica.resc_hier}" '
+                    f'"{path}" in replica "{resc_hier}" '
                     f'(attempt {j + 1}/{CHECKSUM_RETRY}): {ex}'
                 )
                 # Raise if we reached maximum retry count
                 if j == CHECKSUM_RETRY - 1:
                     info = 'maximum network timeout retry attempts reached'
-                    self._raise_checksum_exception(ex, replica, data_obj, info)
+                    self._raise_checksum_exception(ex, path, resc_hier, info)
             # Raise other exceptions normally
             except Exception as ex:
-                self._raise_checksum_exception(ex, replica, data_obj)
+                self._raise_checksum_exception(ex, path, resc_hier)
 
-    def execute(self, landing_zone, file_paths, force, *args, **kwargs):
-        file_count = len(file_paths)
-        if file_count == 0:  # Nothing to do
+    def execute(
+        self,
+        landing_zone,
+        file_paths,
+        force,
+        irods_backend=None,
+        *args,
+        **kwargs,
+    ):
+        if not file_paths:  # Nothing to do
             super().execute(*args, **kwargs)
             return
         status_base = landing_zone.status_info
+        # Skip per-file existence checks and retrieval by preloading replicas
+        replicas = self._get_replicas(file_paths)
+        file_paths = [p for p in file_paths if p in replicas]
+        file_count = len(file_paths)
         i = 0
         i_prev = 0
         landing_zone.set_status(
             landing_zone.status, f'{status_base} (0/{file_count}: 0%)'
         )  # Set initial status in case first file is a time consuming one
+        total_size = 0
         time_start = time.time()
-        for path in file_paths:
-            if not self.irods.data_objects.exists(path):
-                continue
-            data_obj = self.irods.data_objects.get(path)
-            for replica in data_obj.replicas:
-                self._compute_checksum(data_obj, replica, force)
-            i_prev, time_start = self.update_zone_progress(
-                landing_zone, status_base, i, i_prev, file_count, time_start
+        time_progress = time_start
+
+        def _compute(irods, path):
+            return sum(
+                self._compute_checksum(irods, path, r, force)
+                for r in replicas[path]
             )
+
+        # Worker sessions require the backend, otherwise run sequentially
+        workers = settings.TASKFLOW_CHECKSUM_WORKERS if irods_backend else 1
+        for size in self.map_worker_sessions(
+            _compute, file_paths, irods_backend, workers
+        ):
+            total_size += size
             i += 1
+            rate = total_size / max(time.time() - time_start, 0.001)
+            i_prev, time_progress = self.update_zone_progress(
+                landing_zone,
+                status_base,
+                i,
+                i_prev,
+                file_count,
+                time_progress,
+                rate=rate,
+            )
         self.set_zone_final_status(landing_zone, status_base, file_count)
+        duration = time.time() - time_start
+        logger.info(
+            'Calculated checksums for {} in {:.1f}s ({})'.format(
+                filesizeformat(total_size).replace('\xa0', ' '),
+                duration,
+                self.get_rate_str(total_size / max(duration, 0.001)),
+            )
+        )
         super().execute(*args, **kwargs)
         # NOTE: We don't need revert for this
@@ -1,5 +1,7 @@
 """Celery tasks for the taskflowbackend app"""
 
+from django.conf import settings
+
 from config.celery import app
 
 # Projectroles dependency
@@ -33,3 +35,28 @@ def submit_flow_task(
         async_mode=True,
         tl_event=tl_event,
     )
+
+
+# Celery task for running queued flows for a project
+@app.task(bind=True)
+def run_flow_queue_task(_self, project_uuid):
+    taskflow = get_backend_api('taskflow')
+    project = Project.objects.get(sodar_uuid=project_uuid)
+    taskflow.run_queue(project)
+
+
+# Celery task for starting runners for queued and interrupted flows
+@app.task(bind=True)
+def recover_flow_queues_task(_self):
+    taskflow = get_backend_api('taskflow')
+    taskflow.recover_queues()
+
+
+@app.on_after_finalize.connect
+def setup_periodic_tasks(sender, **kwargs):
+    if settings.TASKFLOW_QUEUE_ENABLED:
+        sender.add_periodic_task(
+            settings.TASKFLOW_QUEUE_RECOVER_INTERVAL,
+            recover_flow_queues_task.s(),
+            name='recover_flow_queues_task',
+        )
@@ -1,9 +1,15 @@
 """Tests for TaskflowAPI"""
 
+import os
+import uuid
+
+from django.test import override_settings
+
 # Projectroles dependency
 from projectroles.models import SODAR_CONSTANTS
 
 from taskflowbackend.api import TaskflowAPI
+from taskflowbackend.queue_api import FlowQueueAPI
 from taskflowbackend.tests.base import TaskflowViewTestBase
 
 
@@ -13,6 +19,9 @@ taskflow = TaskflowAPI()
 # SODAR constants
 PROJECT_TYPE_PROJECT = SODAR_CONSTANTS['PROJECT_TYPE_PROJECT']
 
+# Local constants
+COLL_NAME = 'test_coll'
+
 
 class TestTaskflowAPILocking(TaskflowViewTestBase):
     """Tests for project locking features in TaskflowAPI"""
@@ -35,3 +44,156 @@ class TestTaskflowAPILocking(TaskflowViewTestBase):
         """Test is_locked() with locked project"""
         self.lock_project(self.project)
         self.assertEqual(taskflow.is_locked(self.project), True)
+
+
+class TestTaskflowAPIQueue(TaskflowViewTestBase):
+    """Tests for per-project flow queue features in TaskflowAPI"""
+
+    def setUp(self):
+        super().setUp()
+        self.project, self.owner_as = self.make_project_taskflow(
+            title='TestProject',
+            type=PROJECT_TYPE_PROJECT,
+            parent=self.category,
+            owner=self.user,
+            description='description',
+        )
+        self.queue_api = FlowQueueAPI()
+        self.coll_path = os.path.join(
+            self.irods_backend.get_path(self.project), COLL_NAME
+        )
+        self.irods.collections.create(self.coll_path)
+        self.flow_data = {'paths': [self.coll_path]}
+
+    def tearDown(self):
+        self.queue_api.clear(self.project.sodar_uuid)
+        super().tearDown()
+
+    def test_enqueue(self):
+        """Test FlowQueueAPI enqueue() and pop()"""
+        p_uuid = self.project.sodar_uuid
+        job_id, position = self.queue_api.enqueue(
+            p_uuid, 'data_delete', self.flow_data
+        )
+        self.assertEqual(position, 1)
+        job_id2, position2 = self.queue_api.enqueue(
+            p_uuid, 'data_delete', self.flow_data
+        )
+        self.assertEqual(position2, 2)
+        self.assertEqual(self.queue_api.get_length(p_uuid), 2)
+        self.assertEqual(self.queue_api.get_position(p_uuid, job_id2), 2)
+        job = self.queue_api.pop(p_uuid)
+        self.assertEqual(job['job_id'], job_id)
+        self.assertEqual(job['flow_name'], 'data_delete')
+        self.assertEqual(job['flow_data'], self.flow_data)
+        self.assertEqual(self.queue_api.get_position(p_uuid, job_id2), 1)
+        self.assertEqual(self.queue_api.get_position(p_uuid, job_id), None)
+
+    def test_complete(self):
+        """Test FlowQueueAPI pop() and complete() with processing list"""
+        p_uuid = self.project.sodar_uuid
+        self.queue_api.enqueue(p_uuid, 'data_delete', self.flow_data)
+        job = self.queue_api.pop(p_uuid)
+        self.assertEqual(self.queue_api.get_length(p_uuid), 0)
+        self.assertEqual(self.queue_api.get_length(p_uuid, processing=True), 1)
+        self.queue_api.complete(p_uuid, job)
+        self.assertEqual(self.queue_api.get_length(p_uuid, processing=True), 0)
+
+    def test_requeue(self):
+        """Test FlowQueueAPI requeue()"""
+        p_uuid = self.project.sodar_uuid
+        job_id, _ = self.queue_api.enqueue(p_uuid, 'data_delete', {})
+        job_id2, _ = self.queue_api.enqueue(p_uuid, 'data_delete', {})
+        self.queue_api.pop(p_uuid)  # Interrupted job
+        self.assertEqual(self.queue_api.requeue(p_uuid), 1)
+        self.assertEqual(self.queue_api.get_length(p_uuid), 2)
+        # Requeued job should be run next
+        self.assertEqual(self.queue_api.get_position(p_uuid, job_id), 1)
+        self.assertEqual(self.queue_api.get_position(p_uuid, job_id2), 2)
+
+    @override_settings(TASKFLOW_QUEUE_ENABLED=True)
+    def test_submit_queue(self):
+        """Test submit() with queue enabled"""
+        self.assertEqual(self.irods.collections.exists(self.coll_path), True)
+        ret = taskflow.submit(
+            project=self.project,
+            flow_name='data_delete',
+            flow_data=self.flow_data,
+            async_mode=True,
+        )
+        self.assertEqual(ret, 1)
+        self.assertEqual(taskflow.get_queue_length(self.project), 0)
+        self.assertEqual(self.irods.collections.exists(self.coll_path), False)
+
+    @override_settings(TASKFLOW_QUEUE_ENABLED=False)
+    def test_submit_queue_disabled(self):
+        """Test submit() with queue disabled"""
+        ret = taskflow.submit(
+            project=self.project,
+            flow_name='data_delete',
+            flow_data=self.flow_data,
+            async_mode=True,
+        )
+        self.assertIsNone(ret)
+        self.assertEqual(self.irods.collections.exists(self.coll_path), False)
+
+    def test_run_queue(self):
+        """Test run_queue() with multiple queued flows"""
+        coll_path2 = self.coll_path + '2'
+        self.irods.collections.create(coll_path2)
+        p_uuid = self.project.sodar_uuid
+        self.queue_api.enqueue(p_uuid, 'data_delete', self.flow_data)
+        self.queue_api.enqueue(p_uuid, 'data_delete', {'paths': [coll_path2]})
+        taskflow.run_queue(self.project)
+        self.assertEqual(self.queue_api.get_length(p_uuid, processing=True), 0)
+        self.assertEqual(self.irods.collections.exists(self.coll_path), False)
+        self.assertEqual(self.irods.collections.exists(coll_path2), False)
+
+    def test_run_queue_interrupted(self):
+        """Test run_queue() with job left in processing by previous runner"""
+        p_uuid = self.project.sodar_uuid
+        self.queue_api.enqueue(p_uuid, 'data_delete', self.flow_data)
+        self.queue_api.pop(p_uuid)
+        self.assertEqual(self.queue_api.get_length(p_uuid), 0)
+        taskflow.run_queue(self.project)
+        self.assertEqual(self.queue_api.get_length(p_uuid, processing=True), 0)
+        self.assertEqual(self.irods.collections.exists(self.coll_path), False)
+
+    def test_get_project_uuids(self):
+        """Test FlowQueueAPI get_project_uuids()"""
+        p_uuid = str(self.project.sodar_uuid)
+        self.assertNotIn(p_uuid, self.queue_api.get_project_uuids())
+        self.queue_api.enqueue(p_uuid, 'data_delete', self.flow_data)
+        self.assertIn(p_uuid, self.queue_api.get_project_uuids())
+        self.queue_api.pop(p_uuid)
+        self.assertIn(p_uuid, self.queue_api.get_project_uuids())
+
+    def test_recover_queues(self):
+        """Test recover_queues() with job left in processing list"""
+        p_uuid = str(self.project.sodar_uuid)
+        self.queue_api.enqueue(p_uuid, 'data_delete', self.flow_data)
+        self.queue_api.pop(p_uuid)  # Interrupted job
+        self.assertEqual(self.queue_api.get_length(p_uuid), 0)
+        self.assertIn(p_uuid, taskflow.recover_queues())
+        self.assertEqual(self.queue_api.get_length(p_uuid, processing=True), 0)
+        self.assertEqual(self.irods.collections.exists(self.coll_path), False)
+
+    def test_recover_queues_deleted_project(self):
+        """Test recover_queues() with queue of deleted project"""
+        p_uuid = str(uuid.uuid4())
+        self.queue_api.enqueue(p_uuid, 'data_delete', self.flow_data)
+        self.assertNotIn(p_uuid, taskflow.recover_queues())
+        self.assertEqual(self.queue_api.get_length(p_uuid, processing=True), 0)
+        self.assertEqual(self.irods.collections.exists(self.coll_path), True)
+
+    @override_settings(TASKFLOW_QUEUE_LOCK_TIMEOUT=1)
+    def test_run_queue_locked(self):
+        """Test run_queue() with locked project"""
+        self.lock_project(self.project)
+        self.queue_api.enqueue(
+            self.project.sodar_uuid, 'data_delete', self.flow_data
+        )
+        taskflow.run_queue(self.project)
+        # Failed job should be removed from queue without running
+        self.assertEqual(taskflow.get_queue_length(self.project), 0)
+        self.assertEqual(self.irods.collections.exists(self.coll_path), True)
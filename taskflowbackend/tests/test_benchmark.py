@@ -0,0 +1,472 @@
+"""
+Benchmarks for Taskflow tasks in the taskflowbackend app.
+
+These are run against a local iRODS stand-in simulating catalog and network
+latency, so they do not require an iRODS server. Benchmarks are skipped unless
+the SODAR_BENCHMARK environment variable is set. Example:
+
+SODAR_BENCHMARK=1 make test arg=taskflowbackend.tests.test_benchmark
+"""
+
+import hashlib
+import io
+import os
+import threading
+import time
+import uuid
+
+from unittest import skipUnless
+
+from irods.exception import GroupDoesNotExist, UserDoesNotExist
+from irods.models import Collection, DataObject, User, UserGroup
+
+from django.test import SimpleTestCase, override_settings
+
+# Projectroles dependency
+from projectroles.models import SODAR_CONSTANTS, ROLE_RANKING
+
+from taskflowbackend.flows.role_update_irods_batch import (
+    Flow as RoleUpdateIrodsBatchFlow,
+)
+from taskflowbackend.tasks.irods_tasks import (
+    AddUserToGroupTask,
+    BatchCalculateChecksumTask,
+    BatchValidateChecksumsTask,
+    CreateUserGroupTask,
+    CreateUserTask,
+    RemoveUserFromGroupTask,
+)
+
+
+# SODAR constants
+PROJECT_ROLE_CONTRIBUTOR = SODAR_CONSTANTS['PROJECT_ROLE_CONTRIBUTOR']
+PROJECT_ROLE_DELEGATE = SODAR_CONSTANTS['PROJECT_ROLE_DELEGATE']
+
+# Local constants
+BENCHMARK_ENABLED = bool(os.environ.get('SODAR_BENCHMARK'))
+BENCHMARK_SKIP_MSG = 'SODAR_BENCHMARK not set'
+ZONE_PATH = '/sodarZone/projects/00/zone'
+FILE_COUNT = 500
+WORKER_COUNTS = [1, 2, 4, 8, 16]
+RESOURCE_NAME = 'demoResc'
+LATENCY_CONNECT = 0.02  # Simulated session connect and auth latency
+LATENCY_REQUEST = 0.002  # Simulated round-trip latency per request
+QUERY_PAGE_SIZE = 500  # Rows per simulated catalog query page
+CHECKSUM_FILE_SIZE = 64 * 1024 * 1024  # Simulated file size for checksums
+CHECKSUM_RATE = 4 * 1024 * 1024 * 1024  # Simulated server checksum bytes/s
+CATEGORY_PROJECT_COUNT = 50  # Projects in simulated large category
+CATEGORY_USER_COUNT = 20  # Users with inherited roles in simulated category
+
+
+class StandInQuery:
+    """iRODS GenQuery stand-in returning rows in pages"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def filter(self, *args):
+        return self
+
+    def close(self):
+        pass
+
+    def __iter__(self):
+        for i, row in enumerate(self.rows):
+            if i % QUERY_PAGE_SIZE == 0:
+                time.sleep(LATENCY_REQUEST)
+            yield row
+
+
+class StandInDataObjectManager:
+    """iRODS data object manager stand-in"""
+
+    def __init__(self, store):
+        self.store = store
+
+    def open(self, path, mode='r'):
+        time.sleep(LATENCY_REQUEST)
+        return io.BytesIO(self.store[path])
+
+    def chksum(self, path, **options):
+        time.sleep(LATENCY_REQUEST + CHECKSUM_FILE_SIZE / CHECKSUM_RATE)
+        return hashlib.md5(self.store[path]).hexdigest()
+
+
+class StandInSession:
+    """iRODS session stand-in with simulated latency"""
+
+    def __init__(self, store, checksums=True):
+        time.sleep(LATENCY_CONNECT)
+        self.store = store
+        self.checksums = checksums
+        self.data_objects = StandInDataObjectManager(store)
+        self.connection_timeout = None
+        self.zone = 'sodarZone'
+
+    def query(self, *args):
+        rows = []
+        for path, content in self.store.items():
+            if path.endswith('.md5'):
+                continue
+            coll_name, obj_name = path.rsplit('/', 1)
+            rows.append(
+                {
+                    Collection.name: coll_name,
+                    DataObject.name: obj_name,
+                    DataObject.replica_number: 0,
+                    DataObject.resource_name: RESOURCE_NAME,
+                    DataObject.resc_hier: RESOURCE_NAME,
+                    DataObject.checksum: (
+                        hashlib.md5(content).hexdigest()
+                        if self.checksums
+                        else None
+                    ),
+                    DataObject.size: CHECKSUM_FILE_SIZE,
+                }
+            )
+        return StandInQuery(rows)
+
+    def cleanup(self):
+        pass
+
+
+class StandInIrodsAPI:
+    """IrodsAPI stand-in returning stand-in sessions"""
+
+    def __init__(self, store, checksums=True):
+        self.store = store
+        self.checksums = checksums
+
+    def get_session_obj(self):
+        return StandInSession(self.store, self.checksums)
+
+    @classmethod
+    def get_checksum_file_suffix(cls):
+        return '.md5'
+
+
+class StandInCatalog:
+    """iRODS user and group catalog stand-in"""
+
+    def __init__(self):
+        self.users = set()
+        self.groups = {}
+        self.lock = threading.Lock()
+
+
+class StandInUserManager:
+    """iRODS user manager stand-in"""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+
+    def get(self, user_name):
+        time.sleep(LATENCY_REQUEST)
+        if user_name not in self.catalog.users:
+            raise UserDoesNotExist()
+        return user_name
+
+    def create(self, user_name, user_type, user_zone=None):
+        time.sleep(LATENCY_REQUEST)
+        with self.catalog.lock:
+            self.catalog.users.add(user_name)
+
+    def remove(self, user_name, user_zone=None):
+        time.sleep(LATENCY_REQUEST)
+        with self.catalog.lock:
+            self.catalog.users.discard(user_name)
+            self.catalog.groups.pop(user_name, None)
+
+
+class StandInGroup:
+    """iRODS user group stand-in"""
+
+    def __init__(self, catalog, name):
+        self.catalog = catalog
+        self.name = name
+
+    def hasmember(self, user_name):
+        time.sleep(LATENCY_REQUEST)
+        return user_name in self.catalog.groups[self.name]
+
+    def addmember(self, user_name, user_zone=None):
+        time.sleep(LATENCY_REQUEST)
+        with self.catalog.lock:
+            self.catalog.groups[self.name].add(user_name)
+
+    def removemember(self, user_name, user_zone=None):
+        time.sleep(LATENCY_REQUEST)
+        with self.catalog.lock:
+            self.catalog.groups[self.name].discard(user_name)
+
+
+class StandInGroupManager:
+    """iRODS user group manager stand-in"""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+
+    def get(self, name):
+        time.sleep(LATENCY_REQUEST)
+        if name not in self.catalog.groups:
+            raise GroupDoesNotExist()
+        return StandInGroup(self.catalog, name)
+
+    def create(self, name, user_zone=None):
+        time.sleep(LATENCY_REQUEST)
+        with self.catalog.lock:
+            self.catalog.groups.setdefault(name, set())
+
+    def addmember(self, group_name, user_name, user_zone=None):
+        StandInGroup(self.catalog, group_name).addmember(user_name)
+
+    def removemember(self, group_name, user_name, user_zone=None):
+        StandInGroup(self.catalog, group_name).removemember(user_name)
+
+
+class StandInCatalogSession:
+    """iRODS session stand-in for user and group operations"""
+
+    def __init__(self, catalog):
+        time.sleep(LATENCY_CONNECT)
+        self.catalog = catalog
+        self.users = StandInUserManager(catalog)
+        self.user_groups = StandInGroupManager(catalog)
+        self.connection_timeout = None
+        self.zone = 'sodarZone'
+
+    def query(self, *args):
+        if UserGroup.name in args:
+            rows = [
+                {UserGroup.name: g, User.name: u}
+                for g, members in self.catalog.groups.items()
+                for u in members
+            ]
+        else:
+            rows = [
+                {User.name: u, User.type: 'rodsuser'}
+                for u in self.catalog.users
+            ] + [
+                {User.name: g, User.type: 'rodsgroup'}
+                for g in self.catalog.groups
+            ]
+        return StandInQuery(rows)
+
+    def cleanup(self):
+        pass
+
+
+class StandInCatalogIrodsAPI:
+    """IrodsAPI stand-in returning user and group catalog sessions"""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+
+    def get_session_obj(self):
+        return StandInCatalogSession(self.catalog)
+
+    @classmethod
+    def get_group_name(cls, project_uuid, owner=False):
+        return 'omics_project_{}{}'.format(
+            project_uuid, '_owner' if owner else ''
+        )
+
+
+class StandInZone:
+    """LandingZone stand-in"""
+
+    status = 'VALIDATING'
+    status_info = 'Validating'
+
+    def set_status(self, status, status_info=None):
+        pass
+
+
+def make_store(file_count):
+    """Return stand-in iRODS data object store with checksum files"""
+    store = {}
+    for i in range(file_count):
+        path = '{}/sub{}/file{}.fastq.gz'.format(ZONE_PATH, i % 10, i)
+        content = str(i).encode()
+        store[path] = content
+        store[path + '.md5'] = hashlib.md5(content).hexdigest().encode()
+    return store
+
+
+@skipUnless(BENCHMARK_ENABLED, BENCHMARK_SKIP_MSG)
+class TestBatchValidateChecksumsTaskBenchmark(SimpleTestCase):
+    """Benchmark for BatchValidateChecksumsTask worker counts"""
+
+    def setUp(self):
+        self.store = make_store(FILE_COUNT)
+        self.irods_backend = StandInIrodsAPI(self.store)
+        self.file_paths = [p for p in self.store if not p.endswith('.md5')]
+
+    def _run_task(self):
+        task = BatchValidateChecksumsTask(
+            name='Validate checksums',
+            irods=self.irods_backend.get_session_obj(),
+            verbose=False,
+        )
+        time_start = time.time()
+        task.execute(
+            landing_zone=StandInZone(),
+            file_paths=self.file_paths,
+            zone_path=ZONE_PATH,
+            irods_backend=self.irods_backend,
+        )
+        return time.time() - time_start
+
+    def test_validate_workers(self):
+        """Benchmark validating checksums with different worker counts"""
+        print('\nBatchValidateChecksumsTask ({} files)'.format(FILE_COUNT))
+        for workers in WORKER_COUNTS:
+            with override_settings(TASKFLOW_VALIDATE_WORKERS=workers):
+                duration = self._run_task()
+            print(
+                'Workers: {:>3}  Files/s: {:>8.1f}'.format(
+                    workers, FILE_COUNT / duration
+                )
+            )
+
+
+@skipUnless(BENCHMARK_ENABLED, BENCHMARK_SKIP_MSG)
+class TestBatchCalculateChecksumTaskBenchmark(SimpleTestCase):
+    """Benchmark for BatchCalculateChecksumTask worker counts"""
+
+    def setUp(self):
+        self.store = make_store(FILE_COUNT)
+        self.irods_backend = StandInIrodsAPI(self.store, checksums=False)
+        self.file_paths = [p for p in self.store if not p.endswith('.md5')]
+
+    def _run_task(self):
+        task = BatchCalculateChecksumTask(
+            name='Calculate checksums',
+            irods=self.irods_backend.get_session_obj(),
+            verbose=False,
+        )
+        time_start = time.time()
+        task.execute(
+            landing_zone=StandInZone(),
+            file_paths=self.file_paths,
+            force=False,
+            irods_backend=self.irods_backend,
+        )
+        return time.time() - time_start
+
+    def test_calculate_workers(self):
+        """Benchmark calculating checksums with different worker counts"""
+        print('\nBatchCalculateChecksumTask ({} files)'.format(FILE_COUNT))
+        for workers in WORKER_COUNTS:
+            with override_settings(TASKFLOW_CHECKSUM_WORKERS=workers):
+                duration = self._run_task()
+            print(
+                'Workers: {:>3}  Files/s: {:>8.1f}  MB/s: {:>10.1f}'.format(
+                    workers,
+                    FILE_COUNT / duration,
+                    FILE_COUNT * CHECKSUM_FILE_SIZE / duration / 1024**2,
+                )
+            )
+
+
+@skipUnless(BENCHMARK_ENABLED, BENCHMARK_SKIP_MSG)
+class TestRoleUpdateIrodsBatchFlowBenchmark(SimpleTestCase):
+    """Benchmark for role_update_irods_batch flow with batched updates"""
+
+    def setUp(self):
+        self.project_uuids = [
+            str(uuid.uuid4()) for _ in range(CATEGORY_PROJECT_COUNT)
+        ]
+        self.user_names = [
+            'user{}'.format(i) for i in range(CATEGORY_USER_COUNT)
+        ]
+        # First user is a delegate, others are contributors
+        self.rank_delegate = ROLE_RANKING[PROJECT_ROLE_DELEGATE]
+        rank_contributor = ROLE_RANKING[PROJECT_ROLE_CONTRIBUTOR]
+        self.flow_data = {
+            'roles_add': [
+                {
+                    'project_uuid': p,
+                    'user_name': u,
+                    'role_rank': rank_contributor if i else self.rank_delegate,
+                }
+                for p in self.project_uuids
+                for i, u in enumerate(self.user_names)
+            ],
+            'roles_delete': [],
+        }
+
+    def _get_catalog(self):
+        catalog = StandInCatalog()
+        irods_backend = StandInCatalogIrodsAPI(catalog)
+        for p in self.project_uuids:
+            catalog.groups[irods_backend.get_group_name(p)] = set()
+        return catalog, irods_backend
+
+    def _run_tasks(self):
+        """Run role additions with a separate task for each operation"""
+        catalog, irods_backend = self._get_catalog()
+        irods = irods_backend.get_session_obj()
+        time_start = time.time()
+        for r in self.flow_data['roles_add']:
+            owner = r['role_rank'] <= self.rank_delegate
+            group = irods_backend.get_group_name(r['project_uuid'])
+            owner_group = irods_backend.get_group_name(r['project_uuid'], True)
+            CreateUserTask(name='Create user', irods=irods).execute(
+                user_name=r['user_name'], user_type='rodsuser'
+            )
+            if owner:
+                CreateUserGroupTask(name='Create group', irods=irods).execute(
+                    name=owner_group
+                )
+            AddUserToGroupTask(name='Add user', irods=irods).execute(
+                group_name=group, user_name=r['user_name']
+            )
+            if owner:
+                AddUserToGroupTask(name='Add owner', irods=irods).execute(
+                    group_name=owner_group, user_name=r['user_name']
+                )
+            else:
+                RemoveUserFromGroupTask(
+                    name='Remove owner', irods=irods
+                ).execute(group_name=owner_group, user_name=r['user_name'])
+        return time.time() - time_start
+
+    def _run_flow(self):
+        """Run role additions with the batched flow"""
+        catalog, irods_backend = self._get_catalog()
+        flow = RoleUpdateIrodsBatchFlow(
+            irods_backend=irods_backend,
+            project=None,
+            flow_name='role_update_irods_batch',
+            flow_data=self.flow_data,
+        )
+        flow.validate()
+        flow.build()
+        time_start = time.time()
+        self.assertTrue(flow.run(verbose=False))
+        duration = time.time() - time_start
+        # Assert catalog state
+        for p in self.project_uuids:
+            group = irods_backend.get_group_name(p)
+            self.assertEqual(catalog.groups[group], set(self.user_names))
+        return duration
+
+    def test_add_roles(self):
+        """Benchmark adding category roles with single and batch tasks"""
+        role_count = len(self.flow_data['roles_add'])
+        print(
+            '\nrole_update_irods_batch ({} projects, {} roles)'.format(
+                CATEGORY_PROJECT_COUNT, role_count
+            )
+        )
+        for label, func in [
+            ('Single', self._run_tasks),
+            ('Batch', self._run_flow),
+        ]:
+            duration = func()
+            print(
+                '{:<6}  Time: {:>6.2f}s  Roles/s: {:>8.1f}'.format(
+                    label, duration, role_count / duration
+                )
+            )
@@ -2236,6 +2236,35 @@ class TestRoleUpdateIrodsBatch(TaskflowbackendFlowTestBase):
         self.build_and_run(flow)
         self.assert_group_member(self.project, self.user_new, True, True)
 
+    def test_add_multiple(self):
+        """Test role_update_irods_batch for adding multiple users"""
+        self.assert_group_member(self.project, self.user_new, False, False)
+        self.assert_group_member(self.project, self.user_new2, False, False)
+        flow_data = {
+            'roles_add': [
+                get_flow_role(
+                    self.project,
+                    self.user_new,
+                    ROLE_RANKING[PROJECT_ROLE_CONTRIBUTOR],
+                ),
+                get_flow_role(
+                    self.project,
+                    self.user_new2,
+                    ROLE_RANKING[PROJECT_ROLE_OWNER],
+                ),
+            ],
+            'roles_delete': [],
+        }
+        flow = self.taskflow.get_flow(
+            irods_backend=self.irods_backend,
+            project=self.project,
+            flow_name='role_update_irods_batch',
+            flow_data=flow_data,
+        )
+        self.build_and_run(flow)
+        self.assert_group_member(self.project, self.user_new, True, False)
+        self.assert_group_member(self.project, self.user_new2, True, True)
+
     def test_add_locked(self):
         """Test role_update_irods_batch with locked project"""
         self.assert_group_member(self.project, self.user_new, False, False)
@@ -2373,6 +2402,43 @@ class TestRoleUpdateIrodsBatch(TaskflowbackendFlowTestBase):
         self.assert_group_member(self.project, self.user_new, False)
         self.assert_group_member(self.project, self.user_new2, False)
 
+    def test_delete_multiple(self):
+        """Test role_update_irods_batch for deleting multiple users"""
+        self.irods.users.create(
+            self.user_new.username, 'rodsuser', settings.IRODS_ZONE
+        )
+        self.irods.users.create(
+            self.user_new2.username, 'rodsuser', settings.IRODS_ZONE
+        )
+        self.project_group.addmember(self.user_new.username)
+        self.project_group.addmember(self.user_new2.username)
+        self.assert_group_member(self.project, self.user_new)
+        self.assert_group_member(self.project, self.user_new2)
+        flow_data = {
+            'roles_add': [],
+            'roles_delete': [
+                get_flow_role(
+                    self.project,
+                    self.user_new,
+                    ROLE_RANKING[PROJECT_ROLE_CONTRIBUTOR],
+                ),
+                get_flow_role(
+                    self.project,
+                    self.user_new2,
+                    ROLE_RANKING[PROJECT_ROLE_CONTRIBUTOR],
+                ),
+            ],
+        }
+        flow = self.taskflow.get_flow(
+            irods_backend=self.irods_backend,
+            project=self.project,
+            flow_name='role_update_irods_batch',
+            flow_data=flow_data,
+        )
+        self.build_and_run(flow)
+        self.assert_group_member(self.project, self.user_new, False)
+        self.assert_group_member(self.project, self.user_new2, False)
+
     def test_delete_owner(self):
         """Test role_update_irods_batch for deleting users with owner roles"""
         self.irods.users.create(
@@ -1,5 +1,6 @@
 """Tests for Taskflow tasks in the taskflowbackend app"""
 
+import threading
 import uuid
 
 from irods.collection import iRODSCollection
@@ -10,7 +11,7 @@ from irods.ticket import Ticket
 from irods.user import iRODSUser, iRODSUserGroup
 
 from django.conf import settings
-from django.test import override_settings
+from django.test import SimpleTestCase, override_settings
 
 from test_plus import TestCase
 
@@ -1244,6 +1245,122 @@ class TestCleanupAccessTask(IRODSTaskTestBase):
         ua = self.get_user_access(obj, TEST_USER)
         self.assertEqual(ua.access_name, self.irods_access_write)
 
+    def test_execute_nested(self):
+        """Test execute() with nested collection and data object access"""
+        sub_coll = self.irods.collections.create(
+            os.path.join(self.test_coll.path, SUB_COLL_NAME)
+        )
+        obj = self.make_irods_object(sub_coll, TEST_OBJ_NAME)
+        self.set_irods_access(
+            self.test_coll.path, TEST_USER, self.irods_access_write
+        )
+        self.set_irods_access(
+            obj.path, DEFAULT_USER_GROUP, self.irods_access_read
+        )
+        self.assertEqual(
+            self.get_user_access(obj, TEST_USER).access_name,
+            self.irods_access_write,
+        )
+        task = CleanupAccessTask(
+            name=self.task_name,
+            irods=self.irods,
+            verbose=False,
+            inject={'path': self.test_coll.path, 'user_names': [ADMIN_USER]},
+        )
+        self.flow.add_task(task)
+        result = self.run_flow()
+        self.assertEqual(result, True)
+        for target in [self.test_coll, sub_coll, obj]:
+            self.assertIsNone(self.get_user_access(target, TEST_USER))
+        self.assertIsNone(self.get_user_access(obj, DEFAULT_USER_GROUP))
+        self.assertEqual(
+            self.get_user_access(obj, ADMIN_USER).access_name,
+            self.irods_access_own,
+        )
+        removed = task.execute_data['removed_access']
+        self.assertEqual(
+            sorted((a['user_name'], a['path']) for a in removed),
+            sorted(
+                [
+                    (DEFAULT_USER_GROUP, obj.path),
+                    (TEST_USER, obj.path),
+                    (TEST_USER, sub_coll.path),
+                    (TEST_USER, self.test_coll.path),
+                ]
+            ),
+        )
+
+    def test_get_removals(self):
+        """Test _get_removals()"""
+        coll_path = self.test_coll.path
+        sub_path = os.path.join(coll_path, SUB_COLL_NAME)
+        other_path = coll_path + '_other'
+        coll_access = [
+            {'user_name': TEST_USER, 'path': sub_path},
+            {'user_name': TEST_USER, 'path': coll_path},
+            {'user_name': TEST_USER, 'path': other_path},
+            {'user_name': DEFAULT_USER_GROUP, 'path': sub_path},
+        ]
+        obj_access = [
+            {
+                'user_name': TEST_USER,
+                'path': os.path.join(sub_path, TEST_OBJ_NAME),
+                'coll_path': sub_path,
+            },
+            {
+                'user_name': DEFAULT_USER_GROUP,
+                'path': os.path.join(coll_path, TEST_OBJ_NAME),
+                'coll_path': coll_path,
+            },
+        ]
+        expected = [
+            (DEFAULT_USER_GROUP, sub_path, True),
+            (TEST_USER, coll_path, True),
+            (TEST_USER, other_path, True),
+            (DEFAULT_USER_GROUP, os.path.join(coll_path, TEST_OBJ_NAME), False),
+        ]
+        self.assertEqual(
+            CleanupAccessTask._get_removals(coll_access, obj_access), expected
+        )
+
+    def test_get_removed_access(self):
+        """Test _get_removed_access()"""
+        coll_path = self.test_coll.path
+        sub_path = os.path.join(coll_path, SUB_COLL_NAME)
+        obj_path = os.path.join(coll_path, TEST_OBJ_NAME)
+        access = [
+            {'user_name': TEST_USER, 'path': coll_path, 'type': 'coll'},
+            {'user_name': TEST_USER, 'path': sub_path, 'type': 'coll'},
+            {
+                'user_name': DEFAULT_USER_GROUP,
+                'path': obj_path,
+                'type': 'obj',
+                'coll_path': coll_path,
+            },
+            {
+                'user_name': DEFAULT_USER_GROUP,
+                'path': sub_path,
+                'type': 'coll',
+            },
+        ]
+        # Removal from sub_path for DEFAULT_USER_GROUP failed
+        removed = [
+            (TEST_USER, coll_path, True),
+            (DEFAULT_USER_GROUP, obj_path, False),
+        ]
+        expected = [
+            {'user_name': TEST_USER, 'path': coll_path, 'type': 'coll'},
+            {'user_name': TEST_USER, 'path': sub_path, 'type': 'coll'},
+            {
+                'user_name': DEFAULT_USER_GROUP,
+                'path': obj_path,
+                'type': 'obj',
+            },
+        ]
+        self.assertEqual(
+            CleanupAccessTask._get_removed_access(access, removed), expected
+        )
+
 
 class TestIssueTicketTask(IRODSTaskTestBase):
     """Tests for IssueTicketTask"""
@@ -1945,6 +2062,33 @@ class TestBatchCheckFileExistTask(
         expected = f'{self.ex_prefix}\n1 expected file missing:\n{ex_path}'
         self.assertEqual(expected, str(cm.exception))
 
+    def test_task_err_paths(self):
+        """Test task with precomputed missing paths"""
+        self.task_kw['inject']['chk_paths'] = [self.obj_path + self.chk_suffix]
+        self.task_kw['inject']['err_paths'] = [self.obj_path + '.bai']
+        self.add_task(**self.task_kw)
+        with self.assertRaises(Exception) as cm:
+            self.run_flow()
+        ex_path = '/'.join(self.obj_path.split('/')[self.zone_path_len :])
+        expected = f'{self.ex_prefix}\n1 expected file missing:\n{ex_path}.bai'
+        self.assertEqual(expected, str(cm.exception))
+
+    def test_get_missing_paths(self):
+        """Test get_missing_paths()"""
+        obj_path2 = os.path.join(self.zone_path, 'file2.txt')
+        obj_path3 = os.path.join(self.zone_path, 'file3.txt')
+        file_paths = [self.obj_path, obj_path2]
+        chk_paths = [
+            self.obj_path + self.chk_suffix,
+            obj_path3 + self.chk_suffix,
+        ]
+        self.assertEqual(
+            BatchCheckFileExistTask.get_missing_paths(
+                file_paths, chk_paths, self.chk_suffix
+            ),
+            [obj_path2 + self.chk_suffix, obj_path3],
+        )
+
 
 class TestBatchValidateChecksumsTask(
     SampleSheetIOMixin, LandingZoneMixin, IRODSTaskTestBase
@@ -2020,6 +2164,47 @@ class TestBatchValidateChecksumsTask(
             self.run_flow()
         self.assertIn(expected, str(cm.exception))
 
+    def test_validate_no_checksum_file(self):
+        """Test validating checksums with missing checksum file"""
+        self.add_task(**self.task_kw)
+        with self.assertRaises(Exception) as cm:
+            self.run_flow()
+        self.assertIn('Unable to read 1 checksum file:', str(cm.exception))
+
+    @override_settings(TASKFLOW_VALIDATE_WORKERS=2)
+    def test_validate_multiple_workers(self):
+        """Test validating checksums for multiple files with worker pool"""
+        self.make_checksum_object(self.obj)
+        file_paths = [self.obj_path]
+        for i in range(2, 6):
+            obj = self.make_irods_object(self.zone_coll, f'test{i}.txt')
+            self.make_checksum_object(obj)
+            file_paths.append(obj.path)
+        self.task_kw['inject']['file_paths'] = file_paths
+        self.add_task(**self.task_kw)
+        result = self.run_flow()
+        self.assertEqual(result, True)
+        self.zone.refresh_from_db()
+        self.assertEqual(
+            self.zone.status_info,
+            DEFAULT_STATUS_INFO[ZONE_STATUS_ACTIVE] + ' (5/5: 100%)',
+        )
+
+    @override_settings(TASKFLOW_VALIDATE_WORKERS=2)
+    def test_validate_multiple_workers_invalid(self):
+        """Test validating with worker pool and one invalid checksum"""
+        self.make_checksum_object(self.obj)
+        obj = self.make_irods_object(self.zone_coll, 'test2.txt')
+        self.make_checksum_object(obj, content='xxx')
+        self.task_kw['inject']['file_paths'] = [self.obj_path, obj.path]
+        self.add_task(**self.task_kw)
+        with self.assertRaises(Exception) as cm:
+            self.run_flow()
+        self.assertIn(
+            'Checksums do not match for 1 file:\nPath: test2.txt',
+            str(cm.exception),
+        )
+
 
 class TestBatchSetAccessTask(IRODSTaskTestBase):
     """Tests for BatchSetAccessTask"""
@@ -2223,6 +2408,213 @@ class TestBatchSetAccessTask(IRODSTaskTestBase):
         self.assert_irods_access(DEFAULT_USER_GROUP, self.sub_coll_path2, None)
 
 
+class TestBatchCreateUsersTask(IRODSTaskTestBase):
+    """Tests for BatchCreateUsersTask"""
+
+    def setUp(self):
+        super().setUp()
+        self.irods.users.create(
+            user_name=GROUP_USER, user_type=RODS_USER_TYPE, user_zone=IRODS_ZONE
+        )
+        self.inject = {
+            'user_names': [GROUP_USER, TEST_USER],
+            'user_type': RODS_USER_TYPE,
+        }
+
+    def test_execute(self):
+        """Test batch user creation"""
+        self.add_task(
+            cls=BatchCreateUsersTask, name='Create users', inject=self.inject
+        )
+        self.assertRaises(UserDoesNotExist, self.irods.users.get, TEST_USER)
+        result = self.run_flow()
+
+        self.assertEqual(result, True)
+        self.assertIsInstance(self.irods.users.get(GROUP_USER), iRODSUser)
+        self.assertIsInstance(self.irods.users.get(TEST_USER), iRODSUser)
+
+    def test_revert_created(self):
+        """Test batch user creation reverting after creating"""
+        self.add_task(
+            cls=BatchCreateUsersTask,
+            name='Create users',
+            inject=self.inject,
+            force_fail=True,
+        )  # FAIL
+        result = self.run_flow()
+
+        self.assertNotEqual(result, True)
+        # Existing user should not be removed
+        self.assertIsInstance(self.irods.users.get(GROUP_USER), iRODSUser)
+        self.assertRaises(UserDoesNotExist, self.irods.users.get, TEST_USER)
+
+
+class TestBatchCreateUserGroupsTask(IRODSTaskTestBase):
+    """Tests for BatchCreateUserGroupsTask"""
+
+    def setUp(self):
+        super().setUp()
+        self.irods.user_groups.create(DEFAULT_USER_GROUP)
+        self.inject = {'names': [DEFAULT_USER_GROUP, TEST_USER_GROUP]}
+
+    def test_execute(self):
+        """Test batch user group creation"""
+        self.add_task(
+            cls=BatchCreateUserGroupsTask,
+            name='Create user groups',
+            inject=self.inject,
+        )
+        self.assertRaises(
+            GroupDoesNotExist, self.irods.user_groups.get, TEST_USER_GROUP
+        )
+        result = self.run_flow()
+
+        self.assertEqual(result, True)
+        group = self.irods.user_groups.get(TEST_USER_GROUP)
+        self.assertIsInstance(group, iRODSUserGroup)
+
+    def test_revert_created(self):
+        """Test batch user group creation reverting after creating"""
+        self.add_task(
+            cls=BatchCreateUserGroupsTask,
+            name='Create user groups',
+            inject=self.inject,
+            force_fail=True,
+        )  # FAIL
+        result = self.run_flow()
+
+        self.assertNotEqual(result, True)
+        group = self.irods.user_groups.get(DEFAULT_USER_GROUP)
+        self.assertIsInstance(group, iRODSUserGroup)
+        self.assertRaises(
+            GroupDoesNotExist, self.irods.user_groups.get, TEST_USER_GROUP
+        )
+
+
+class TestBatchUpdateGroupMembersTask(IRODSTaskTestBase):
+    """Tests for BatchUpdateGroupMembersTask"""
+
+    def setUp(self):
+        super().setUp()
+        # Init default user groups
+        self.group = self.irods.user_groups.create(DEFAULT_USER_GROUP)
+        self.group2 = self.irods.user_groups.create(TEST_USER_GROUP)
+        # Init default users
+        for user_name in [GROUP_USER, GROUPLESS_USER]:
+            self.irods.users.create(
+                user_name=user_name,
+                user_type=RODS_USER_TYPE,
+                user_zone=IRODS_ZONE,
+            )
+        self.group.addmember(GROUP_USER)
+
+    def _assert_member(self, group_name, user_name, expected=True):
+        group = self.irods.user_groups.get(group_name)
+        self.assertEqual(group.hasmember(user_name), expected)
+
+    def test_execute(self):
+        """Test adding and removing group members"""
+        self.add_task(
+            cls=BatchUpdateGroupMembersTask,
+            name='Update group members',
+            inject={
+                'members': [
+                    (DEFAULT_USER_GROUP, GROUP_USER, False),
+                    (DEFAULT_USER_GROUP, GROUPLESS_USER, True),
+                    (TEST_USER_GROUP, GROUP_USER, True),
+                ]
+            },
+        )
+        result = self.run_flow()
+
+        self.assertEqual(result, True)
+        self._assert_member(DEFAULT_USER_GROUP, GROUP_USER, False)
+        self._assert_member(DEFAULT_USER_GROUP, GROUPLESS_USER, True)
+        self._assert_member(TEST_USER_GROUP, GROUP_USER, True)
+
+    def test_execute_last_entry(self):
+        """Test updating with multiple entries for the same member"""
+        self.add_task(
+            cls=BatchUpdateGroupMembersTask,
+            name='Update group members',
+            inject={
+                'members': [
+                    (DEFAULT_USER_GROUP, GROUPLESS_USER, True),
+                    (DEFAULT_USER_GROUP, GROUPLESS_USER, False),
+                ]
+            },
+        )
+        result = self.run_flow()
+
+        self.assertEqual(result, True)
+        self._assert_member(DEFAULT_USER_GROUP, GROUPLESS_USER, False)
+
+    def test_execute_remove_no_group(self):
+        """Test removing member from nonexistent group"""
+        self.add_task(
+            cls=BatchUpdateGroupMembersTask,
+            name='Update group members',
+            inject={'members': [(USER_PREFIX + 'group3', GROUP_USER, False)]},
+        )
+        result = self.run_flow()
+        self.assertEqual(result, True)
+
+    def test_execute_add_no_group(self):
+        """Test adding member to nonexistent group (should fail)"""
+        self.add_task(
+            cls=BatchUpdateGroupMembersTask,
+            name='Update group members',
+            inject={
+                'members': [
+                    (TEST_USER_GROUP, GROUPLESS_USER, True),
+                    (USER_PREFIX + 'group3', GROUP_USER, True),
+                ]
+            },
+        )
+        with self.assertRaises(Exception):
+            self.run_flow()
+        self._assert_member(TEST_USER_GROUP, GROUPLESS_USER, False)
+
+    def test_get_updates(self):
+        """Test get_updates()"""
+        members = [
+            (DEFAULT_USER_GROUP, GROUP_USER, True),
+            (DEFAULT_USER_GROUP, GROUPLESS_USER, True),
+            (TEST_USER_GROUP, GROUP_USER, False),
+            (TEST_USER_GROUP, GROUPLESS_USER, False),
+            (USER_PREFIX + 'group3', GROUP_USER, False),
+        ]
+        current = {
+            (DEFAULT_USER_GROUP, GROUP_USER),
+            (TEST_USER_GROUP, GROUP_USER),
+        }
+        groups = {DEFAULT_USER_GROUP, TEST_USER_GROUP}
+        add, remove = BatchUpdateGroupMembersTask.get_updates(
+            members, current, groups
+        )
+        self.assertEqual(add, [(DEFAULT_USER_GROUP, GROUPLESS_USER)])
+        self.assertEqual(remove, [(TEST_USER_GROUP, GROUP_USER)])
+
+    def test_revert_modified(self):
+        """Test updating group members reverting after modification"""
+        self.add_task(
+            cls=BatchUpdateGroupMembersTask,
+            name='Update group members',
+            inject={
+                'members': [
+                    (DEFAULT_USER_GROUP, GROUP_USER, False),
+                    (DEFAULT_USER_GROUP, GROUPLESS_USER, True),
+                ]
+            },
+            force_fail=True,
+        )  # FAIL
+        result = self.run_flow()
+
+        self.assertNotEqual(result, True)
+        self._assert_member(DEFAULT_USER_GROUP, GROUP_USER, True)
+        self._assert_member(DEFAULT_USER_GROUP, GROUPLESS_USER, False)
+
+
 class TestBatchCheckFileSuffixTask(
     SampleSheetIOMixin,
     LandingZoneMixin,
@@ -2349,6 +2741,19 @@ class TestBatchCheckFileSuffixTask(
             self.assertNotIn(SUFFIX_OBJ_NAME_VCF, ex)
             self.assertNotIn(SUFFIX_OBJ_NAME_TXT, ex)
 
+    def test_get_prohibited_paths(self):
+        """Test get_prohibited_paths()"""
+        self.assertEqual(
+            BatchCheckFileSuffixTask.get_prohibited_paths(
+                self.obj_paths, ['bam', 'vcf.gz']
+            ),
+            [self.obj_bam.path, self.obj_vcf.path],
+        )
+        self.assertEqual(
+            BatchCheckFileSuffixTask.get_prohibited_paths(self.obj_paths, []),
+            [],
+        )
+
     def test_check_extra_spaces(self):
         """Test check with extra spaces"""
         self.task_kw['inject']['suffixes'] = ' bam '
@@ -2797,6 +3202,129 @@ class TestBatchMoveDataObjectsTask(
             DEFAULT_STATUS_INFO[ZONE_STATUS_ACTIVE] + ' (2/2: 100%)',
         )  # Checksum files should not be counted
 
+    def test_get_coll_moves(self):
+        """Test get_coll_moves()"""
+        sub_path = os.path.join(self.batch_src_path, 'sub')
+        leaf_path = os.path.join(sub_path, 'leaf')
+        empty_path = os.path.join(self.batch_src_path, 'empty')
+        exist_path = os.path.join(self.batch_src_path, 'exist')
+        coll_moves = BatchMoveDataObjectsTask.get_coll_moves(
+            self.batch_src_path,
+            self.batch_dest_path,
+            [
+                self.batch_obj_path,
+                os.path.join(sub_path, 'obj1'),
+                os.path.join(leaf_path, 'obj2'),
+                os.path.join(exist_path, 'obj3'),
+            ],
+            [self.batch_src_path, sub_path, leaf_path, empty_path, exist_path],
+            [self.batch_dest_path, os.path.join(self.batch_dest_path, 'exist')],
+        )
+        self.assertEqual(
+            coll_moves,
+            {leaf_path: os.path.join(self.batch_dest_path, 'sub', 'leaf')},
+        )
+
+    def test_get_coll_access(self):
+        """Test get_coll_access()"""
+        leaf_path = os.path.join(self.batch_src_path, 'leaf')
+        leaf_obj_path = os.path.join(leaf_path, 'obj1')
+        access = {
+            self.batch_src_path: 'read',
+            self.batch_obj_path: 'read',
+            leaf_path: 'read',
+            leaf_obj_path: 'modify_object',
+            os.path.join(leaf_path, 'obj2'): 'null',
+        }
+        coll_access = BatchMoveDataObjectsTask.get_coll_access(
+            access, {leaf_path: os.path.join(self.batch_dest_path, 'leaf')}
+        )
+        self.assertEqual(
+            coll_access, {leaf_path: {'': 'read', 'obj1': 'modify_object'}}
+        )
+
+    def _setup_coll_moves(self):
+        """Set up leaf collection for collection move tests"""
+        self.leaf_path = os.path.join(self.batch_src_path, 'leaf')
+        self.irods.collections.create(self.leaf_path)
+        self.leaf_obj_path = os.path.join(self.leaf_path, BATCH_OBJ_NAME)
+        self.irods.data_objects.create(self.leaf_obj_path)
+        self.dest_leaf_path = os.path.join(self.batch_dest_path, 'leaf')
+        self.dest_leaf_obj_path = os.path.join(
+            self.dest_leaf_path, BATCH_OBJ_NAME
+        )
+        return {self.leaf_path: self.dest_leaf_path}
+
+    def test_execute_coll_moves(self):
+        """Test moving with leaf collection moved as a whole"""
+        coll_moves = self._setup_coll_moves()
+        self.add_task(
+            cls=BatchMoveDataObjectsTask,
+            name='Move data objects',
+            inject={
+                'landing_zone': self.zone,
+                'src_root': self.batch_src_path,
+                'dest_root': self.batch_dest_path,
+                'src_paths': [self.batch_obj_path, self.leaf_obj_path],
+                'access_name': IRODS_ACCESS_READ_IN,
+                'user_name': DEFAULT_USER_GROUP,
+                'irods_backend': self.irods_backend,
+                'coll_moves': coll_moves,
+            },
+        )
+        result = self.run_flow()
+
+        self.assertEqual(result, True)
+        self.assertFalse(self.irods.collections.exists(self.leaf_path))
+        self.assertFalse(self.irods.data_objects.exists(self.batch_obj_path))
+        self.assertTrue(self.irods.data_objects.exists(self.dest_obj_path))
+        self.assertTrue(self.irods.data_objects.exists(self.dest_leaf_obj_path))
+        for target in [
+            self.irods.collections.get(self.dest_leaf_path),
+            self.irods.data_objects.get(self.dest_leaf_obj_path),
+            self.irods.data_objects.get(self.dest_obj_path),
+        ]:
+            access = self.get_user_access(
+                target=target, user_name=DEFAULT_USER_GROUP
+            )
+            self.assertIsInstance(access, iRODSAccess)
+            self.assertEqual(access.access_name, self.irods_access_read)
+
+    def test_revert_coll_moves(self):
+        """Test reverting moving with leaf collection moved as a whole"""
+        coll_moves = self._setup_coll_moves()
+        self.add_task(
+            cls=BatchMoveDataObjectsTask,
+            name='Move data objects',
+            inject={
+                'landing_zone': self.zone,
+                'src_root': self.batch_src_path,
+                'dest_root': self.batch_dest_path,
+                'src_paths': [self.batch_obj_path, self.leaf_obj_path],
+                'access_name': IRODS_ACCESS_READ_IN,
+                'user_name': DEFAULT_USER_GROUP,
+                'irods_backend': self.irods_backend,
+                'coll_moves': coll_moves,
+            },
+            force_fail=True,
+        )  # FAILS
+        result = self.run_flow()
+
+        self.assertNotEqual(result, True)
+        self.assertFalse(self.irods.collections.exists(self.dest_leaf_path))
+        self.assertTrue(self.irods.data_objects.exists(self.leaf_obj_path))
+        self.assertTrue(self.irods.data_objects.exists(self.batch_obj_path))
+        for target in [
+            self.irods.collections.get(self.leaf_path),
+            self.irods.data_objects.get(self.leaf_obj_path),
+            self.irods.data_objects.get(self.batch_obj_path),
+        ]:
+            self.assertIsNone(
+                self.get_user_access(
+                    target=target, user_name=DEFAULT_USER_GROUP
+                )
+            )
+
 
 class TestBatchCalculateChecksumTask(
     SampleSheetIOMixin, LandingZoneMixin, IRODSTaskTestBase
@@ -2900,6 +3428,77 @@ class TestBatchCalculateChecksumTask(
             DEFAULT_STATUS_INFO[ZONE_STATUS_ACTIVE] + ' (1/1: 100%)',
         )
 
+    def test_calculate_force(self):
+        """Test calculating with existing checksum and force"""
+        obj = self.make_irods_object(self.test_coll, self.obj_name)
+        self.assertIsNotNone(obj.replicas[0].checksum)
+        self.add_task(
+            cls=BatchCalculateChecksumTask,
+            name='Calculate checksums',
+            inject={
+                'landing_zone': self.zone,
+                'file_paths': [self.obj_path],
+                'force': True,
+            },
+        )
+        result = self.run_flow()
+        self.assertEqual(result, True)
+        obj = self.irods.data_objects.get(self.obj_path)
+        self.assertEqual(obj.replicas[0].checksum, self.get_checksum(obj))
+
+    def test_calculate_non_existent(self):
+        """Test calculating with non-existent data object"""
+        obj = self.make_irods_object(
+            self.test_coll, self.obj_name, checksum=False
+        )
+        self.add_task(
+            cls=BatchCalculateChecksumTask,
+            name='Calculate checksums',
+            inject={
+                'landing_zone': self.zone,
+                'file_paths': [
+                    self.obj_path,
+                    os.path.join(self.test_coll_path, 'non_existent.txt'),
+                ],
+                'force': False,
+            },
+        )
+        result = self.run_flow()
+        self.assertEqual(result, True)
+        obj = self.irods.data_objects.get(self.obj_path)
+        self.assertEqual(obj.replicas[0].checksum, self.get_checksum(obj))
+
+    @override_settings(TASKFLOW_CHECKSUM_WORKERS=2)
+    def test_calculate_multiple_workers(self):
+        """Test calculating checksums with worker pool"""
+        file_paths = []
+        for i in range(5):
+            obj = self.make_irods_object(
+                self.test_coll, f'test{i}.txt', checksum=False
+            )
+            self.assertIsNone(obj.replicas[0].checksum)
+            file_paths.append(obj.path)
+        self.add_task(
+            cls=BatchCalculateChecksumTask,
+            name='Calculate checksums',
+            inject={
+                'landing_zone': self.zone,
+                'file_paths': file_paths,
+                'force': False,
+                'irods_backend': self.irods_backend,
+            },
+        )
+        result = self.run_flow()
+        self.assertEqual(result, True)
+        for path in file_paths:
+            obj = self.irods.data_objects.get(path)
+            self.assertEqual(obj.replicas[0].checksum, self.get_checksum(obj))
+        self.zone.refresh_from_db()
+        self.assertEqual(
+            self.zone.status_info,
+            DEFAULT_STATUS_INFO[ZONE_STATUS_ACTIVE] + ' (5/5: 100%)',
+        )
+
 
 class TestTimelineEventExtraDataUpdateTask(
     ProjectMixin, TimelineEventMixin, TaskTestMixin, TestCase
@@ -3036,3 +3635,59 @@ class TestTimelineEventExtraDataUpdateTask(
         self.run_flow()
         self.event.refresh_from_db()
         self.assertEqual(self.event.extra_data, og_data)
+
+
+class TestWorkerSessionMixin(SimpleTestCase):
+    """Tests for WorkerSessionMixin"""
+
+    class StandInSession:
+        connection_timeout = None
+
+        def __init__(self, sessions):
+            sessions.append(self)
+            self.closed = False
+
+        def cleanup(self):
+            self.closed = True
+
+    class StandInIrodsAPI:
+        def __init__(self, sessions):
+            self.sessions = sessions
+
+        def get_session_obj(self):
+            return TestWorkerSessionMixin.StandInSession(self.sessions)
+
+    def setUp(self):
+        self.sessions = []
+        self.irods_backend = self.StandInIrodsAPI(self.sessions)
+        self.mixin = WorkerSessionMixin()
+
+    def test_map(self):
+        """Test map_worker_sessions()"""
+        results = list(
+            self.mixin.map_worker_sessions(
+                lambda irods, x: x * 2, range(20), self.irods_backend, 2
+            )
+        )
+        self.assertEqual(results, [x * 2 for x in range(20)])
+        self.assertTrue(all(s.closed for s in self.sessions))
+
+    def test_map_exception(self):
+        """Test map_worker_sessions() cancelling items after exception"""
+        processed = []
+        lock = threading.Lock()
+
+        def _func(irods, x):
+            if x == 0:
+                raise ValueError('Test')
+            with lock:
+                processed.append(x)
+
+        with self.assertRaises(ValueError):
+            list(
+                self.mixin.map_worker_sessions(
+                    _func, range(1000), self.irods_backend, 2
+                )
+            )
+        self.assertLess(len(processed), 1000)
+        self.assertTrue(all(s.closed for s in self.sessions))